@@ -0,0 +1,31 @@
+"""Add (fleet_id, driverProfileId) index to driver_fleet_assignment.
+
+Revision ID: i2j3k4l5m6n7
+Revises: h1i2j3k4l5m6
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+
+
+revision = "i2j3k4l5m6n7"
+down_revision = "h1i2j3k4l5m6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Cover fleet-scoped driver lookups used by API-key scoping."""
+    op.create_index(
+        "ix_driver_fleet_assignment_fleet_driver",
+        "driver_fleet_assignment",
+        ["fleet_id", "driverProfileId"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the fleet-scoped driver lookup index."""
+    op.drop_index(
+        "ix_driver_fleet_assignment_fleet_driver",
+        table_name="driver_fleet_assignment",
+    )
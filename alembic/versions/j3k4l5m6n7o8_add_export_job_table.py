@@ -0,0 +1,64 @@
+"""Add export_job table.
+
+Revision ID: j3k4l5m6n7o8
+Revises: i2j3k4l5m6n7
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy_utils import UUIDType
+
+
+revision = "j3k4l5m6n7o8"
+down_revision = "i2j3k4l5m6n7"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(inspector: sa.Inspector, name: str) -> bool:
+    return name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    """Create the table tracking background export jobs."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _table_exists(inspector, "export_job"):
+        op.create_table(
+            "export_job",
+            sa.Column("id", UUIDType(binary=True), primary_key=True),
+            sa.Column("dataset", sa.String(length=100), nullable=False),
+            sa.Column("export_format", sa.String(length=20), nullable=False),
+            sa.Column("params", sa.JSON(), nullable=False),
+            sa.Column("params_hash", sa.String(length=64), nullable=False),
+            sa.Column("api_client_id", UUIDType(binary=True), nullable=True),
+            sa.Column("status", sa.String(length=20), nullable=False),
+            sa.Column("row_count", sa.BigInteger(), nullable=False, server_default="0"),
+            sa.Column("byte_size", sa.BigInteger(), nullable=False, server_default="0"),
+            sa.Column("checksum", sa.String(length=64), nullable=True),
+            sa.Column("artifact_path", sa.String(length=500), nullable=True),
+            sa.Column("error", sa.Text(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+            sa.Column("completed_at", sa.DateTime(), nullable=True),
+            sa.Column("expires_at", sa.DateTime(), nullable=True),
+        )
+        op.create_index(
+            "ix_export_job_params_hash_status",
+            "export_job",
+            ["params_hash", "status"],
+        )
+        op.create_index("ix_export_job_expires_at", "export_job", ["expires_at"])
+
+
+def downgrade() -> None:
+    """Drop the export_job table."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "export_job"):
+        op.drop_index("ix_export_job_expires_at", table_name="export_job")
+        op.drop_index("ix_export_job_params_hash_status", table_name="export_job")
+        op.drop_table("export_job")
@@ -0,0 +1,52 @@
+"""Add ingested_at change-tracking columns to the exported tables.
+
+Revision ID: k4l5m6n7o8p9
+Revises: j3k4l5m6n7o8
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+revision = "k4l5m6n7o8p9"
+down_revision = "j3k4l5m6n7o8"
+branch_labels = None
+depends_on = None
+
+TABLES = ("raw_sensor_data", "trip", "nlg_report")
+
+
+def _ingested_at_type() -> sa.types.TypeEngine:
+    return sa.DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql")
+
+
+def upgrade() -> None:
+    """Add, backfill and index ``ingested_at`` for ``since`` export cursors."""
+    migrated_at = datetime.utcnow()
+    for table in TABLES:
+        op.add_column(table, sa.Column("ingested_at", _ingested_at_type(), nullable=True))
+        # Existing rows count as written now: the first delta pull after the
+        # upgrade returns them once.
+        op.execute(
+            sa.text(f"UPDATE {table} SET ingested_at = :migrated_at").bindparams(
+                migrated_at=migrated_at
+            )
+        )
+        op.alter_column(
+            table,
+            "ingested_at",
+            existing_type=_ingested_at_type(),
+            nullable=False,
+        )
+        op.create_index(f"ix_{table}_ingested_at", table, ["ingested_at"])
+
+
+def downgrade() -> None:
+    """Drop the ``ingested_at`` columns."""
+    for table in reversed(TABLES):
+        op.drop_index(f"ix_{table}_ingested_at", table_name=table)
+        op.drop_column(table, "ingested_at")
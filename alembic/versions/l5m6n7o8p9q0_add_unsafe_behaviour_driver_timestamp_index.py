@@ -0,0 +1,31 @@
+"""Add (driverProfileId, timestamp) index to unsafe_behaviour.
+
+Revision ID: l5m6n7o8p9q0
+Revises: k4l5m6n7o8p9
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+
+
+revision = "l5m6n7o8p9q0"
+down_revision = "k4l5m6n7o8p9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Cover per-driver time-window counts and recent-event pages."""
+    op.create_index(
+        "ix_unsafe_behaviour_driver_timestamp",
+        "unsafe_behaviour",
+        ["driverProfileId", "timestamp"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the per-driver timestamp index."""
+    op.drop_index(
+        "ix_unsafe_behaviour_driver_timestamp",
+        table_name="unsafe_behaviour",
+    )
@@ -0,0 +1,67 @@
+"""Add speeding_event table.
+
+Revision ID: m6n7o8p9q0r1
+Revises: l5m6n7o8p9q0
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy_utils import UUIDType
+
+
+revision = "m6n7o8p9q0r1"
+down_revision = "l5m6n7o8p9q0"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(inspector: sa.Inspector, name: str) -> bool:
+    return name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    """Create the table of speeding episodes detected at ingest."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _table_exists(inspector, "speeding_event"):
+        op.create_table(
+            "speeding_event",
+            sa.Column("id", UUIDType(binary=True), primary_key=True),
+            sa.Column(
+                "driverProfileId",
+                UUIDType(binary=True),
+                sa.ForeignKey("driver_profile.driverProfileId"),
+                nullable=False,
+            ),
+            sa.Column("trip_id", UUIDType(binary=True), sa.ForeignKey("trip.id"), nullable=False),
+            sa.Column("timestamp", sa.BigInteger(), nullable=False),
+            sa.Column("end_timestamp", sa.BigInteger(), nullable=False),
+            sa.Column("point_count", sa.Integer(), nullable=False, server_default="1"),
+            sa.Column("max_speed", sa.Float(), nullable=False),
+            sa.Column("speed_limit", sa.Float(), nullable=False),
+            sa.Column("max_overspeed", sa.Float(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+        )
+        op.create_index(
+            "ix_speeding_event_driver_timestamp",
+            "speeding_event",
+            ["driverProfileId", "timestamp"],
+        )
+        op.create_index(
+            "ix_speeding_event_trip_timestamp",
+            "speeding_event",
+            ["trip_id", "timestamp"],
+        )
+
+
+def downgrade() -> None:
+    """Drop the speeding_event table."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "speeding_event"):
+        op.drop_index("ix_speeding_event_trip_timestamp", table_name="speeding_event")
+        op.drop_index("ix_speeding_event_driver_timestamp", table_name="speeding_event")
+        op.drop_table("speeding_event")
@@ -0,0 +1,61 @@
+"""Add vehicle_day_stats rollup table.
+
+Revision ID: n7o8p9q0r1s2
+Revises: m6n7o8p9q0r1
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy_utils import UUIDType
+
+
+revision = "n7o8p9q0r1s2"
+down_revision = "m6n7o8p9q0r1"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(inspector: sa.Inspector, name: str) -> bool:
+    return name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    """
+    Create the per vehicle, day and driver usage rollup. Populate it with
+    scripts/rebuild_vehicle_day_stats.py.
+    """
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _table_exists(inspector, "vehicle_day_stats"):
+        op.create_table(
+            "vehicle_day_stats",
+            sa.Column(
+                "vehicle_id",
+                UUIDType(binary=True),
+                sa.ForeignKey("vehicle.id", ondelete="CASCADE"),
+                primary_key=True,
+            ),
+            sa.Column("day", sa.Date(), primary_key=True),
+            sa.Column(
+                "driverProfileId",
+                UUIDType(binary=True),
+                sa.ForeignKey("driver_profile.driverProfileId", ondelete="CASCADE"),
+                primary_key=True,
+            ),
+            sa.Column("trip_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("distance_m", sa.Float(), nullable=False, server_default="0"),
+            sa.Column("duration_ms", sa.BigInteger(), nullable=False, server_default="0"),
+            sa.Column("unsafe_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+        )
+
+
+def downgrade() -> None:
+    """Drop the vehicle_day_stats table."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "vehicle_day_stats"):
+        op.drop_table("vehicle_day_stats")
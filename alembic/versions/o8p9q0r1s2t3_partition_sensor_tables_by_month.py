@@ -0,0 +1,98 @@
+"""Partition raw_sensor_data and location by month on MySQL.
+
+Revision ID: o8p9q0r1s2t3
+Revises: n7o8p9q0r1s2
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+from safedrive.core.partitions import (
+    MAX_PARTITION,
+    PARTITION_MONTHS_AHEAD,
+    PARTITIONED_TABLES,
+    add_months,
+    month_start,
+    partition_clause,
+)
+
+
+revision = "o8p9q0r1s2t3"
+down_revision = "n7o8p9q0r1s2"
+branch_labels = None
+depends_on = None
+
+# Foreign keys MySQL does not allow on or against partitioned tables, and
+# the names they are restored under on downgrade.
+FOREIGN_KEYS = (
+    ("fk_raw_sensor_data_location_id", "raw_sensor_data", "location_id", "location", None),
+    ("fk_raw_sensor_data_trip_id", "raw_sensor_data", "trip_id", "trip", "CASCADE"),
+    ("fk_unsafe_behaviour_location_id", "unsafe_behaviour", "location_id", "location", None),
+)
+
+
+def _first_month(bind, table: str):
+    oldest = bind.execute(sa.text(f"SELECT MIN(`timestamp`) FROM {table}")).scalar()
+    if oldest is None:
+        return month_start(datetime.utcnow().date())
+    return month_start(datetime.utcfromtimestamp(oldest / 1000.0).date())
+
+
+def upgrade() -> None:
+    """
+    RANGE partition both tables on ``timestamp``, one partition per month
+    from the oldest row to ``PARTITION_MONTHS_AHEAD`` months ahead, plus
+    ``pmax``. MySQL requires the partition column in every unique key and
+    allows no foreign keys on partitioned tables, so the primary keys become
+    ``(id, timestamp)`` and the foreign keys listed above are dropped (the
+    ORM relationships and cascades are unaffected). Other backends are left
+    as they are.
+    """
+    bind = op.get_bind()
+    if bind.dialect.name != "mysql":
+        return
+    inspector = sa.inspect(bind)
+
+    for table in ("raw_sensor_data", "unsafe_behaviour"):
+        for foreign_key in inspector.get_foreign_keys(table):
+            if foreign_key["referred_table"] in PARTITIONED_TABLES or table in PARTITIONED_TABLES:
+                op.drop_constraint(foreign_key["name"], table, type_="foreignkey")
+
+    last = add_months(month_start(datetime.utcnow().date()), PARTITION_MONTHS_AHEAD)
+    for table in PARTITIONED_TABLES:
+        # Epoch milliseconds overflow INT.
+        op.execute(f"ALTER TABLE {table} MODIFY `timestamp` BIGINT NOT NULL")
+        op.execute(f"ALTER TABLE {table} DROP PRIMARY KEY, ADD PRIMARY KEY (id, `timestamp`)")
+
+        month = _first_month(bind, table)
+        clauses = []
+        while month <= last:
+            clauses.append(partition_clause(month))
+            month = add_months(month, 1)
+        clauses.append(f"PARTITION {MAX_PARTITION} VALUES LESS THAN MAXVALUE")
+        op.execute(
+            f"ALTER TABLE {table} PARTITION BY RANGE (`timestamp`) ({', '.join(clauses)})"
+        )
+
+
+def downgrade() -> None:
+    """
+    Remove the partitioning, restore the ``id`` primary keys and the
+    foreign keys. ``timestamp`` stays BIGINT: millisecond values no longer
+    fit the old INT column.
+    """
+    bind = op.get_bind()
+    if bind.dialect.name != "mysql":
+        return
+
+    for table in PARTITIONED_TABLES:
+        op.execute(f"ALTER TABLE {table} REMOVE PARTITIONING")
+        op.execute(f"ALTER TABLE {table} DROP PRIMARY KEY, ADD PRIMARY KEY (id)")
+
+    for name, table, column, referred_table, ondelete in FOREIGN_KEYS:
+        op.create_foreign_key(
+            name, table, referred_table, [column], ["id"], ondelete=ondelete
+        )
@@ -0,0 +1,62 @@
+"""Add sensor_archive catalog table.
+
+Revision ID: p9q0r1s2t3u4
+Revises: o8p9q0r1s2t3
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy_utils import UUIDType
+
+
+revision = "p9q0r1s2t3u4"
+down_revision = "o8p9q0r1s2t3"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(inspector: sa.Inspector, name: str) -> bool:
+    return name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    """Create the catalog of Parquet files holding archived sensor rows."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _table_exists(inspector, "sensor_archive"):
+        op.create_table(
+            "sensor_archive",
+            sa.Column("id", UUIDType(binary=True), primary_key=True),
+            sa.Column("table_name", sa.String(length=50), nullable=False),
+            sa.Column("month", sa.Date(), nullable=False),
+            sa.Column("driverProfileId", UUIDType(binary=True), nullable=True),
+            sa.Column("path", sa.String(length=500), nullable=False),
+            sa.Column("row_count", sa.BigInteger(), nullable=False, server_default="0"),
+            sa.Column("byte_size", sa.BigInteger(), nullable=False, server_default="0"),
+            sa.Column("min_timestamp", sa.BigInteger(), nullable=False),
+            sa.Column("max_timestamp", sa.BigInteger(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+        )
+        op.create_index(
+            "ix_sensor_archive_table_driver_month",
+            "sensor_archive",
+            ["table_name", "driverProfileId", "month"],
+        )
+        op.create_index(
+            "ix_sensor_archive_table_max_timestamp",
+            "sensor_archive",
+            ["table_name", "max_timestamp"],
+        )
+
+
+def downgrade() -> None:
+    """Drop the sensor_archive table; the Parquet files are left in place."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "sensor_archive"):
+        op.drop_index("ix_sensor_archive_table_max_timestamp", table_name="sensor_archive")
+        op.drop_index("ix_sensor_archive_table_driver_month", table_name="sensor_archive")
+        op.drop_table("sensor_archive")
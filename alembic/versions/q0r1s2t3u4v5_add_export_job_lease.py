@@ -0,0 +1,26 @@
+"""Add lease_id to export_job.
+
+Revision ID: q0r1s2t3u4v5
+Revises: p9q0r1s2t3u4
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy_utils import UUIDType
+
+
+revision = "q0r1s2t3u4v5"
+down_revision = "p9q0r1s2t3u4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the lease a runner must hold to write an export job."""
+    op.add_column("export_job", sa.Column("lease_id", UUIDType(binary=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop ``export_job.lease_id``."""
+    op.drop_column("export_job", "lease_id")
@@ -0,0 +1,45 @@
+"""Add vehicle_day_dirty queue table.
+
+Revision ID: r1s2t3u4v5w6
+Revises: q0r1s2t3u4v5
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy_utils import UUIDType
+
+
+revision = "r1s2t3u4v5w6"
+down_revision = "q0r1s2t3u4v5"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(inspector: sa.Inspector, name: str) -> bool:
+    return name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    """Create the queue of vehicle-days waiting for a rollup rebuild."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _table_exists(inspector, "vehicle_day_dirty"):
+        op.create_table(
+            "vehicle_day_dirty",
+            sa.Column("vehicle_id", UUIDType(binary=True), primary_key=True),
+            sa.Column("day", sa.Date(), primary_key=True),
+            sa.Column("marked_at", sa.DateTime(), nullable=False),
+        )
+        op.create_index("ix_vehicle_day_dirty_marked_at", "vehicle_day_dirty", ["marked_at"])
+
+
+def downgrade() -> None:
+    """Drop the vehicle_day_dirty table."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "vehicle_day_dirty"):
+        op.drop_index("ix_vehicle_day_dirty_marked_at", table_name="vehicle_day_dirty")
+        op.drop_table("vehicle_day_dirty")
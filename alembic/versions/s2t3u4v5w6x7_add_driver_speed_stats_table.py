@@ -0,0 +1,53 @@
+"""Add driver_speed_stats totals table.
+
+Revision ID: s2t3u4v5w6x7
+Revises: r1s2t3u4v5w6
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy_utils import UUIDType
+
+
+revision = "s2t3u4v5w6x7"
+down_revision = "r1s2t3u4v5w6"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(inspector: sa.Inspector, name: str) -> bool:
+    return name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    """
+    Create the per-driver location and speeding totals. Rows are seeded on
+    a driver's first monitor read; scripts/backfill_speeding_events.py
+    fills them all.
+    """
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _table_exists(inspector, "driver_speed_stats"):
+        op.create_table(
+            "driver_speed_stats",
+            sa.Column(
+                "driverProfileId",
+                UUIDType(binary=True),
+                sa.ForeignKey("driver_profile.driverProfileId", ondelete="CASCADE"),
+                primary_key=True,
+            ),
+            sa.Column("location_count", sa.BigInteger(), nullable=False, server_default="0"),
+            sa.Column("speeding_count", sa.BigInteger(), nullable=False, server_default="0"),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+        )
+
+
+def downgrade() -> None:
+    """Drop the driver_speed_stats table."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _table_exists(inspector, "driver_speed_stats"):
+        op.drop_table("driver_speed_stats")
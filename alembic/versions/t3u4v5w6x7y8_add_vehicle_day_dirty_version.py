@@ -0,0 +1,28 @@
+"""Add version to vehicle_day_dirty.
+
+Revision ID: t3u4v5w6x7y8
+Revises: s2t3u4v5w6x7
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "t3u4v5w6x7y8"
+down_revision = "s2t3u4v5w6x7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Count the writes to a queued vehicle-day, so rebuilds keep newer marks."""
+    op.add_column(
+        "vehicle_day_dirty",
+        sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+    )
+
+
+def downgrade() -> None:
+    """Drop ``vehicle_day_dirty.version``."""
+    op.drop_column("vehicle_day_dirty", "version")
@@ -8,7 +8,7 @@ import logging
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
-from safedrive.database.db import get_db
+from safedrive.database.db import get_read_db
 from safedrive.models.trip import Trip
 from safedrive.models.location import Location
 from safedrive.models.raw_sensor_data import RawSensorData
@@ -138,7 +138,7 @@ def _paired_ttest(a: List[float], b: List[float]) -> Tuple[float, float]:
     return mean_diff, p
 
 
-def trip_metrics(trip_id: UUID, db: Session = Depends(get_db)):
+def trip_metrics(trip_id: UUID, db: Session = Depends(get_read_db)):
     distances = _trip_distances(db)
     behaviours = _trip_behaviour_counts(db)
     if trip_id not in distances:
@@ -159,7 +159,7 @@ def trip_metrics(trip_id: UUID, db: Session = Depends(get_db)):
 def driver_weekly_metrics(
     driver_id: UUID,
     week: str | None = Query(None, description="ISO week YYYY-WW"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     if week is None:
         today = date.today()
@@ -179,7 +179,7 @@ def driver_weekly_metrics(
     return {"driverProfileId": driver_id, "week": week, "ubpk": ubpk}
 
 
-def driver_improvement(driver_id: UUID, db: Session = Depends(get_db)):
+def driver_improvement(driver_id: UUID, db: Session = Depends(get_read_db)):
     today = date.today()
     this_week = f"{today.isocalendar()[0]}-{today.isocalendar()[1]:02d}"
     last_week_dt = today - timedelta(weeks=1)
@@ -205,7 +205,7 @@ def driver_improvement(driver_id: UUID, db: Session = Depends(get_db)):
 
 
 @router.get("/v2/trip/{trip_id}")
-def trip_metrics_v2(trip_id: UUID, db: Session = Depends(get_db)):
+def trip_metrics_v2(trip_id: UUID, db: Session = Depends(get_read_db)):
     distances = _trip_distances(db)
     behaviours = _trip_behaviour_counts(db)
     if trip_id not in distances:
@@ -238,7 +238,7 @@ def trip_metrics_v2(trip_id: UUID, db: Session = Depends(get_db)):
 def driver_weekly_metrics_v2(
     driver_id: UUID,
     week: str | None = Query(None, description="ISO week YYYY-WW"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     if week is None:
         today = date.today()
@@ -270,7 +270,7 @@ def driver_weekly_metrics_v2(
 def driver_improvement_v2(
     driver_id: UUID,
     week: str | None = Query(None, description="ISO week YYYY-WW"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     if week is None:
         today = date.today()
@@ -309,7 +309,7 @@ def driver_improvement_v2(
 
 
 @router.get("/trip/{trip_id}/ubpk", response_model=TripUBPKResponse)  # type: ignore
-def trip_ubpk(trip_id: UUID, db: Session = Depends(get_db)) -> TripUBPKResponse:
+def trip_ubpk(trip_id: UUID, db: Session = Depends(get_read_db)) -> TripUBPKResponse:
     events = unsafe_behaviour_crud.get_by_trip(db, trip_id)
     if not events:
         raise HTTPException(404, "No unsafe events for trip")
@@ -339,7 +339,7 @@ def trip_ubpk(trip_id: UUID, db: Session = Depends(get_db)) -> TripUBPKResponse:
 def driver_week_metrics(
     driver_id: UUID,
     week: Optional[str] = Query(None, regex=r"^\d{4}-W\d{2}$"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 )->DriverWeekUBPKResponse:
     if week is None:
         today = date.today()
@@ -380,7 +380,7 @@ def driver_week_metrics(
 def driver_improvement_endpoint(
     driver_id: UUID,
     week: Optional[str] = Query(None, regex=r"^\d{4}-W\d{2}$"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> DriverImprovementResponse:
     if week is None:
         today = date.today()
@@ -410,7 +410,7 @@ def driver_improvement_endpoint(
 @router.get("/trips", response_model=List[TripUBPKResponse])  # type: ignore
 def trips_weekly(
     week: Optional[str] = Query(None, regex=r"^\d{4}-W\d{2}$"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
  ) -> List[TripUBPKResponse]:
     # 1) Log input
     logger.info(f"[trips_weekly] called with week={week!r}")
@@ -12,6 +12,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from alembic.config import Config
 from alembic import command
 from safedrive.core.security import Role, require_roles
+from safedrive.core.etag import ContentETagMiddleware, NotModified, not_modified_handler
+from safedrive.database.query_log import QueryStatsMiddleware
+from safedrive.database.async_db import configure_threadpool
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -55,6 +58,10 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
+# Conditional GET: 304 short-circuit for version-based ETags
+app.add_exception_handler(NotModified, not_modified_handler)
+
+
 # Example usage of environment variables
 DATABASE_URL = os.getenv("DATABASE_URL")
 SECRET_KEY = os.getenv("SECRET_KEY")
@@ -87,6 +94,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Content-hash ETags for conditional endpoints without shared table versions
+app.add_middleware(ContentETagMiddleware)
+
+# Request ids, per-request query totals and slow request logging
+app.add_middleware(QueryStatsMiddleware)
+
 # Include API router
 app.include_router(api_router)
 app.include_router(
@@ -103,6 +116,13 @@ app.include_router(
     ],
 )
 
+
+@app.on_event("startup")
+async def size_threadpool():
+    # Sync endpoints and dependencies share this pool (THREADPOOL_SIZE).
+    configure_threadpool()
+
+
 # Alembic configuration file path
 ALEMBIC_CONFIG_PATH = "./alembic.ini"
 
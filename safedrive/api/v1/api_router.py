@@ -24,6 +24,7 @@ from safedrive.api.v1.endpoints.behaviour_metrics import router as behaviour_met
 from safedrive.api.v1.endpoints.fleet_monitoring import router as fleet_monitoring_router
 from safedrive.api.v1.endpoints.fleet_management import router as fleet_management_router
 from safedrive.api.v1.endpoints.researcher import router as researcher_router
+from safedrive.api.v1.endpoints.export_jobs import router as export_jobs_router
 from safedrive.api.v1.endpoints.road import router as road_router
 from safedrive.api.v1.endpoints.insurance_partner import router as insurance_partner_router
 from safedrive.api.v1.endpoints.admin import router as admin_router
@@ -34,6 +35,7 @@ from safedrive.api.v1.endpoints.driver_auth import router as driver_auth_router
 from safedrive.api.v1.endpoints.vehicles import router as vehicles_router
 from safedrive.api.v1.endpoints.user_management import router as user_management_router
 from safedrive.api.v1.endpoints.fleet_driver import router as fleet_driver_router
+from safedrive.api.v1.endpoints.alerts import router as alerts_router
 from safedrive.core.security import (
     Role,
     get_current_client,
@@ -195,6 +197,14 @@ safe_drive_africa_api_router.include_router(
     tags=["Researcher"],
     dependencies=[Depends(require_roles(Role.ADMIN, Role.RESEARCHER))],
 )
+safe_drive_africa_api_router.include_router(
+    export_jobs_router,
+    prefix="/api",
+    tags=["Export Jobs"],
+    dependencies=[
+        Depends(require_roles(Role.ADMIN, Role.RESEARCHER, Role.INSURANCE_PARTNER))
+    ],
+)
 safe_drive_africa_api_router.include_router(
     road_router,
     prefix="/api",
@@ -207,6 +217,12 @@ safe_drive_africa_api_router.include_router(
     tags=["Insurance Partner"],
     dependencies=[Depends(require_roles(Role.ADMIN, Role.INSURANCE_PARTNER))],
 )
+# Authenticated per route: the WebSocket route cannot use HTTP dependencies.
+safe_drive_africa_api_router.include_router(
+    alerts_router,
+    prefix="/api",
+    tags=["Alerts"],
+)
 safe_drive_africa_api_router.include_router(
     admin_router,
     prefix="/api",
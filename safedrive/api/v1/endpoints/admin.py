@@ -5,9 +5,11 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
+from safedrive.core.etag import conditional_get
 from safedrive.core.security import (
     DATASET_ACCESS_SETTING_KEY,
     DEFAULT_DATASET_ACCESS,
+    auth_context_cache,
     hash_api_key,
 )
 from safedrive.database.db import get_db
@@ -15,7 +17,7 @@ from safedrive.models.admin_setting import AdminSetting
 from safedrive.models.auth import ApiClient
 from safedrive.models.driver_profile import DriverProfile
 from safedrive.models.insurance_partner import InsurancePartner, InsurancePartnerDriver
-from safedrive.schemas.admin import CloudEndpointConfig, DatasetAccessConfig
+from safedrive.schemas.admin import AuthCacheStats, CloudEndpointConfig, DatasetAccessConfig
 from safedrive.schemas.auth import (
     ApiClientCreate,
     ApiClientCreated,
@@ -196,7 +198,11 @@ def remove_driver_from_partner(
     db.commit()
 
 
-@router.get("/admin/cloud-endpoints", response_model=CloudEndpointConfig)
+@router.get(
+    "/admin/cloud-endpoints",
+    response_model=CloudEndpointConfig,
+    dependencies=[Depends(conditional_get(AdminSetting, per_client=False))],
+)
 def get_cloud_endpoints(db: Session = Depends(get_db)) -> CloudEndpointConfig:
     setting = _get_setting(db, CLOUD_ENDPOINTS_SETTING_KEY)
     payload = _coerce_dict(setting.value) if setting else {}
@@ -216,7 +222,11 @@ def update_cloud_endpoints(
     return CloudEndpointConfig(**current)
 
 
-@router.get("/admin/dataset-access", response_model=DatasetAccessConfig)
+@router.get(
+    "/admin/dataset-access",
+    response_model=DatasetAccessConfig,
+    dependencies=[Depends(conditional_get(AdminSetting, per_client=False))],
+)
 def get_dataset_access(db: Session = Depends(get_db)) -> DatasetAccessConfig:
     setting = _get_setting(db, DATASET_ACCESS_SETTING_KEY)
     payload = _coerce_dict(setting.value) if setting else {}
@@ -234,3 +244,13 @@ def update_dataset_access(
     value = payload.model_dump()
     _upsert_setting(db, DATASET_ACCESS_SETTING_KEY, value)
     return payload
+
+
+@router.get("/admin/auth-cache", response_model=AuthCacheStats)
+def get_auth_cache_stats() -> AuthCacheStats:
+    return AuthCacheStats(**auth_context_cache.stats())
+
+
+@router.delete("/admin/auth-cache", status_code=status.HTTP_204_NO_CONTENT)
+def flush_auth_cache() -> None:
+    auth_context_cache.invalidate_all()
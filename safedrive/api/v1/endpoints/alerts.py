@@ -0,0 +1,173 @@
+import json
+from typing import Optional
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from safedrive.core.alert_stream import (
+    ALERT_STREAM_KEEPALIVE_SECONDS,
+    AlertFilter,
+    AlertStreamOverflow,
+    AlertSubscription,
+    alert_broker,
+)
+from safedrive.core.security import (
+    ApiClientContext,
+    Role,
+    ensure_dataset_access,
+    require_roles,
+    resolve_api_key,
+)
+from safedrive.database.db import get_db
+
+router = APIRouter()
+
+STREAM_ROLES = (Role.ADMIN, Role.FLEET_MANAGER, Role.INSURANCE_PARTNER)
+# Sent to SSE clients as the reconnect delay, in milliseconds.
+SSE_RETRY_MS = 3000
+# WebSocket close code for "try again later" (RFC 6455 registry).
+WS_TRY_AGAIN_LATER = 1013
+
+
+# The endpoints are async; authorization does blocking database and Redis
+# I/O, so it lives in these sync dependencies, which FastAPI runs in its
+# thread pool instead of on the event loop.
+
+
+def _authorize_stream(db: Session, client: ApiClientContext) -> None:
+    dataset = (
+        "insurance_alerts" if client.role == Role.INSURANCE_PARTNER else "fleet_monitoring"
+    )
+    ensure_dataset_access(db, client, dataset)
+    # Streams stay open for minutes; don't hold a pooled connection meanwhile.
+    db.close()
+
+
+def _stream_client(
+    db: Session = Depends(get_db),
+    current_client: ApiClientContext = Depends(require_roles(*STREAM_ROLES)),
+) -> ApiClientContext:
+    _authorize_stream(db, current_client)
+    return current_client
+
+
+def _websocket_client(
+    websocket: WebSocket, db: Session = Depends(get_db)
+) -> Optional[ApiClientContext]:
+    """The authorized client of a WebSocket handshake, or None to reject it."""
+    api_key = websocket.headers.get("x-api-key")
+    current_client = resolve_api_key(db, api_key) if api_key else None
+    if current_client is None or current_client.role not in STREAM_ROLES:
+        return None
+    try:
+        _authorize_stream(db, current_client)
+    except HTTPException:
+        return None
+    return current_client
+
+
+def _alert_filter(client: ApiClientContext, min_severity: float) -> AlertFilter:
+    if client.role == Role.ADMIN:
+        return AlertFilter(driver_ids=None, min_severity=min_severity)
+    driver_ids = frozenset(str(driver_id) for driver_id in client.allowed_driver_ids or ())
+    return AlertFilter(driver_ids=driver_ids, min_severity=min_severity)
+
+
+def _parse_event_id(value: Optional[str]) -> Optional[int]:
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid Last-Event-ID.")
+
+
+def _sse_frame(alert: dict) -> bytes:
+    return (
+        f"id: {alert['id']}\nevent: {alert['alert_type']}\ndata: {json.dumps(alert)}\n\n"
+    ).encode("utf-8")
+
+
+async def sse_alert_events(subscription: AlertSubscription, keepalive: float):
+    """SSE frames for ``subscription`` until the client leaves or overflows."""
+    try:
+        yield f"retry: {SSE_RETRY_MS}\n\n".encode("ascii")
+        while True:
+            try:
+                alert = await subscription.next_alert(keepalive)
+            except AlertStreamOverflow:
+                # Closing makes the client reconnect with Last-Event-ID.
+                return
+            if alert is None:
+                yield b": keepalive\n\n"
+                continue
+            yield _sse_frame(alert)
+    finally:
+        alert_broker.unsubscribe(subscription)
+
+
+@router.get("/alerts/stream")
+async def stream_alerts(
+    min_severity: float = Query(0.8, alias="minSeverity"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    current_client: ApiClientContext = Depends(_stream_client),
+):
+    """
+    Server-Sent Events stream of unsafe behaviour and speeding alerts for
+    the caller's drivers, as they are ingested.
+    """
+    subscription = alert_broker.subscribe(
+        _alert_filter(current_client, min_severity), _parse_event_id(last_event_id)
+    )
+    return StreamingResponse(
+        sse_alert_events(subscription, ALERT_STREAM_KEEPALIVE_SECONDS),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/alerts/ws")
+async def alerts_websocket(
+    websocket: WebSocket,
+    min_severity: float = Query(0.8, alias="minSeverity"),
+    last_event_id: Optional[str] = Query(None, alias="lastEventId"),
+    current_client: Optional[ApiClientContext] = Depends(_websocket_client),
+):
+    """WebSocket variant of ``/alerts/stream``; alerts are sent as JSON text."""
+    try:
+        if current_client is None:
+            raise HTTPException(status_code=403)
+        resume_after = _parse_event_id(last_event_id)
+    except HTTPException:
+        await websocket.close(code=1008)
+        return
+
+    # Subscribe before accepting so nothing published after the handshake is missed.
+    subscription = alert_broker.subscribe(
+        _alert_filter(current_client, min_severity), resume_after
+    )
+    try:
+        await websocket.accept()
+        while True:
+            try:
+                alert = await subscription.next_alert(ALERT_STREAM_KEEPALIVE_SECONDS)
+            except AlertStreamOverflow:
+                await websocket.close(code=WS_TRY_AGAIN_LATER)
+                return
+            if alert is None:
+                await websocket.send_json({"alert_type": "keepalive"})
+                continue
+            await websocket.send_json(alert)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        alert_broker.unsubscribe(subscription)
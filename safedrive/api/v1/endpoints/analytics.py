@@ -4,9 +4,10 @@ from typing import Dict, Iterable, List, Optional, Set, Tuple
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func
+from sqlalchemy import and_, func
 from sqlalchemy.orm import Session
 
+from safedrive.core.partitions import recorded_since
 from safedrive.core.security import (
     ApiClientContext,
     Role,
@@ -14,7 +15,7 @@ from safedrive.core.security import (
     require_roles,
     require_roles_or_jwt,
 )
-from safedrive.database.db import get_db
+from safedrive.database.db import get_read_db
 from safedrive.models.fleet import OldDriverFleetAssignment
 from safedrive.models.insurance_partner import InsurancePartnerDriver
 from safedrive.models.location import Location
@@ -154,7 +155,14 @@ def _period_end(value: datetime, period: str) -> datetime:
     raise ValueError("Unsupported period")
 
 
-def _trip_stats(db: Session, trip_ids: Iterable[UUID]) -> Tuple[Dict[UUID, float], Dict[UUID, int]]:
+def _trip_stats(
+    db: Session, trip_ids: Iterable[UUID], since: Optional[datetime] = None
+) -> Tuple[Dict[UUID, float], Dict[UUID, int]]:
+    """
+    Distance and unsafe behaviour count per trip. ``since`` (the earliest
+    trip start) bounds the sensor and location timestamps so MySQL can skip
+    older partitions.
+    """
     trip_ids = list(trip_ids)
     if not trip_ids:
         return {}, {}
@@ -163,8 +171,20 @@ def _trip_stats(db: Session, trip_ids: Iterable[UUID]) -> Tuple[Dict[UUID, float
             Trip.id,
             func.coalesce(func.sum(Location.distance), 0.0),
         )
-        .outerjoin(RawSensorData, RawSensorData.trip_id == Trip.id)
-        .outerjoin(Location, Location.id == RawSensorData.location_id)
+        .outerjoin(
+            RawSensorData,
+            and_(
+                RawSensorData.trip_id == Trip.id,
+                *recorded_since(RawSensorData.timestamp, since),
+            ),
+        )
+        .outerjoin(
+            Location,
+            and_(
+                Location.id == RawSensorData.location_id,
+                *recorded_since(Location.timestamp, since),
+            ),
+        )
         .filter(Trip.id.in_(trip_ids))
         .group_by(Trip.id)
         .all()
@@ -313,6 +333,33 @@ def _bad_days_summary(
     return per_driver, threshold
 
 
+def _leaderboard_entries(
+    db: Session,
+    current_client: ApiClientContext,
+    fleet_id: Optional[UUID],
+    insurance_partner_id: Optional[UUID],
+    start_dt: Optional[datetime],
+    end_dt: Optional[datetime],
+    window_days: int,
+) -> List[LeaderboardEntry]:
+    cohort_ids, _ = _resolve_cohort(
+        db, current_client, fleet_id, insurance_partner_id, require_scope=False
+    )
+    cohort_ids = cohort_ids or set()
+
+    # Optimize: Only fetch trips within the required window (+ buffer for date ranges)
+    cutoff_date = (start_dt or datetime.utcnow()) - timedelta(days=window_days + 30)
+    
+    trips_query = db.query(Trip).filter(Trip.start_time >= cutoff_date)
+    if cohort_ids:
+        trips_query = trips_query.filter(Trip.driverProfileId.in_(cohort_ids))
+    trips = _filter_trips_by_window(trips_query.all(), start_dt, end_dt)
+    trip_ids = [trip.id for trip in trips]
+    distances, unsafe_counts = _trip_stats(db, trip_ids, since=start_dt)
+    driver_stats = _aggregate_driver_window(trips, distances, unsafe_counts)
+    return _build_leaderboard_entries(driver_stats)
+
+
 @router.get("/analytics/leaderboard", response_model=LeaderboardResponse)
 def leaderboard(
     period: str = Query("week"),
@@ -321,7 +368,7 @@ def leaderboard(
     limit: int = Query(5, ge=1, le=50),
     fleet_id: Optional[UUID] = Query(None, alias="fleetId"),
     insurance_partner_id: Optional[UUID] = Query(None, alias="insurancePartnerId"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_client: ApiClientContext = Depends(
         require_roles_or_jwt(
             Role.ADMIN,
@@ -336,25 +383,17 @@ def leaderboard(
     if period not in SUPPORTED_PERIODS:
         raise HTTPException(status_code=400, detail="Invalid period value.")
 
-    cohort_ids, _ = _resolve_cohort(
-        db, current_client, fleet_id, insurance_partner_id, require_scope=False
-    )
-    cohort_ids = cohort_ids or set()
-
     window_days = LEADERBOARD_WINDOWS[period]
     start_dt, end_dt = _resolve_window(start_date, end_date, window_days)
-
-    # Optimize: Only fetch trips within the required window (+ buffer for date ranges)
-    cutoff_date = (start_dt or datetime.utcnow()) - timedelta(days=window_days + 30)
-    
-    trips_query = db.query(Trip).filter(Trip.start_time >= cutoff_date)
-    if cohort_ids:
-        trips_query = trips_query.filter(Trip.driverProfileId.in_(cohort_ids))
-    trips = _filter_trips_by_window(trips_query.all(), start_dt, end_dt)
-    trip_ids = [trip.id for trip in trips]
-    distances, unsafe_counts = _trip_stats(db, trip_ids)
-    driver_stats = _aggregate_driver_window(trips, distances, unsafe_counts)
-    entries = _build_leaderboard_entries(driver_stats)
+    entries = _leaderboard_entries(
+        db,
+        current_client,
+        fleet_id,
+        insurance_partner_id,
+        start_dt,
+        end_dt,
+        window_days,
+    )
 
     return LeaderboardResponse(
         period=period,
@@ -372,7 +411,7 @@ def driver_ubpk_series(
     start_date: Optional[datetime] = Query(None, alias="startDate"),
     end_date: Optional[datetime] = Query(None, alias="endDate"),
     driver_profile_id: Optional[UUID] = Query(None, alias="driverProfileId"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_client: ApiClientContext = Depends(
         require_roles_or_jwt(
             Role.ADMIN,
@@ -409,7 +448,7 @@ def driver_ubpk_series(
         .all()
     )
     trips = _filter_trips_by_window(trips, start_dt, end_dt)
-    distances, unsafe_counts = _trip_stats(db, [trip.id for trip in trips])
+    distances, unsafe_counts = _trip_stats(db, [trip.id for trip in trips], since=start_dt)
     series_by_driver = _period_series_by_driver(trips, distances, unsafe_counts, period)
     buckets = series_by_driver.get(driver_id, {})
     series: List[DriverPeriodUBPK] = []
@@ -442,7 +481,7 @@ def bad_days(
     insurance_partner_id: Optional[UUID] = Query(None, alias="insurancePartnerId"),
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(25, ge=10, le=100, description="Drivers per page"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_client: ApiClientContext = Depends(
         require_roles_or_jwt(
             Role.ADMIN,
@@ -487,7 +526,15 @@ def bad_days(
             RawSensorData.trip_id,
             func.coalesce(func.sum(Location.distance), 0).label("total_distance")
         )
-        .outerjoin(Location, Location.id == RawSensorData.location_id)
+        .outerjoin(
+            Location,
+            and_(
+                Location.id == RawSensorData.location_id,
+                *recorded_since(Location.timestamp, cutoff_date),
+            ),
+        )
+        # Only trips since the cutoff are read; skip older partitions.
+        .filter(*recorded_since(RawSensorData.timestamp, cutoff_date))
         .group_by(RawSensorData.trip_id)
         .subquery()
     )
@@ -621,7 +668,7 @@ def driver_kpis(
     end_date: Optional[datetime] = Query(None, alias="endDate"),
     fleet_id: Optional[UUID] = Query(None, alias="fleetId"),
     insurance_partner_id: Optional[UUID] = Query(None, alias="insurancePartnerId"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_client: ApiClientContext = Depends(
         require_roles_or_jwt(
             Role.ADMIN,
@@ -651,7 +698,7 @@ def driver_kpis(
     if cohort_ids:
         trips_query = trips_query.filter(Trip.driverProfileId.in_(cohort_ids))
     trips = _filter_trips_by_window(trips_query.all(), start_dt, end_dt)
-    distances, unsafe_counts = _trip_stats(db, [trip.id for trip in trips])
+    distances, unsafe_counts = _trip_stats(db, [trip.id for trip in trips], since=start_dt)
     driver_stats = _aggregate_driver_window(trips, distances, unsafe_counts)
 
     day_summary, _ = _bad_days_summary(
@@ -6,7 +6,7 @@ from uuid import UUID
 from typing import List, Dict, Tuple, Optional
 from scipy.stats import ttest_ind
 
-from safedrive.database.db import get_db
+from safedrive.database.db import get_read_db
 from safedrive.core.security import (
     ApiClientContext,
     Role,
@@ -69,7 +69,7 @@ def _filter_trip_distances(
 
 @router.get("/behaviour_metrics/ubpk", response_model=List[DriverUBPK])
 def ubpk_per_driver(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_client: ApiClientContext = Depends(
         require_roles(
             Role.ADMIN,
@@ -106,7 +106,7 @@ def ubpk_per_driver(
 
 @router.get("/behaviour_metrics/trip", response_model=List[TripUBPK])
 def ubpk_per_trip(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_client: ApiClientContext = Depends(
         require_roles(
             Role.ADMIN,
@@ -139,7 +139,7 @@ def ubpk_per_trip(
 
 @router.get("/behaviour_metrics/weekly", response_model=List[WeeklyDriverUBPK])
 def ubpk_per_week(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_client: ApiClientContext = Depends(
         require_roles(
             Role.ADMIN,
@@ -184,7 +184,7 @@ def ubpk_per_week(
 
 @router.get("/behaviour_metrics/improvement", response_model=List[ImprovementSummary])
 def drivers_improvement(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_client: ApiClientContext = Depends(
         require_roles(
             Role.ADMIN,
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
+from safedrive.core.etag import conditional_get
 from safedrive.database.db import get_db
 from safedrive.models.admin_setting import AdminSetting
 from safedrive.schemas.admin import CloudEndpointConfig
@@ -14,7 +15,11 @@ def _coerce_dict(value) -> dict:
     return value if isinstance(value, dict) else {}
 
 
-@router.get("/config/cloud-endpoints", response_model=CloudEndpointConfig)
+@router.get(
+    "/config/cloud-endpoints",
+    response_model=CloudEndpointConfig,
+    dependencies=[Depends(conditional_get(AdminSetting, per_client=False))],
+)
 def get_cloud_endpoints(db: Session = Depends(get_db)) -> CloudEndpointConfig:
     setting = (
         db.query(AdminSetting)
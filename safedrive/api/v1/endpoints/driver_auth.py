@@ -3,13 +3,25 @@
 import logging
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
 from safedrive.database.db import get_db
 from safedrive.models.driver_profile import DriverProfile
 from safedrive.schemas.auth import DriverRegister, DriverLogin, TokenResponse
 from safedrive.schemas.driver_profile import DriverProfileResponse
-from safedrive.core.jwt_auth import hash_password, verify_password, create_access_token, get_current_driver
+from safedrive.core.jwt_auth import (
+    create_access_token,
+    decode_driver_token,
+    get_current_driver,
+    security,
+    token_revocations,
+)
+from safedrive.core.passwords import (
+    hash_password,
+    login_throttle,
+    verify_and_update_password,
+)
 from safedrive.crud import fleet_driver as crud_fleet
 
 logger = logging.getLogger(__name__)
@@ -118,21 +130,31 @@ def login_driver(
     Login an existing driver from the mobile app.
     Returns a JWT token with fleet status information.
     """
+    login_throttle.check(credentials.email)
+
     # Find driver by email
     driver = db.query(DriverProfile).filter(DriverProfile.email == credentials.email).first()
     
     if not driver or not driver.password_hash:
+        login_throttle.record_failure(credentials.email)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
         )
     
-    # Verify password
-    if not verify_password(credentials.password, driver.password_hash):
+    # Verify password; hashes made with an outdated bcrypt cost are replaced
+    valid, new_hash = verify_and_update_password(credentials.password, driver.password_hash)
+    if not valid:
+        login_throttle.record_failure(credentials.email)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
         )
+    login_throttle.reset(credentials.email)
+    if new_hash:
+        driver.password_hash = new_hash
+        db.commit()
+        logger.info(f"Rehashed password for driver {driver.driverProfileId}")
     
     logger.info(f"Driver logged in: {driver.email} ({driver.driverProfileId})")
     
@@ -213,3 +235,16 @@ def get_current_driver_profile(
         email=driver.email,
         sync=driver.sync
     )
+
+
+@router.post("/driver/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout_driver(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> None:
+    """
+    Revoke the presented JWT token.
+    Other tokens issued to the same driver stay valid.
+    """
+    payload = decode_driver_token(credentials.credentials)
+    token_revocations.revoke_token(payload.get("jti"), float(payload["exp"]))
+    logger.info(f"Driver logged out: {payload['sub']}")
@@ -6,6 +6,7 @@ from uuid import UUID
 from safedrive.database.db import get_db
 from safedrive.models.driver_profile import DriverProfile
 from safedrive.models.raw_sensor_data import RawSensorData
+from safedrive.core.jwt_auth import token_revocations
 from safedrive.core.security import (
     ApiClientContext,
     Role,
@@ -102,6 +103,8 @@ def batch_delete_driver_profiles(
 ):
     """Delete multiple driver profiles at once."""
     deleted = driver_profile_crud.batch_delete(db=db, ids=ids)
+    for driver_id in ids:
+        token_revocations.revoke_driver(driver_id)
     logger.info("Batch deleted %s DriverProfile records.", deleted)
 
 @router.get("/driver_profiles/{profile_id}", response_model=DriverProfileResponse)
@@ -268,6 +271,7 @@ def delete_driver_profile(
         logger.warning(f"DriverProfile with ID {profile_id} not found for deletion.")
         raise HTTPException(status_code=404, detail="Driver profile not found")
     deleted_profile = driver_profile_crud.delete(db=db, id=profile_id)
+    token_revocations.revoke_driver(profile_id)
     logger.info(f"Deleted DriverProfile with ID: {profile_id}")
     return DriverProfileResponse(driverProfileId=deleted_profile.id_uuid, email=deleted_profile.email, sync=deleted_profile.sync)
 
@@ -291,6 +295,7 @@ def delete_driver_profile_by_email(
     deleted_profile = driver_profile_crud.delete_by_email_cascade(db, email)
     if not deleted_profile:
         raise HTTPException(status_code=404, detail="Driver profile not found")
+    token_revocations.revoke_driver(deleted_profile.driverProfileId)
 
     # Convert the (already deleted) SQLAlchemy object to a response schema.
     return DriverProfileResponse.model_validate(deleted_profile)
@@ -10,6 +10,8 @@ from safedrive.core.security import (
     ensure_driver_access,
     require_roles_or_jwt,
 )
+from safedrive.core.etag import conditional_get
+from safedrive.models.driving_tip import DrivingTip
 from safedrive.schemas.driving_tip_sch import DrivingTipCreate, DrivingTipUpdate, DrivingTipResponse
 from safedrive.crud.driving_tip import driving_tip_crud
 import logging
@@ -39,7 +41,11 @@ def create_driving_tip(
         logger.error(f"Unexpected error while creating DrivingTip: {str(e)}")
         raise HTTPException(status_code=500, detail="Error creating driving tip")
 
-@router.get("/driving_tips/{tip_id}", response_model=DrivingTipResponse)
+@router.get(
+    "/driving_tips/{tip_id}",
+    response_model=DrivingTipResponse,
+    dependencies=[Depends(conditional_get(DrivingTip))],
+)
 def get_driving_tip(
     tip_id: UUID,
     db: Session = Depends(get_db),
@@ -75,7 +81,11 @@ def get_driving_tip(
         logger.error(f"Error retrieving DrivingTip: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/driving_tips/", response_model=List[DrivingTipResponse])
+@router.get(
+    "/driving_tips/",
+    response_model=List[DrivingTipResponse],
+    dependencies=[Depends(conditional_get(DrivingTip))],
+)
 def get_all_driving_tips(
     skip: int = 0,
     limit: int = 20,
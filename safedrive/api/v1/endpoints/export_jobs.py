@@ -0,0 +1,93 @@
+import os
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+
+from safedrive.core.export_jobs import artifact_filename, job_manifest
+from safedrive.core.security import (
+    ApiClientContext,
+    Role,
+    ensure_dataset_access,
+    require_roles,
+)
+from safedrive.database.db import get_db
+from safedrive.models.export_job import ExportJob
+from safedrive.schemas.export_job import ExportJobResponse
+
+router = APIRouter()
+
+
+def _get_job(db: Session, job_id: UUID, current_client: ApiClientContext) -> ExportJob:
+    job = db.get(ExportJob, job_id)
+    # Jobs are private to the client that created them.
+    if job is None or (
+        current_client.role != Role.ADMIN and job.api_client_id != current_client.id
+    ):
+        raise HTTPException(status_code=404, detail="Export job not found")
+    ensure_dataset_access(db, current_client, job.dataset)
+    return job
+
+
+def _completed_artifact(job: ExportJob) -> str:
+    if job.status in ("pending", "running"):
+        raise HTTPException(status_code=409, detail="Export job has not finished yet")
+    if job.status == "failed":
+        raise HTTPException(status_code=409, detail="Export job failed")
+    expired = job.status == "expired" or (
+        job.expires_at is not None and job.expires_at <= datetime.utcnow()
+    )
+    if expired or not job.artifact_path or not os.path.exists(job.artifact_path):
+        raise HTTPException(status_code=410, detail="Export artifact has expired")
+    return job.artifact_path
+
+
+@router.get("/exports/{job_id}", response_model=ExportJobResponse)
+def get_export_job(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_client: ApiClientContext = Depends(
+        require_roles(Role.ADMIN, Role.RESEARCHER, Role.INSURANCE_PARTNER)
+    ),
+) -> ExportJobResponse:
+    return ExportJobResponse.model_validate(_get_job(db, job_id, current_client))
+
+
+@router.get("/exports/{job_id}/manifest")
+def get_export_manifest(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_client: ApiClientContext = Depends(
+        require_roles(Role.ADMIN, Role.RESEARCHER, Role.INSURANCE_PARTNER)
+    ),
+) -> dict:
+    job = _get_job(db, job_id, current_client)
+    _completed_artifact(job)
+    manifest = job_manifest(job)
+    if manifest is None:
+        raise HTTPException(status_code=410, detail="Export artifact has expired")
+    return manifest
+
+
+@router.get("/exports/{job_id}/download")
+def download_export(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_client: ApiClientContext = Depends(
+        require_roles(Role.ADMIN, Role.RESEARCHER, Role.INSURANCE_PARTNER)
+    ),
+):
+    """
+    Serve a finished artifact. ``Range`` and ``If-Range`` are honoured, so an
+    interrupted download can continue where it stopped.
+    """
+    job = _get_job(db, job_id, current_client)
+    path = _completed_artifact(job)
+    return FileResponse(
+        path,
+        media_type="application/gzip",
+        filename=artifact_filename(job),
+        headers={"X-Checksum-SHA256": job.checksum or ""},
+    )
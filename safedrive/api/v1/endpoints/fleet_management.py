@@ -1,4 +1,3 @@
-from datetime import datetime
 import io
 import json
 from typing import List, Optional
@@ -8,6 +7,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from safedrive.core.driver_reports import build_driver_report
+from safedrive.core.etag import conditional_get
 from safedrive.core.security import (
     ApiClientContext,
     Role,
@@ -518,6 +519,18 @@ def get_trip_context(
     "/fleet/reports/{driver_id}",
     response_model=fleet_schemas.FleetReportResponse,
     status_code=status.HTTP_200_OK,
+    dependencies=[
+        Depends(
+            conditional_get(
+                Trip,
+                Location,
+                RawSensorData,
+                UnsafeBehaviour,
+                AlcoholQuestionnaire,
+                OldDriverFleetAssignment,
+            )
+        )
+    ],
 )
 def get_driver_report(
     driver_id: UUID,
@@ -529,7 +542,7 @@ def get_driver_report(
     ensure_dataset_access(db, current_client, "fleet_reports")
     ensure_driver_access(current_client, driver_id)
     _ensure_driver_exists(db, driver_id)
-    return _build_driver_report(db, driver_id)
+    return build_driver_report(db, driver_id)
 
 
 @router.get(
@@ -546,7 +559,7 @@ def download_driver_report(
     ensure_dataset_access(db, current_client, "fleet_reports")
     ensure_driver_access(current_client, driver_id)
     _ensure_driver_exists(db, driver_id)
-    report_data = _build_driver_report(db, driver_id)
+    report_data = build_driver_report(db, driver_id)
     payload = json.dumps(report_data, default=str).encode("utf-8")
     buffer = io.BytesIO(payload)
     headers = {
@@ -557,116 +570,3 @@ def download_driver_report(
         media_type="application/json",
         headers=headers,
     )
-
-
-def _trip_locations(db: Session, trip_id: UUID) -> List[Location]:
-    return (
-        db.query(Location)
-        .join(RawSensorData, RawSensorData.location_id == Location.id)
-        .filter(RawSensorData.trip_id == trip_id)
-        .all()
-    )
-
-
-def _build_trip_summary(trip: Trip, db: Session) -> dict:
-    locations = _trip_locations(db, trip.id)
-    distance = sum((loc.distance or 0) for loc in locations)
-    speeding_events = sum(
-        1 for loc in locations if loc.speedLimit and loc.speed and loc.speed > loc.speedLimit
-    )
-    behaviours = (
-        db.query(UnsafeBehaviour)
-        .filter(UnsafeBehaviour.trip_id == trip.id)
-        .all()
-    )
-    unsafe_count = len(behaviours)
-    avg_severity = float(
-        sum((beh.severity for beh in behaviours)) / unsafe_count
-        if unsafe_count
-        else 0.0
-    )
-
-    return {
-        "trip_id": trip.id,
-        "start_time": trip.start_time and datetime.fromtimestamp(trip.start_time / 1000),
-        "end_time": trip.end_time and datetime.fromtimestamp(trip.end_time / 1000),
-        "influence": trip.influence,
-        "distance_km": distance / 1000.0,
-        "unsafe_count": unsafe_count,
-        "avg_severity": avg_severity,
-        "speeding_events": speeding_events,
-    }
-
-
-def _build_driver_report(db: Session, driver_id: UUID) -> dict:
-    trips = (
-        db.query(Trip)
-        .filter(Trip.driverProfileId == driver_id)
-        .order_by(Trip.start_time.desc())
-        .all()
-    )
-
-    trip_summaries = [_build_trip_summary(trip, db) for trip in trips]
-
-    unsafe_logs = (
-        db.query(UnsafeBehaviour)
-        .filter(UnsafeBehaviour.driverProfileId == driver_id)
-        .order_by(UnsafeBehaviour.timestamp.desc())
-        .limit(100)
-        .all()
-    )
-
-    locations = (
-        db.query(Location)
-        .join(RawSensorData, RawSensorData.location_id == Location.id)
-        .join(Trip, RawSensorData.trip_id == Trip.id)
-        .filter(Trip.driverProfileId == driver_id)
-        .all()
-    )
-
-    total_locations = len(locations)
-    speeding_events = sum(
-        1 for loc in locations if loc.speedLimit and loc.speed and loc.speed > loc.speedLimit
-    )
-
-    questionnaires = (
-        db.query(AlcoholQuestionnaire)
-        .filter(AlcoholQuestionnaire.driverProfileId == driver_id)
-        .order_by(AlcoholQuestionnaire.date.desc())
-        .all()
-    )
-
-    return {
-        "driverProfileId": driver_id,
-        "report_generated_at": datetime.utcnow(),
-        "trips": trip_summaries,
-        "unsafe_behaviour_logs": [
-            {
-                "id": log.id,
-                "trip_id": log.trip_id,
-                "behaviour_type": log.behaviour_type,
-                "severity": log.severity,
-                "timestamp": log.timestamp,
-            }
-            for log in unsafe_logs
-        ],
-        "alcohol_responses": [
-            {
-                "id": response.id,
-                "drankAlcohol": response.drankAlcohol,
-                "plansToDrive": response.plansToDrive,
-                "impairmentLevel": response.impairmentLevel,
-                "date": response.date,
-            }
-            for response in questionnaires
-        ],
-        "speed_compliance": {
-            "total_records": total_locations,
-            "speeding_events": speeding_events,
-            "compliance_ratio": (
-                (total_locations - speeding_events) / total_locations
-                if total_locations
-                else 1.0
-            ),
-        },
-    }
@@ -1,9 +1,20 @@
-from datetime import datetime, timedelta
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+import anyio
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from safedrive.core.driver_monitor import driver_monitor_counters
+from safedrive.core.pagination import (
+    FEED_MAX_PAGE_SIZE,
+    FEED_PAGE_SIZE,
+    before_keyset,
+    decode_keyset_cursor,
+    encode_keyset_cursor,
+)
 from safedrive.core.security import (
     ApiClientContext,
     Role,
@@ -11,80 +22,87 @@ from safedrive.core.security import (
     ensure_driver_access,
     require_roles,
 )
+from safedrive.database.async_db import get_async_db
 from safedrive.database.db import get_db
 from safedrive.models.driver_profile import DriverProfile
-from safedrive.models.location import Location
-from safedrive.models.raw_sensor_data import RawSensorData
 from safedrive.models.trip import Trip
 from safedrive.models.unsafe_behaviour import UnsafeBehaviour
 
 router = APIRouter()
 
 
-@router.get("/fleet/driver_monitor/{driver_id}")
-def driver_monitor(
-    driver_id: UUID,
+def _monitoring_client(
     db: Session = Depends(get_db),
     current_client: ApiClientContext = Depends(
         require_roles(Role.ADMIN, Role.FLEET_MANAGER)
     ),
-):
+) -> ApiClientContext:
+    # A sync dependency: the access check may call Redis, so it runs in the
+    # thread pool rather than on the event loop.
     ensure_dataset_access(db, current_client, "fleet_monitoring")
+    return current_client
+
+
+@router.get("/fleet/driver_monitor/{driver_id}")
+async def driver_monitor(
+    driver_id: UUID,
+    limit: int = Query(FEED_PAGE_SIZE, ge=1, le=FEED_MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+    sync_db: Session = Depends(get_db),
+    current_client: ApiClientContext = Depends(_monitoring_client),
+):
     ensure_driver_access(current_client, driver_id)
-    driver = (
-        db.query(DriverProfile)
-        .filter(DriverProfile.driverProfileId == driver_id)
-        .first()
+    driver = await db.scalar(
+        select(DriverProfile).where(DriverProfile.driverProfileId == driver_id)
     )
     if not driver:
         raise HTTPException(status_code=404, detail="Driver not found")
 
-    active_trip = (
-        db.query(Trip)
-        .filter(
+    active_trip = await db.scalar(
+        select(Trip.id)
+        .where(
             Trip.driverProfileId == driver.driverProfileId,
             Trip.end_date.is_(None),
         )
-        .order_by(Trip.start_time.desc())
-        .first()
-    )
-
-    behaviours = (
-        db.query(UnsafeBehaviour)
-        .filter(UnsafeBehaviour.driverProfileId == driver.driverProfileId)
-        .all()
+        .limit(1)
     )
 
-    now_ms = int(datetime.utcnow().timestamp() * 1000)
-    last_24h_ms = now_ms - (24 * 60 * 60 * 1000)
-    unsafe_behaviour_last_24h = sum(
-        1 for b in behaviours if b.timestamp >= last_24h_ms
+    # The counters use Redis and a sync session (the one the access check
+    # used); run them in a worker thread too.
+    counters = await anyio.to_thread.run_sync(
+        driver_monitor_counters.counters, sync_db, driver.driverProfileId
     )
 
-    location_records = (
-        db.query(Location)
-        .join(RawSensorData, RawSensorData.location_id == Location.id)
-        .join(Trip, RawSensorData.trip_id == Trip.id)
-        .filter(Trip.driverProfileId == driver.driverProfileId)
-        .all()
-    )
-
-    total_locations = len(location_records)
-    speeding_count = sum(
-        1 for loc in location_records if loc.speed > (loc.speedLimit or float("inf"))
-    )
-    compliant_count = total_locations - speeding_count
-    speed_compliance_ratio = (
-        compliant_count / total_locations if total_locations else 1.0
+    recent_query = select(
+        UnsafeBehaviour.id,
+        UnsafeBehaviour.behaviour_type,
+        UnsafeBehaviour.severity,
+        UnsafeBehaviour.timestamp,
+    ).where(UnsafeBehaviour.driverProfileId == driver.driverProfileId)
+    after = before_keyset(
+        UnsafeBehaviour.timestamp, UnsafeBehaviour.id, decode_keyset_cursor(cursor)
     )
+    if after is not None:
+        recent_query = recent_query.where(after)
+    recent = (
+        await db.execute(
+            recent_query.order_by(UnsafeBehaviour.timestamp.desc(), UnsafeBehaviour.id.desc())
+            .limit(limit + 1)
+        )
+    ).all()
+    next_cursor = None
+    if len(recent) > limit:
+        recent = recent[:limit]
+        next_cursor = encode_keyset_cursor(recent[-1].timestamp, recent[-1].id)
 
     payload = {
         "driverProfileId": str(driver.driverProfileId),
-        "activeTripStatus": "ACTIVE" if active_trip else "IDLE",
-        "unsafeBehaviourCount": len(behaviours),
-        "unsafeBehaviourLast24h": unsafe_behaviour_last_24h,
-        "speedComplianceRatio": speed_compliance_ratio,
-        "speedingCount": speeding_count,
+        "activeTripStatus": "ACTIVE" if active_trip is not None else "IDLE",
+        "unsafeBehaviourCount": counters.unsafe_total,
+        "unsafeBehaviourLast24h": counters.unsafe_in_window,
+        "speedComplianceRatio": counters.speed_compliance_ratio,
+        "speedingCount": counters.speeding_count,
         "recentUnsafeBehaviours": [
             {
                 "id": str(item.id),
@@ -92,8 +110,9 @@ def driver_monitor(
                 "severity": item.severity,
                 "timestamp": item.timestamp,
             }
-            for item in sorted(behaviours, key=lambda x: x.timestamp, reverse=True)
+            for item in recent
         ],
+        "recentUnsafeBehavioursNextCursor": next_cursor,
     }
 
     return payload
@@ -1,13 +1,52 @@
 from datetime import datetime, timedelta
+import hashlib
+import heapq
 import io
+from itertools import islice
 import json
-from typing import Dict, Iterable, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from safedrive.core.driver_reports import (
+    DriverMetrics,
+    TripMetrics,
+    build_driver_report,
+    driver_metrics,
+    trip_end,
+    trip_metrics,
+    trip_start,
+)
+from safedrive.core.etag import conditional_get
+from safedrive.core.export_jobs import (
+    EXPORT_JOB_FORMATS,
+    ExportDataset,
+    create_export_job,
+    register_export_dataset,
+)
+from safedrive.core.exports import (
+    NEXT_CURSOR_HEADER,
+    apply_change_cursor,
+    csv_chunks,
+    json_cell,
+    jsonl_chunks,
+    next_change_cursor,
+    parse_compression,
+    stream_rows,
+    text_export_response,
+)
+from safedrive.core.pagination import (
+    before_keyset,
+    decode_keyset_cursor,
+    encode_keyset_cursor,
+)
+from safedrive.core.report_snapshots import report_snapshots
 from safedrive.core.security import (
     ApiClientContext,
     Role,
@@ -16,13 +55,16 @@ from safedrive.core.security import (
     filter_query_by_driver_ids,
     require_roles,
 )
-from safedrive.database.db import get_db
+from safedrive.database.async_db import get_async_db
+from safedrive.database.db import get_db, get_read_db
 from safedrive.models.alcohol_questionnaire import AlcoholQuestionnaire
 from safedrive.models.insurance_partner import InsurancePartner, InsurancePartnerDriver
 from safedrive.models.location import Location
 from safedrive.models.raw_sensor_data import RawSensorData
+from safedrive.models.speeding_event import SpeedingEvent
 from safedrive.models.trip import Trip
 from safedrive.models.unsafe_behaviour import UnsafeBehaviour
+from safedrive.schemas.export_job import ExportJobResponse
 from safedrive.schemas.fleet import FleetReportResponse
 from safedrive.schemas.insurance_partner import (
     InsuranceAggregateDriverSummary,
@@ -34,155 +76,67 @@ from safedrive.schemas.insurance_partner import (
 
 router = APIRouter()
 
-
-def _trip_locations(db: Session, trip_id: UUID) -> List[Location]:
-    return (
-        db.query(Location)
-        .join(RawSensorData, RawSensorData.location_id == Location.id)
-        .filter(RawSensorData.trip_id == trip_id)
-        .all()
-    )
+# Tables the aggregate report reads; a write to any of them supersedes its
+# snapshots.
+AGGREGATE_REPORT_TABLES = (
+    "trip",
+    "location",
+    "raw_sensor_data",
+    "unsafe_behaviour",
+    "alcohol_questionnaire",
+    "insurance_partner_driver",
+)
 
 
-def _build_trip_metrics(trip: Trip, db: Session) -> InsuranceTelematicsTrip:
-    locations = _trip_locations(db, trip.id)
-    distance = sum((loc.distance or 0) for loc in locations)
-    speeding_events = sum(
-        1 for loc in locations if loc.speedLimit and loc.speed and loc.speed > loc.speedLimit
-    )
-    behaviours = (
-        db.query(UnsafeBehaviour)
-        .filter(UnsafeBehaviour.trip_id == trip.id)
-        .all()
-    )
-    unsafe_count = len(behaviours)
-    avg_severity = float(
-        sum((beh.severity for beh in behaviours)) / unsafe_count
-        if unsafe_count
-        else 0.0
-    )
-    total_locations = len(locations)
-    speed_compliance_ratio = (
-        (total_locations - speeding_events) / total_locations if total_locations else 1.0
-    )
+def _trip_telematics(trip: Trip, metrics: Optional[TripMetrics]) -> InsuranceTelematicsTrip:
+    metrics = metrics or TripMetrics()
     return InsuranceTelematicsTrip(
         trip_id=trip.id,
         driverProfileId=trip.driverProfileId,
-        start_time=trip.start_time and datetime.fromtimestamp(trip.start_time / 1000),
-        end_time=trip.end_time and datetime.fromtimestamp(trip.end_time / 1000),
+        start_time=trip_start(trip),
+        end_time=trip_end(trip),
         influence=trip.influence,
-        distance_km=distance / 1000.0,
-        unsafe_count=unsafe_count,
-        avg_severity=avg_severity,
-        speeding_events=speeding_events,
-        speed_compliance_ratio=speed_compliance_ratio,
+        distance_km=metrics.distance_km,
+        unsafe_count=metrics.unsafe_count,
+        avg_severity=metrics.avg_severity,
+        speeding_events=metrics.speeding_events,
+        speed_compliance_ratio=metrics.speed_compliance_ratio,
     )
 
 
-def _build_driver_report(db: Session, driver_id: UUID) -> dict:
-    trips = (
-        db.query(Trip)
-        .filter(Trip.driverProfileId == driver_id)
-        .order_by(Trip.start_time.desc())
-        .all()
-    )
-
-    trip_summaries = []
-    for trip in trips:
-        metrics = _build_trip_metrics(trip, db)
-        trip_summaries.append(
-            {
-                "trip_id": metrics.trip_id,
-                "start_time": metrics.start_time,
-                "end_time": metrics.end_time,
-                "influence": metrics.influence,
-                "distance_km": metrics.distance_km,
-                "unsafe_count": metrics.unsafe_count,
-                "avg_severity": metrics.avg_severity,
-                "speeding_events": metrics.speeding_events,
-            }
+def _driver_scope_criterion(column, partner: Optional[InsurancePartner], driver_ids):
+    if partner is not None:
+        return column.in_(
+            select(InsurancePartnerDriver.driverProfileId).where(
+                InsurancePartnerDriver.partner_id == partner.id
+            )
         )
+    return column.in_(driver_ids)
 
-    unsafe_logs = (
-        db.query(UnsafeBehaviour)
-        .filter(UnsafeBehaviour.driverProfileId == driver_id)
-        .order_by(UnsafeBehaviour.timestamp.desc())
-        .limit(100)
-        .all()
-    )
-
-    locations = (
-        db.query(Location)
-        .join(RawSensorData, RawSensorData.location_id == Location.id)
-        .join(Trip, RawSensorData.trip_id == Trip.id)
-        .filter(Trip.driverProfileId == driver_id)
-        .all()
-    )
-
-    total_locations = len(locations)
-    speeding_events = sum(
-        1 for loc in locations if loc.speedLimit and loc.speed and loc.speed > loc.speedLimit
-    )
-
-    questionnaires = (
-        db.query(AlcoholQuestionnaire)
-        .filter(AlcoholQuestionnaire.driverProfileId == driver_id)
-        .order_by(AlcoholQuestionnaire.date.desc())
-        .all()
-    )
-
-    return {
-        "driverProfileId": driver_id,
-        "report_generated_at": datetime.utcnow(),
-        "trips": trip_summaries,
-        "unsafe_behaviour_logs": [
-            {
-                "id": log.id,
-                "trip_id": log.trip_id,
-                "behaviour_type": log.behaviour_type,
-                "severity": log.severity,
-                "timestamp": log.timestamp,
-            }
-            for log in unsafe_logs
-        ],
-        "alcohol_responses": [
-            {
-                "id": response.id,
-                "drankAlcohol": response.drankAlcohol,
-                "plansToDrive": response.plansToDrive,
-                "impairmentLevel": response.impairmentLevel,
-                "date": response.date,
-            }
-            for response in questionnaires
-        ],
-        "speed_compliance": {
-            "total_records": total_locations,
-            "speeding_events": speeding_events,
-            "compliance_ratio": (
-                (total_locations - speeding_events) / total_locations
-                if total_locations
-                else 1.0
-            ),
-        },
-    }
 
-
-def _apply_trip_date_filters(query, start_date: Optional[datetime], end_date: Optional[datetime]):
-    if start_date:
-        query = query.filter(Trip.start_date >= start_date)
-    if end_date:
-        query = query.filter(Trip.start_date <= end_date)
-    return query
-
-
-def _apply_questionnaire_date_filters(
-    query, start_date: Optional[datetime], end_date: Optional[datetime]
-):
+def _aggregate_criteria(
+    partner: Optional[InsurancePartner],
+    driver_ids: Optional[Set[UUID]],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+) -> Tuple[list, list]:
+    """Filters on ``Trip`` and on ``AlcoholQuestionnaire`` for an aggregate report."""
+    trip_criteria = []
+    questionnaire_criteria = []
+    if driver_ids is not None:
+        trip_criteria.append(
+            _driver_scope_criterion(Trip.driverProfileId, partner, driver_ids)
+        )
+        questionnaire_criteria.append(
+            _driver_scope_criterion(AlcoholQuestionnaire.driverProfileId, partner, driver_ids)
+        )
     if start_date:
-        query = query.filter(AlcoholQuestionnaire.date >= start_date)
+        trip_criteria.append(Trip.start_date >= start_date)
+        questionnaire_criteria.append(AlcoholQuestionnaire.date >= start_date)
     if end_date:
-        query = query.filter(AlcoholQuestionnaire.date <= end_date)
-    return query
+        trip_criteria.append(Trip.start_date <= end_date)
+        questionnaire_criteria.append(AlcoholQuestionnaire.date <= end_date)
+    return trip_criteria, questionnaire_criteria
 
 
 def _resolve_partner_scope(
@@ -252,98 +206,41 @@ def _build_aggregate_report(
             drivers=[],
         )
 
-    trip_query = db.query(Trip)
-    if driver_ids is not None:
-        trip_query = trip_query.filter(Trip.driverProfileId.in_(driver_ids))
-    trip_query = _apply_trip_date_filters(trip_query, start_date, end_date)
-    trips = trip_query.all()
-
-    per_driver: Dict[UUID, dict] = {}
-    total_distance = 0.0
-    total_unsafe = 0
-    total_severity_weighted = 0.0
-    total_speeding = 0
-
-    for trip in trips:
-        metrics = _build_trip_metrics(trip, db)
-        driver_id = trip.driverProfileId
-        summary = per_driver.setdefault(
-            driver_id,
-            {
-                "trip_count": 0,
-                "distance_km": 0.0,
-                "unsafe_count": 0,
-                "severity_weighted": 0.0,
-                "speeding_events": 0,
-                "alcohol_positive": 0,
-                "latest_trip_start": None,
-            },
-        )
-        summary["trip_count"] += 1
-        summary["distance_km"] += metrics.distance_km
-        summary["unsafe_count"] += metrics.unsafe_count
-        summary["severity_weighted"] += metrics.avg_severity * metrics.unsafe_count
-        summary["speeding_events"] += metrics.speeding_events
-        if metrics.start_time:
-            latest = summary["latest_trip_start"]
-            if latest is None or metrics.start_time > latest:
-                summary["latest_trip_start"] = metrics.start_time
-
-        total_distance += metrics.distance_km
-        total_unsafe += metrics.unsafe_count
-        total_severity_weighted += metrics.avg_severity * metrics.unsafe_count
-        total_speeding += metrics.speeding_events
-
-    questionnaire_query = db.query(AlcoholQuestionnaire)
-    if driver_ids is not None:
-        questionnaire_query = questionnaire_query.filter(
-            AlcoholQuestionnaire.driverProfileId.in_(driver_ids)
-        )
-    questionnaire_query = _apply_questionnaire_date_filters(
-        questionnaire_query, start_date, end_date
+    trip_criteria, questionnaire_criteria = _aggregate_criteria(
+        partner, driver_ids, start_date, end_date
     )
-    positive_rows = questionnaire_query.filter(
-        AlcoholQuestionnaire.drankAlcohol.is_(True)
+    per_driver = driver_metrics(db, trip_criteria)
+    positive_rows = db.execute(
+        select(AlcoholQuestionnaire.driverProfileId, func.count(AlcoholQuestionnaire.id))
+        .where(AlcoholQuestionnaire.drankAlcohol.is_(True), *questionnaire_criteria)
+        .group_by(AlcoholQuestionnaire.driverProfileId)
     ).all()
-
-    for row in positive_rows:
-        summary = per_driver.setdefault(
-            row.driverProfileId,
-            {
-                "trip_count": 0,
-                "distance_km": 0.0,
-                "unsafe_count": 0,
-                "severity_weighted": 0.0,
-                "speeding_events": 0,
-                "alcohol_positive": 0,
-                "latest_trip_start": None,
-            },
-        )
-        summary["alcohol_positive"] += 1
+    alcohol_positive = {driver_id: int(count) for driver_id, count in positive_rows}
+    for driver_id in alcohol_positive:
+        per_driver.setdefault(driver_id, DriverMetrics())
 
     driver_summaries: List[InsuranceAggregateDriverSummary] = []
-    for driver_id, summary in per_driver.items():
-        unsafe_count = summary["unsafe_count"]
-        avg_severity = (
-            summary["severity_weighted"] / unsafe_count if unsafe_count else 0.0
-        )
+    for driver_id, metrics in per_driver.items():
         driver_summaries.append(
             InsuranceAggregateDriverSummary(
                 driverProfileId=driver_id,
-                trip_count=summary["trip_count"],
-                distance_km=summary["distance_km"],
-                unsafe_count=unsafe_count,
-                avg_severity=avg_severity,
-                speeding_events=summary["speeding_events"],
-                alcohol_positive=summary["alcohol_positive"],
-                latest_trip_start=summary["latest_trip_start"],
+                trip_count=metrics.trip_count,
+                distance_km=metrics.distance_km,
+                unsafe_count=metrics.unsafe_count,
+                avg_severity=metrics.avg_severity,
+                speeding_events=metrics.speeding_events,
+                alcohol_positive=alcohol_positive.get(driver_id, 0),
+                latest_trip_start=(
+                    datetime.fromtimestamp(metrics.latest_start_time / 1000)
+                    if metrics.latest_start_time
+                    else None
+                ),
             )
         )
 
     driver_summaries.sort(key=lambda item: item.unsafe_count, reverse=True)
-    avg_unsafe_severity = (
-        total_severity_weighted / total_unsafe if total_unsafe else 0.0
-    )
+    total_unsafe = sum(metrics.unsafe_count for metrics in per_driver.values())
+    total_severity = sum(metrics.severity_total for metrics in per_driver.values())
 
     return InsuranceAggregateReport(
         generated_at=datetime.utcnow(),
@@ -352,16 +249,57 @@ def _build_aggregate_report(
         start_date=start_date,
         end_date=end_date,
         total_drivers=len(driver_summaries),
-        total_trips=len(trips),
-        total_distance_km=total_distance,
+        total_trips=sum(metrics.trip_count for metrics in per_driver.values()),
+        total_distance_km=sum(metrics.distance_km for metrics in per_driver.values()),
         total_unsafe_events=total_unsafe,
-        avg_unsafe_severity=avg_unsafe_severity,
-        total_speeding_events=total_speeding,
-        alcohol_positive_responses=len(positive_rows),
+        avg_unsafe_severity=total_severity / total_unsafe if total_unsafe else 0.0,
+        total_speeding_events=sum(
+            metrics.speeding_events for metrics in per_driver.values()
+        ),
+        alcohol_positive_responses=sum(alcohol_positive.values()),
         drivers=driver_summaries,
     )
 
 
+def _aggregate_report_snapshot(
+    db: Session,
+    driver_ids: Optional[Set[UUID]],
+    partner: Optional[InsurancePartner],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+) -> dict:
+    """
+    The aggregate report as a JSON-safe dict, shared with the download.
+
+    Built on the primary: snapshots are keyed by table versions, so a report
+    read from a lagging replica would be cached as current.
+    """
+    params = {
+        "partner": str(partner.id) if partner else None,
+        "drivers": (
+            None
+            if driver_ids is None
+            else hashlib.sha256(
+                ",".join(sorted(str(value) for value in driver_ids)).encode("utf-8")
+            ).hexdigest()
+        ),
+        "start_date": start_date,
+        "end_date": end_date,
+    }
+    return report_snapshots.get_or_build(
+        "insurance_aggregate",
+        params,
+        AGGREGATE_REPORT_TABLES,
+        lambda: _build_aggregate_report(
+            db,
+            driver_ids=driver_ids,
+            partner=partner,
+            start_date=start_date,
+            end_date=end_date,
+        ).model_dump(mode="json"),
+    )
+
+
 @router.get("/insurance/telematics/trips", response_model=InsuranceTelematicsResponse)
 def list_insurance_trips(
     driver_profile_id: Optional[UUID] = Query(None, alias="driverProfileId"),
@@ -369,7 +307,7 @@ def list_insurance_trips(
     end_date: Optional[datetime] = Query(None, alias="endDate"),
     skip: int = 0,
     limit: int = 200,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_client: ApiClientContext = Depends(
         require_roles(Role.ADMIN, Role.INSURANCE_PARTNER)
     ),
@@ -390,7 +328,8 @@ def list_insurance_trips(
         .limit(limit)
         .all()
     )
-    metrics = [_build_trip_metrics(trip, db) for trip in trips]
+    metrics_by_trip = trip_metrics(db, [trip.id for trip in trips])
+    metrics = [_trip_telematics(trip, metrics_by_trip.get(trip.id)) for trip in trips]
     return InsuranceTelematicsResponse(total=len(metrics), trips=metrics)
 
 
@@ -409,12 +348,8 @@ def get_insurance_aggregate_report(
     partner, driver_ids = _resolve_partner_scope(
         db, current_client, partner_id, partner_label
     )
-    return _build_aggregate_report(
-        db,
-        driver_ids=driver_ids,
-        partner=partner,
-        start_date=start_date,
-        end_date=end_date,
+    return InsuranceAggregateReport.model_validate(
+        _aggregate_report_snapshot(db, driver_ids, partner, start_date, end_date)
     )
 
 
@@ -433,14 +368,8 @@ def download_insurance_aggregate_report(
     partner, driver_ids = _resolve_partner_scope(
         db, current_client, partner_id, partner_label
     )
-    report = _build_aggregate_report(
-        db,
-        driver_ids=driver_ids,
-        partner=partner,
-        start_date=start_date,
-        end_date=end_date,
-    )
-    payload = json.dumps(report.model_dump(), default=str).encode("utf-8")
+    report = _aggregate_report_snapshot(db, driver_ids, partner, start_date, end_date)
+    payload = json.dumps(report).encode("utf-8")
     buffer = io.BytesIO(payload)
     filename = "insurance_aggregate_report"
     if partner and partner.label:
@@ -453,7 +382,22 @@ def download_insurance_aggregate_report(
     )
 
 
-@router.get("/insurance/reports/{driver_id}", response_model=FleetReportResponse)
+@router.get(
+    "/insurance/reports/{driver_id}",
+    response_model=FleetReportResponse,
+    dependencies=[
+        Depends(
+            conditional_get(
+                Trip,
+                Location,
+                RawSensorData,
+                UnsafeBehaviour,
+                AlcoholQuestionnaire,
+                InsurancePartnerDriver,
+            )
+        )
+    ],
+)
 def get_insurance_driver_report(
     driver_id: UUID,
     db: Session = Depends(get_db),
@@ -461,23 +405,24 @@ def get_insurance_driver_report(
         require_roles(Role.ADMIN, Role.INSURANCE_PARTNER)
     ),
 ) -> FleetReportResponse:
+    # Primary, not replica: the ETag comes from current table versions.
     ensure_dataset_access(db, current_client, "insurance_reports")
     ensure_driver_access(current_client, driver_id)
-    payload = _build_driver_report(db, driver_id)
+    payload = build_driver_report(db, driver_id)
     return FleetReportResponse.model_validate(payload)
 
 
 @router.get("/insurance/reports/{driver_id}/download")
 def download_insurance_driver_report(
     driver_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_client: ApiClientContext = Depends(
         require_roles(Role.ADMIN, Role.INSURANCE_PARTNER)
     ),
 ):
     ensure_dataset_access(db, current_client, "insurance_reports")
     ensure_driver_access(current_client, driver_id)
-    report_data = _build_driver_report(db, driver_id)
+    report_data = build_driver_report(db, driver_id)
     payload = json.dumps(report_data, default=str).encode("utf-8")
     buffer = io.BytesIO(payload)
     headers = {
@@ -490,14 +435,126 @@ def download_insurance_driver_report(
     )
 
 
+RAW_SENSOR_CSV_HEADER = [
+    "id",
+    "driverProfileId",
+    "sensor_type",
+    "sensor_type_name",
+    "values",
+    "timestamp",
+    "date",
+    "accuracy",
+    "location_id",
+    "trip_id",
+    "sync",
+]
+
+
+def _raw_sensor_export_query(
+    db: Session,
+    current_client: ApiClientContext,
+    driver_profile_id: Optional[UUID] = None,
+    trip_id: Optional[UUID] = None,
+    start_timestamp: Optional[int] = None,
+    end_timestamp: Optional[int] = None,
+):
+    query = select(
+        RawSensorData.id,
+        Trip.driverProfileId,
+        RawSensorData.sensor_type,
+        RawSensorData.sensor_type_name,
+        RawSensorData.values,
+        RawSensorData.timestamp,
+        RawSensorData.date,
+        RawSensorData.accuracy,
+        RawSensorData.location_id,
+        RawSensorData.trip_id,
+        RawSensorData.sync,
+    ).outerjoin(Trip, RawSensorData.trip_id == Trip.id)
+    query = filter_query_by_driver_ids(query, Trip.driverProfileId, current_client)
+    if driver_profile_id:
+        query = query.filter(Trip.driverProfileId == driver_profile_id)
+    if trip_id:
+        query = query.filter(RawSensorData.trip_id == trip_id)
+    if start_timestamp is not None:
+        query = query.filter(RawSensorData.timestamp >= start_timestamp)
+    if end_timestamp is not None:
+        query = query.filter(RawSensorData.timestamp <= end_timestamp)
+    # The id tie-break gives export jobs a unique keyset to page along.
+    return query.order_by(RawSensorData.timestamp.asc(), RawSensorData.id.asc())
+
+
+def _raw_sensor_payload(row: Row) -> dict:
+    return {
+        "id": str(row.id),
+        "driverProfileId": str(row.driverProfileId) if row.driverProfileId else None,
+        "sensor_type": row.sensor_type,
+        "sensor_type_name": row.sensor_type_name,
+        "values": row.values,
+        "timestamp": row.timestamp,
+        "date": row.date,
+        "accuracy": row.accuracy,
+        "location_id": str(row.location_id) if row.location_id else None,
+        "trip_id": str(row.trip_id) if row.trip_id else None,
+        "sync": row.sync,
+    }
+
+
+def _raw_sensor_csv_row(payload: dict) -> List[str]:
+    return [
+        payload["id"],
+        payload["driverProfileId"] or "",
+        str(payload["sensor_type"]),
+        payload["sensor_type_name"],
+        json_cell(payload["values"]),
+        str(payload["timestamp"]),
+        str(payload["date"]) if payload["date"] else "",
+        str(payload["accuracy"]),
+        payload["location_id"] or "",
+        payload["trip_id"] or "",
+        str(payload["sync"]),
+    ]
+
+
+def _raw_sensor_job_query(
+    db: Session, current_client: ApiClientContext, params: Dict[str, Any]
+):
+    driver_profile_id = params.get("driverProfileId")
+    trip_id = params.get("tripId")
+    return _raw_sensor_export_query(
+        db,
+        current_client,
+        driver_profile_id=UUID(driver_profile_id) if driver_profile_id else None,
+        trip_id=UUID(trip_id) if trip_id else None,
+        start_timestamp=params.get("startTimestamp"),
+        end_timestamp=params.get("endTimestamp"),
+    )
+
+
+register_export_dataset(
+    ExportDataset(
+        name="insurance_raw_sensor_export",
+        filename="insurance_raw_sensor_data",
+        build_query=_raw_sensor_job_query,
+        payload=_raw_sensor_payload,
+        csv_header=RAW_SENSOR_CSV_HEADER,
+        csv_row=_raw_sensor_csv_row,
+        keyset=(RawSensorData.timestamp, RawSensorData.id),
+    )
+)
+
+
 @router.get("/insurance/raw_sensor_data/export")
 def export_insurance_raw_sensor_data(
     driver_profile_id: Optional[UUID] = Query(None, alias="driverProfileId"),
     trip_id: Optional[UUID] = Query(None, alias="tripId"),
     start_timestamp: Optional[int] = Query(None, alias="startTimestamp"),
     end_timestamp: Optional[int] = Query(None, alias="endTimestamp"),
+    since: Optional[str] = Query(None),
     export_format: str = Query("jsonl", alias="format"),
-    db: Session = Depends(get_db),
+    compression: Optional[str] = Query(None),
+    accept_encoding: Optional[str] = Header(None, alias="Accept-Encoding"),
+    db: Session = Depends(get_read_db),
     current_client: ApiClientContext = Depends(
         require_roles(Role.ADMIN, Role.INSURANCE_PARTNER)
     ),
@@ -509,109 +566,121 @@ def export_insurance_raw_sensor_data(
             status_code=400,
             detail="Invalid format. Supported values are 'jsonl' and 'csv'.",
         )
+    compression = parse_compression(compression, export_format)
+    export_headers = {NEXT_CURSOR_HEADER: next_change_cursor(db)}
 
-    query = db.query(RawSensorData, Trip.driverProfileId).outerjoin(
-        Trip, RawSensorData.trip_id == Trip.id
-    )
-    query = filter_query_by_driver_ids(query, Trip.driverProfileId, current_client)
     if driver_profile_id:
         ensure_driver_access(current_client, driver_profile_id)
-        query = query.filter(Trip.driverProfileId == driver_profile_id)
-    if trip_id:
-        query = query.filter(RawSensorData.trip_id == trip_id)
-    if start_timestamp is not None:
-        query = query.filter(RawSensorData.timestamp >= start_timestamp)
-    if end_timestamp is not None:
-        query = query.filter(RawSensorData.timestamp <= end_timestamp)
-    query = query.order_by(RawSensorData.timestamp.asc())
-
-    def _record_payload(row) -> dict:
-        raw, driver_id = row
-        return {
-            "id": str(raw.id),
-            "driverProfileId": str(driver_id) if driver_id else None,
-            "sensor_type": raw.sensor_type,
-            "sensor_type_name": raw.sensor_type_name,
-            "values": raw.values,
-            "timestamp": raw.timestamp,
-            "date": raw.date,
-            "accuracy": raw.accuracy,
-            "location_id": str(raw.location_id) if raw.location_id else None,
-            "trip_id": str(raw.trip_id) if raw.trip_id else None,
-            "sync": raw.sync,
-        }
+    query = _raw_sensor_export_query(
+        db,
+        current_client,
+        driver_profile_id=driver_profile_id,
+        trip_id=trip_id,
+        start_timestamp=start_timestamp,
+        end_timestamp=end_timestamp,
+    )
+    query = apply_change_cursor(query, RawSensorData.ingested_at, since)
 
     if export_format == "csv":
-        header = [
-            "id",
-            "driverProfileId",
-            "sensor_type",
-            "sensor_type_name",
-            "values",
-            "timestamp",
-            "date",
-            "accuracy",
-            "location_id",
-            "trip_id",
-            "sync",
-        ]
-
-        def rows() -> Iterable[str]:
-            yield ",".join(header) + "\n"
-            for raw, driver_id in query.yield_per(500):
-                payload = _record_payload((raw, driver_id))
-                values = [
-                    payload["id"],
-                    payload["driverProfileId"] or "",
-                    str(payload["sensor_type"]),
-                    payload["sensor_type_name"],
-                    json.dumps(payload["values"], default=str),
-                    str(payload["timestamp"]),
-                    str(payload["date"]) if payload["date"] else "",
-                    str(payload["accuracy"]),
-                    payload["location_id"] or "",
-                    payload["trip_id"] or "",
-                    str(payload["sync"]),
-                ]
-                yield ",".join(values) + "\n"
-
-        headers = {
-            "Content-Disposition": "attachment; filename=\"insurance_raw_sensor_data.csv\""
-        }
-        return StreamingResponse(
-            rows(),
-            media_type="text/csv",
-            headers=headers,
+
+        rows = (
+            _raw_sensor_csv_row(_raw_sensor_payload(row))
+            for row in stream_rows(db, query)
+        )
+        return text_export_response(
+            csv_chunks(RAW_SENSOR_CSV_HEADER, rows),
+            "text/csv",
+            "insurance_raw_sensor_data.csv",
+            compression,
+            accept_encoding,
+            headers=export_headers,
         )
 
-    def jsonl_rows() -> Iterable[bytes]:
-        for raw, driver_id in query.yield_per(500):
-            payload = _record_payload((raw, driver_id))
-            yield (json.dumps(payload, default=str) + "\n").encode("utf-8")
+    return text_export_response(
+        jsonl_chunks(_raw_sensor_payload(row) for row in stream_rows(db, query)),
+        "application/x-ndjson",
+        "insurance_raw_sensor_data.jsonl",
+        compression,
+        accept_encoding,
+        headers=export_headers,
+    )
 
-    headers = {
-        "Content-Disposition": "attachment; filename=\"insurance_raw_sensor_data.jsonl\""
+
+@router.post(
+    "/insurance/raw_sensor_data/export/jobs",
+    response_model=ExportJobResponse,
+    status_code=202,
+)
+def create_insurance_raw_sensor_export_job(
+    driver_profile_id: Optional[UUID] = Query(None, alias="driverProfileId"),
+    trip_id: Optional[UUID] = Query(None, alias="tripId"),
+    start_timestamp: Optional[int] = Query(None, alias="startTimestamp"),
+    end_timestamp: Optional[int] = Query(None, alias="endTimestamp"),
+    export_format: str = Query("jsonl", alias="format"),
+    db: Session = Depends(get_db),
+    current_client: ApiClientContext = Depends(
+        require_roles(Role.ADMIN, Role.INSURANCE_PARTNER)
+    ),
+) -> ExportJobResponse:
+    ensure_dataset_access(db, current_client, "insurance_raw_sensor_export")
+    export_format = (export_format or "").lower()
+    if export_format not in EXPORT_JOB_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid format. Supported values are 'jsonl' and 'csv'.",
+        )
+    if driver_profile_id:
+        ensure_driver_access(current_client, driver_profile_id)
+
+    params = {
+        "driverProfileId": str(driver_profile_id) if driver_profile_id else None,
+        "tripId": str(trip_id) if trip_id else None,
+        "startTimestamp": start_timestamp,
+        "endTimestamp": end_timestamp,
     }
-    return StreamingResponse(
-        jsonl_rows(),
-        media_type="application/x-ndjson",
-        headers=headers,
+    job = create_export_job(
+        db, current_client, "insurance_raw_sensor_export", export_format, params
     )
+    return ExportJobResponse.model_validate(job)
 
 
-@router.get("/insurance/alerts", response_model=List[InsuranceAlert])
-def list_insurance_alerts(
-    min_severity: float = Query(0.8, alias="minSeverity"),
-    since_hours: int = Query(24, alias="sinceHours", ge=1, le=168),
-    limit: int = Query(100, ge=1, le=500),
+def _alerts_client(
     db: Session = Depends(get_db),
     current_client: ApiClientContext = Depends(
         require_roles(Role.ADMIN, Role.INSURANCE_PARTNER)
     ),
-) -> List[InsuranceAlert]:
+) -> ApiClientContext:
+    # A sync dependency: the access check may call Redis, so it runs in the
+    # thread pool rather than on the event loop.
     ensure_dataset_access(db, current_client, "insurance_alerts")
+    return current_client
+
+
+@router.get("/insurance/alerts", response_model=List[InsuranceAlert])
+async def list_insurance_alerts(
+    response: Response,
+    min_severity: float = Query(0.8, alias="minSeverity"),
+    since_hours: int = Query(24, alias="sinceHours", ge=1, le=168),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_client: ApiClientContext = Depends(_alerts_client),
+) -> List[InsuranceAlert]:
+    """
+    Unsafe behaviours and speeding episodes, newest first. Pages continue
+    from the cursor returned in ``X-Next-Cursor``.
+    """
     since_ms = int((datetime.utcnow() - timedelta(hours=since_hours)).timestamp() * 1000)
-    unsafe_query = db.query(UnsafeBehaviour)
+    position = decode_keyset_cursor(cursor)
+
+    unsafe_query = select(
+        UnsafeBehaviour.id,
+        UnsafeBehaviour.driverProfileId,
+        UnsafeBehaviour.trip_id,
+        UnsafeBehaviour.behaviour_type,
+        UnsafeBehaviour.severity,
+        UnsafeBehaviour.timestamp,
+    )
     unsafe_query = filter_query_by_driver_ids(
         unsafe_query, UnsafeBehaviour.driverProfileId, current_client
     )
@@ -619,42 +688,74 @@ def list_insurance_alerts(
         UnsafeBehaviour.timestamp >= since_ms,
         UnsafeBehaviour.severity >= min_severity,
     )
-    unsafe_events = unsafe_query.order_by(UnsafeBehaviour.timestamp.desc()).limit(limit).all()
-
-    alerts: List[InsuranceAlert] = [
-        InsuranceAlert(
-            driverProfileId=event.driverProfileId,
-            trip_id=event.trip_id,
-            alert_type="unsafe_behaviour",
-            severity=event.severity,
-            timestamp=event.timestamp,
-            message=f"Unsafe behaviour {event.behaviour_type} severity {event.severity}",
+    after = before_keyset(UnsafeBehaviour.timestamp, UnsafeBehaviour.id, position)
+    if after is not None:
+        unsafe_query = unsafe_query.filter(after)
+    unsafe_events = (
+        await db.execute(
+            unsafe_query.order_by(UnsafeBehaviour.timestamp.desc(), UnsafeBehaviour.id.desc())
+            .limit(limit + 1)
         )
-        for event in unsafe_events
-    ]
+    ).all()
 
-    speed_query = (
-        db.query(Location, Trip.id, Trip.driverProfileId)
-        .join(RawSensorData, RawSensorData.location_id == Location.id)
-        .join(Trip, RawSensorData.trip_id == Trip.id)
-        .filter(Location.speedLimit.isnot(None))
-        .filter(Location.speed.isnot(None))
-        .filter(Location.speed > Location.speedLimit)
-    )
     speed_query = filter_query_by_driver_ids(
-        speed_query, Trip.driverProfileId, current_client
-    )
-    speed_events = speed_query.limit(limit).all()
-    for loc, trip_id, driver_id in speed_events:
-        alerts.append(
+        select(SpeedingEvent), SpeedingEvent.driverProfileId, current_client
+    ).filter(SpeedingEvent.timestamp >= since_ms)
+    after = before_keyset(SpeedingEvent.timestamp, SpeedingEvent.id, position)
+    if after is not None:
+        speed_query = speed_query.filter(after)
+    speed_events = (
+        await db.scalars(
+            speed_query.order_by(SpeedingEvent.timestamp.desc(), SpeedingEvent.id.desc())
+            .limit(limit + 1)
+        )
+    ).all()
+
+    unsafe_alerts = [
+        (
+            event.timestamp,
+            event.id,
             InsuranceAlert(
-                driverProfileId=driver_id,
-                trip_id=trip_id,
+                driverProfileId=event.driverProfileId,
+                trip_id=event.trip_id,
+                alert_type="unsafe_behaviour",
+                severity=event.severity,
+                timestamp=event.timestamp,
+                message=f"Unsafe behaviour {event.behaviour_type} severity {event.severity}",
+            ),
+        )
+        for event in unsafe_events
+    ]
+    speed_alerts = [
+        (
+            event.timestamp,
+            event.id,
+            InsuranceAlert(
+                driverProfileId=event.driverProfileId,
+                trip_id=event.trip_id,
                 alert_type="speed_violation",
                 severity=None,
-                timestamp=loc.timestamp,
-                message="Speed exceeded posted limit",
-            )
+                timestamp=event.timestamp,
+                end_timestamp=event.end_timestamp,
+                max_overspeed=event.max_overspeed,
+                message=(
+                    f"Speed exceeded posted limit by up to {event.max_overspeed:g} "
+                    f"over {event.point_count} readings"
+                ),
+            ),
         )
-
-    return alerts[:limit]
+        for event in speed_events
+    ]
+    merged = list(
+        islice(
+            heapq.merge(
+                unsafe_alerts, speed_alerts, key=lambda item: item[:2], reverse=True
+            ),
+            limit + 1,
+        )
+    )
+    if len(merged) > limit:
+        merged = merged[:limit]
+        timestamp, last_id, _ = merged[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_keyset_cursor(timestamp, last_id)
+    return [alert for _, _, alert in merged]
@@ -10,6 +10,8 @@ from safedrive.core.security import (
     ensure_driver_access,
     require_roles_or_jwt,
 )
+from safedrive.core.etag import conditional_get
+from safedrive.models.nlg_report import NLGReport
 from safedrive.schemas.nlg_report import NLGReportCreate, NLGReportUpdate, NLGReportResponse
 from safedrive.crud.nlg_report import nlg_report_crud
 import logging
@@ -36,7 +38,11 @@ def create_nlg_report(
         logger.error(f"Error creating NLGReport: {str(e)}")
         raise HTTPException(status_code=500, detail="Error creating NLG report")
 
-@router.get("/nlg_reports/{report_id}", response_model=NLGReportResponse)
+@router.get(
+    "/nlg_reports/{report_id}",
+    response_model=NLGReportResponse,
+    dependencies=[Depends(conditional_get(NLGReport))],
+)
 def get_nlg_report(
     report_id: UUID,
     db: Session = Depends(get_db),
@@ -52,7 +58,11 @@ def get_nlg_report(
     ensure_driver_access(current_client, report.driverProfileId)
     return NLGReportResponse.model_validate(report)
 
-@router.get("/nlg_reports/", response_model=List[NLGReportResponse])
+@router.get(
+    "/nlg_reports/",
+    response_model=List[NLGReportResponse],
+    dependencies=[Depends(conditional_get(NLGReport))],
+)
 def get_all_nlg_reports(
     skip: int = 0,
     limit: int = 20,
@@ -1,9 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
 from uuid import UUID
 import logging
 
+from safedrive.database.async_db import get_async_db
 from safedrive.database.db import get_db
 from safedrive.core.security import (
     ApiClientContext,
@@ -54,7 +57,7 @@ def create_raw_sensor_data(
                 raise HTTPException(status_code=404, detail="Trip not found")
             ensure_driver_access(current_client, trip.driverProfileId)
         new_data = raw_sensor_data_crud.create(db=db, obj_in=raw_data_in)
-        logger.info(f"Raw sensor data created with ID: {new_data.id.hex()}")
+        logger.info(f"Raw sensor data created with ID: {new_data.id}")
         return RawSensorDataResponse.model_validate(new_data)
     except Exception as e:
         logger.exception("Error creating raw sensor data")
@@ -94,10 +97,10 @@ def get_raw_sensor_data(
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
 @router.get("/raw_sensor_data/", response_model=List[RawSensorDataResponse])
-def get_all_raw_sensor_data(
+async def get_all_raw_sensor_data(
     skip: int = 0,
     limit: int = 5000,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_client: ApiClientContext = Depends(
         require_roles_or_jwt(Role.ADMIN, Role.DRIVER)
     ),
@@ -112,15 +115,11 @@ def get_all_raw_sensor_data(
         # if limit > 100:
         #     logger.error("Limit cannot exceed 100 items.")
         #     raise HTTPException(status_code=400, detail="Limit cannot exceed 100 items")
-        if current_client.role == Role.ADMIN:
-            data_list = raw_sensor_data_crud.get_all(db=db, skip=skip, limit=limit)
-        else:
-            query = (
-                db.query(raw_sensor_data_crud.model)
-                .join(Trip, raw_sensor_data_crud.model.trip_id == Trip.id)
-            )
+        query = select(raw_sensor_data_crud.model)
+        if current_client.role != Role.ADMIN:
+            query = query.join(Trip, raw_sensor_data_crud.model.trip_id == Trip.id)
             query = filter_query_by_driver_ids(query, Trip.driverProfileId, current_client)
-            data_list = query.offset(skip).limit(limit).all()
+        data_list = (await db.scalars(query.offset(skip).limit(limit))).all()
         logger.info(f"Retrieved {len(data_list)} raw sensor data entries.")
         return [RawSensorDataResponse.model_validate(data) for data in data_list]
     except Exception as e:
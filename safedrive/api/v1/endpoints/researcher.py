@@ -1,22 +1,49 @@
-from datetime import datetime, timedelta
-import csv
+from datetime import datetime, timedelta, timezone
 import io
 import json
-from typing import Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from fastapi.responses import StreamingResponse
-from sqlalchemy import case, func
+import pyarrow as pa
+from sqlalchemy import and_, case, func, select
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
+from safedrive.core.export_jobs import (
+    EXPORT_JOB_FORMATS,
+    ExportDataset,
+    create_export_job,
+    register_export_dataset,
+)
+from safedrive.core.exports import (
+    COLUMNAR_FORMATS,
+    NEXT_CURSOR_HEADER,
+    apply_change_cursor,
+    csv_chunks,
+    json_cell,
+    jsonl_chunks,
+    next_change_cursor,
+    parse_compression,
+    stream_columnar,
+    stream_rows,
+    text_export_response,
+)
+from safedrive.core.cold_archive import archived_rows
+from safedrive.core.partitions import (
+    PARTITION_PRUNING_SLACK_MS,
+    epoch_ms,
+    recorded_between,
+    recorded_since,
+)
 from safedrive.core.security import (
     ApiClientContext,
     Role,
     ensure_dataset_access,
     require_roles,
 )
-from safedrive.database.db import get_db
+from safedrive.database.db import get_db, get_read_db
 from safedrive.models.alcohol_questionnaire import AlcoholQuestionnaire
 from safedrive.models.driver_profile import DriverProfile
 from safedrive.models.driving_tip import DrivingTip
@@ -27,6 +54,7 @@ from safedrive.models.trip import Trip
 from safedrive.models.unsafe_behaviour import UnsafeBehaviour
 from safedrive.schemas.alcohol_questionnaire import AlcoholQuestionnaireResponseSchema
 from safedrive.schemas.behaviour_metrics import DriverUBPK, TripUBPK
+from safedrive.schemas.export_job import ExportJobResponse
 from safedrive.schemas.researcher import (
     AggregatedSnapshotResponse,
     IngestionStatusItem,
@@ -42,6 +70,75 @@ router = APIRouter()
 MATCHING_RULE = "Same UTC calendar day"
 MATCHING_TIMEZONE = "UTC"
 
+EXPORT_FORMATS = ("jsonl", "csv", *COLUMNAR_FORMATS)
+
+NLG_REPORT_ARROW_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("driverProfileId", pa.string()),
+        ("startDate", pa.timestamp("us")),
+        ("endDate", pa.timestamp("us")),
+        ("report_text", pa.string()),
+        ("generated_at", pa.timestamp("us")),
+        ("sync", pa.bool_()),
+    ]
+)
+
+RAW_SENSOR_ARROW_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("driverProfileId", pa.string()),
+        ("sensor_type", pa.int32()),
+        ("sensor_type_name", pa.string()),
+        ("values", pa.list_(pa.float32())),
+        ("timestamp", pa.int64()),
+        ("date", pa.timestamp("us")),
+        ("accuracy", pa.int32()),
+        ("location_id", pa.string()),
+        ("trip_id", pa.string()),
+        ("sync", pa.bool_()),
+    ]
+)
+
+MATCHED_QUESTIONNAIRE_ARROW_TYPE = pa.struct(
+    [
+        ("id", pa.string()),
+        ("driverProfileId", pa.string()),
+        ("drankAlcohol", pa.bool_()),
+        ("selectedAlcoholTypes", pa.string()),
+        ("beerQuantity", pa.string()),
+        ("wineQuantity", pa.string()),
+        ("spiritsQuantity", pa.string()),
+        ("firstDrinkTime", pa.string()),
+        ("lastDrinkTime", pa.string()),
+        ("emptyStomach", pa.bool_()),
+        ("caffeinatedDrink", pa.bool_()),
+        ("impairmentLevel", pa.int32()),
+        ("date", pa.timestamp("us")),
+        ("plansToDrive", pa.bool_()),
+        ("sync", pa.bool_()),
+    ]
+)
+
+TRIP_ARROW_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("driverProfileId", pa.string()),
+        ("startDate", pa.timestamp("us")),
+        ("endDate", pa.timestamp("us")),
+        ("startTime", pa.int64()),
+        ("endTime", pa.int64()),
+        ("influence", pa.string()),
+        ("tripNotes", pa.string()),
+        ("alcoholProbability", pa.float64()),
+        ("userAlcoholResponse", pa.string()),
+        ("sync", pa.bool_()),
+        ("matchedQuestionnaire", MATCHED_QUESTIONNAIRE_ARROW_TYPE),
+        ("matchingRule", pa.string()),
+        ("matchingTimezone", pa.string()),
+    ]
+)
+
 
 def _parse_week(week: str) -> tuple[datetime, datetime]:
     try:
@@ -69,6 +166,25 @@ def _apply_date_filters(query, column, start_date, end_date, week):
     return query
 
 
+def _recorded_window(column, start_date, end_date, week) -> list:
+    """
+    The date filters as predicates on an epoch-ms ``timestamp`` column, so
+    MySQL can skip sensor partitions outside the window.
+    """
+    predicates = recorded_between(column, start_date, end_date)
+    if week:
+        predicates += recorded_between(column, *_parse_week(week))
+    return predicates
+
+
+def _recorded_after_window_start(column, start_date, week) -> list:
+    """Lower bound only: sensor rows of trips starting in the window."""
+    predicates = recorded_since(column, start_date)
+    if week:
+        predicates += recorded_since(column, _parse_week(week)[0])
+    return predicates
+
+
 def _apply_report_period_filters(
     query,
     start_column,
@@ -123,9 +239,117 @@ def _match_questionnaire(
     return lookup.get(driver_id, {}).get(trip_day)
 
 
+def _trip_questionnaire_passes(trips_query, questionnaires_query) -> list:
+    """
+    Order trips and questionnaires by (driverProfileId, UTC day) for
+    ``_merge_questionnaires``. Trips without ``start_date`` take their day
+    from ``start_time``, which SQL cannot order alongside ``start_date``
+    portably, so they are merged in a second pass.
+    """
+    questionnaires_query = questionnaires_query.filter(
+        AlcoholQuestionnaire.date.isnot(None)
+    ).order_by(
+        AlcoholQuestionnaire.driverProfileId,
+        AlcoholQuestionnaire.date,
+        AlcoholQuestionnaire.id,
+    )
+    return [
+        (
+            trips_query.filter(Trip.start_date.isnot(None)).order_by(
+                Trip.driverProfileId, Trip.start_date, Trip.id
+            ),
+            questionnaires_query,
+        ),
+        (
+            trips_query.filter(Trip.start_date.is_(None)).order_by(
+                Trip.driverProfileId, Trip.start_time, Trip.id
+            ),
+            questionnaires_query,
+        ),
+    ]
+
+
+def _latest_questionnaire_per_day(questionnaires: Iterable) -> Iterable[tuple]:
+    """Fold (driverProfileId, date)-ordered questionnaires into the latest per driver-day."""
+    key = None
+    latest = None
+    for questionnaire in questionnaires:
+        questionnaire_key = (
+            questionnaire.driverProfileId,
+            questionnaire.date.date(),
+        )
+        if questionnaire_key != key:
+            if latest is not None:
+                yield key, latest
+            key, latest = questionnaire_key, questionnaire
+        elif questionnaire.date > latest.date:
+            latest = questionnaire
+    if latest is not None:
+        yield key, latest
+
+
+def _merge_questionnaires(trips: Iterable, questionnaires: Iterable) -> Iterable[tuple]:
+    """
+    Pair each trip with its same-UTC-day questionnaire (latest wins) in one
+    forward pass over both inputs, holding a single driver-day at a time.
+    """
+    days = iter(_latest_questionnaire_per_day(questionnaires))
+    current = next(days, None)
+    for trip in trips:
+        trip_day = _trip_day_utc(trip)
+        if trip_day is None:
+            yield trip, None
+            continue
+        key = (trip.driverProfileId, trip_day)
+        while current is not None and current[0] < key:
+            current = next(days, None)
+        if current is not None and current[0] == key:
+            yield trip, current[1]
+        else:
+            yield trip, None
+
+
+def _stream_questionnaires(db: Session, statement) -> Iterable[Row]:
+    # Own connection: the trips are streamed on the session's at the same time.
+    with db.get_bind().connect() as connection:
+        yield from stream_rows(connection, statement)
+
+
 def _parse_export_format(export_format: str) -> str:
     value = (export_format or "").lower()
-    if value not in {"jsonl", "csv"}:
+    if value not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                "Invalid format. Supported values are 'jsonl', 'csv', "
+                "'parquet' and 'arrow'."
+            ),
+        )
+    return value
+
+
+def _columnar_response(
+    rows: Iterable[dict],
+    schema: pa.Schema,
+    export_format: str,
+    filename: str,
+    headers: Dict[str, str],
+) -> StreamingResponse:
+    media_type, extension = COLUMNAR_FORMATS[export_format]
+    headers = {
+        **headers,
+        "Content-Disposition": f'attachment; filename="{filename}.{extension}"',
+    }
+    return StreamingResponse(
+        stream_columnar(rows, schema, export_format),
+        media_type=media_type,
+        headers=headers,
+    )
+
+
+def _parse_job_format(export_format: str) -> str:
+    value = (export_format or "").lower()
+    if value not in EXPORT_JOB_FORMATS:
         raise HTTPException(
             status_code=400,
             detail="Invalid format. Supported values are 'jsonl' and 'csv'.",
@@ -133,6 +357,21 @@ def _parse_export_format(export_format: str) -> str:
     return value
 
 
+def _uuid_param(value: Optional[str]) -> Optional[UUID]:
+    return UUID(value) if value else None
+
+
+def _datetime_param(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _sensor_values(values) -> Optional[List[float]]:
+    # Older rows stored the readings as a JSON-encoded string.
+    if isinstance(values, str):
+        values = json.loads(values)
+    return values
+
+
 def _unsafe_behaviour_summary(
     db: Session,
     driver_profile_id: Optional[UUID] = None,
@@ -214,6 +453,9 @@ def _raw_sensor_summary(
     query = _apply_date_filters(
         query, RawSensorData.date, start_date, end_date, week
     )
+    query = query.filter(
+        *_recorded_window(RawSensorData.timestamp, start_date, end_date, week)
+    )
 
     query = query.group_by(RawSensorData.sensor_type, RawSensorData.sensor_type_name)
 
@@ -246,8 +488,20 @@ def _trip_distances(
             func.coalesce(func.sum(Location.distance), 0.0),
             Trip.start_date,
         )
-        .outerjoin(RawSensorData, RawSensorData.trip_id == Trip.id)
-        .outerjoin(Location, Location.id == RawSensorData.location_id)
+        .outerjoin(
+            RawSensorData,
+            and_(
+                RawSensorData.trip_id == Trip.id,
+                *_recorded_after_window_start(RawSensorData.timestamp, start_date, week),
+            ),
+        )
+        .outerjoin(
+            Location,
+            and_(
+                Location.id == RawSensorData.location_id,
+                *_recorded_after_window_start(Location.timestamp, start_date, week),
+            ),
+        )
         .group_by(Trip.id)
     )
     if driver_profile_id:
@@ -340,20 +594,6 @@ def _sync_counts(
     return total, synced, total - synced
 
 
-def _stream_csv(header: List[str], rows: Iterable[List[str]]) -> Iterable[str]:
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(header)
-    yield output.getvalue()
-    output.seek(0)
-    output.truncate(0)
-    for row in rows:
-        writer.writerow(row)
-        yield output.getvalue()
-        output.seek(0)
-        output.truncate(0)
-
-
 @router.get(
     "/researcher/unsafe_behaviours/summary",
     response_model=List[UnsafeBehaviourSummary],
@@ -366,7 +606,7 @@ def get_unsafe_behaviour_summary(
     week: Optional[str] = Query(None),
     min_severity: Optional[float] = Query(None, alias="minSeverity"),
     max_severity: Optional[float] = Query(None, alias="maxSeverity"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_client: ApiClientContext = Depends(
         require_roles(Role.ADMIN, Role.RESEARCHER)
     ),
@@ -398,7 +638,7 @@ def get_raw_sensor_summary(
     start_date: Optional[datetime] = Query(None, alias="startDate"),
     end_date: Optional[datetime] = Query(None, alias="endDate"),
     week: Optional[str] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_client: ApiClientContext = Depends(
         require_roles(Role.ADMIN, Role.RESEARCHER)
     ),
@@ -429,7 +669,7 @@ def get_alcohol_trip_bundle(
     week: Optional[str] = Query(None),
     skip: int = 0,
     limit: int = 5000,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_client: ApiClientContext = Depends(
         require_roles(Role.ADMIN, Role.RESEARCHER)
     ),
@@ -501,16 +741,29 @@ def export_nlg_reports(
     end_date: Optional[datetime] = Query(None, alias="endDate"),
     week: Optional[str] = Query(None),
     sync: Optional[bool] = Query(None),
+    since: Optional[str] = Query(None),
     export_format: str = Query("jsonl", alias="format"),
-    db: Session = Depends(get_db),
+    compression: Optional[str] = Query(None),
+    accept_encoding: Optional[str] = Header(None, alias="Accept-Encoding"),
+    db: Session = Depends(get_read_db),
     current_client: ApiClientContext = Depends(
         require_roles(Role.ADMIN, Role.RESEARCHER)
     ),
 ):
     ensure_dataset_access(db, current_client, "researcher_nlg_reports")
     export_format = _parse_export_format(export_format)
+    compression = parse_compression(compression, export_format)
+    export_headers = {NEXT_CURSOR_HEADER: next_change_cursor(db)}
 
-    query = db.query(NLGReport)
+    query = select(
+        NLGReport.id,
+        NLGReport.driverProfileId,
+        NLGReport.start_date,
+        NLGReport.end_date,
+        NLGReport.report_text,
+        NLGReport.generated_at,
+        NLGReport.sync,
+    )
     if driver_profile_id:
         query = query.filter(NLGReport.driverProfileId == driver_profile_id)
     query = _apply_report_period_filters(
@@ -523,10 +776,11 @@ def export_nlg_reports(
     )
     if sync is not None:
         query = query.filter(NLGReport.sync == sync)
+    query = apply_change_cursor(query, NLGReport.ingested_at, since)
 
     query = query.order_by(NLGReport.generated_at.desc())
 
-    def _record_payload(report: NLGReport) -> dict:
+    def _record_payload(report: Row) -> dict:
         return {
             "id": str(report.id),
             "driverProfileId": str(report.driverProfileId),
@@ -541,6 +795,15 @@ def export_nlg_reports(
     if driver_profile_id:
         filename = f"{filename}_{driver_profile_id}"
 
+    if export_format in COLUMNAR_FORMATS:
+        return _columnar_response(
+            (_record_payload(report) for report in stream_rows(db, query)),
+            NLG_REPORT_ARROW_SCHEMA,
+            export_format,
+            filename,
+            export_headers,
+        )
+
     if export_format == "csv":
         header = [
             "id",
@@ -553,7 +816,7 @@ def export_nlg_reports(
         ]
 
         def rows() -> Iterable[List[str]]:
-            for report in query.yield_per(500):
+            for report in stream_rows(db, query):
                 payload = _record_payload(report)
                 yield [
                     payload["id"],
@@ -565,30 +828,202 @@ def export_nlg_reports(
                     str(payload["sync"]),
                 ]
 
-        headers = {
-            "Content-Disposition": f'attachment; filename="{filename}.csv"'
-        }
-        return StreamingResponse(
-            _stream_csv(header, rows()),
-            media_type="text/csv",
-            headers=headers,
+        return text_export_response(
+            csv_chunks(header, rows()),
+            "text/csv",
+            f"{filename}.csv",
+            compression,
+            accept_encoding,
+            headers=export_headers,
         )
 
-    def jsonl_rows() -> Iterable[bytes]:
-        for report in query.yield_per(500):
-            payload = _record_payload(report)
-            yield (json.dumps(payload, default=str) + "\n").encode("utf-8")
+    return text_export_response(
+        jsonl_chunks(_record_payload(report) for report in stream_rows(db, query)),
+        "application/x-ndjson",
+        f"{filename}.jsonl",
+        compression,
+        accept_encoding,
+        headers=export_headers,
+    )
+
 
-    headers = {
-        "Content-Disposition": f'attachment; filename="{filename}.jsonl"'
+RAW_SENSOR_CSV_HEADER = [
+    "id",
+    "driverProfileId",
+    "sensor_type",
+    "sensor_type_name",
+    "values",
+    "timestamp",
+    "date",
+    "accuracy",
+    "location_id",
+    "trip_id",
+    "sync",
+]
+
+
+def _raw_sensor_export_query(
+    db: Session,
+    driver_profile_id: Optional[UUID] = None,
+    trip_id: Optional[UUID] = None,
+    sensor_type: Optional[int] = None,
+    sensor_type_name: Optional[str] = None,
+    start_timestamp: Optional[int] = None,
+    end_timestamp: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    week: Optional[str] = None,
+):
+    query = select(
+        RawSensorData.id,
+        Trip.driverProfileId,
+        RawSensorData.sensor_type,
+        RawSensorData.sensor_type_name,
+        RawSensorData.values,
+        RawSensorData.timestamp,
+        RawSensorData.date,
+        RawSensorData.accuracy,
+        RawSensorData.location_id,
+        RawSensorData.trip_id,
+        RawSensorData.sync,
+    ).outerjoin(Trip, RawSensorData.trip_id == Trip.id)
+    if driver_profile_id:
+        query = query.filter(Trip.driverProfileId == driver_profile_id)
+    if trip_id:
+        query = query.filter(RawSensorData.trip_id == trip_id)
+    if sensor_type is not None:
+        query = query.filter(RawSensorData.sensor_type == sensor_type)
+    if sensor_type_name:
+        query = query.filter(RawSensorData.sensor_type_name == sensor_type_name)
+    if start_timestamp is not None:
+        query = query.filter(RawSensorData.timestamp >= start_timestamp)
+    if end_timestamp is not None:
+        query = query.filter(RawSensorData.timestamp <= end_timestamp)
+    query = _apply_date_filters(
+        query, RawSensorData.date, start_date, end_date, week
+    )
+    query = query.filter(
+        *_recorded_window(RawSensorData.timestamp, start_date, end_date, week)
+    )
+    # The id tie-break gives export jobs a unique keyset to page along.
+    return query.order_by(RawSensorData.timestamp.asc(), RawSensorData.id.asc())
+
+
+def _raw_sensor_payload(row: Row) -> dict:
+    return {
+        "id": str(row.id),
+        "driverProfileId": str(row.driverProfileId) if row.driverProfileId else None,
+        "sensor_type": row.sensor_type,
+        "sensor_type_name": row.sensor_type_name,
+        "values": row.values,
+        "timestamp": row.timestamp,
+        "date": row.date,
+        "accuracy": row.accuracy,
+        "location_id": str(row.location_id) if row.location_id else None,
+        "trip_id": str(row.trip_id) if row.trip_id else None,
+        "sync": row.sync,
     }
-    return StreamingResponse(
-        jsonl_rows(),
-        media_type="application/x-ndjson",
-        headers=headers,
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _archived_raw_sensor_payloads(
+    db: Session,
+    driver_profile_id: Optional[UUID] = None,
+    trip_id: Optional[UUID] = None,
+    sensor_type: Optional[int] = None,
+    sensor_type_name: Optional[str] = None,
+    start_timestamp: Optional[int] = None,
+    end_timestamp: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    week: Optional[str] = None,
+) -> Iterable[dict]:
+    """
+    Rows of the cold archive matching the export filters, in export order.
+    Nothing is read unless the range predates the hot window.
+    """
+    lower, upper = _naive_utc(start_date), _naive_utc(end_date)
+    week_start = week_end = None
+    if week:
+        week_start, week_end = _parse_week(week)
+    starts = [start_timestamp] if start_timestamp is not None else []
+    starts += [epoch_ms(value) - PARTITION_PRUNING_SLACK_MS for value in (lower, week_start) if value]
+    ends = [end_timestamp] if end_timestamp is not None else []
+    ends += [epoch_ms(value) + PARTITION_PRUNING_SLACK_MS for value in (upper, week_end) if value]
+
+    for row in archived_rows(
+        db,
+        "raw_sensor_data",
+        driver_profile_id=driver_profile_id,
+        trip_id=trip_id,
+        start_ms=max(starts) if starts else None,
+        end_ms=min(ends) if ends else None,
+    ):
+        if sensor_type is not None and row["sensor_type"] != sensor_type:
+            continue
+        if sensor_type_name and row["sensor_type_name"] != sensor_type_name:
+            continue
+        recorded = row["date"]
+        if (lower or upper or week) and recorded is None:
+            continue
+        if (lower and recorded < lower) or (upper and recorded > upper):
+            continue
+        if week and not week_start <= recorded < week_end:
+            continue
+        yield {key: row[key] for key in RAW_SENSOR_CSV_HEADER}
+
+
+def _raw_sensor_csv_row(payload: dict) -> List[str]:
+    return [
+        payload["id"],
+        payload["driverProfileId"] or "",
+        str(payload["sensor_type"]),
+        payload["sensor_type_name"],
+        json_cell(payload["values"]),
+        str(payload["timestamp"]),
+        str(payload["date"]) if payload["date"] else "",
+        str(payload["accuracy"]),
+        payload["location_id"] or "",
+        payload["trip_id"] or "",
+        str(payload["sync"]),
+    ]
+
+
+def _raw_sensor_job_query(
+    db: Session, client: ApiClientContext, params: Dict[str, Any]
+):
+    return _raw_sensor_export_query(
+        db,
+        driver_profile_id=_uuid_param(params.get("driverProfileId")),
+        trip_id=_uuid_param(params.get("tripId")),
+        sensor_type=params.get("sensorType"),
+        sensor_type_name=params.get("sensorTypeName"),
+        start_timestamp=params.get("startTimestamp"),
+        end_timestamp=params.get("endTimestamp"),
+        start_date=_datetime_param(params.get("startDate")),
+        end_date=_datetime_param(params.get("endDate")),
+        week=params.get("week"),
     )
 
 
+register_export_dataset(
+    ExportDataset(
+        name="researcher_raw_sensor_export",
+        filename="raw_sensor_data",
+        build_query=_raw_sensor_job_query,
+        payload=_raw_sensor_payload,
+        csv_header=RAW_SENSOR_CSV_HEADER,
+        csv_row=_raw_sensor_csv_row,
+        keyset=(RawSensorData.timestamp, RawSensorData.id),
+    )
+)
+
+
 @router.get("/researcher/raw_sensor_data/export")
 def export_raw_sensor_data(
     driver_profile_id: Optional[UUID] = Query(None, alias="driverProfileId"),
@@ -600,110 +1035,136 @@ def export_raw_sensor_data(
     start_date: Optional[datetime] = Query(None, alias="startDate"),
     end_date: Optional[datetime] = Query(None, alias="endDate"),
     week: Optional[str] = Query(None),
+    since: Optional[str] = Query(None),
     export_format: str = Query("jsonl", alias="format"),
-    db: Session = Depends(get_db),
+    compression: Optional[str] = Query(None),
+    accept_encoding: Optional[str] = Header(None, alias="Accept-Encoding"),
+    db: Session = Depends(get_read_db),
     current_client: ApiClientContext = Depends(
         require_roles(Role.ADMIN, Role.RESEARCHER)
     ),
 ):
     ensure_dataset_access(db, current_client, "researcher_raw_sensor_export")
     export_format = _parse_export_format(export_format)
+    compression = parse_compression(compression, export_format)
+    export_headers = {NEXT_CURSOR_HEADER: next_change_cursor(db)}
 
-    query = db.query(RawSensorData, Trip.driverProfileId).outerjoin(
-        Trip, RawSensorData.trip_id == Trip.id
-    )
-    if driver_profile_id:
-        query = query.filter(Trip.driverProfileId == driver_profile_id)
-    if trip_id:
-        query = query.filter(RawSensorData.trip_id == trip_id)
-    if sensor_type is not None:
-        query = query.filter(RawSensorData.sensor_type == sensor_type)
-    if sensor_type_name:
-        query = query.filter(RawSensorData.sensor_type_name == sensor_type_name)
-    if start_timestamp is not None:
-        query = query.filter(RawSensorData.timestamp >= start_timestamp)
-    if end_timestamp is not None:
-        query = query.filter(RawSensorData.timestamp <= end_timestamp)
-    query = _apply_date_filters(
-        query, RawSensorData.date, start_date, end_date, week
+    query = _raw_sensor_export_query(
+        db,
+        driver_profile_id=driver_profile_id,
+        trip_id=trip_id,
+        sensor_type=sensor_type,
+        sensor_type_name=sensor_type_name,
+        start_timestamp=start_timestamp,
+        end_timestamp=end_timestamp,
+        start_date=start_date,
+        end_date=end_date,
+        week=week,
     )
-
-    query = query.order_by(RawSensorData.timestamp.asc())
-
-    def _record_payload(row: Tuple[RawSensorData, Optional[UUID]]) -> dict:
-        raw, driver_id = row
-        return {
-            "id": str(raw.id),
-            "driverProfileId": str(driver_id) if driver_id else None,
-            "sensor_type": raw.sensor_type,
-            "sensor_type_name": raw.sensor_type_name,
-            "values": raw.values,
-            "timestamp": raw.timestamp,
-            "date": raw.date,
-            "accuracy": raw.accuracy,
-            "location_id": str(raw.location_id) if raw.location_id else None,
-            "trip_id": str(raw.trip_id) if raw.trip_id else None,
-            "sync": raw.sync,
-        }
+    query = apply_change_cursor(query, RawSensorData.ingested_at, since)
 
     filename = "raw_sensor_data"
     if driver_profile_id:
         filename = f"{filename}_{driver_profile_id}"
 
+    def payloads() -> Iterable[dict]:
+        # Archived months come first; ``since`` syncs only ever see hot rows.
+        if since is None:
+            yield from _archived_raw_sensor_payloads(
+                db,
+                driver_profile_id=driver_profile_id,
+                trip_id=trip_id,
+                sensor_type=sensor_type,
+                sensor_type_name=sensor_type_name,
+                start_timestamp=start_timestamp,
+                end_timestamp=end_timestamp,
+                start_date=start_date,
+                end_date=end_date,
+                week=week,
+            )
+        for row in stream_rows(db, query):
+            yield _raw_sensor_payload(row)
+
+    if export_format in COLUMNAR_FORMATS:
+
+        def columnar_rows() -> Iterable[dict]:
+            for payload in payloads():
+                payload["values"] = _sensor_values(payload["values"])
+                yield payload
+
+        return _columnar_response(
+            columnar_rows(),
+            RAW_SENSOR_ARROW_SCHEMA,
+            export_format,
+            filename,
+            export_headers,
+        )
+
     if export_format == "csv":
-        header = [
-            "id",
-            "driverProfileId",
-            "sensor_type",
-            "sensor_type_name",
-            "values",
-            "timestamp",
-            "date",
-            "accuracy",
-            "location_id",
-            "trip_id",
-            "sync",
-        ]
 
         def rows() -> Iterable[List[str]]:
-            for raw, driver_id in query.yield_per(500):
-                payload = _record_payload((raw, driver_id))
-                yield [
-                    payload["id"],
-                    payload["driverProfileId"] or "",
-                    str(payload["sensor_type"]),
-                    payload["sensor_type_name"],
-                    json.dumps(payload["values"], default=str),
-                    str(payload["timestamp"]),
-                    str(payload["date"]) if payload["date"] else "",
-                    str(payload["accuracy"]),
-                    payload["location_id"] or "",
-                    payload["trip_id"] or "",
-                    str(payload["sync"]),
-                ]
-
-        headers = {
-            "Content-Disposition": f'attachment; filename="{filename}.csv"'
-        }
-        return StreamingResponse(
-            _stream_csv(header, rows()),
-            media_type="text/csv",
-            headers=headers,
+            for payload in payloads():
+                yield _raw_sensor_csv_row(payload)
+
+        return text_export_response(
+            csv_chunks(RAW_SENSOR_CSV_HEADER, rows()),
+            "text/csv",
+            f"{filename}.csv",
+            compression,
+            accept_encoding,
+            headers=export_headers,
         )
 
-    def jsonl_rows() -> Iterable[bytes]:
-        for raw, driver_id in query.yield_per(500):
-            payload = _record_payload((raw, driver_id))
-            yield (json.dumps(payload, default=str) + "\n").encode("utf-8")
+    return text_export_response(
+        jsonl_chunks(payloads()),
+        "application/x-ndjson",
+        f"{filename}.jsonl",
+        compression,
+        accept_encoding,
+        headers=export_headers,
+    )
 
-    headers = {
-        "Content-Disposition": f'attachment; filename="{filename}.jsonl"'
+
+@router.post(
+    "/researcher/raw_sensor_data/export/jobs",
+    response_model=ExportJobResponse,
+    status_code=202,
+)
+def create_raw_sensor_export_job(
+    driver_profile_id: Optional[UUID] = Query(None, alias="driverProfileId"),
+    trip_id: Optional[UUID] = Query(None, alias="tripId"),
+    sensor_type: Optional[int] = Query(None, alias="sensorType"),
+    sensor_type_name: Optional[str] = Query(None, alias="sensorTypeName"),
+    start_timestamp: Optional[int] = Query(None, alias="startTimestamp"),
+    end_timestamp: Optional[int] = Query(None, alias="endTimestamp"),
+    start_date: Optional[datetime] = Query(None, alias="startDate"),
+    end_date: Optional[datetime] = Query(None, alias="endDate"),
+    week: Optional[str] = Query(None),
+    export_format: str = Query("jsonl", alias="format"),
+    db: Session = Depends(get_db),
+    current_client: ApiClientContext = Depends(
+        require_roles(Role.ADMIN, Role.RESEARCHER)
+    ),
+) -> ExportJobResponse:
+    ensure_dataset_access(db, current_client, "researcher_raw_sensor_export")
+    export_format = _parse_job_format(export_format)
+    if week:
+        _parse_week(week)
+    params = {
+        "driverProfileId": str(driver_profile_id) if driver_profile_id else None,
+        "tripId": str(trip_id) if trip_id else None,
+        "sensorType": sensor_type,
+        "sensorTypeName": sensor_type_name,
+        "startTimestamp": start_timestamp,
+        "endTimestamp": end_timestamp,
+        "startDate": start_date.isoformat() if start_date else None,
+        "endDate": end_date.isoformat() if end_date else None,
+        "week": week,
     }
-    return StreamingResponse(
-        jsonl_rows(),
-        media_type="application/x-ndjson",
-        headers=headers,
+    job = create_export_job(
+        db, current_client, "researcher_raw_sensor_export", export_format, params
     )
+    return ExportJobResponse.model_validate(job)
 
 
 @router.get("/researcher/trips/export")
@@ -712,24 +1173,41 @@ def export_trips(
     start_date: Optional[datetime] = Query(None, alias="startDate"),
     end_date: Optional[datetime] = Query(None, alias="endDate"),
     week: Optional[str] = Query(None),
+    since: Optional[str] = Query(None),
     export_format: str = Query("jsonl", alias="format"),
-    db: Session = Depends(get_db),
+    compression: Optional[str] = Query(None),
+    accept_encoding: Optional[str] = Header(None, alias="Accept-Encoding"),
+    db: Session = Depends(get_read_db),
     current_client: ApiClientContext = Depends(
         require_roles(Role.ADMIN, Role.RESEARCHER)
     ),
 ):
     ensure_dataset_access(db, current_client, "researcher_trips_export")
     export_format = _parse_export_format(export_format)
-
-    trips_query = db.query(Trip)
+    compression = parse_compression(compression, export_format)
+    export_headers = {NEXT_CURSOR_HEADER: next_change_cursor(db)}
+
+    trips_query = select(
+        Trip.id,
+        Trip.driverProfileId,
+        Trip.start_date,
+        Trip.end_date,
+        Trip.start_time,
+        Trip.end_time,
+        Trip.influence,
+        Trip.trip_notes,
+        Trip.alcohol_probability,
+        Trip.user_alcohol_response,
+        Trip.sync,
+    )
     if driver_profile_id:
         trips_query = trips_query.filter(Trip.driverProfileId == driver_profile_id)
     trips_query = _apply_date_filters(
         trips_query, Trip.start_date, start_date, end_date, week
     )
-    trips_query = trips_query.order_by(Trip.start_date.desc())
+    trips_query = apply_change_cursor(trips_query, Trip.ingested_at, since)
 
-    questionnaires_query = db.query(AlcoholQuestionnaire)
+    questionnaires_query = select(*AlcoholQuestionnaire.__table__.columns)
     if driver_profile_id:
         questionnaires_query = questionnaires_query.filter(
             AlcoholQuestionnaire.driverProfileId == driver_profile_id
@@ -737,13 +1215,16 @@ def export_trips(
     questionnaires_query = _apply_date_filters(
         questionnaires_query, AlcoholQuestionnaire.date, start_date, end_date, week
     )
+    passes = _trip_questionnaire_passes(trips_query, questionnaires_query)
 
-    lookup = _build_questionnaire_lookup(questionnaires_query.all())
+    def matched_trips() -> Iterable[tuple]:
+        for trips_statement, questionnaires_statement in passes:
+            yield from _merge_questionnaires(
+                stream_rows(db, trips_statement),
+                _stream_questionnaires(db, questionnaires_statement),
+            )
 
-    def _trip_payload(trip: Trip) -> dict:
-        match = _match_questionnaire(
-            lookup, trip.driverProfileId, _trip_day_utc(trip)
-        )
+    def _trip_payload(trip: Row, match: Optional[Row]) -> dict:
         questionnaire_payload = (
             AlcoholQuestionnaireResponseSchema.model_validate(match).model_dump()
             if match
@@ -770,6 +1251,27 @@ def export_trips(
     if driver_profile_id:
         filename = f"{filename}_{driver_profile_id}"
 
+    if export_format in COLUMNAR_FORMATS:
+
+        def columnar_rows() -> Iterable[dict]:
+            for trip, match in matched_trips():
+                payload = _trip_payload(trip, match)
+                questionnaire = payload["matchedQuestionnaire"]
+                if questionnaire:
+                    questionnaire["id"] = str(questionnaire["id"])
+                    questionnaire["driverProfileId"] = str(
+                        questionnaire["driverProfileId"]
+                    )
+                yield payload
+
+        return _columnar_response(
+            columnar_rows(),
+            TRIP_ARROW_SCHEMA,
+            export_format,
+            filename,
+            export_headers,
+        )
+
     if export_format == "csv":
         header = [
             "id",
@@ -789,8 +1291,8 @@ def export_trips(
         ]
 
         def rows() -> Iterable[List[str]]:
-            for trip in trips_query.yield_per(200):
-                payload = _trip_payload(trip)
+            for trip, match in matched_trips():
+                payload = _trip_payload(trip, match)
                 yield [
                     payload["id"],
                     payload["driverProfileId"],
@@ -805,34 +1307,29 @@ def export_trips(
                     else "",
                     payload["userAlcoholResponse"] or "",
                     str(payload["sync"]),
-                    json.dumps(payload["matchedQuestionnaire"], default=str)
+                    json_cell(payload["matchedQuestionnaire"])
                     if payload["matchedQuestionnaire"]
                     else "",
                     payload["matchingRule"],
                     payload["matchingTimezone"],
                 ]
 
-        headers = {
-            "Content-Disposition": f'attachment; filename="{filename}.csv"'
-        }
-        return StreamingResponse(
-            _stream_csv(header, rows()),
-            media_type="text/csv",
-            headers=headers,
+        return text_export_response(
+            csv_chunks(header, rows()),
+            "text/csv",
+            f"{filename}.csv",
+            compression,
+            accept_encoding,
+            headers=export_headers,
         )
 
-    def jsonl_rows() -> Iterable[bytes]:
-        for trip in trips_query.yield_per(200):
-            payload = _trip_payload(trip)
-            yield (json.dumps(payload, default=str) + "\n").encode("utf-8")
-
-    headers = {
-        "Content-Disposition": f'attachment; filename="{filename}.jsonl"'
-    }
-    return StreamingResponse(
-        jsonl_rows(),
-        media_type="application/x-ndjson",
-        headers=headers,
+    return text_export_response(
+        jsonl_chunks(_trip_payload(trip, match) for trip, match in matched_trips()),
+        "application/x-ndjson",
+        f"{filename}.jsonl",
+        compression,
+        accept_encoding,
+        headers=export_headers,
     )
 
 
@@ -845,7 +1342,7 @@ def get_aggregate_snapshot(
     start_date: Optional[datetime] = Query(None, alias="startDate"),
     end_date: Optional[datetime] = Query(None, alias="endDate"),
     week: Optional[str] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_client: ApiClientContext = Depends(
         require_roles(Role.ADMIN, Role.RESEARCHER)
     ),
@@ -885,7 +1382,7 @@ def download_aggregate_snapshot(
     start_date: Optional[datetime] = Query(None, alias="startDate"),
     end_date: Optional[datetime] = Query(None, alias="endDate"),
     week: Optional[str] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_client: ApiClientContext = Depends(
         require_roles(Role.ADMIN, Role.RESEARCHER)
     ),
@@ -929,9 +1426,8 @@ def backfill_trip_alcohol(
     trips_query = _apply_date_filters(
         trips_query, Trip.start_date, start_date, end_date, week
     )
-    trips = trips_query.all()
 
-    questionnaires_query = db.query(AlcoholQuestionnaire)
+    questionnaires_query = select(*AlcoholQuestionnaire.__table__.columns)
     if driver_profile_id:
         questionnaires_query = questionnaires_query.filter(
             AlcoholQuestionnaire.driverProfileId == driver_profile_id
@@ -940,33 +1436,38 @@ def backfill_trip_alcohol(
         questionnaires_query, AlcoholQuestionnaire.date, start_date, end_date, week
     )
 
-    lookup = _build_questionnaire_lookup(questionnaires_query.all())
-
+    total_trips = 0
     matched = 0
     updated = 0
     skipped_no_date = 0
 
-    for trip in trips:
-        trip_day = _trip_day_utc(trip)
-        if trip_day is None:
-            skipped_no_date += 1
-            continue
-        match = _match_questionnaire(lookup, trip.driverProfileId, trip_day)
-        if not match:
-            continue
-        matched += 1
-        response_code = "1" if match.drankAlcohol else "0"
-        probability = 1.0 if match.drankAlcohol else 0.0
-
-        changed = False
-        if overwrite or trip.user_alcohol_response in (None, ""):
-            trip.user_alcohol_response = response_code
-            changed = True
-        if overwrite or trip.alcohol_probability is None:
-            trip.alcohol_probability = probability
-            changed = True
-        if changed:
-            updated += 1
+    for trips_statement, questionnaires_statement in _trip_questionnaire_passes(
+        trips_query, questionnaires_query
+    ):
+        # Trips are loaded (they are updated in place); questionnaires stream.
+        trips = trips_statement.all()
+        total_trips += len(trips)
+        for trip, match in _merge_questionnaires(
+            trips, stream_rows(db, questionnaires_statement)
+        ):
+            if _trip_day_utc(trip) is None:
+                skipped_no_date += 1
+                continue
+            if not match:
+                continue
+            matched += 1
+            response_code = "1" if match.drankAlcohol else "0"
+            probability = 1.0 if match.drankAlcohol else 0.0
+
+            changed = False
+            if overwrite or trip.user_alcohol_response in (None, ""):
+                trip.user_alcohol_response = response_code
+                changed = True
+            if overwrite or trip.alcohol_probability is None:
+                trip.alcohol_probability = probability
+                changed = True
+            if changed:
+                updated += 1
 
     if updated:
         db.commit()
@@ -975,7 +1476,7 @@ def backfill_trip_alcohol(
         "driverProfileId": str(driver_profile_id) if driver_profile_id else None,
         "matchingRule": MATCHING_RULE,
         "matchingTimezone": MATCHING_TIMEZONE,
-        "totalTrips": len(trips),
+        "totalTrips": total_trips,
         "matchedTrips": matched,
         "updatedTrips": updated,
         "skippedTripsNoDate": skipped_no_date,
@@ -988,7 +1489,7 @@ def backfill_trip_alcohol(
     response_model=IngestionStatusResponse,
 )
 def get_ingestion_status(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_client: ApiClientContext = Depends(
         require_roles(Role.ADMIN, Role.RESEARCHER)
     ),
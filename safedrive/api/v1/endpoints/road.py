@@ -3,6 +3,8 @@ from sqlalchemy.orm import Session
 from typing import List
 from uuid import UUID
 from safedrive.database.db import get_db
+from safedrive.core.etag import conditional_get
+from safedrive.models.road import Road
 from safedrive.schemas.road import RoadCreate, RoadUpdate, RoadResponse
 from safedrive.crud.road import crud_road
 import logging
@@ -21,7 +23,11 @@ def create_road(*, db: Session = Depends(get_db), road_in: RoadCreate) -> RoadRe
         logger.error(f"Error creating Road: {str(e)}")
         raise HTTPException(status_code=500, detail="Error creating road")
 
-@router.get("/roads/{road_id}", response_model=RoadResponse)
+@router.get(
+    "/roads/{road_id}",
+    response_model=RoadResponse,
+    dependencies=[Depends(conditional_get(Road))],
+)
 def get_road(road_id: UUID, db: Session = Depends(get_db)) -> RoadResponse:
     """Retrieve a road by ID."""
     road = crud_road.get(db=db, id=road_id)
@@ -30,7 +36,11 @@ def get_road(road_id: UUID, db: Session = Depends(get_db)) -> RoadResponse:
         raise HTTPException(status_code=404, detail="Road not found")
     return RoadResponse.model_validate(road)
 
-@router.get("/roads/", response_model=List[RoadResponse])
+@router.get(
+    "/roads/",
+    response_model=List[RoadResponse],
+    dependencies=[Depends(conditional_get(Road))],
+)
 def get_all_roads(skip: int = 0, limit: int = 20, db: Session = Depends(get_db)) -> List[RoadResponse]:
     """List all roads with optional pagination."""
     roads = crud_road.get_all(db=db, skip=skip, limit=limit)
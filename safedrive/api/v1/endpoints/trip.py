@@ -1,10 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException
+from itertools import chain, islice
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
 from uuid import UUID
 import logging
+from safedrive.core.cold_archive import archived_rows
+from safedrive.core.partitions import PARTITION_PRUNING_SLACK_MS
 from safedrive.crud.trip import trip_crud
 from safedrive.crud.driver_profile import driver_profile_crud
+from safedrive.database.async_db import get_async_db
 from safedrive.database.db import get_db
 from safedrive.core.security import (
     ApiClientContext,
@@ -13,7 +19,9 @@ from safedrive.core.security import (
     filter_query_by_driver_ids,
     require_roles_or_jwt,
 )
+from safedrive.models.raw_sensor_data import RawSensorData
 from safedrive.models.trip import Trip
+from safedrive.schemas.raw_sensor_data import RawSensorDataResponse
 from safedrive.schemas.trip import (
     TripCreate,
     TripUpdate,
@@ -85,14 +93,55 @@ def get_trip(
         logger.exception("Error retrieving trip")
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
-@router.get("/trips/", response_model=List[TripResponse])
-def get_all_trips(
+@router.get("/trips/{trip_id}/raw_sensor_data", response_model=List[RawSensorDataResponse])
+def get_trip_raw_sensor_data(
+    trip_id: UUID,
     skip: int = 0,
     limit: int = 5000,
     db: Session = Depends(get_db),
     current_client: ApiClientContext = Depends(
         require_roles_or_jwt(Role.ADMIN, Role.DRIVER)
     ),
+) -> List[RawSensorDataResponse]:
+    """
+    Retrieve a trip's sensor readings in recording order, including readings
+    already moved to the cold archive.
+
+    - **trip_id**: The UUID of the trip.
+    - **skip**: Number of readings to skip.
+    - **limit**: Maximum number of readings to return.
+    """
+    trip = trip_crud.get(db=db, id=trip_id)
+    if not trip:
+        logger.warning(f"Trip with ID {trip_id} not found.")
+        raise HTTPException(status_code=404, detail="Trip not found")
+    ensure_driver_access(current_client, trip.driverProfileId)
+
+    archived = archived_rows(
+        db,
+        "raw_sensor_data",
+        driver_profile_id=trip.driverProfileId,
+        trip_id=trip.id,
+        start_ms=trip.start_time - PARTITION_PRUNING_SLACK_MS if trip.start_time else None,
+        end_ms=trip.end_time + PARTITION_PRUNING_SLACK_MS if trip.end_time else None,
+    )
+    hot = (
+        db.query(RawSensorData)
+        .filter(RawSensorData.trip_id == trip.id)
+        .order_by(RawSensorData.timestamp.asc(), RawSensorData.id.asc())
+        .limit(skip + limit)
+    )
+    rows = islice(chain(archived, hot), skip, skip + limit)
+    return [RawSensorDataResponse.model_validate(row) for row in rows]
+
+@router.get("/trips/", response_model=List[TripResponse])
+async def get_all_trips(
+    skip: int = 0,
+    limit: int = 5000,
+    db: AsyncSession = Depends(get_async_db),
+    current_client: ApiClientContext = Depends(
+        require_roles_or_jwt(Role.ADMIN, Role.DRIVER)
+    ),
 ) -> List[TripResponse]:
     """
     Retrieve all trips with optional pagination.
@@ -104,12 +153,8 @@ def get_all_trips(
         # if limit > 100:
         #     logger.error("Limit cannot exceed 100 items.")
         #     raise HTTPException(status_code=400, detail="Limit cannot exceed 100 items")
-        if current_client.role == Role.ADMIN:
-            trips = trip_crud.get_all(db=db, skip=skip, limit=limit)
-        else:
-            query = db.query(Trip)
-            query = filter_query_by_driver_ids(query, Trip.driverProfileId, current_client)
-            trips = query.offset(skip).limit(limit).all()
+        query = filter_query_by_driver_ids(select(Trip), Trip.driverProfileId, current_client)
+        trips = (await db.scalars(query.offset(skip).limit(limit))).all()
         logger.info(f"Retrieved {len(trips)} trips.")
         return [TripResponse.model_validate(trip) for trip in trips]
     except Exception as e:
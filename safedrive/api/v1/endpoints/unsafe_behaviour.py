@@ -51,7 +51,7 @@ def create_unsafe_behaviour(
             raise HTTPException(status_code=400, detail="Trip ID and behaviour type are required")
         ensure_driver_access(current_client, unsafe_behaviour_in.driverProfileId)
         new_behaviour = unsafe_behaviour_crud.create(db=db, obj_in=unsafe_behaviour_in)
-        logger.info(f"Unsafe behaviour created with ID: {new_behaviour.id.hex()}")
+        logger.info(f"Unsafe behaviour created with ID: {new_behaviour.id}")
         return UnsafeBehaviourResponse.model_validate(new_behaviour)
     except Exception as e:
         logger.exception("Error creating unsafe behaviour")
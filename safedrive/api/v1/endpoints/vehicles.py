@@ -1,11 +1,12 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import and_, func, desc
+from sqlalchemy import func, desc
 from sqlalchemy.orm import Session, joinedload
 
+from safedrive.core.driver_reports import trip_metrics
 from safedrive.core.security import (
     ApiClientContext,
     Role,
@@ -17,8 +18,7 @@ from safedrive.models.vehicle import Vehicle, DriverVehicleAssignment
 from safedrive.models.driver_profile import DriverProfile
 from safedrive.models.fleet import Fleet, VehicleGroup
 from safedrive.models.trip import Trip
-from safedrive.models.unsafe_behaviour import UnsafeBehaviour
-from safedrive.models.location import Location
+from safedrive.models.vehicle_day_stats import VehicleDayStats
 from safedrive.crud.vehicle import crud_vehicle, crud_driver_vehicle_assignment
 from safedrive.schemas import vehicle as vehicle_schemas
 
@@ -53,6 +53,50 @@ def _ensure_vehicle_access(db: Session, client: ApiClientContext, vehicle_id: UU
     return vehicle
 
 
+def _trip_summaries(db: Session, trips: List[Trip]) -> List[vehicle_schemas.TripSummary]:
+    """Summaries for a page of trips, with metrics from two grouped queries."""
+    metrics = trip_metrics(db, [trip.id for trip in trips])
+    return [
+        vehicle_schemas.TripSummary(
+            id=trip.id_uuid,
+            start_time=trip.start_time,
+            end_time=trip.end_time,
+            distance_km=metrics[trip.id].distance_km,
+            unsafe_count=metrics[trip.id].unsafe_count
+        )
+        for trip in trips
+    ]
+
+
+def _vehicle_rollup(db: Session, vehicle_id: UUID, start_day: Optional[date] = None):
+    """
+    Per-driver sums of the vehicle's ``vehicle_day_stats`` rows from
+    ``start_day`` on, busiest driver first: ``(driverProfileId, email,
+    trip_count, distance_m, duration_ms, unsafe_count)``.
+    """
+    trip_count = func.sum(VehicleDayStats.trip_count)
+    query = (
+        db.query(
+            VehicleDayStats.driverProfileId,
+            DriverProfile.email,
+            trip_count,
+            func.sum(VehicleDayStats.distance_m),
+            func.sum(VehicleDayStats.duration_ms),
+            func.sum(VehicleDayStats.unsafe_count),
+        )
+        .outerjoin(
+            DriverProfile,
+            DriverProfile.driverProfileId == VehicleDayStats.driverProfileId,
+        )
+        .filter(VehicleDayStats.vehicle_id == vehicle_id)
+        .group_by(VehicleDayStats.driverProfileId, DriverProfile.email)
+        .order_by(desc(trip_count))
+    )
+    if start_day:
+        query = query.filter(VehicleDayStats.day >= start_day)
+    return query.all()
+
+
 # --- Vehicle CRUD Endpoints ---
 
 @router.get(
@@ -169,49 +213,13 @@ def get_vehicle(
         .order_by(Trip.start_time.desc())
         .limit(10)
     )
-    recent_trips = []
-    for trip in recent_trips_query:
-        # Calculate distance from locations
-        distance_km = (
-            db.query(func.sum(Location.distance))
-            .filter(Location.trip_id == trip.id)
-            .scalar() or 0.0
-        )
-        # Get unsafe behaviour count
-        unsafe_count = (
-            db.query(func.count(UnsafeBehaviour.id))
-            .filter(UnsafeBehaviour.trip_id == trip.id)
-            .scalar() or 0
-        )
-        recent_trips.append(vehicle_schemas.TripSummary(
-            id=trip.id_uuid,
-            start_time=trip.start_time,
-            end_time=trip.end_time,
-            distance_km=distance_km,
-            unsafe_count=unsafe_count
-        ))
-
-    # Calculate vehicle statistics
-    stats_query = (
-        db.query(
-            func.count(Trip.id).label('total_trips'),
-            func.sum(Location.distance).label('total_distance')
-        )
-        .outerjoin(Location, Location.trip_id == Trip.id)
-        .filter(Trip.vehicle_id == vehicle_id.bytes)
-        .first()
-    )
-
-    total_trips = stats_query.total_trips or 0
-    total_distance_km = float(stats_query.total_distance or 0.0)
+    recent_trips = _trip_summaries(db, recent_trips_query.all())
 
-    # Get total unsafe behaviours
-    total_unsafe = (
-        db.query(func.count(UnsafeBehaviour.id))
-        .join(Trip, Trip.id == UnsafeBehaviour.trip_id)
-        .filter(Trip.vehicle_id == vehicle_id.bytes)
-        .scalar() or 0
-    )
+    # Calculate vehicle statistics from the rollup
+    rollup = _vehicle_rollup(db, vehicle_id)
+    total_trips = sum(int(row[2] or 0) for row in rollup)
+    total_distance_km = sum(float(row[3] or 0.0) for row in rollup) / 1000.0
+    total_unsafe = sum(int(row[5] or 0) for row in rollup)
 
     # Calculate UBPK
     ubpk = (total_unsafe / total_distance_km) if total_distance_km > 0 else 0.0
@@ -579,7 +587,7 @@ def get_vehicle_trips(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(25, ge=10, le=100, description="Items per page"),
     db: Session = Depends(get_db),
-    client: ApiClientContext = Depends(require_roles([Role.ADMIN, Role.FLEET_MANAGER, Role.INSURANCE_PARTNER]))
+    client: ApiClientContext = Depends(require_roles(Role.ADMIN, Role.FLEET_MANAGER, Role.INSURANCE_PARTNER))
 ):
     """Get trips for a vehicle with optional date filtering and pagination."""
     vehicle = _ensure_vehicle_access(db, client, vehicle_id)
@@ -602,28 +610,7 @@ def get_vehicle_trips(
     skip = (page - 1) * page_size
     trips = query.order_by(Trip.start_time.desc()).offset(skip).limit(page_size).all()
 
-    # Build response
-    trip_summaries = []
-    for trip in trips:
-        # Calculate distance
-        distance_km = (
-            db.query(func.sum(Location.distance))
-            .filter(Location.trip_id == trip.id)
-            .scalar() or 0.0
-        )
-        # Get unsafe count
-        unsafe_count = (
-            db.query(func.count(UnsafeBehaviour.id))
-            .filter(UnsafeBehaviour.trip_id == trip.id)
-            .scalar() or 0
-        )
-        trip_summaries.append(vehicle_schemas.TripSummary(
-            id=trip.id_uuid,
-            start_time=trip.start_time,
-            end_time=trip.end_time,
-            distance_km=distance_km,
-            unsafe_count=unsafe_count
-        ))
+    trip_summaries = _trip_summaries(db, trips)
 
     return vehicle_schemas.VehicleTripsResponse(
         trips=trip_summaries,
@@ -645,101 +632,41 @@ def get_vehicle_stats(
     db: Session = Depends(get_db),
     client: ApiClientContext = Depends(require_roles(Role.ADMIN, Role.FLEET_MANAGER, Role.INSURANCE_PARTNER))
 ):
-    """Get statistics for a vehicle."""
-    vehicle = _ensure_vehicle_access(db, client, vehicle_id)
+    """
+    Get statistics for a vehicle from the ``vehicle_day_stats`` rollup.
 
-    # Calculate date filter based on period
-    start_date = None
+    Periods are counted in whole UTC days of trip start: ``day`` covers
+    today and yesterday, ``week`` the last 7 days and ``month`` the last 30.
+    """
+    _ensure_vehicle_access(db, client, vehicle_id)
+
+    # Calculate the first rollup day of the period
+    start_day = None
     if period == "day":
-        start_date = datetime.utcnow() - timedelta(days=1)
+        start_day = (datetime.utcnow() - timedelta(days=1)).date()
     elif period == "week":
-        start_date = datetime.utcnow() - timedelta(weeks=1)
+        start_day = (datetime.utcnow() - timedelta(weeks=1)).date()
     elif period == "month":
-        start_date = datetime.utcnow() - timedelta(days=30)
-
-    # Build trip query
-    trip_query = db.query(Trip).filter(Trip.vehicle_id == vehicle_id.bytes)
-    if start_date:
-        start_timestamp_ms = int(start_date.timestamp() * 1000)
-        trip_query = trip_query.filter(Trip.start_time >= start_timestamp_ms)
-
-    # Get trip IDs for the period
-    trip_ids = [trip.id for trip in trip_query.all()]
-
-    # Calculate statistics
-    total_trips = len(trip_ids)
+        start_day = (datetime.utcnow() - timedelta(days=30)).date()
 
-    if total_trips > 0:
-        # Total distance
-        total_distance_km = float(
-            db.query(func.sum(Location.distance))
-            .filter(Location.trip_id.in_(trip_ids))
-            .scalar() or 0.0
-        )
-
-        # Total duration in hours
-        duration_query = (
-            db.query(
-                func.sum((Trip.end_time - Trip.start_time) / 1000 / 3600)
-            )
-            .filter(
-                and_(
-                    Trip.id.in_(trip_ids),
-                    Trip.end_time.isnot(None)
-                )
-            )
-            .scalar()
-        )
-        total_duration_hours = float(duration_query or 0.0)
-
-        # Total unsafe behaviours
-        total_unsafe = (
-            db.query(func.count(UnsafeBehaviour.id))
-            .filter(UnsafeBehaviour.trip_id.in_(trip_ids))
-            .scalar() or 0
-        )
-
-        # UBPK
-        ubpk = (total_unsafe / total_distance_km) if total_distance_km > 0 else 0.0
+    # One range query over the rollup, per driver so distinct drivers and
+    # the busiest driver come from the same rows
+    rows = _vehicle_rollup(db, vehicle_id, start_day)
 
-        # Unique drivers
-        unique_drivers = (
-            db.query(func.count(func.distinct(Trip.driverProfileId)))
-            .filter(Trip.id.in_(trip_ids))
-            .scalar() or 0
-        )
+    total_trips = sum(int(row[2] or 0) for row in rows)
+    total_distance_km = sum(float(row[3] or 0.0) for row in rows) / 1000.0
+    total_duration_hours = sum(int(row[4] or 0) for row in rows) / 1000 / 3600
+    total_unsafe = sum(int(row[5] or 0) for row in rows)
+    ubpk = (total_unsafe / total_distance_km) if total_distance_km > 0 else 0.0
 
-        # Busiest driver
-        busiest_query = (
-            db.query(
-                Trip.driverProfileId,
-                func.count(Trip.id).label('trip_count')
-            )
-            .filter(Trip.id.in_(trip_ids))
-            .group_by(Trip.driverProfileId)
-            .order_by(desc('trip_count'))
-            .first()
+    busiest_driver = None
+    if rows and rows[0][1] is not None:
+        busiest_driver = vehicle_schemas.BusiestDriver(
+            driver_profile_id=rows[0][0],
+            email=rows[0][1],
+            trip_count=int(rows[0][2])
         )
 
-        busiest_driver = None
-        if busiest_query:
-            driver = db.query(DriverProfile).filter(
-                DriverProfile.driverProfileId == busiest_query.driverProfileId
-            ).first()
-            if driver:
-                busiest_driver = vehicle_schemas.BusiestDriver(
-                    driver_profile_id=driver.driverProfileId,
-                    email=driver.email,
-                    trip_count=busiest_query.trip_count
-                )
-    else:
-        total_distance_km = 0.0
-        total_duration_hours = 0.0
-        total_unsafe = 0
-        ubpk = 0.0
-        unique_drivers = 0
-        busiest_driver = None
-
     return vehicle_schemas.VehicleStatsResponse(
         vehicle_id=vehicle_id,
         period=period,
@@ -748,6 +675,6 @@ def get_vehicle_stats(
         total_duration_hours=total_duration_hours,
         total_unsafe_behaviours=total_unsafe,
         ubpk=ubpk,
-        unique_drivers=unique_drivers,
+        unique_drivers=len(rows),
         busiest_driver=busiest_driver
     )
@@ -0,0 +1,241 @@
+"""
+Real-time alert push for the ``/alerts/stream`` (SSE) and ``/alerts/ws``
+(WebSocket) endpoints.
+
+Dashboards used to poll ``/insurance/alerts`` and the driver monitor every
+few seconds, re-running their queries on each poll. Alerts are now pushed
+as they are ingested:
+
+* Committed ``unsafe_behaviour`` and ``speeding_event`` inserts are turned
+  into alerts by ``safedrive.database.events`` insert hooks and published.
+* With Redis, alerts get a globally increasing id (``INCRBY``) and are
+  published on a pub/sub channel; a listener thread in every worker with
+  subscribers fans them out locally. Without Redis they are fanned out in
+  process only.
+* Each worker keeps the last ``ALERT_STREAM_REPLAY_SIZE`` alerts, so a
+  client reconnecting with ``Last-Event-ID`` gets what it missed.
+* Every subscription has a bounded queue. A subscriber that falls
+  ``ALERT_STREAM_QUEUE_SIZE`` alerts behind is disconnected instead of
+  buffering without limit; it resumes from ``Last-Event-ID``.
+
+Subscriptions filter by the client's ``allowed_driver_ids`` and a minimum
+severity, which applies to unsafe behaviours (speeding alerts carry none).
+"""
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, FrozenSet, List, Optional, Set
+
+from redis.exceptions import RedisError
+
+from safedrive.core.cache import get_redis_client
+from safedrive.database.events import on_inserts_committed
+
+logger = logging.getLogger(__name__)
+
+ALERT_STREAM_QUEUE_SIZE = int(os.getenv("ALERT_STREAM_QUEUE_SIZE", "100"))
+ALERT_STREAM_REPLAY_SIZE = int(os.getenv("ALERT_STREAM_REPLAY_SIZE", "1000"))
+ALERT_STREAM_KEEPALIVE_SECONDS = float(os.getenv("ALERT_STREAM_KEEPALIVE_SECONDS", "15"))
+
+ALERT_CHANNEL = "alerts:stream"
+ALERT_SEQUENCE_KEY = "alerts:stream:seq"
+
+
+class AlertStreamOverflow(Exception):
+    """The subscriber fell too far behind and must reconnect."""
+
+
+@dataclass(frozen=True)
+class AlertFilter:
+    driver_ids: Optional[FrozenSet[str]]
+    min_severity: float
+
+    def matches(self, alert: dict) -> bool:
+        if self.driver_ids is not None and alert["driverProfileId"] not in self.driver_ids:
+            return False
+        severity = alert.get("severity")
+        return severity is None or severity >= self.min_severity
+
+
+@dataclass(eq=False)
+class AlertSubscription:
+    filter: AlertFilter
+    loop: asyncio.AbstractEventLoop
+    backlog: Deque[dict] = field(default_factory=deque)
+    queue: asyncio.Queue = field(
+        default_factory=lambda: asyncio.Queue(maxsize=ALERT_STREAM_QUEUE_SIZE)
+    )
+    overflowed: bool = False
+
+    def offer(self, alert: dict) -> None:
+        """Queue ``alert``; call on the subscription's event loop."""
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(alert)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def next_alert(self, timeout: float) -> Optional[dict]:
+        """The next alert, or None after ``timeout`` seconds without one."""
+        if self.backlog:
+            return self.backlog.popleft()
+        if self.overflowed:
+            raise AlertStreamOverflow()
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class AlertBroker:
+    """Fans published alerts out to subscriptions in this process."""
+
+    def __init__(self, replay_size: int = ALERT_STREAM_REPLAY_SIZE) -> None:
+        self._lock = threading.Lock()
+        self._subscriptions: Set[AlertSubscription] = set()
+        self._replay: Deque[dict] = deque(maxlen=replay_size)
+        # Microseconds since the epoch, so ids keep increasing across restarts.
+        self._sequence = time.time_ns() // 1000
+        self._listener: Optional[threading.Thread] = None
+
+    def _next_ids(self, count: int) -> List[int]:
+        client = get_redis_client()
+        if client is not None:
+            try:
+                pipe = client.pipeline(transaction=False)
+                pipe.set(ALERT_SEQUENCE_KEY, time.time_ns() // 1000, nx=True)
+                pipe.incrby(ALERT_SEQUENCE_KEY, count)
+                last = int(pipe.execute()[1])
+                return list(range(last - count + 1, last + 1))
+            except RedisError as e:
+                logger.warning(f"Alert sequence unavailable: {e}")
+        with self._lock:
+            first = self._sequence + 1
+            self._sequence += count
+        return list(range(first, first + count))
+
+    def publish(self, alerts: List[dict]) -> None:
+        if not alerts:
+            return
+        for alert, alert_id in zip(alerts, self._next_ids(len(alerts))):
+            alert["id"] = alert_id
+        client = get_redis_client()
+        if client is not None:
+            try:
+                client.publish(ALERT_CHANNEL, json.dumps(alerts))
+                return
+            except RedisError as e:
+                logger.warning(f"Alert publish failed, delivering locally: {e}")
+        self._dispatch(alerts)
+
+    def _dispatch(self, alerts: List[dict]) -> None:
+        with self._lock:
+            self._replay.extend(alerts)
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            matching = [alert for alert in alerts if subscription.filter.matches(alert)]
+            for alert in matching:
+                try:
+                    subscription.loop.call_soon_threadsafe(subscription.offer, alert)
+                except RuntimeError:
+                    # The subscriber's loop is closed; it is going away.
+                    break
+
+    def subscribe(
+        self, alert_filter: AlertFilter, last_event_id: Optional[int] = None
+    ) -> AlertSubscription:
+        """Register a subscription on the running loop, replaying after ``last_event_id``."""
+        subscription = AlertSubscription(alert_filter, asyncio.get_running_loop())
+        self._ensure_listener()
+        with self._lock:
+            if last_event_id is not None:
+                subscription.backlog.extend(
+                    alert
+                    for alert in self._replay
+                    if alert["id"] > last_event_id and alert_filter.matches(alert)
+                )
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: AlertSubscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def _ensure_listener(self) -> None:
+        if self._listener is not None and self._listener.is_alive():
+            return
+        if get_redis_client() is None:
+            return
+        with self._lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = threading.Thread(
+                    target=self._listen, name="alert-stream", daemon=True
+                )
+                self._listener.start()
+
+    def _listen(self) -> None:
+        while True:
+            client = get_redis_client()
+            if client is None:
+                time.sleep(1.0)
+                continue
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(ALERT_CHANNEL)
+                while True:
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is not None:
+                        self._dispatch(json.loads(message["data"]))
+            except (RedisError, ValueError) as e:
+                logger.warning(f"Alert stream listener reconnecting: {e}")
+                time.sleep(1.0)
+            finally:
+                pubsub.close()
+
+
+alert_broker = AlertBroker()
+
+
+@on_inserts_committed("unsafe_behaviour")
+def _publish_unsafe_behaviours(rows: List[dict]) -> None:
+    alert_broker.publish(
+        [
+            {
+                "alert_type": "unsafe_behaviour",
+                "driverProfileId": str(row["driverProfileId"]),
+                "trip_id": str(row["trip_id"]) if row.get("trip_id") else None,
+                "severity": row["severity"],
+                "timestamp": row["timestamp"],
+                "message": f"Unsafe behaviour {row['behaviour_type']} severity {row['severity']}",
+            }
+            for row in rows
+        ]
+    )
+
+
+@on_inserts_committed("speeding_event")
+def _publish_speeding_events(rows: List[dict]) -> None:
+    alert_broker.publish(
+        [
+            {
+                "alert_type": "speed_violation",
+                "driverProfileId": str(row["driverProfileId"]),
+                "trip_id": str(row["trip_id"]),
+                "severity": None,
+                "timestamp": row["timestamp"],
+                "end_timestamp": row["end_timestamp"],
+                "max_overspeed": row["max_overspeed"],
+                "message": (
+                    f"Speed exceeded posted limit by up to {row['max_overspeed']:g} "
+                    f"over {row['point_count']} readings"
+                ),
+            }
+            for row in rows
+        ]
+    )
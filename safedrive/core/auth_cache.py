@@ -0,0 +1,220 @@
+"""
+Cache of resolved API-key auth contexts.
+
+Resolving an API key costs an ``api_client`` lookup and, for fleet managers
+and insurance partners, a scan of every assigned driver. The resolved
+context is cached by key hash in-process (LRU with a TTL) and, when Redis is
+available, in Redis so other workers can reuse it.
+
+Any committed ORM write to ``api_client``, ``driver_fleet_assignment`` or
+``insurance_partner_driver`` invalidates the whole cache. With Redis the
+invalidation bumps a shared generation number that every worker checks on
+lookup; without Redis other workers only notice once their entries expire,
+so keep ``AUTH_CACHE_TTL`` short in multi-worker deployments without Redis.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from redis.exceptions import RedisError
+
+from safedrive.core.cache import get_redis_client
+from safedrive.database.events import on_tables_committed
+
+logger = logging.getLogger(__name__)
+
+AUTH_CACHE_ENABLED = os.getenv("AUTH_CACHE_ENABLED", "true").lower() == "true"
+AUTH_CACHE_TTL = int(os.getenv("AUTH_CACHE_TTL", "60"))
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "10000"))
+
+AUTH_CACHE_KEY_PREFIX = "auth:ctx"
+AUTH_CACHE_GENERATION_KEY = f"{AUTH_CACHE_KEY_PREFIX}:generation"
+
+# Tables whose contents feed into a resolved auth context.
+AUTH_SCOPE_TABLES = frozenset(
+    {"api_client", "driver_fleet_assignment", "insurance_partner_driver"}
+)
+
+_COUNTERS = (
+    "local_hits",
+    "redis_hits",
+    "misses",
+    "evictions",
+    "invalidations",
+    "db_queries_saved",
+    "db_rows_saved",
+)
+
+
+class AuthContextCache:
+    """
+    LRU + TTL cache for auth contexts with an optional Redis tier.
+
+    ``serialize``/``deserialize`` convert a context to and from a JSON-safe
+    dict for Redis; ``cost`` returns the ``(queries, rows)`` a database load
+    of that context takes, which feeds the saved-load metrics.
+    """
+
+    def __init__(
+        self,
+        serialize: Callable[[Any], dict],
+        deserialize: Callable[[dict], Any],
+        cost: Callable[[Any], Tuple[int, int]],
+        ttl: int = AUTH_CACHE_TTL,
+        max_entries: int = AUTH_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self._serialize = serialize
+        self._deserialize = deserialize
+        self._cost = cost
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # key_hash -> (context, expires_at, redis generation)
+        self._entries: "OrderedDict[str, Tuple[Any, float, Optional[str]]]" = OrderedDict()
+        # Bumped on every local invalidation so loads racing with it are dropped.
+        self._epoch = 0
+        self._counters: Dict[str, int] = dict.fromkeys(_COUNTERS, 0)
+        self._load_seconds = 0.0
+
+    @staticmethod
+    def _generation(client) -> Optional[str]:
+        if client is None:
+            return None
+        try:
+            return client.get(AUTH_CACHE_GENERATION_KEY) or "0"
+        except (RedisError, Exception) as e:
+            logger.warning(f"Auth cache generation read failed: {e}")
+            return None
+
+    def _count_hit(self, counter: str, context: Any) -> None:
+        queries, rows = self._cost(context)
+        self._counters[counter] += 1
+        self._counters["db_queries_saved"] += queries
+        self._counters["db_rows_saved"] += rows
+
+    def _store_local(self, key_hash: str, context: Any, generation: Optional[str]) -> None:
+        self._entries[key_hash] = (context, time.monotonic() + self.ttl, generation)
+        self._entries.move_to_end(key_hash)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    def get_or_load(self, key_hash: str, loader: Callable[[], Optional[Any]]) -> Optional[Any]:
+        """
+        Return the cached context for ``key_hash`` or call ``loader``.
+
+        ``loader`` returning None (unknown or inactive key) is not cached, and
+        exceptions it raises propagate untouched.
+        """
+        if not AUTH_CACHE_ENABLED or self.ttl <= 0:
+            return loader()
+
+        client = get_redis_client()
+        generation = self._generation(client)
+        if generation is None:
+            client = None
+
+        with self._lock:
+            entry = self._entries.get(key_hash)
+            if entry is not None:
+                context, expires_at, entry_generation = entry
+                if expires_at > time.monotonic() and entry_generation == generation:
+                    self._entries.move_to_end(key_hash)
+                    self._count_hit("local_hits", context)
+                    return context
+                del self._entries[key_hash]
+            epoch = self._epoch
+
+        redis_key = f"{AUTH_CACHE_KEY_PREFIX}:{generation}:{key_hash}"
+        if client is not None:
+            try:
+                cached = client.get(redis_key)
+            except (RedisError, Exception) as e:
+                logger.warning(f"Auth cache read failed: {e}")
+                cached = None
+            if cached:
+                context = self._deserialize(json.loads(cached))
+                with self._lock:
+                    if epoch == self._epoch:
+                        self._store_local(key_hash, context, generation)
+                    self._count_hit("redis_hits", context)
+                return context
+
+        started = time.perf_counter()
+        context = loader()
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._counters["misses"] += 1
+            self._load_seconds += elapsed
+            if context is None:
+                return None
+            if epoch == self._epoch:
+                self._store_local(key_hash, context, generation)
+
+        if client is not None:
+            try:
+                client.setex(redis_key, self.ttl, json.dumps(self._serialize(context)))
+            except (RedisError, Exception) as e:
+                logger.warning(f"Auth cache write failed: {e}")
+        return context
+
+    def invalidate_all(self) -> None:
+        """Drop every cached context here and, through Redis, in other workers."""
+        with self._lock:
+            self._entries.clear()
+            self._epoch += 1
+            self._counters["invalidations"] += 1
+        client = get_redis_client()
+        if client is None:
+            return
+        try:
+            # Old entries are orphaned under the previous generation and
+            # expire on their own TTL.
+            client.incr(AUTH_CACHE_GENERATION_KEY)
+        except (RedisError, Exception) as e:
+            logger.warning(f"Auth cache invalidation failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            entries = len(self._entries)
+            load_seconds = self._load_seconds
+        hits = counters["local_hits"] + counters["redis_hits"]
+        lookups = hits + counters["misses"]
+        avg_load_ms = (load_seconds / counters["misses"] * 1000.0) if counters["misses"] else 0.0
+        return {
+            "enabled": AUTH_CACHE_ENABLED and self.ttl > 0,
+            "redis_available": get_redis_client() is not None,
+            "ttl_seconds": self.ttl,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            **counters,
+            "hit_rate": round(hits / lookups * 100, 2) if lookups else 0.0,
+            "avg_load_ms": round(avg_load_ms, 3),
+            "estimated_db_ms_saved": round(avg_load_ms * hits, 1),
+        }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._counters = dict.fromkeys(_COUNTERS, 0)
+            self._load_seconds = 0.0
+
+
+_caches = []
+
+
+def register_auth_cache(cache: AuthContextCache) -> AuthContextCache:
+    """Invalidate ``cache`` whenever a commit touches ``AUTH_SCOPE_TABLES``."""
+    _caches.append(cache)
+    return cache
+
+
+@on_tables_committed
+def _invalidate_on_scope_change(tables) -> None:
+    if AUTH_SCOPE_TABLES.intersection(tables):
+        for cache in _caches:
+            cache.invalidate_all()
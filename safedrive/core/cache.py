@@ -5,6 +5,7 @@ Provides caching utilities for analytics endpoints.
 import hashlib
 import json
 import os
+import time
 from typing import Optional, Any
 import redis
 from redis.exceptions import RedisError
@@ -23,15 +24,22 @@ CACHE_TTL_SHORT = 300  # 5 minutes
 CACHE_TTL_MEDIUM = 600  # 10 minutes
 CACHE_TTL_LONG = 1800  # 30 minutes
 
+# Seconds to wait before retrying a failed Redis connection. Without this,
+# every caller pays a connection attempt while Redis is down.
+REDIS_RETRY_INTERVAL = float(os.getenv("REDIS_RETRY_INTERVAL", "30"))
+
 # Redis client singleton
 _redis_client: Optional[redis.Redis] = None
+_redis_retry_at: float = 0.0
 
 
 def get_redis_client() -> Optional[redis.Redis]:
     """Get Redis client singleton. Returns None if Redis unavailable."""
-    global _redis_client
+    global _redis_client, _redis_retry_at
     
     if _redis_client is None:
+        if time.monotonic() < _redis_retry_at:
+            return None
         try:
             _redis_client = redis.Redis(
                 host=REDIS_HOST,
@@ -48,6 +56,7 @@ def get_redis_client() -> Optional[redis.Redis]:
         except (RedisError, Exception) as e:
             logger.warning(f"Redis unavailable: {e}. Caching disabled.")
             _redis_client = None
+            _redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
     
     return _redis_client
 
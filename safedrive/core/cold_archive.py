@@ -0,0 +1,583 @@
+"""
+Cold-tier archive of old ``raw_sensor_data`` and ``location`` rows.
+
+``archive_sensor_data`` (``scripts/archive_sensor_data.py``, run after the
+partition rotation) moves rows recorded before the hot window, the
+``SENSOR_ARCHIVE_AFTER_MONTHS`` most recent UTC months, into zstd Parquet
+files under ``SENSOR_ARCHIVE_DIR``::
+
+    <table>/month=YYYY-MM/driver=<driverProfileId>/part-<uuid>.parquet
+
+and records each file in the ``sensor_archive`` catalog. Every driver-month
+is one transaction: its files are written, its hot rows deleted by id and
+its catalog rows added together, and the files are removed again if the
+transaction fails. Rows of trips without a driver go under ``driver=none``.
+A location is archived with the driver of the sensor rows pointing at it;
+locations still referenced by hot sensor rows or by unsafe behaviours stay
+hot. Rows synced late for an archived month are picked up by the next run
+as an additional part file.
+
+``archived_rows`` is the read path: it finds the catalog files overlapping
+a driver, trip and timestamp range and yields their rows in ``(timestamp,
+id)`` order. Ranges starting inside the hot window skip the catalog. Files
+are streamed in ``ARCHIVE_READ_BATCH_ROWS`` record batches, skipping row
+groups outside the range by their timestamp statistics, so memory is bounded
+by one batch per file of a month. A trip filter without a driver or range
+takes both from the trip, so it reads one driver's files for the trip's
+months rather than every file.
+
+Archived rows must not outlive their owners. Deleting a driver removes the
+driver's catalog entries and part files (``delete_archived_driver``).
+Deleted trips are not rewritten out of the files; instead reads drop sensor
+rows whose trip no longer exists.
+"""
+import heapq
+import logging
+import os
+import tempfile
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from sqlalchemy import delete, exists, func, or_, select
+from sqlalchemy.orm import Session, aliased
+
+from safedrive.core.exports import stream_rows
+from safedrive.core.partitions import (
+    PARTITION_PRUNING_SLACK_MS,
+    add_months,
+    epoch_ms,
+    month_start,
+    partition_bound,
+)
+from safedrive.models.location import Location
+from safedrive.models.raw_sensor_data import RawSensorData
+from safedrive.models.sensor_archive import SensorArchive
+from safedrive.models.trip import Trip
+from safedrive.models.unsafe_behaviour import UnsafeBehaviour
+
+logger = logging.getLogger(__name__)
+
+SENSOR_ARCHIVE_AFTER_MONTHS = int(os.getenv("SENSOR_ARCHIVE_AFTER_MONTHS", "0"))
+SENSOR_ARCHIVE_DIR = os.getenv(
+    "SENSOR_ARCHIVE_DIR", os.path.join(tempfile.gettempdir(), "safedrive-archive")
+)
+ARCHIVE_BATCH_ROWS = int(os.getenv("ARCHIVE_BATCH_ROWS", "50000"))
+# Rows decoded at a time per archive file while reading.
+ARCHIVE_READ_BATCH_ROWS = int(os.getenv("ARCHIVE_READ_BATCH_ROWS", "4096"))
+# Rows per ``IN (...)`` when deleting archived rows.
+_DELETE_CHUNK = 500
+
+RAW_SENSOR_ARCHIVE_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("sensor_type", pa.int32()),
+        ("sensor_type_name", pa.string()),
+        ("values", pa.list_(pa.float64())),
+        ("timestamp", pa.int64()),
+        ("date", pa.timestamp("us")),
+        ("accuracy", pa.int32()),
+        ("location_id", pa.string()),
+        ("trip_id", pa.string()),
+        ("sync", pa.bool_()),
+        ("ingested_at", pa.timestamp("us")),
+    ]
+)
+
+LOCATION_ARCHIVE_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("latitude", pa.float64()),
+        ("longitude", pa.float64()),
+        ("timestamp", pa.int64()),
+        ("date", pa.timestamp("us")),
+        ("altitude", pa.float64()),
+        ("speed", pa.float64()),
+        ("speedLimit", pa.float64()),
+        ("distance", pa.float64()),
+        ("sync", pa.bool_()),
+    ]
+)
+
+ARCHIVE_SCHEMAS = {
+    "raw_sensor_data": RAW_SENSOR_ARCHIVE_SCHEMA,
+    "location": LOCATION_ARCHIVE_SCHEMA,
+}
+_MODELS = {"raw_sensor_data": RawSensorData, "location": Location}
+
+
+def hot_window_start(
+    today: Optional[date] = None, after_months: int = SENSOR_ARCHIVE_AFTER_MONTHS
+) -> date:
+    """First day of the oldest month kept in the hot tables."""
+    return add_months(month_start(today or datetime.utcnow().date()), -after_months)
+
+
+def reads_archive(start_ms: Optional[int], after_months: int = SENSOR_ARCHIVE_AFTER_MONTHS) -> bool:
+    """Whether a range starting at ``start_ms`` can reach archived rows."""
+    if start_ms is None or after_months <= 0:
+        return True
+    window = hot_window_start(after_months=after_months)
+    return start_ms < epoch_ms(datetime(window.year, window.month, 1))
+
+
+def _uuid_str(value) -> Optional[str]:
+    return str(value) if value else None
+
+
+def _sensor_values(values) -> Optional[List[float]]:
+    # Older rows stored the readings as a JSON-encoded string.
+    if isinstance(values, str):
+        values = orjson.loads(values)
+    return values
+
+
+def _raw_sensor_record(row: RawSensorData) -> dict:
+    return {
+        "id": str(row.id),
+        "sensor_type": row.sensor_type,
+        "sensor_type_name": row.sensor_type_name,
+        "values": _sensor_values(row.values),
+        "timestamp": row.timestamp,
+        "date": row.date,
+        "accuracy": row.accuracy,
+        "location_id": _uuid_str(row.location_id),
+        "trip_id": _uuid_str(row.trip_id),
+        "sync": row.sync,
+        "ingested_at": row.ingested_at,
+    }
+
+
+def _location_record(row: Location) -> dict:
+    return {
+        "id": str(row.id),
+        "latitude": row.latitude,
+        "longitude": row.longitude,
+        "timestamp": row.timestamp,
+        "date": row.date,
+        "altitude": row.altitude,
+        "speed": row.speed,
+        "speedLimit": row.speedLimit,
+        "distance": row.distance,
+        "sync": row.sync,
+    }
+
+
+def _month_range(month: date) -> Tuple[int, int]:
+    return epoch_ms(datetime(month.year, month.month, 1)), partition_bound(month)
+
+
+def _raw_sensor_query(lo: int, hi: int, driver_id: Optional[UUID]):
+    query = (
+        select(RawSensorData)
+        .outerjoin(Trip, RawSensorData.trip_id == Trip.id)
+        .where(RawSensorData.timestamp >= lo, RawSensorData.timestamp < hi)
+    )
+    if driver_id is None:
+        query = query.where(Trip.driverProfileId.is_(None))
+    else:
+        query = query.where(Trip.driverProfileId == driver_id)
+    return query.order_by(RawSensorData.timestamp.asc(), RawSensorData.id.asc())
+
+
+def _location_query(lo: int, hi: int, driver_id: Optional[UUID]):
+    """
+    Locations of the month that can leave the hot table together with
+    ``driver_id``'s sensor rows: every sensor row pointing at them is
+    archived in the same pass and no unsafe behaviour does.
+    """
+    sensor = aliased(RawSensorData)
+    sensor_trip = aliased(Trip)
+    query = select(Location).where(
+        Location.timestamp >= lo,
+        Location.timestamp < hi,
+        ~exists().where(UnsafeBehaviour.location_id == Location.id),
+    )
+    if driver_id is None:
+        query = query.where(~exists().where(RawSensorData.location_id == Location.id))
+    else:
+        staying = (
+            select(sensor.id)
+            .outerjoin(sensor_trip, sensor.trip_id == sensor_trip.id)
+            .where(
+                sensor.location_id == Location.id,
+                or_(
+                    sensor.timestamp < lo,
+                    sensor.timestamp >= hi,
+                    sensor_trip.driverProfileId.is_(None),
+                    sensor_trip.driverProfileId != driver_id,
+                ),
+            )
+        )
+        query = query.where(
+            exists(
+                select(RawSensorData.id)
+                .join(Trip, RawSensorData.trip_id == Trip.id)
+                .where(RawSensorData.location_id == Location.id, Trip.driverProfileId == driver_id)
+            ),
+            ~exists(staying),
+        )
+    return query.order_by(Location.timestamp.asc(), Location.id.asc())
+
+
+def archive_path(table: str, month: date, driver_id: Optional[UUID]) -> str:
+    """Path of a new part file, relative to the archive directory."""
+    return os.path.join(
+        table,
+        f"month={month.year:04d}-{month.month:02d}",
+        f"driver={driver_id or 'none'}",
+        f"part-{uuid4()}.parquet",
+    )
+
+
+def _write_part(
+    db: Session, table: str, query, month: date, driver_id: Optional[UUID], archive_dir: str
+) -> Tuple[Optional[SensorArchive], List[UUID], Optional[str]]:
+    """Write the rows of ``query`` to one part file; returns its catalog entry and row ids."""
+    schema = ARCHIVE_SCHEMAS[table]
+    to_record = _raw_sensor_record if table == "raw_sensor_data" else _location_record
+    relative = archive_path(table, month, driver_id)
+    full_path = os.path.join(archive_dir, relative)
+    ids: List[UUID] = []
+    low = high = None
+    writer = None
+
+    def _flush(batch: List[dict]) -> None:
+        nonlocal writer
+        if writer is None:
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            writer = pq.ParquetWriter(full_path, schema, compression="zstd")
+        writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+
+    try:
+        batch: List[dict] = []
+        for (row,) in stream_rows(db, query, ARCHIVE_BATCH_ROWS):
+            ids.append(row.id)
+            low = row.timestamp if low is None else min(low, row.timestamp)
+            high = row.timestamp if high is None else max(high, row.timestamp)
+            batch.append(to_record(row))
+            if len(batch) >= ARCHIVE_BATCH_ROWS:
+                _flush(batch)
+                batch = []
+        if batch:
+            _flush(batch)
+    finally:
+        if writer is not None:
+            writer.close()
+    if not ids:
+        return None, ids, None
+    entry = SensorArchive(
+        table_name=table,
+        month=month,
+        driverProfileId=driver_id,
+        path=relative,
+        row_count=len(ids),
+        byte_size=os.path.getsize(full_path),
+        min_timestamp=low,
+        max_timestamp=high,
+    )
+    return entry, ids, full_path
+
+
+def _delete_rows(db: Session, table: str, ids: List[UUID], lo: int, hi: int) -> None:
+    model = _MODELS[table]
+    for offset in range(0, len(ids), _DELETE_CHUNK):
+        # The timestamp bounds let MySQL prune to the month's partition.
+        db.execute(
+            delete(model)
+            .where(
+                model.id.in_(ids[offset:offset + _DELETE_CHUNK]),
+                model.timestamp >= lo,
+                model.timestamp < hi,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+
+def archive_driver_month(
+    db: Session, month: date, driver_id: Optional[UUID], archive_dir: Optional[str] = None
+) -> List[SensorArchive]:
+    """Move one driver's rows of ``month`` to the archive and commit."""
+    archive_dir = archive_dir or SENSOR_ARCHIVE_DIR
+    lo, hi = _month_range(month)
+    written: List[str] = []
+    entries: List[SensorArchive] = []
+    try:
+        # Locations first: which of them may go depends on the sensor rows.
+        location_entry, location_ids, location_path = _write_part(
+            db, "location", _location_query(lo, hi, driver_id), month, driver_id, archive_dir
+        )
+        written += [location_path] if location_path else []
+        sensor_entry, sensor_ids, sensor_path = _write_part(
+            db, "raw_sensor_data", _raw_sensor_query(lo, hi, driver_id), month, driver_id, archive_dir
+        )
+        written += [sensor_path] if sensor_path else []
+
+        _delete_rows(db, "raw_sensor_data", sensor_ids, lo, hi)
+        _delete_rows(db, "location", location_ids, lo, hi)
+        entries = [entry for entry in (location_entry, sensor_entry) if entry is not None]
+        db.add_all(entries)
+        db.commit()
+    except Exception:
+        db.rollback()
+        for path in written:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        raise
+    return entries
+
+
+def _month_drivers(db: Session, lo: int, hi: int) -> List[Optional[UUID]]:
+    drivers = db.execute(
+        select(Trip.driverProfileId)
+        .join(RawSensorData, RawSensorData.trip_id == Trip.id)
+        .where(RawSensorData.timestamp >= lo, RawSensorData.timestamp < hi)
+        .distinct()
+    ).scalars()
+    # Rows without a driver last, once the drivers' locations are gone.
+    return sorted(drivers, key=str) + [None]
+
+
+def archive_months(db: Session, before: date) -> List[date]:
+    """Months holding hot rows recorded before ``before``, oldest first."""
+    cutoff = epoch_ms(datetime(before.year, before.month, 1))
+    oldest = [
+        db.execute(select(func.min(model.timestamp)).where(model.timestamp < cutoff)).scalar()
+        for model in _MODELS.values()
+    ]
+    oldest = [value for value in oldest if value is not None]
+    if not oldest:
+        return []
+    month = month_start(datetime.utcfromtimestamp(min(oldest) / 1000.0).date())
+    months = []
+    while month < before:
+        months.append(month)
+        month = add_months(month, 1)
+    return months
+
+
+def pending_rows(db: Session, month: date) -> dict:
+    """Hot rows per table recorded in ``month``."""
+    lo, hi = _month_range(month)
+    return {
+        table: db.execute(
+            select(func.count()).select_from(model).where(model.timestamp >= lo, model.timestamp < hi)
+        ).scalar()
+        for table, model in _MODELS.items()
+    }
+
+
+def archive_sensor_data(
+    db: Session,
+    today: Optional[date] = None,
+    after_months: int = SENSOR_ARCHIVE_AFTER_MONTHS,
+    archive_dir: Optional[str] = None,
+) -> List[SensorArchive]:
+    """
+    Archive every month before the hot window. ``after_months`` of ``0``
+    disables archiving. Returns the catalog entries written.
+    """
+    if after_months <= 0:
+        return []
+    entries: List[SensorArchive] = []
+    for month in archive_months(db, hot_window_start(today, after_months)):
+        lo, hi = _month_range(month)
+        written: List[SensorArchive] = []
+        for driver_id in _month_drivers(db, lo, hi):
+            written += archive_driver_month(db, month, driver_id, archive_dir)
+        logger.info(
+            f"Archived {month:%Y-%m}: {len(written)} files, "
+            f"{sum(entry.row_count for entry in written)} rows"
+        )
+        entries += written
+    return entries
+
+
+def delete_archived_driver(
+    db: Session, driver_id: UUID, archive_dir: Optional[str] = None
+) -> int:
+    """
+    Remove a deleted driver's archived rows: their catalog entries are
+    deleted and committed, then their files. Returns the files removed.
+    """
+    archive_dir = archive_dir or SENSOR_ARCHIVE_DIR
+    paths = db.execute(
+        select(SensorArchive.path).where(SensorArchive.driverProfileId == driver_id)
+    ).scalars().all()
+    if not paths:
+        return 0
+    db.execute(
+        delete(SensorArchive)
+        .where(SensorArchive.driverProfileId == driver_id)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    for path in paths:
+        try:
+            os.remove(os.path.join(archive_dir, path))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            # Uncatalogued, so never read again; log it for cleanup.
+            logger.warning(f"Could not remove archive part {path}: {e}")
+    return len(paths)
+
+
+_COMPARISONS = {">=": pc.greater_equal, "<=": pc.less_equal, "==": pc.equal}
+
+
+def _row_groups(parquet: pq.ParquetFile, start_ms: Optional[int], end_ms: Optional[int]) -> List[int]:
+    """Row groups whose timestamp statistics overlap ``[start_ms, end_ms]``."""
+    column = parquet.schema_arrow.get_field_index("timestamp")
+    selected = []
+    for index in range(parquet.num_row_groups):
+        stats = parquet.metadata.row_group(index).column(column).statistics
+        if stats is not None and stats.has_min_max:
+            if (start_ms is not None and stats.max < start_ms) or (
+                end_ms is not None and stats.min > end_ms
+            ):
+                continue
+        selected.append(index)
+    return selected
+
+
+def _live_trip_filter(db: Session) -> Callable[[pa.RecordBatch], pa.RecordBatch]:
+    """Drops rows of trips deleted since they were archived; remembers lookups."""
+    live: Dict[str, bool] = {}
+
+    def _filter(batch: pa.RecordBatch) -> pa.RecordBatch:
+        unseen = [
+            trip_id
+            for trip_id in pc.unique(batch.column("trip_id")).to_pylist()
+            if trip_id is not None and trip_id not in live
+        ]
+        if unseen:
+            found = {
+                str(trip_id)
+                for trip_id in db.execute(
+                    select(Trip.id).where(Trip.id.in_([UUID(trip_id) for trip_id in unseen]))
+                ).scalars()
+            }
+            live.update((trip_id, trip_id in found) for trip_id in unseen)
+        deleted = [trip_id for trip_id, exists_ in live.items() if not exists_]
+        if not deleted:
+            return batch
+        return batch.filter(pc.invert(pc.is_in(batch.column("trip_id"), pa.array(deleted))))
+
+    return _filter
+
+
+def _read_part(
+    path: str,
+    filters: List[Tuple[str, str, object]],
+    start_ms: Optional[int],
+    end_ms: Optional[int],
+    extra: dict,
+    keep: Optional[Callable[[pa.RecordBatch], pa.RecordBatch]] = None,
+) -> Iterator[dict]:
+    parquet = pq.ParquetFile(path)
+    try:
+        row_groups = _row_groups(parquet, start_ms, end_ms)
+        if not row_groups:
+            return
+        for batch in parquet.iter_batches(
+            batch_size=ARCHIVE_READ_BATCH_ROWS, row_groups=row_groups
+        ):
+            if filters:
+                mask = None
+                for column, op, value in filters:
+                    condition = _COMPARISONS[op](batch.column(column), value)
+                    mask = condition if mask is None else pc.and_(mask, condition)
+                batch = batch.filter(mask)
+            if keep is not None:
+                batch = keep(batch)
+            for row in batch.to_pylist():
+                row.update(extra)
+                yield row
+    finally:
+        parquet.close()
+
+
+def archived_rows(
+    db: Session,
+    table: str,
+    driver_profile_id: Optional[UUID] = None,
+    trip_id: Optional[UUID] = None,
+    start_ms: Optional[int] = None,
+    end_ms: Optional[int] = None,
+    archive_dir: Optional[str] = None,
+) -> Iterator[dict]:
+    """
+    Archived rows of ``table`` recorded between ``start_ms`` and ``end_ms``
+    (inclusive), in ``(timestamp, id)`` order. Each row carries its file's
+    ``driverProfileId``. Sensor rows of deleted trips are skipped.
+    """
+    driver_is_none = False
+    if trip_id is not None and (driver_profile_id is None or start_ms is None or end_ms is None):
+        # Narrow a trip filter to the trip's driver and time range.
+        trip = db.execute(
+            select(Trip.driverProfileId, Trip.start_time, Trip.end_time).where(Trip.id == trip_id)
+        ).first()
+        if trip is None:
+            return
+        if driver_profile_id is None:
+            driver_profile_id = trip.driverProfileId
+            driver_is_none = driver_profile_id is None
+        elif driver_profile_id != trip.driverProfileId:
+            return
+        if trip.start_time is not None:
+            trip_start = trip.start_time - PARTITION_PRUNING_SLACK_MS
+            start_ms = trip_start if start_ms is None else max(start_ms, trip_start)
+        if trip.end_time is not None:
+            trip_end = trip.end_time + PARTITION_PRUNING_SLACK_MS
+            end_ms = trip_end if end_ms is None else min(end_ms, trip_end)
+
+    if not reads_archive(start_ms):
+        return
+    archive_dir = archive_dir or SENSOR_ARCHIVE_DIR
+    query = select(SensorArchive).where(SensorArchive.table_name == table)
+    if driver_is_none:
+        query = query.where(SensorArchive.driverProfileId.is_(None))
+    elif driver_profile_id is not None:
+        query = query.where(SensorArchive.driverProfileId == driver_profile_id)
+    if start_ms is not None:
+        query = query.where(SensorArchive.max_timestamp >= start_ms)
+    if end_ms is not None:
+        query = query.where(SensorArchive.min_timestamp <= end_ms)
+    entries = db.execute(query.order_by(SensorArchive.month)).scalars().all()
+
+    filters = []
+    if start_ms is not None:
+        filters.append(("timestamp", ">=", start_ms))
+    if end_ms is not None:
+        filters.append(("timestamp", "<=", end_ms))
+    keep = None
+    if table == "raw_sensor_data":
+        if trip_id is not None:
+            filters.append(("trip_id", "==", str(trip_id)))
+        keep = _live_trip_filter(db)
+
+    by_month = defaultdict(list)
+    for entry in entries:
+        by_month[entry.month].append(entry)
+    for month in sorted(by_month):
+        parts: Iterable[Iterator[dict]] = [
+            _read_part(
+                os.path.join(archive_dir, entry.path),
+                filters,
+                start_ms,
+                end_ms,
+                {"driverProfileId": _uuid_str(entry.driverProfileId)},
+                keep,
+            )
+            for entry in by_month[month]
+        ]
+        # Each part is sorted; merge the month's drivers and late parts.
+        yield from heapq.merge(*parts, key=lambda row: (row["timestamp"], row["id"]))
@@ -0,0 +1,240 @@
+"""
+Live per-driver counters behind the fleet driver monitor.
+
+The monitor used to load every unsafe behaviour and every location a driver
+ever produced to derive a handful of numbers. The counters here keep those
+numbers ready instead:
+
+* ``unsafe_total`` and a sliding ``MONITOR_WINDOW_SECONDS`` window of unsafe
+  behaviour timestamps, fed by committed ``unsafe_behaviour`` inserts
+  (``safedrive.database.events.on_inserts_committed``);
+* the lifetime location and speeding counts behind the speed compliance
+  ratio, read from the driver's ``driver_speed_stats`` row, which sensor
+  ingestion keeps current (``safedrive.core.speeding``).
+
+A driver's counters are seeded from the database on first use (one count,
+one window range scan and one primary key lookup) and trusted for
+``MONITOR_COUNTER_TTL`` seconds, after which they are seeded again. That
+bounds drift from writes the insert hook cannot see (bulk or raw SQL
+inserts, deletes, other workers when Redis is unavailable) and picks up the
+speeding totals, which are not pushed to the counters.
+
+Counters live in Redis (a hash plus a sorted set per driver) so every worker
+shares them, with an in-process LRU of ring buffers as the fallback.
+"""
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Tuple
+from uuid import UUID
+
+from redis.exceptions import RedisError
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from safedrive.core.cache import get_redis_client
+from safedrive.core.speeding import driver_speed_totals
+from safedrive.database.events import on_inserts_committed
+from safedrive.models.unsafe_behaviour import UnsafeBehaviour
+
+logger = logging.getLogger(__name__)
+
+MONITOR_WINDOW_SECONDS = int(os.getenv("MONITOR_WINDOW_SECONDS", str(24 * 60 * 60)))
+MONITOR_COUNTER_TTL = int(os.getenv("MONITOR_COUNTER_TTL", "300"))
+MONITOR_LOCAL_MAX_DRIVERS = int(os.getenv("MONITOR_LOCAL_MAX_DRIVERS", "1024"))
+MONITOR_LOCAL_MAX_EVENTS = int(os.getenv("MONITOR_LOCAL_MAX_EVENTS", "10000"))
+
+MONITOR_KEY_PREFIX = "monitor:driver"
+_COUNTER_FIELDS = ("unsafe_total", "locations", "speeding")
+
+
+@dataclass
+class DriverCounters:
+    unsafe_total: int = 0
+    unsafe_in_window: int = 0
+    location_count: int = 0
+    speeding_count: int = 0
+
+    @property
+    def speed_compliance_ratio(self) -> float:
+        if not self.location_count:
+            return 1.0
+        return (self.location_count - self.speeding_count) / self.location_count
+
+
+@dataclass
+class _Seed:
+    unsafe_total: int
+    window: List[Tuple[int, str]]
+    location_count: int
+    speeding_count: int
+
+
+class _LocalCounters:
+    def __init__(self, seed: _Seed, expires_at: float) -> None:
+        self.unsafe_total = seed.unsafe_total
+        self.location_count = seed.location_count
+        self.speeding_count = seed.speeding_count
+        self.window: Deque[int] = deque(
+            (timestamp for timestamp, _ in seed.window), maxlen=MONITOR_LOCAL_MAX_EVENTS
+        )
+        self.expires_at = expires_at
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+class DriverMonitorCounters:
+    """Redis-backed live counters with an in-process fallback."""
+
+    def __init__(self, ttl: int = MONITOR_COUNTER_TTL) -> None:
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._local: "OrderedDict[UUID, _LocalCounters]" = OrderedDict()
+
+    @staticmethod
+    def _keys(driver_id: UUID) -> Tuple[str, str]:
+        base = f"{MONITOR_KEY_PREFIX}:{driver_id}"
+        return base, f"{base}:window"
+
+    @staticmethod
+    def _seed(db: Session, driver_id: UUID, cutoff_ms: int) -> _Seed:
+        unsafe_total = db.execute(
+            select(func.count(UnsafeBehaviour.id)).where(
+                UnsafeBehaviour.driverProfileId == driver_id
+            )
+        ).scalar_one()
+        window = db.execute(
+            select(UnsafeBehaviour.timestamp, UnsafeBehaviour.id).where(
+                UnsafeBehaviour.driverProfileId == driver_id,
+                UnsafeBehaviour.timestamp >= cutoff_ms,
+            )
+        ).all()
+        location_count, speeding_count = driver_speed_totals(db, driver_id)
+        return _Seed(
+            unsafe_total=int(unsafe_total),
+            window=[(int(timestamp), str(event_id)) for timestamp, event_id in window],
+            location_count=location_count,
+            speeding_count=speeding_count,
+        )
+
+    def counters(self, db: Session, driver_id: UUID) -> DriverCounters:
+        """Current counters for ``driver_id``, seeding them if needed."""
+        cutoff_ms = _now_ms() - MONITOR_WINDOW_SECONDS * 1000
+        client = get_redis_client()
+        if client is not None:
+            try:
+                return self._redis_counters(client, db, driver_id, cutoff_ms)
+            except RedisError as e:
+                logger.warning(f"Driver monitor counters unavailable for {driver_id}: {e}")
+        return self._local_counters(db, driver_id, cutoff_ms)
+
+    def _redis_counters(self, client, db: Session, driver_id: UUID, cutoff_ms: int) -> DriverCounters:
+        counter_key, window_key = self._keys(driver_id)
+        pipe = client.pipeline(transaction=False)
+        pipe.hmget(counter_key, _COUNTER_FIELDS)
+        pipe.zremrangebyscore(window_key, "-inf", f"({cutoff_ms}")
+        pipe.zcard(window_key)
+        values, _, in_window = pipe.execute()
+        if all(value is not None for value in values):
+            unsafe_total, locations, speeding = (int(value) for value in values)
+            return DriverCounters(unsafe_total, int(in_window), locations, speeding)
+
+        seed = self._seed(db, driver_id, cutoff_ms)
+        pipe = client.pipeline(transaction=True)
+        pipe.delete(counter_key, window_key)
+        pipe.hset(
+            counter_key,
+            mapping={
+                "unsafe_total": seed.unsafe_total,
+                "locations": seed.location_count,
+                "speeding": seed.speeding_count,
+            },
+        )
+        if seed.window:
+            pipe.zadd(window_key, {event_id: timestamp for timestamp, event_id in seed.window})
+        pipe.expire(counter_key, self.ttl)
+        pipe.expire(window_key, self.ttl)
+        pipe.execute()
+        return DriverCounters(
+            seed.unsafe_total, len(seed.window), seed.location_count, seed.speeding_count
+        )
+
+    def _local_counters(self, db: Session, driver_id: UUID, cutoff_ms: int) -> DriverCounters:
+        with self._lock:
+            entry = self._local.get(driver_id)
+            if entry is not None and entry.expires_at > time.monotonic():
+                self._local.move_to_end(driver_id)
+                return DriverCounters(
+                    entry.unsafe_total,
+                    sum(1 for timestamp in entry.window if timestamp >= cutoff_ms),
+                    entry.location_count,
+                    entry.speeding_count,
+                )
+
+        seed = self._seed(db, driver_id, cutoff_ms)
+        with self._lock:
+            self._local[driver_id] = _LocalCounters(seed, time.monotonic() + self.ttl)
+            self._local.move_to_end(driver_id)
+            while len(self._local) > MONITOR_LOCAL_MAX_DRIVERS:
+                self._local.popitem(last=False)
+        return DriverCounters(
+            seed.unsafe_total, len(seed.window), seed.location_count, seed.speeding_count
+        )
+
+    def record_unsafe_behaviours(self, events: List[Tuple[UUID, str, int]]) -> None:
+        """Count committed ``(driver_id, event_id, timestamp)`` events for seeded drivers."""
+        by_driver: Dict[UUID, List[Tuple[str, int]]] = {}
+        for driver_id, event_id, timestamp in events:
+            by_driver.setdefault(driver_id, []).append((event_id, timestamp))
+
+        with self._lock:
+            for driver_id, driver_events in by_driver.items():
+                entry = self._local.get(driver_id)
+                if entry is None:
+                    continue
+                entry.unsafe_total += len(driver_events)
+                entry.window.extend(timestamp for _, timestamp in driver_events)
+
+        client = get_redis_client()
+        if client is None:
+            return
+        try:
+            drivers = list(by_driver)
+            pipe = client.pipeline(transaction=False)
+            for driver_id in drivers:
+                pipe.exists(self._keys(driver_id)[0])
+            seeded = pipe.execute()
+            pipe = client.pipeline(transaction=False)
+            for driver_id, is_seeded in zip(drivers, seeded):
+                # Unseeded drivers pick these events up from the database.
+                if not is_seeded:
+                    continue
+                counter_key, window_key = self._keys(driver_id)
+                pipe.hincrby(counter_key, "unsafe_total", len(by_driver[driver_id]))
+                pipe.zadd(window_key, dict(by_driver[driver_id]))
+            pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Driver monitor counter update failed: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._local.clear()
+
+
+driver_monitor_counters = DriverMonitorCounters()
+
+
+@on_inserts_committed(UnsafeBehaviour.__tablename__)
+def _count_unsafe_behaviours(rows: List[dict]) -> None:
+    driver_monitor_counters.record_unsafe_behaviours(
+        [
+            (row["driverProfileId"], str(row["id"]), int(row["timestamp"]))
+            for row in rows
+            if row.get("driverProfileId") is not None and row.get("timestamp") is not None
+        ]
+    )
@@ -0,0 +1,280 @@
+"""
+Set-based trip metrics and the driver report shared by fleet and insurance.
+
+Per-trip distance, speeding and location counts come from one grouped query
+over the distinct ``(trip_id, location_id)`` pairs in ``raw_sensor_data``;
+unsafe behaviour counts and severities from a second grouped query. A report
+therefore costs a fixed number of round trips however many trips the driver
+has, where the previous per-trip helpers issued two queries per trip.
+
+Locations are linked to trips through sensor rows, and a location usually
+has several (accelerometer, gyroscope, ...). Joining through the sensor rows
+directly counted a location's distance and speeding once per sensor row;
+deduplicating the pairs first counts each location once per trip.
+
+``driver_metrics`` applies the same queries grouped by driver for reports
+spanning many drivers, so no trip rows are loaded at all.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Sequence, Union
+from uuid import UUID
+
+from sqlalchemy import and_, case, func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement, Select
+
+from safedrive.models.alcohol_questionnaire import AlcoholQuestionnaire
+from safedrive.models.location import Location
+from safedrive.models.raw_sensor_data import RawSensorData
+from safedrive.models.trip import Trip
+from safedrive.models.unsafe_behaviour import UnsafeBehaviour
+
+UNSAFE_LOG_LIMIT = 100
+
+
+@dataclass
+class TripMetrics:
+    """Location and unsafe behaviour totals for one trip."""
+
+    distance_m: float = 0.0
+    location_count: int = 0
+    speeding_events: int = 0
+    unsafe_count: int = 0
+    severity_total: float = 0.0
+
+    @property
+    def distance_km(self) -> float:
+        return self.distance_m / 1000.0
+
+    @property
+    def avg_severity(self) -> float:
+        return self.severity_total / self.unsafe_count if self.unsafe_count else 0.0
+
+    @property
+    def speed_compliance_ratio(self) -> float:
+        if not self.location_count:
+            return 1.0
+        return (self.location_count - self.speeding_events) / self.location_count
+
+
+def speeding_condition():
+    """A location over a known, non-zero speed limit."""
+    return and_(
+        Location.speedLimit != 0,
+        Location.speed != 0,
+        Location.speed > Location.speedLimit,
+    )
+
+
+def trip_metrics(
+    db: Session, trip_ids: Union[Sequence[UUID], Select]
+) -> Dict[UUID, TripMetrics]:
+    """
+    Metrics for ``trip_ids`` (a list of ids or a ``select`` of ``Trip.id``),
+    in two grouped queries. Trips without data get zeroed metrics.
+    """
+    metrics: Dict[UUID, TripMetrics] = {}
+    if not isinstance(trip_ids, Select):
+        trip_ids = list(trip_ids)
+        if not trip_ids:
+            return metrics
+        metrics = {trip_id: TripMetrics() for trip_id in trip_ids}
+
+    pairs = (
+        select(RawSensorData.trip_id, RawSensorData.location_id)
+        .where(
+            RawSensorData.trip_id.in_(trip_ids),
+            RawSensorData.location_id.isnot(None),
+        )
+        .distinct()
+        .subquery()
+    )
+    location_rows = db.execute(
+        select(
+            pairs.c.trip_id,
+            func.coalesce(func.sum(Location.distance), 0.0),
+            func.count(Location.id),
+            func.coalesce(func.sum(case((speeding_condition(), 1), else_=0)), 0),
+        )
+        .join(Location, Location.id == pairs.c.location_id)
+        .group_by(pairs.c.trip_id)
+    )
+    for trip_id, distance, location_count, speeding in location_rows:
+        entry = metrics.setdefault(trip_id, TripMetrics())
+        entry.distance_m = float(distance)
+        entry.location_count = int(location_count)
+        entry.speeding_events = int(speeding)
+
+    behaviour_rows = db.execute(
+        select(
+            UnsafeBehaviour.trip_id,
+            func.count(UnsafeBehaviour.id),
+            func.coalesce(func.sum(UnsafeBehaviour.severity), 0.0),
+        )
+        .where(UnsafeBehaviour.trip_id.in_(trip_ids))
+        .group_by(UnsafeBehaviour.trip_id)
+    )
+    for trip_id, unsafe_count, severity_total in behaviour_rows:
+        entry = metrics.setdefault(trip_id, TripMetrics())
+        entry.unsafe_count = int(unsafe_count)
+        entry.severity_total = float(severity_total)
+    return metrics
+
+
+@dataclass
+class DriverMetrics(TripMetrics):
+    """``TripMetrics`` summed over a driver's trips."""
+
+    trip_count: int = 0
+    latest_start_time: Optional[int] = None
+
+
+def driver_metrics(
+    db: Session, trip_criteria: Sequence[ColumnElement]
+) -> Dict[UUID, DriverMetrics]:
+    """
+    Per-driver totals over the trips matching ``trip_criteria`` (filters on
+    ``Trip``), in three grouped queries.
+    """
+    metrics: Dict[UUID, DriverMetrics] = {}
+
+    trip_rows = db.execute(
+        select(Trip.driverProfileId, func.count(Trip.id), func.max(Trip.start_time))
+        .where(*trip_criteria)
+        .group_by(Trip.driverProfileId)
+    )
+    for driver_id, trip_count, latest_start_time in trip_rows:
+        metrics[driver_id] = DriverMetrics(
+            trip_count=int(trip_count), latest_start_time=latest_start_time
+        )
+
+    pairs = (
+        select(Trip.driverProfileId, RawSensorData.trip_id, RawSensorData.location_id)
+        .join(Trip, Trip.id == RawSensorData.trip_id)
+        .where(RawSensorData.location_id.isnot(None), *trip_criteria)
+        .distinct()
+        .subquery()
+    )
+    location_rows = db.execute(
+        select(
+            pairs.c.driverProfileId,
+            func.coalesce(func.sum(Location.distance), 0.0),
+            func.count(Location.id),
+            func.coalesce(func.sum(case((speeding_condition(), 1), else_=0)), 0),
+        )
+        .join(Location, Location.id == pairs.c.location_id)
+        .group_by(pairs.c.driverProfileId)
+    )
+    for driver_id, distance, location_count, speeding in location_rows:
+        entry = metrics.setdefault(driver_id, DriverMetrics())
+        entry.distance_m = float(distance)
+        entry.location_count = int(location_count)
+        entry.speeding_events = int(speeding)
+
+    behaviour_rows = db.execute(
+        select(
+            Trip.driverProfileId,
+            func.count(UnsafeBehaviour.id),
+            func.coalesce(func.sum(UnsafeBehaviour.severity), 0.0),
+        )
+        .join(Trip, Trip.id == UnsafeBehaviour.trip_id)
+        .where(*trip_criteria)
+        .group_by(Trip.driverProfileId)
+    )
+    for driver_id, unsafe_count, severity_total in behaviour_rows:
+        entry = metrics.setdefault(driver_id, DriverMetrics())
+        entry.unsafe_count = int(unsafe_count)
+        entry.severity_total = float(severity_total)
+    return metrics
+
+
+def trip_start(trip: Trip):
+    return trip.start_time and datetime.fromtimestamp(trip.start_time / 1000)
+
+
+def trip_end(trip: Trip):
+    return trip.end_time and datetime.fromtimestamp(trip.end_time / 1000)
+
+
+def build_driver_report(db: Session, driver_id: UUID) -> dict:
+    """The consolidated driver report (``FleetReportResponse`` shape)."""
+    trips = (
+        db.query(Trip)
+        .filter(Trip.driverProfileId == driver_id)
+        .order_by(Trip.start_time.desc())
+        .all()
+    )
+    metrics = trip_metrics(
+        db, select(Trip.id).where(Trip.driverProfileId == driver_id)
+    )
+
+    trip_summaries = []
+    total_locations = 0
+    speeding_events = 0
+    for trip in trips:
+        trip_metric = metrics.get(trip.id) or TripMetrics()
+        total_locations += trip_metric.location_count
+        speeding_events += trip_metric.speeding_events
+        trip_summaries.append(
+            {
+                "trip_id": trip.id,
+                "start_time": trip_start(trip),
+                "end_time": trip_end(trip),
+                "influence": trip.influence,
+                "distance_km": trip_metric.distance_km,
+                "unsafe_count": trip_metric.unsafe_count,
+                "avg_severity": trip_metric.avg_severity,
+                "speeding_events": trip_metric.speeding_events,
+            }
+        )
+
+    unsafe_logs = (
+        db.query(UnsafeBehaviour)
+        .filter(UnsafeBehaviour.driverProfileId == driver_id)
+        .order_by(UnsafeBehaviour.timestamp.desc())
+        .limit(UNSAFE_LOG_LIMIT)
+        .all()
+    )
+
+    questionnaires = (
+        db.query(AlcoholQuestionnaire)
+        .filter(AlcoholQuestionnaire.driverProfileId == driver_id)
+        .order_by(AlcoholQuestionnaire.date.desc())
+        .all()
+    )
+
+    return {
+        "driverProfileId": driver_id,
+        "report_generated_at": datetime.utcnow(),
+        "trips": trip_summaries,
+        "unsafe_behaviour_logs": [
+            {
+                "id": log.id,
+                "trip_id": log.trip_id,
+                "behaviour_type": log.behaviour_type,
+                "severity": log.severity,
+                "timestamp": log.timestamp,
+            }
+            for log in unsafe_logs
+        ],
+        "alcohol_responses": [
+            {
+                "id": response.id,
+                "drankAlcohol": response.drankAlcohol,
+                "plansToDrive": response.plansToDrive,
+                "impairmentLevel": response.impairmentLevel,
+                "date": response.date,
+            }
+            for response in questionnaires
+        ],
+        "speed_compliance": {
+            "total_records": total_locations,
+            "speeding_events": speeding_events,
+            "compliance_ratio": (
+                (total_locations - speeding_events) / total_locations
+                if total_locations
+                else 1.0
+            ),
+        },
+    }
@@ -0,0 +1,312 @@
+"""
+Conditional GET support (ETag / Last-Modified) for read-mostly resources.
+
+Two strategies share one entry point, the ``conditional_get`` dependency:
+
+* Table versions. Every committed ORM write bumps a counter for each table it
+  touched. Counters live in Redis so all workers agree; a process-local store
+  can be enabled with ``ETAG_LOCAL_VERSIONS=true`` for single-worker
+  deployments. The ETag is derived from the counters, so a matching
+  ``If-None-Match`` is answered with ``304`` before the endpoint runs: no ORM
+  objects are loaded and no body is serialized. ``Last-Modified`` is sent
+  for information only: it has one-second resolution, so a write in the
+  same second as a cached response would still look unmodified, and
+  ``If-Modified-Since`` is never honoured.
+* Content hash. When no trustworthy counters are available the dependency
+  marks the request and ``ContentETagMiddleware`` hashes the rendered body
+  instead. That still saves bandwidth, but not database work.
+
+Writes issued as raw SQL (``db.execute(text(...))``) are not tracked; see
+``safedrive.database.events``.
+"""
+import hashlib
+import logging
+import os
+import threading
+import time
+from email.utils import formatdate
+from typing import Dict, Iterable, Optional, Tuple
+from uuid import uuid4
+
+from fastapi import Depends, Request, Response
+from redis.exceptions import RedisError
+from safedrive.core.cache import get_redis_client
+from safedrive.core.security import ApiClientContext, get_current_client_or_driver
+from safedrive.database.events import on_tables_committed
+
+logger = logging.getLogger(__name__)
+
+ETAG_LOCAL_VERSIONS = os.getenv("ETAG_LOCAL_VERSIONS", "false").lower() == "true"
+ETAG_CONTENT_MAX_BODY = int(os.getenv("ETAG_CONTENT_MAX_BODY", str(2 * 1024 * 1024)))
+
+VERSION_KEY_PREFIX = "etag:table"
+CONTENT_ETAG_STATE_KEY = "etag_content_hash"
+CACHE_CONTROL = "private, no-cache"
+
+class TableVersionStore:
+    """Per-table write counters with an optional Redis backing."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # Local counters restart at zero with the process; the epoch keeps
+        # tokens from a previous process from ever matching again.
+        self._epoch = uuid4().hex[:12]
+        self._versions: Dict[str, int] = {}
+        self._modified: Dict[str, float] = {}
+
+    @staticmethod
+    def _keys(table: str) -> Tuple[str, str]:
+        return f"{VERSION_KEY_PREFIX}:{table}:v", f"{VERSION_KEY_PREFIX}:{table}:m"
+
+    def bump(self, tables: Iterable[str]) -> None:
+        tables = sorted(set(tables))
+        if not tables:
+            return
+        now = time.time()
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+                self._modified[table] = now
+
+        client = get_redis_client()
+        if client is None:
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            for table in tables:
+                version_key, modified_key = self._keys(table)
+                pipe.incr(version_key)
+                pipe.set(modified_key, int(now))
+            pipe.execute()
+        except (RedisError, Exception) as e:
+            logger.warning(f"Table version bump failed for {tables}: {e}")
+
+    def snapshot(self, tables: Iterable[str]) -> Optional[Tuple[str, Optional[float]]]:
+        """
+        Return ``(version_token, last_modified)`` for the given tables, or
+        None when no counters can be trusted across workers.
+        """
+        tables = sorted(set(tables))
+        client = get_redis_client()
+        if client is not None:
+            try:
+                return self._redis_snapshot(client, tables)
+            except (RedisError, Exception) as e:
+                logger.warning(f"Table version read failed for {tables}: {e}")
+
+        if not ETAG_LOCAL_VERSIONS:
+            return None
+        with self._lock:
+            token = self._epoch + ";" + ";".join(
+                f"{table}={self._versions.get(table, 0)}" for table in tables
+            )
+            modified = [self._modified[t] for t in tables if t in self._modified]
+        return token, (max(modified) if modified else None)
+
+    def _redis_snapshot(self, client, tables) -> Tuple[str, Optional[float]]:
+        keys = [key for table in tables for key in self._keys(table)]
+        values = client.mget(keys)
+        missing = [t for t, v in zip(tables, values[::2]) if v is None]
+        if missing:
+            # Seed unseen tables with a time-based value so a flushed Redis
+            # never hands out a token that was valid before the flush.
+            seed = time.time_ns()
+            pipe = client.pipeline(transaction=False)
+            for table in missing:
+                version_key, modified_key = self._keys(table)
+                pipe.set(version_key, seed, nx=True)
+                pipe.set(modified_key, int(time.time()), nx=True)
+            pipe.execute()
+            values = client.mget(keys)
+
+        token = ";".join(f"{t}={v}" for t, v in zip(tables, values[::2]))
+        modified = [float(m) for m in values[1::2] if m is not None]
+        return token, (max(modified) if modified else None)
+
+
+table_versions = TableVersionStore()
+
+
+@on_tables_committed
+def _bump_committed_tables(tables) -> None:
+    table_versions.bump(tables)
+
+
+def compute_etag(*parts: str) -> str:
+    """Build a strong ETag from the given parts."""
+    digest = hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of ``If-None-Match`` against ``etag`` (RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def is_not_modified(headers, etag: str) -> bool:
+    """
+    Evaluate conditional request headers. Only ``If-None-Match`` is used;
+    ``If-Modified-Since`` cannot tell writes within one second apart.
+    """
+    if_none_match = headers.get("if-none-match")
+    return if_none_match is not None and etag_matches(if_none_match, etag)
+
+
+class NotModified(Exception):
+    """Raised by ``conditional_get`` to short-circuit with ``304``."""
+
+    def __init__(self, etag: str, last_modified: Optional[str] = None):
+        self.headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        if last_modified:
+            self.headers["Last-Modified"] = last_modified
+
+
+async def not_modified_handler(request: Request, exc: NotModified) -> Response:
+    return Response(status_code=304, headers=exc.headers)
+
+
+def _credential_scope(request: Request) -> str:
+    credentials = "\x1f".join(
+        request.headers.get(name, "") for name in ("x-api-key", "authorization")
+    )
+    return hashlib.sha256(credentials.encode("utf-8")).hexdigest()
+
+
+def _table_name(model) -> str:
+    return model if isinstance(model, str) else model.__tablename__
+
+
+def conditional_get(*models, per_client: bool = True):
+    """
+    Dependency factory answering ``If-None-Match`` for GET endpoints.
+
+    ``models`` are the ORM models (or table names) the response is built
+    from. With ``per_client`` the ETag is also scoped to the caller's
+    credentials, which is required whenever the payload depends on who asks.
+
+    The precondition is only evaluated for an authenticated caller, so a
+    request without valid credentials gets ``401``, never ``304``. Role
+    checks are the router's dependencies, which run first.
+    """
+    tables = tuple(sorted({_table_name(model) for model in models}))
+
+    def _dependency(
+        request: Request,
+        response: Response,
+        client: ApiClientContext = Depends(get_current_client_or_driver),
+    ) -> None:
+        snapshot = table_versions.snapshot(tables)
+        if snapshot is None:
+            setattr(request.state, CONTENT_ETAG_STATE_KEY, True)
+            return
+        token, modified = snapshot
+        query = "&".join(
+            f"{key}={value}" for key, value in sorted(request.query_params.multi_items())
+        )
+        etag = compute_etag(
+            request.url.path,
+            query,
+            _credential_scope(request) if per_client else "",
+            token,
+        )
+        last_modified = formatdate(modified, usegmt=True) if modified else None
+        if is_not_modified(request.headers, etag):
+            raise NotModified(etag, last_modified)
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = CACHE_CONTROL
+        if last_modified:
+            response.headers["Last-Modified"] = last_modified
+
+    return _dependency
+
+
+class ContentETagMiddleware:
+    """
+    Hash-based ETags for requests marked by ``conditional_get``.
+
+    Only successful GET responses up to ``max_body_size`` bytes are buffered;
+    anything larger is passed through untouched.
+    """
+
+    def __init__(self, app, max_body_size: int = ETAG_CONTENT_MAX_BODY):
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        chunks = []
+        size = 0
+        passthrough = False
+
+        async def _send(message):
+            nonlocal start_message, size, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                state = scope.get("state") or {}
+                if message["status"] != 200 or not state.get(CONTENT_ETAG_STATE_KEY):
+                    passthrough = True
+                    await send(message)
+                    return
+                start_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            chunks.append(body)
+            size += len(body)
+            more_body = message.get("more_body", False)
+            if size > self.max_body_size:
+                passthrough = True
+                await send(start_message)
+                await send(
+                    {"type": "http.response.body", "body": b"".join(chunks), "more_body": more_body}
+                )
+                return
+            if more_body:
+                return
+
+            payload = b"".join(chunks)
+            etag = '"' + hashlib.sha256(payload).hexdigest()[:32] + '"'
+            request_headers = {
+                key.decode("latin-1").lower(): value.decode("latin-1")
+                for key, value in scope.get("headers", [])
+            }
+            headers = [
+                (key, value)
+                for key, value in start_message["headers"]
+                if key.lower() not in (b"etag", b"cache-control")
+            ]
+            headers.append((b"etag", etag.encode("latin-1")))
+            headers.append((b"cache-control", CACHE_CONTROL.encode("latin-1")))
+            if etag_matches(request_headers.get("if-none-match"), etag):
+                headers = [
+                    (key, value)
+                    for key, value in headers
+                    if key.lower() not in (b"content-length", b"content-type")
+                ]
+                await send({"type": "http.response.start", "status": 304, "headers": headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+            await send({**start_message, "headers": headers})
+            await send({"type": "http.response.body", "body": payload})
+
+        await self.app(scope, receive, _send)
@@ -0,0 +1,434 @@
+"""
+Background export jobs with chunked, checksummed artifacts.
+
+Large exports used to stream straight from a live query inside the request:
+a dropped connection restarted the whole export and the worker was pinned
+for its duration. A job instead writes the export to local storage and the
+artifact is then served as a plain file, so clients can resume downloads
+with HTTP ``Range`` requests.
+
+* Rows are read in keyset chunks of ``EXPORT_CHUNK_ROWS`` along the
+  dataset's ``(order column, id)`` ordering, so no cursor stays open across
+  the progress commits and each query is bounded. Each chunk is an
+  independent gzip member appended to the artifact, so the file is a valid
+  gzip stream at every chunk boundary.
+* A JSON manifest next to the artifact records every chunk (offset, length,
+  rows, SHA-256) and the keyset position. A job interrupted by a restart
+  resumes after the last recorded chunk instead of starting over.
+* Identical requests (same dataset, format, client and filters) share a job
+  through ``params_hash`` until the artifact expires after ``EXPORT_JOB_TTL``.
+* A runner writes a job only while it holds the job's ``lease_id``. Every
+  write is a conditional ``UPDATE ... WHERE lease_id = :lease`` that also
+  bumps ``updated_at`` as a heartbeat; a stale job is taken over by swapping
+  in a new lease, so exactly one runner resumes it and the old one stops at
+  its next write.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import and_, or_, update
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from safedrive.core.exports import csv_chunks, jsonl_chunks
+from safedrive.core.security import ApiClientContext
+from safedrive.database.base import SessionLocal
+from safedrive.models.export_job import ExportJob
+
+logger = logging.getLogger(__name__)
+
+EXPORT_STORAGE_DIR = os.getenv(
+    "EXPORT_STORAGE_DIR", os.path.join(tempfile.gettempdir(), "safedrive-exports")
+)
+EXPORT_JOB_TTL = int(os.getenv("EXPORT_JOB_TTL", "86400"))
+EXPORT_JOB_WORKERS = int(os.getenv("EXPORT_JOB_WORKERS", "2"))
+EXPORT_CHUNK_ROWS = int(os.getenv("EXPORT_CHUNK_ROWS", "50000"))
+# A running job not updated for this long is treated as abandoned and resumed.
+EXPORT_JOB_STALE_SECONDS = int(os.getenv("EXPORT_JOB_STALE_SECONDS", "300"))
+
+EXPORT_JOB_FORMATS = {"jsonl", "csv"}
+ACTIVE_STATUSES = ("pending", "running", "completed")
+
+
+@dataclass(frozen=True)
+class ExportDataset:
+    """How to query, serialize and name one exportable dataset."""
+
+    name: str
+    filename: str
+    build_query: Callable[[Session, ApiClientContext, Dict[str, Any]], Select]
+    payload: Callable[[Any], dict]
+    csv_header: List[str]
+    csv_row: Callable[[dict], List[str]]
+    # (order column, unique UUID tie-break) matching ``build_query``'s
+    # ordering; jobs scan in keyset chunks along it.
+    keyset: Tuple[Any, Any]
+
+
+_datasets: Dict[str, ExportDataset] = {}
+
+
+def register_export_dataset(dataset: ExportDataset) -> ExportDataset:
+    _datasets[dataset.name] = dataset
+    return dataset
+
+
+def get_export_dataset(name: str) -> ExportDataset:
+    return _datasets[name]
+
+
+def params_hash(
+    dataset: str, export_format: str, client: ApiClientContext, params: Dict[str, Any]
+) -> str:
+    # The client is part of the key: scoped clients see different rows for
+    # the same filters.
+    payload = json.dumps(
+        {
+            "dataset": dataset,
+            "format": export_format,
+            "client": str(client.id),
+            "params": params,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def artifact_filename(job: ExportJob) -> str:
+    return f"{get_export_dataset(job.dataset).filename}.{job.export_format}.gz"
+
+
+def _manifest_path(artifact_path: str) -> str:
+    return f"{artifact_path}.manifest.json"
+
+
+def _read_manifest(artifact_path: str) -> Optional[dict]:
+    try:
+        with open(_manifest_path(artifact_path), "r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_manifest(artifact_path: str, manifest: dict) -> None:
+    path = _manifest_path(artifact_path)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle)
+    os.replace(tmp_path, path)
+
+
+def job_manifest(job: ExportJob) -> Optional[dict]:
+    if not job.artifact_path:
+        return None
+    return _read_manifest(job.artifact_path)
+
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _encode_chunk(
+    dataset: ExportDataset, export_format: str, payloads: List[dict], header: bool
+) -> bytes:
+    if export_format == "csv":
+        rows = (dataset.csv_row(payload) for payload in payloads)
+        data = b"".join(csv_chunks(dataset.csv_header if header else None, rows))
+    else:
+        data = b"".join(jsonl_chunks(payloads))
+    return gzip.compress(data)
+
+
+class LeaseLost(Exception):
+    """Another runner claimed the job this runner was writing."""
+
+
+def _update_leased(db: Session, job_id: UUID, lease: UUID, **values: Any) -> bool:
+    """Update the job only while ``lease`` is still its lease, renewing the heartbeat."""
+    result = db.execute(
+        update(ExportJob)
+        .where(ExportJob.id == job_id, ExportJob.lease_id == lease)
+        .values(updated_at=datetime.utcnow(), **values)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def _renew_lease(db: Session, job_id: UUID, lease: UUID, **values: Any) -> None:
+    if not _update_leased(db, job_id, lease, **values):
+        raise LeaseLost(f"Export job {job_id} is no longer leased to this runner")
+
+
+class ExportJobRunner:
+    """Runs export jobs on a small thread pool; ``workers=0`` runs inline."""
+
+    def __init__(
+        self,
+        workers: int = EXPORT_JOB_WORKERS,
+        storage_dir: str = EXPORT_STORAGE_DIR,
+        chunk_rows: int = EXPORT_CHUNK_ROWS,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ) -> None:
+        self.workers = workers
+        self.storage_dir = storage_dir
+        self.chunk_rows = chunk_rows
+        self.session_factory = session_factory
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers, thread_name_prefix="export-job"
+                    )
+        return self._executor
+
+    def submit(self, job_id: UUID, client: ApiClientContext, lease: UUID) -> None:
+        if self.workers <= 0:
+            self.run(job_id, client, lease)
+            return
+        self._get_executor().submit(self.run, job_id, client, lease)
+
+    def run(self, job_id: UUID, client: ApiClientContext, lease: UUID) -> None:
+        """Write the job's artifact, provided ``lease`` is the job's current lease."""
+        db = self.session_factory()
+        try:
+            job = db.get(ExportJob, job_id)
+            if job is None or job.status not in ("pending", "running") or job.lease_id != lease:
+                return
+            try:
+                self._write_artifact(db, job, client, lease)
+            except LeaseLost:
+                db.rollback()
+                logger.warning(f"Export job {job_id} was taken over by another runner")
+            except Exception as exc:
+                logger.exception(f"Export job {job_id} failed")
+                db.rollback()
+                _update_leased(db, job_id, lease, status="failed", error=str(exc)[:2000])
+        finally:
+            db.close()
+
+    def _write_artifact(
+        self, db: Session, job: ExportJob, client: ApiClientContext, lease: UUID
+    ) -> None:
+        dataset = get_export_dataset(job.dataset)
+        os.makedirs(self.storage_dir, exist_ok=True)
+        artifact_path = os.path.join(self.storage_dir, f"{job.id}.{job.export_format}.gz")
+        part_path = f"{artifact_path}.part"
+        # Confirm the lease before touching files a previous runner may share.
+        _renew_lease(db, job.id, lease, status="running", artifact_path=artifact_path)
+
+        manifest = _read_manifest(artifact_path)
+        if manifest is None or not os.path.exists(part_path):
+            manifest = {
+                "job_id": str(job.id),
+                "dataset": job.dataset,
+                "format": job.export_format,
+                "rows": 0,
+                "bytes": 0,
+                "chunks": [],
+            }
+            open(part_path, "wb").close()
+        # Drop any bytes written after the last chunk the manifest recorded.
+        with open(part_path, "r+b") as handle:
+            handle.truncate(manifest["bytes"])
+
+        statement = dataset.build_query(db, client, job.params)
+        order_column, unique_column = dataset.keyset
+        with open(part_path, "ab") as handle:
+            while True:
+                chunk_statement = statement
+                cursor = manifest.get("cursor")
+                if cursor is not None:
+                    last_value, last_id = cursor[0], UUID(cursor[1])
+                    chunk_statement = chunk_statement.where(
+                        or_(
+                            order_column > last_value,
+                            and_(order_column == last_value, unique_column > last_id),
+                        )
+                    )
+                rows = db.execute(chunk_statement.limit(self.chunk_rows)).all()
+                first_chunk = not manifest["chunks"]
+                if not rows and not first_chunk:
+                    break
+                payloads = [dataset.payload(row) for row in rows]
+                data = _encode_chunk(dataset, job.export_format, payloads, first_chunk)
+                _renew_lease(db, job.id, lease)
+                handle.write(data)
+                handle.flush()
+                os.fsync(handle.fileno())
+                manifest["chunks"].append(
+                    {
+                        "offset": manifest["bytes"],
+                        "length": len(data),
+                        "rows": len(rows),
+                        "sha256": hashlib.sha256(data).hexdigest(),
+                    }
+                )
+                manifest["rows"] += len(rows)
+                manifest["bytes"] += len(data)
+                if rows:
+                    last = rows[-1]._mapping
+                    manifest["cursor"] = [last[order_column], str(last[unique_column])]
+                _write_manifest(artifact_path, manifest)
+                _renew_lease(
+                    db, job.id, lease, row_count=manifest["rows"], byte_size=manifest["bytes"]
+                )
+                if len(rows) < self.chunk_rows:
+                    break
+
+        _renew_lease(db, job.id, lease)
+        os.replace(part_path, artifact_path)
+        manifest["sha256"] = _file_sha256(artifact_path)
+        manifest["completed_at"] = datetime.utcnow().isoformat()
+        _write_manifest(artifact_path, manifest)
+
+        now = datetime.utcnow()
+        _renew_lease(
+            db,
+            job.id,
+            lease,
+            status="completed",
+            checksum=manifest["sha256"],
+            completed_at=now,
+            expires_at=now + timedelta(seconds=EXPORT_JOB_TTL),
+        )
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+
+export_job_runner = ExportJobRunner()
+
+
+def _remove_artifact(artifact_path: Optional[str]) -> None:
+    if not artifact_path:
+        return
+    for path in (artifact_path, f"{artifact_path}.part", _manifest_path(artifact_path)):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def purge_expired_exports(db: Session) -> int:
+    """Delete artifacts of expired jobs and mark them ``expired``."""
+    expired = (
+        db.query(ExportJob)
+        .filter(ExportJob.status == "completed", ExportJob.expires_at <= datetime.utcnow())
+        .all()
+    )
+    for job in expired:
+        _remove_artifact(job.artifact_path)
+        job.status = "expired"
+    if expired:
+        db.commit()
+    return len(expired)
+
+
+def _is_reusable(job: ExportJob) -> bool:
+    if job.status == "completed":
+        return bool(job.artifact_path) and os.path.exists(job.artifact_path)
+    return True
+
+
+def _stale_before() -> datetime:
+    return datetime.utcnow() - timedelta(seconds=EXPORT_JOB_STALE_SECONDS)
+
+
+def _is_stale(job: ExportJob) -> bool:
+    if job.status not in ("pending", "running"):
+        return False
+    return job.updated_at <= _stale_before()
+
+
+def claim_export_job(db: Session, job: ExportJob) -> Optional[UUID]:
+    """
+    Take over a stale job with a new lease.
+
+    The swap only matches while the job still carries the lease it was read
+    with and is still stale, so of several requests finding the same
+    abandoned job exactly one gets the lease; the others get ``None``.
+    """
+    lease = uuid4()
+    seen = (
+        ExportJob.lease_id.is_(None) if job.lease_id is None else ExportJob.lease_id == job.lease_id
+    )
+    result = db.execute(
+        update(ExportJob)
+        .where(
+            ExportJob.id == job.id,
+            ExportJob.status.in_(("pending", "running")),
+            ExportJob.updated_at <= _stale_before(),
+            seen,
+        )
+        .values(lease_id=lease, status="running", updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return lease if result.rowcount == 1 else None
+
+
+def create_export_job(
+    db: Session,
+    client: ApiClientContext,
+    dataset: str,
+    export_format: str,
+    params: Dict[str, Any],
+) -> ExportJob:
+    """Return the live job for these parameters, creating and queueing one if needed."""
+    purge_expired_exports(db)
+    digest = params_hash(dataset, export_format, client, params)
+    existing = (
+        db.query(ExportJob)
+        .filter(ExportJob.params_hash == digest, ExportJob.status.in_(ACTIVE_STATUSES))
+        .order_by(ExportJob.created_at.desc())
+        .first()
+    )
+    if existing is not None and _is_reusable(existing):
+        if _is_stale(existing):
+            # Its worker went away (e.g. a restart); resume from the manifest.
+            lease = claim_export_job(db, existing)
+            if lease is not None:
+                export_job_runner.submit(existing.id, client, lease)
+            db.refresh(existing)
+        return existing
+    if existing is not None:
+        existing.status = "expired"
+
+    job = ExportJob(
+        dataset=dataset,
+        export_format=export_format,
+        params=params,
+        params_hash=digest,
+        api_client_id=client.id,
+        status="pending",
+        lease_id=uuid4(),
+    )
+    db.add(job)
+    db.commit()
+    export_job_runner.submit(job.id, client, job.lease_id)
+    db.refresh(job)
+    return job
+
@@ -0,0 +1,338 @@
+"""
+Streaming helpers shared by the dataset exports.
+
+``stream_rows`` runs an export statement on a server-side cursor
+(``stream_results``) and hands back plain rows in partitions of
+``EXPORT_STREAM_BATCH_ROWS``. Exports select columns rather than ORM
+entities, so nothing is hydrated into the session's identity map and memory
+stays flat however many rows are exported. With PyMySQL this selects an
+unbuffered ``SSCursor`` instead of fetching the whole result up front.
+
+``jsonl_chunks`` and ``csv_chunks`` serialize rows into ~``EXPORT_CHUNK_BYTES``
+byte chunks. Yielding one tiny string per row made ASGI sends (and the
+threadpool hop behind every sync-iterator chunk) dominate export CPU time;
+JSONL is encoded with orjson, which handles UUIDs and datetimes natively
+instead of going through a ``default=str`` fallback per value.
+
+Exports accept a ``since`` change cursor. Exported tables carry an
+``ingested_at`` column that every ORM or Core insert/update sets, and each
+export returns ``X-Next-Cursor``; passing it back as ``since`` selects only
+rows written after it. The cursor trails the clock by
+``EXPORT_CURSOR_LAG_SECONDS`` so a row stamped just before the export but
+committed after it is not skipped; exports served from a read replica also
+trail its lag allowance. Delivery is at-least-once: rows inside
+that window come back on the next pull, so consumers upsert by ``id``.
+
+``text_export_response`` can compress those chunks on the fly with gzip or
+zstd. A ``compression=`` query parameter yields a compressed download
+(``.jsonl.gz``, ``.csv.zst``); otherwise the encoding is negotiated from
+``Accept-Encoding`` and sent as ``Content-Encoding``, which HTTP clients
+decode transparently. Compression runs chunk by chunk inside the response
+iterator, so only the compressor's window is buffered.
+
+For the columnar formats (Apache Parquet and Arrow IPC stream), rows are
+grouped into batches of ``COLUMNAR_EXPORT_BATCH_ROWS`` and converted to
+Arrow record batches. Each batch is written as one Parquet row group (or
+one IPC stream message) and the encoded bytes are handed to the response
+before the next batch is built, so a worker only ever holds a single batch
+in memory regardless of the export size.
+"""
+import base64
+import binascii
+import csv
+import io
+import os
+import zlib
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
+import zstandard
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy.engine import Connection, Row
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from safedrive.database.replicas import READ_LAG_ALLOWANCE_KEY
+
+EXPORT_CHUNK_BYTES = int(os.getenv("EXPORT_CHUNK_BYTES", "65536"))
+EXPORT_STREAM_BATCH_ROWS = int(os.getenv("EXPORT_STREAM_BATCH_ROWS", "1000"))
+COLUMNAR_EXPORT_BATCH_ROWS = int(os.getenv("COLUMNAR_EXPORT_BATCH_ROWS", "50000"))
+EXPORT_GZIP_LEVEL = int(os.getenv("EXPORT_GZIP_LEVEL", "6"))
+EXPORT_ZSTD_LEVEL = int(os.getenv("EXPORT_ZSTD_LEVEL", "3"))
+EXPORT_CURSOR_LAG_SECONDS = int(os.getenv("EXPORT_CURSOR_LAG_SECONDS", "5"))
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# format -> (media type, file extension)
+COLUMNAR_FORMATS: Dict[str, Tuple[str, str]] = {
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+}
+
+# encoding -> (download media type, file extension), in order of preference
+# when Accept-Encoding weighs them equally.
+EXPORT_COMPRESSIONS: Dict[str, Tuple[str, str]] = {
+    "zstd": ("application/zstd", "zst"),
+    "gzip": ("application/gzip", "gz"),
+}
+
+
+def stream_rows(
+    db: Union[Session, Connection], statement: Select, batch_rows: Optional[int] = None
+) -> Iterator[Row]:
+    """
+    Yield the rows of ``statement`` from a server-side cursor. Pass a separate
+    ``Connection`` to stream a second result while one is already open:
+    unbuffered MySQL cursors allow one active result per connection.
+    """
+    batch_rows = batch_rows or EXPORT_STREAM_BATCH_ROWS
+    result = db.execute(
+        statement.execution_options(stream_results=True, yield_per=batch_rows)
+    )
+    try:
+        for partition in result.partitions():
+            yield from partition
+    finally:
+        # Release the cursor even when the client disconnects mid-export.
+        result.close()
+
+
+def encode_change_cursor(value: datetime) -> str:
+    return base64.urlsafe_b64encode(value.isoformat().encode("ascii")).decode("ascii")
+
+
+def decode_change_cursor(cursor: str) -> datetime:
+    """Parse a ``since`` cursor issued by ``next_change_cursor``."""
+    try:
+        return datetime.fromisoformat(
+            base64.urlsafe_b64decode(cursor.encode("ascii")).decode("ascii")
+        )
+    except (ValueError, UnicodeError, binascii.Error):
+        raise HTTPException(status_code=400, detail="Invalid since cursor.")
+
+
+def next_change_cursor(db: Optional[Session] = None) -> str:
+    """
+    Cursor to hand back with an export; take it before the export query runs.
+    Exports read from a replica (``db``) trail its lag allowance as well.
+    """
+    lag = EXPORT_CURSOR_LAG_SECONDS
+    if db is not None:
+        lag += db.info.get(READ_LAG_ALLOWANCE_KEY, 0)
+    return encode_change_cursor(datetime.utcnow() - timedelta(seconds=lag))
+
+
+def apply_change_cursor(statement, column, since: Optional[str]):
+    """Restrict ``statement`` to rows whose ``column`` is after the ``since`` cursor."""
+    if since is None:
+        return statement
+    return statement.filter(column > decode_change_cursor(since))
+
+
+def json_cell(value: Any) -> str:
+    """JSON-encode a nested value for a single CSV cell."""
+    return orjson.dumps(value, default=str).decode("utf-8")
+
+
+def jsonl_chunks(
+    payloads: Iterable[dict], chunk_bytes: Optional[int] = None
+) -> Iterator[bytes]:
+    """Encode ``payloads`` as JSON lines, yielding ~``chunk_bytes`` at a time."""
+    chunk_bytes = chunk_bytes or EXPORT_CHUNK_BYTES
+    buffer = bytearray()
+    for payload in payloads:
+        buffer += orjson.dumps(
+            payload, default=str, option=orjson.OPT_APPEND_NEWLINE
+        )
+        if len(buffer) >= chunk_bytes:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def csv_chunks(
+    header: Optional[List[str]],
+    rows: Iterable[List[Any]],
+    chunk_bytes: Optional[int] = None,
+) -> Iterator[bytes]:
+    """Encode ``rows`` (preceded by ``header``) as CSV in ~``chunk_bytes`` chunks."""
+    chunk_bytes = chunk_bytes or EXPORT_CHUNK_BYTES
+    output = io.StringIO()
+    writer = csv.writer(output)
+    if header:
+        writer.writerow(header)
+    for batch in _batches(rows, 256):
+        writer.writerows(batch)
+        if output.tell() >= chunk_bytes:
+            yield output.getvalue().encode("utf-8")
+            output.seek(0)
+            output.truncate(0)
+    if output.tell():
+        yield output.getvalue().encode("utf-8")
+
+
+def parse_compression(compression: Optional[str], export_format: str) -> Optional[str]:
+    """
+    Validate an explicit ``compression=`` value. Returns the encoding name,
+    ``"identity"`` for ``none`` or ``None`` when the parameter was omitted.
+    """
+    if compression is None:
+        return None
+    value = compression.lower()
+    if value in ("none", "identity"):
+        return "identity"
+    if value not in EXPORT_COMPRESSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid compression. Supported values are 'gzip', 'zstd' and 'none'.",
+        )
+    if export_format in COLUMNAR_FORMATS:
+        # Parquet compresses its pages itself; Arrow clients expect raw IPC.
+        raise HTTPException(
+            status_code=400,
+            detail="Compression is only supported for 'jsonl' and 'csv' exports.",
+        )
+    return value
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the preferred supported encoding from an ``Accept-Encoding`` header."""
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        if name == "*":
+            for encoding in EXPORT_COMPRESSIONS:
+                weights.setdefault(encoding, weight)
+        elif name in EXPORT_COMPRESSIONS:
+            weights[name] = weight
+    best = None
+    for encoding in EXPORT_COMPRESSIONS:
+        weight = weights.get(encoding, 0.0)
+        if weight > 0 and (best is None or weight > weights[best]):
+            best = encoding
+    return best
+
+
+def compress_chunks(chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+    """Compress ``chunks`` incrementally as one gzip or zstd stream."""
+    if encoding == "zstd":
+        compressor = zstandard.ZstdCompressor(level=EXPORT_ZSTD_LEVEL).compressobj()
+    else:
+        # wbits=31 writes a gzip header and trailer around the deflate stream.
+        compressor = zlib.compressobj(EXPORT_GZIP_LEVEL, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def text_export_response(
+    chunks: Iterable[bytes],
+    media_type: str,
+    filename: str,
+    compression: Optional[str] = None,
+    accept_encoding: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> StreamingResponse:
+    """
+    Stream a CSV/JSONL export, compressed per ``compression`` (a value from
+    ``parse_compression``) or, when that is ``None``, per ``Accept-Encoding``.
+    ``filename`` includes the format extension.
+    """
+    headers = dict(headers or {})
+    if compression is None:
+        encoding = negotiate_encoding(accept_encoding)
+        headers["Vary"] = "Accept-Encoding"
+        if encoding:
+            chunks = compress_chunks(chunks, encoding)
+            headers["Content-Encoding"] = encoding
+    elif compression != "identity":
+        chunks = compress_chunks(chunks, compression)
+        media_type, extension = EXPORT_COMPRESSIONS[compression]
+        filename = f"{filename}.{extension}"
+    headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return StreamingResponse(chunks, media_type=media_type, headers=headers)
+
+
+class _ChunkSink:
+    """Write-only file object that buffers bytes until they are drained."""
+
+    closed = False
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _batches(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def stream_columnar(
+    rows: Iterable[dict],
+    schema: pa.Schema,
+    export_format: str,
+    batch_rows: Optional[int] = None,
+) -> Iterator[bytes]:
+    """
+    Encode ``rows`` (dicts keyed by ``schema`` field names) as Parquet or an
+    Arrow IPC stream, yielding the encoded bytes one batch at a time.
+    """
+    batch_rows = batch_rows or COLUMNAR_EXPORT_BATCH_ROWS
+    sink = _ChunkSink()
+    if export_format == "parquet":
+        writer = pq.ParquetWriter(sink, schema)
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+    try:
+        for batch in _batches(rows, batch_rows):
+            writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    # Parquet footer / IPC end-of-stream marker.
+    yield sink.drain()
@@ -1,48 +1,59 @@
 """JWT Authentication utilities for mobile app drivers."""
 
+import logging
 import os
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional
+from uuid import uuid4
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from uuid import UUID
 
+from redis.exceptions import RedisError
+
+from safedrive.core.cache import get_redis_client
+# Re-exported for existing imports; hashing lives in safedrive.core.passwords.
+from safedrive.core.passwords import hash_password, pwd_context, verify_password  # noqa: F401
 from safedrive.database.db import get_db
 from safedrive.models.driver_profile import DriverProfile
 
+logger = logging.getLogger(__name__)
+
 # JWT Configuration
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-this-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 30  # 30 days for mobile app
-
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+DRIVER_TOKEN_TYPE = "driver_mobile"
+REVOCATION_KEY_PREFIX = "auth:jwt"
+# Trust this process's revocation maps alone when Redis is unavailable.
+# Only sound with a single worker: other workers never see its revocations.
+TOKEN_REVOCATION_LOCAL = os.getenv("TOKEN_REVOCATION_LOCAL", "false").lower() == "true"
 
 # Bearer token security scheme
 security = HTTPBearer()
 
 
-def hash_password(password: str) -> str:
-    """Hash a password."""
-    return pwd_context.hash(password)
-
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
-
-
 def create_access_token(driver_profile_id: UUID, email: str) -> str:
-    """Create a JWT access token for a driver."""
-    expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    """
+    Create a JWT access token for a driver.
+
+    The claims are everything needed to authenticate a request, so
+    verification does not touch the database; see ``token_revocations``.
+    """
+    now = datetime.utcnow()
+    expire = now + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode = {
         "sub": str(driver_profile_id),
         "email": email,
+        # Sub-second, so a token issued just after a revocation stays valid.
+        "iat": round(time.time(), 6),
         "exp": expire,
-        "type": "driver_mobile"
+        "jti": uuid4().hex,
+        "type": DRIVER_TOKEN_TYPE,
     }
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
@@ -60,20 +71,137 @@ def decode_token(token: str) -> dict:
         )
 
 
+class TokenRevocationStore:
+    """
+    Revoked driver tokens, checked without touching the database.
+
+    Two compact maps are kept, in-process and mirrored to Redis when it is
+    available so every worker sees them:
+
+    * a ``jti`` denylist for single tokens (logout), kept until the token
+      would have expired anyway;
+    * a per-driver "revoked at" timestamp rejecting every token issued
+      before it (profile deletion). Tokens from before ``iat`` was added are
+      treated as issued at 0.
+
+    When Redis is unavailable, whether the lookup fails or no client could
+    be connected, tokens with a ``jti`` are refused with ``503`` rather than
+    accepted, since a logout on another worker would otherwise be missed.
+    ``TOKEN_REVOCATION_LOCAL=true`` trusts the in-process maps instead; a
+    revocation then only reaches the worker that handled it and is lost on
+    restart, so it is only sound for single-worker deployments.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tokens: Dict[str, float] = {}
+        self._drivers: Dict[str, float] = {}
+
+    @staticmethod
+    def _token_key(jti: str) -> str:
+        return f"{REVOCATION_KEY_PREFIX}:jti:{jti}"
+
+    @staticmethod
+    def _driver_key(driver_profile_id: str) -> str:
+        return f"{REVOCATION_KEY_PREFIX}:driver:{driver_profile_id}"
+
+    def _prune(self, now: float) -> None:
+        self._tokens = {jti: exp for jti, exp in self._tokens.items() if exp > now}
+        horizon = now - ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        self._drivers = {
+            driver: revoked_at
+            for driver, revoked_at in self._drivers.items()
+            if revoked_at > horizon
+        }
+
+    def revoke_token(self, jti: str, expires_at: float) -> None:
+        now = time.time()
+        if not jti or expires_at <= now:
+            return
+        with self._lock:
+            self._prune(now)
+            self._tokens[jti] = expires_at
+        self._redis_set(self._token_key(jti), int(expires_at - now) + 1, 1)
+
+    def revoke_driver(self, driver_profile_id) -> None:
+        now = time.time()
+        driver = str(driver_profile_id)
+        with self._lock:
+            self._prune(now)
+            self._drivers[driver] = now
+        self._redis_set(self._driver_key(driver), ACCESS_TOKEN_EXPIRE_MINUTES * 60, now)
+
+    def is_revoked(self, payload: dict) -> bool:
+        jti = payload.get("jti")
+        driver = str(payload.get("sub"))
+        issued_at = float(payload.get("iat") or 0)
+        with self._lock:
+            if jti and jti in self._tokens:
+                return True
+            revoked_at = self._drivers.get(driver)
+        if revoked_at is not None and issued_at < revoked_at:
+            return True
+
+        client = get_redis_client()
+        try:
+            if client is None:
+                raise RedisError("Redis unavailable")
+            token_flag, driver_revoked_at = client.mget(
+                self._token_key(jti or ""), self._driver_key(driver)
+            )
+        except (RedisError, Exception) as e:
+            if TOKEN_REVOCATION_LOCAL or not jti:
+                return False
+            logger.warning(f"Token revocation lookup failed: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Token revocation check unavailable. Try again later.",
+                headers={"Retry-After": "5"},
+            )
+        if token_flag:
+            return True
+        return driver_revoked_at is not None and issued_at < float(driver_revoked_at)
+
+    @staticmethod
+    def _redis_set(key: str, ttl: int, value) -> None:
+        client = get_redis_client()
+        if client is None:
+            return
+        try:
+            client.setex(key, ttl, value)
+        except (RedisError, Exception) as e:
+            logger.warning(f"Token revocation write failed for {key}: {e}")
+
+
+token_revocations = TokenRevocationStore()
+
+
+def decode_driver_token(token: str) -> dict:
+    """Decode a driver token and reject it if it has been revoked."""
+    payload = decode_token(token)
+    if payload.get("type") != DRIVER_TOKEN_TYPE or not payload.get("sub"):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token payload",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if token_revocations.is_revoked(payload):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return payload
+
+
 async def get_current_driver(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> DriverProfile:
     """Dependency to get the current authenticated driver from JWT token."""
     token = credentials.credentials
-    payload = decode_token(token)
-    
-    driver_profile_id = payload.get("sub")
-    if not driver_profile_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token payload"
-        )
+    payload = decode_driver_token(token)
+    driver_profile_id = payload["sub"]
     
     driver = db.query(DriverProfile).filter(
         DriverProfile.driverProfileId == UUID(driver_profile_id)
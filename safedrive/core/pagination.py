@@ -0,0 +1,45 @@
+"""
+Opaque keyset cursors for time-ordered feeds.
+
+A cursor encodes the ``(timestamp, id)`` of the last item a client received.
+The next page continues strictly after it along the ``(timestamp desc, id
+desc)`` ordering, so pages stay stable while new rows are inserted at the
+head and each page costs one bounded index range scan regardless of depth.
+"""
+import base64
+from typing import Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_
+
+FEED_PAGE_SIZE = 20
+FEED_MAX_PAGE_SIZE = 100
+
+
+def encode_keyset_cursor(timestamp: int, item_id: UUID) -> str:
+    raw = f"{int(timestamp)}:{item_id}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_keyset_cursor(cursor: Optional[str]) -> Optional[Tuple[int, UUID]]:
+    """Decode a cursor from ``encode_keyset_cursor``; 400 if malformed."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, item_id = base64.urlsafe_b64decode(padded).decode("ascii").split(":", 1)
+        return int(timestamp), UUID(item_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+
+def before_keyset(timestamp_column, id_column, position: Optional[Tuple[int, UUID]]):
+    """Criterion for rows after ``position`` in ``(timestamp, id)`` descending order."""
+    if position is None:
+        return None
+    timestamp, item_id = position
+    return or_(
+        timestamp_column < timestamp,
+        and_(timestamp_column == timestamp, id_column < item_id),
+    )
@@ -0,0 +1,217 @@
+"""
+Monthly partitions for ``raw_sensor_data`` and ``location``.
+
+On MySQL both tables are RANGE partitioned on their epoch-millisecond
+``timestamp`` (migration ``o8p9q0r1s2t3``): one partition per UTC calendar
+month named ``pYYYYMM``, plus ``pmax`` (``VALUES LESS THAN MAXVALUE``) so
+rows from badly set device clocks always have somewhere to go.
+
+``rotate_partitions`` (``scripts/rotate_partitions.py``, run daily) keeps
+``PARTITION_MONTHS_AHEAD`` future months split out of ``pmax`` and applies
+the retention policy: months older than ``SENSOR_RETENTION_MONTHS``
+(``0`` keeps everything) are dropped, or with
+``SENSOR_RETENTION_ACTION=archive`` swapped into a standalone
+``<table>_archive_pYYYYMM`` table (``EXCHANGE PARTITION``, a metadata-only
+move) to be exported before it is dropped.
+
+MySQL only skips partitions for predicates on ``timestamp`` itself.
+``recorded_since`` and ``recorded_between`` turn datetime windows into such
+predicates, widened by ``PARTITION_PRUNING_SLACK_MS`` because ``date`` and
+trip start times come from device clocks and local time zones. Add them
+next to the exact filters; on other backends they are plain range filters.
+"""
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+PARTITIONED_TABLES = ("raw_sensor_data", "location")
+MAX_PARTITION = "pmax"
+
+PARTITION_MONTHS_AHEAD = int(os.getenv("PARTITION_MONTHS_AHEAD", "3"))
+SENSOR_RETENTION_MONTHS = int(os.getenv("SENSOR_RETENTION_MONTHS", "0"))
+SENSOR_RETENTION_ACTION = os.getenv("SENSOR_RETENTION_ACTION", "archive").lower()
+PARTITION_PRUNING_SLACK_MS = int(os.getenv("PARTITION_PRUNING_SLACK_MS", str(24 * 60 * 60 * 1000)))
+
+_PARTITION_NAME = re.compile(r"^p(\d{4})(\d{2})$")
+
+
+def epoch_ms(value: datetime) -> int:
+    """Epoch milliseconds of ``value``; naive datetimes are UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1000)
+
+
+def recorded_since(column, since: Optional[datetime]) -> list:
+    """Pruning predicates for rows recorded at or after ``since``."""
+    if since is None:
+        return []
+    return [column >= epoch_ms(since) - PARTITION_PRUNING_SLACK_MS]
+
+
+def recorded_between(column, start: Optional[datetime], end: Optional[datetime]) -> list:
+    """Pruning predicates for rows recorded between ``start`` and ``end``."""
+    predicates = recorded_since(column, start)
+    if end is not None:
+        predicates.append(column < epoch_ms(end) + PARTITION_PRUNING_SLACK_MS)
+    return predicates
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"p{month.year:04d}{month.month:02d}"
+
+
+def partition_month(name: str) -> Optional[date]:
+    """The month a ``pYYYYMM`` partition holds, or None for other names."""
+    match = _PARTITION_NAME.match(name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def partition_bound(month: date) -> int:
+    """``VALUES LESS THAN`` bound of ``month``'s partition: the next month's start."""
+    following = add_months(month, 1)
+    return epoch_ms(datetime(following.year, following.month, 1))
+
+
+def partition_clause(month: date) -> str:
+    return f"PARTITION {partition_name(month)} VALUES LESS THAN ({partition_bound(month)})"
+
+
+@dataclass
+class RotationPlan:
+    """Partitions to split out of ``pmax`` and expired partitions to retire."""
+
+    table: str
+    create: List[date] = field(default_factory=list)
+    expire: List[date] = field(default_factory=list)
+
+
+def plan_rotation(
+    table: str,
+    existing: Sequence[str],
+    today: date,
+    months_ahead: int = PARTITION_MONTHS_AHEAD,
+    retention_months: int = SENSOR_RETENTION_MONTHS,
+) -> RotationPlan:
+    """
+    What to change so ``table`` has partitions up to ``months_ahead`` past
+    the current month and none older than ``retention_months``.
+    """
+    months = sorted(month for month in map(partition_month, existing) if month)
+    current = month_start(today)
+    plan = RotationPlan(table=table)
+
+    last = months[-1] if months else add_months(current, -1)
+    target = add_months(current, months_ahead)
+    while last < target:
+        last = add_months(last, 1)
+        plan.create.append(last)
+
+    if retention_months > 0:
+        oldest_kept = add_months(current, -retention_months)
+        plan.expire = [month for month in months if month < oldest_kept]
+    return plan
+
+
+def _existing_partitions(connection: Connection, table: str) -> List[str]:
+    rows = connection.execute(
+        text(
+            "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table "
+            "AND PARTITION_NAME IS NOT NULL ORDER BY PARTITION_ORDINAL_POSITION"
+        ),
+        {"table": table},
+    )
+    return [row[0] for row in rows]
+
+
+def _archive_partition(connection: Connection, table: str, month: date) -> str:
+    name = partition_name(month)
+    archive = f"{table}_archive_{name}"
+    exists = connection.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :name"
+        ),
+        {"name": archive},
+    ).scalar()
+    if exists:
+        # Exchanging again would swap its rows back into the live table.
+        raise RuntimeError(f"{archive} already exists; export and drop it first.")
+    connection.execute(text(f"CREATE TABLE {archive} LIKE {table}"))
+    connection.execute(text(f"ALTER TABLE {archive} REMOVE PARTITIONING"))
+    connection.execute(text(f"ALTER TABLE {table} EXCHANGE PARTITION {name} WITH TABLE {archive}"))
+    return archive
+
+
+def apply_rotation(connection: Connection, plan: RotationPlan, action: str) -> None:
+    """Carry out ``plan``; expired partitions are archived or dropped per ``action``."""
+    if plan.create:
+        clauses = ", ".join(partition_clause(month) for month in plan.create)
+        connection.execute(
+            text(
+                f"ALTER TABLE {plan.table} REORGANIZE PARTITION {MAX_PARTITION} INTO "
+                f"({clauses}, PARTITION {MAX_PARTITION} VALUES LESS THAN MAXVALUE)"
+            )
+        )
+        logger.info(f"{plan.table}: added partitions {[partition_name(m) for m in plan.create]}")
+    for month in plan.expire:
+        name = partition_name(month)
+        if action == "archive":
+            archive = _archive_partition(connection, plan.table, month)
+            logger.info(f"{plan.table}: moved {name} to {archive}")
+        connection.execute(text(f"ALTER TABLE {plan.table} DROP PARTITION {name}"))
+        logger.info(f"{plan.table}: dropped {name}")
+
+
+def rotate_partitions(
+    engine: Engine,
+    today: Optional[date] = None,
+    months_ahead: int = PARTITION_MONTHS_AHEAD,
+    retention_months: int = SENSOR_RETENTION_MONTHS,
+    action: str = SENSOR_RETENTION_ACTION,
+    dry_run: bool = False,
+) -> List[RotationPlan]:
+    """
+    Rotate the partitions of every table in ``PARTITIONED_TABLES``. Returns
+    the plans; nothing is changed with ``dry_run`` or on other backends.
+    """
+    if action not in ("archive", "drop"):
+        raise ValueError(f"Unknown retention action {action!r}; use 'archive' or 'drop'.")
+    if engine.dialect.name != "mysql":
+        logger.info(f"{engine.dialect.name} has no table partitions; nothing to rotate.")
+        return []
+
+    today = today or datetime.utcnow().date()
+    plans = []
+    with engine.connect() as connection:
+        for table in PARTITIONED_TABLES:
+            existing = _existing_partitions(connection, table)
+            if MAX_PARTITION not in existing:
+                logger.warning(f"{table} is not partitioned; run the migrations first.")
+                continue
+            plan = plan_rotation(table, existing, today, months_ahead, retention_months)
+            plans.append(plan)
+            if not dry_run:
+                # DDL commits implicitly; each statement stands on its own.
+                apply_rotation(connection, plan, action)
+    return plans
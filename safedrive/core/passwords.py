@@ -0,0 +1,245 @@
+"""
+Password hashing service for driver accounts.
+
+bcrypt is deliberately slow (~250 ms of CPU at cost 12). Hashed inline on
+the request threadpool, a login storm runs dozens of hashes at once and
+every other request on the worker waits for CPU (or for the GIL, with
+backends that do not release it). Hashes and verifications are therefore
+run in a bounded process pool; request threads only wait on the result.
+
+* ``PASSWORD_BCRYPT_ROUNDS`` sets the cost. Hashes made with any other cost
+  are replaced on the next successful login (``verify_and_update``).
+* ``PASSWORD_HASH_WORKERS`` sizes the pool; ``0`` hashes inline. Workers
+  are spawned, not forked: the pool starts inside a running server whose
+  other threads may hold locks (logging, Redis, allocator) that a forked
+  child would inherit locked. The jobs are module-level functions so the
+  spawned workers can import them.
+* ``PASSWORD_HASH_MAX_PENDING`` caps queued work; beyond it callers get a
+  ``503`` instead of piling up behind the pool.
+* ``LoginThrottle`` limits failed attempts per email so brute-force traffic
+  is rejected before any hashing is done.
+"""
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+from redis.exceptions import RedisError
+
+from safedrive.core.cache import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+PASSWORD_BCRYPT_ROUNDS = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 2)))
+PASSWORD_HASH_MAX_PENDING = int(
+    os.getenv("PASSWORD_HASH_MAX_PENDING", str(max(PASSWORD_HASH_WORKERS, 1) * 8))
+)
+PASSWORD_HASH_QUEUE_TIMEOUT = float(os.getenv("PASSWORD_HASH_QUEUE_TIMEOUT", "5"))
+
+LOGIN_MAX_FAILED_ATTEMPTS = int(os.getenv("LOGIN_MAX_FAILED_ATTEMPTS", "5"))
+LOGIN_THROTTLE_WINDOW = int(os.getenv("LOGIN_THROTTLE_WINDOW", "300"))
+LOGIN_THROTTLE_KEY_PREFIX = "auth:login_failures"
+
+
+def build_context(rounds: int) -> CryptContext:
+    # Pinning min and max to the default makes any other cost "needs update".
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+pwd_context = build_context(PASSWORD_BCRYPT_ROUNDS)
+
+# Worker processes build their own context once per cost setting.
+_worker_contexts: Dict[int, CryptContext] = {}
+
+
+def _worker_context(rounds: int) -> CryptContext:
+    context = _worker_contexts.get(rounds)
+    if context is None:
+        context = _worker_contexts[rounds] = build_context(rounds)
+    return context
+
+
+def _hash_job(password: str, rounds: int) -> str:
+    return _worker_context(rounds).hash(password)
+
+
+def _verify_and_update_job(
+    password: str, hashed_password: str, rounds: int
+) -> Tuple[bool, Optional[str]]:
+    return _worker_context(rounds).verify_and_update(password, hashed_password)
+
+
+class PasswordHasher:
+    """Runs bcrypt jobs in a lazily started, bounded process pool."""
+
+    def __init__(
+        self,
+        workers: int = PASSWORD_HASH_WORKERS,
+        rounds: int = PASSWORD_BCRYPT_ROUNDS,
+        max_pending: int = PASSWORD_HASH_MAX_PENDING,
+    ) -> None:
+        self.workers = workers
+        self.rounds = rounds
+        self._slots = threading.BoundedSemaphore(max(max_pending, 1))
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+        return self._pool
+
+    def _run(self, fn, *args):
+        if self.workers <= 0:
+            return fn(*args)
+        if not self._slots.acquire(timeout=PASSWORD_HASH_QUEUE_TIMEOUT):
+            logger.warning("Password hashing queue is full; rejecting request.")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication service is busy, please retry shortly.",
+                headers={"Retry-After": "1"},
+            )
+        try:
+            return self._get_pool().submit(fn, *args).result()
+        finally:
+            self._slots.release()
+
+    def hash(self, password: str) -> str:
+        return self._run(_hash_job, password, self.rounds)
+
+    def verify_and_update(
+        self, password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """Return ``(valid, new_hash)``; ``new_hash`` is set when the cost changed."""
+        return self._run(_verify_and_update_job, password, hashed_password, self.rounds)
+
+    def shutdown(self) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+
+
+password_hasher = PasswordHasher()
+
+
+class LoginThrottle:
+    """
+    Failed-login counter per email over a fixed window.
+
+    Counts live in Redis when available so all workers share them, with an
+    in-process fallback.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = LOGIN_MAX_FAILED_ATTEMPTS,
+        window: int = LOGIN_THROTTLE_WINDOW,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.window = window
+        self._lock = threading.Lock()
+        self._failures: Dict[str, List[float]] = {}
+
+    @staticmethod
+    def _key(email: str) -> str:
+        return f"{LOGIN_THROTTLE_KEY_PREFIX}:{email.strip().lower()}"
+
+    def _local_failures(self, key: str, now: float) -> List[float]:
+        recent = [t for t in self._failures.get(key, []) if t > now - self.window]
+        if recent:
+            self._failures[key] = recent
+        else:
+            self._failures.pop(key, None)
+        return recent
+
+    def check(self, email: str) -> None:
+        """Raise ``429`` if ``email`` has too many recent failed attempts."""
+        if self.max_attempts <= 0:
+            return
+        key = self._key(email)
+        failures = None
+        client = get_redis_client()
+        if client is not None:
+            try:
+                value = client.get(key)
+                failures = int(value) if value else 0
+            except (RedisError, Exception) as e:
+                logger.warning(f"Login throttle read failed: {e}")
+        if failures is None:
+            with self._lock:
+                failures = len(self._local_failures(key, time.time()))
+        if failures >= self.max_attempts:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many failed login attempts. Try again later.",
+                headers={"Retry-After": str(self.window)},
+            )
+
+    def record_failure(self, email: str) -> None:
+        key = self._key(email)
+        client = get_redis_client()
+        if client is not None:
+            try:
+                # One MULTI: the window's TTL is set with the counter, so a
+                # failure between the two can't leave a key that never expires.
+                pipe = client.pipeline(transaction=True)
+                pipe.set(key, 0, ex=self.window, nx=True)
+                pipe.incr(key)
+                pipe.execute()
+                return
+            except (RedisError, Exception) as e:
+                logger.warning(f"Login throttle write failed: {e}")
+        now = time.time()
+        with self._lock:
+            self._local_failures(key, now)
+            self._failures.setdefault(key, []).append(now)
+
+    def reset(self, email: str) -> None:
+        key = self._key(email)
+        with self._lock:
+            self._failures.pop(key, None)
+        client = get_redis_client()
+        if client is None:
+            return
+        try:
+            client.delete(key)
+        except (RedisError, Exception) as e:
+            logger.warning(f"Login throttle reset failed: {e}")
+
+
+login_throttle = LoginThrottle()
+
+
+def hash_password(password: str) -> str:
+    """Hash a password with the configured bcrypt cost."""
+    return password_hasher.hash(password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash."""
+    return password_hasher.verify_and_update(plain_password, hashed_password)[0]
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """Verify a password and return a replacement hash if the cost changed."""
+    return password_hasher.verify_and_update(plain_password, hashed_password)
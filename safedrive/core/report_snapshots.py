@@ -0,0 +1,132 @@
+"""
+Versioned snapshots of expensive report payloads.
+
+A snapshot is keyed by report name, parameters and the write versions of
+every table the report reads (``safedrive.core.etag.table_versions``). Any
+committed write to one of those tables changes the key, so the next request
+rebuilds the report and the superseded entry simply ages out. Variants of a
+report (e.g. the JSON response and its download) share one snapshot.
+
+Payloads are JSON-safe dicts kept in Redis, shared by all workers, and in a
+small in-process LRU. Concurrent requests for the same snapshot in one
+process wait for a single build. Without trustworthy table versions (no
+Redis and ``ETAG_LOCAL_VERSIONS`` off) reports are built on every request.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from redis.exceptions import RedisError
+
+from safedrive.core import etag
+from safedrive.core.cache import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+REPORT_SNAPSHOT_TTL = int(os.getenv("REPORT_SNAPSHOT_TTL", "3600"))
+REPORT_SNAPSHOT_MAX_ENTRIES = int(os.getenv("REPORT_SNAPSHOT_MAX_ENTRIES", "256"))
+
+REPORT_SNAPSHOT_KEY_PREFIX = "report:snapshot"
+
+
+class ReportSnapshotStore:
+    """Redis + in-process LRU of report payloads keyed by table versions."""
+
+    def __init__(
+        self, ttl: int = REPORT_SNAPSHOT_TTL, max_entries: int = REPORT_SNAPSHOT_MAX_ENTRIES
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[dict, float]]" = OrderedDict()
+        self._build_locks: Dict[str, threading.Lock] = {}
+
+    @staticmethod
+    def _key(name: str, params: Dict[str, Any], version: str) -> str:
+        digest = hashlib.sha256(
+            json.dumps(
+                {"params": params, "version": version}, sort_keys=True, default=str
+            ).encode("utf-8")
+        ).hexdigest()
+        return f"{REPORT_SNAPSHOT_KEY_PREFIX}:{name}:{digest}"
+
+    def _get_local(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            payload, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def _set_local(self, key: str, payload: dict) -> None:
+        with self._lock:
+            self._entries[key] = (payload, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _get_redis(self, key: str) -> Optional[dict]:
+        client = get_redis_client()
+        if client is None:
+            return None
+        try:
+            value = client.get(key)
+            return json.loads(value) if value else None
+        except (RedisError, ValueError, Exception) as e:
+            logger.warning(f"Report snapshot read failed for {key}: {e}")
+            return None
+
+    def _set_redis(self, key: str, payload: dict) -> None:
+        client = get_redis_client()
+        if client is None:
+            return
+        try:
+            client.setex(key, self.ttl, json.dumps(payload))
+        except (RedisError, TypeError, Exception) as e:
+            logger.warning(f"Report snapshot write failed for {key}: {e}")
+
+    def get_or_build(
+        self,
+        name: str,
+        params: Dict[str, Any],
+        tables: Iterable[str],
+        build: Callable[[], dict],
+    ) -> dict:
+        """Return the snapshot of ``name`` for ``params``, building it if stale."""
+        versions = etag.table_versions.snapshot(tables)
+        if versions is None:
+            return build()
+        key = self._key(name, params, versions[0])
+
+        payload = self._get_local(key)
+        if payload is not None:
+            return payload
+        with self._lock:
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+        with build_lock:
+            payload = self._get_local(key)
+            if payload is None:
+                payload = self._get_redis(key)
+                if payload is None:
+                    payload = build()
+                    self._set_redis(key, payload)
+                self._set_local(key, payload)
+        with self._lock:
+            self._build_locks.pop(key, None)
+        return payload
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+report_snapshots = ReportSnapshotStore()
@@ -1,22 +1,32 @@
 from __future__ import annotations
 
 import hashlib
+import logging
+import os
+import threading
+import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Set
+from typing import Optional, Set, Tuple
 from uuid import UUID
 
 from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import false
+from sqlalchemy import Select, false, select
+from redis.exceptions import RedisError
 from sqlalchemy.orm import Session
 
+from safedrive.core.auth_cache import AuthContextCache, register_auth_cache
+from safedrive.core.cache import get_redis_client
 from safedrive.database.db import get_db
+from safedrive.database.events import on_tables_committed
 from safedrive.models.auth import ApiClient
 from safedrive.models.admin_setting import AdminSetting
 from safedrive.models.fleet import OldDriverFleetAssignment
 from safedrive.models.insurance_partner import InsurancePartnerDriver
-from safedrive.models.driver_profile import DriverProfile
+
+
+logger = logging.getLogger(__name__)
 
 
 class Role(str, Enum):
@@ -62,6 +72,15 @@ DEFAULT_DATASET_ACCESS = {
 }
 
 
+DATASET_ACCESS_VERSION_KEY = "dataset_access:version"
+# Upper bound on how stale another worker's dataset-access map can be.
+DATASET_ACCESS_RECHECK_SECONDS = float(os.getenv("DATASET_ACCESS_RECHECK_SECONDS", "2"))
+
+# Driver scopes larger than this are filtered with a subquery on the
+# assignment table instead of an inline list of bound driver ids.
+DRIVER_SCOPE_INLINE_LIMIT = int(os.getenv("DRIVER_SCOPE_INLINE_LIMIT", "500"))
+
+
 def hash_api_key(value: str) -> str:
     return hashlib.sha256(value.encode("utf-8")).hexdigest()
 
@@ -105,21 +124,69 @@ def _load_allowed_driver_ids(
     return None
 
 
-def get_current_client(
-    api_key: str = Header(..., alias="X-API-Key"),
-    db: Session = Depends(get_db),
-) -> ApiClientContext:
-    key_hash = hash_api_key(api_key)
+def _context_to_cache(context: ApiClientContext) -> dict:
+    return {
+        "id": str(context.id),
+        "name": context.name,
+        "role": context.role.value,
+        "driver_profile_id": _uuid_str(context.driver_profile_id),
+        "fleet_id": _uuid_str(context.fleet_id),
+        "insurance_partner_id": _uuid_str(context.insurance_partner_id),
+        "allowed_driver_ids": (
+            None
+            if context.allowed_driver_ids is None
+            else sorted(str(value) for value in context.allowed_driver_ids)
+        ),
+    }
+
+
+def _context_from_cache(payload: dict) -> ApiClientContext:
+    allowed = payload.get("allowed_driver_ids")
+    return ApiClientContext(
+        id=UUID(payload["id"]),
+        name=payload["name"],
+        role=Role(payload["role"]),
+        driver_profile_id=_uuid_or_none(payload.get("driver_profile_id")),
+        fleet_id=_uuid_or_none(payload.get("fleet_id")),
+        insurance_partner_id=_uuid_or_none(payload.get("insurance_partner_id")),
+        allowed_driver_ids=(
+            None if allowed is None else frozenset(UUID(value) for value in allowed)
+        ),
+    )
+
+
+def _context_load_cost(context: ApiClientContext) -> Tuple[int, int]:
+    """``(queries, rows)`` spent loading ``context`` from the database."""
+    if context.role in {Role.FLEET_MANAGER, Role.INSURANCE_PARTNER}:
+        return 2, 1 + len(context.allowed_driver_ids or ())
+    return 1, 1
+
+
+def _uuid_str(value: Optional[UUID]) -> Optional[str]:
+    return str(value) if value is not None else None
+
+
+def _uuid_or_none(value: Optional[str]) -> Optional[UUID]:
+    return UUID(value) if value else None
+
+
+auth_context_cache = register_auth_cache(
+    AuthContextCache(
+        serialize=_context_to_cache,
+        deserialize=_context_from_cache,
+        cost=_context_load_cost,
+    )
+)
+
+
+def _load_api_client_context(db: Session, key_hash: str) -> Optional[ApiClientContext]:
     client = (
         db.query(ApiClient)
         .filter(ApiClient.api_key_hash == key_hash, ApiClient.active.is_(True))
         .first()
     )
     if not client:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or inactive API key.",
-        )
+        return None
     try:
         role = Role(client.role)
     except ValueError as exc:
@@ -127,7 +194,11 @@ def get_current_client(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Unsupported role for this API key.",
         ) from exc
+    # Contexts are shared between requests through the cache, so the driver
+    # scope is frozen.
     allowed_driver_ids = _load_allowed_driver_ids(db, role, client)
+    if allowed_driver_ids is not None:
+        allowed_driver_ids = frozenset(allowed_driver_ids)
     return ApiClientContext(
         id=client.id,
         name=client.name,
@@ -139,6 +210,30 @@ def get_current_client(
     )
 
 
+def resolve_api_key(db: Session, api_key: str) -> Optional[ApiClientContext]:
+    """Resolve an API key to its context, or None if unknown or inactive."""
+    key_hash = hash_api_key(api_key)
+    return auth_context_cache.get_or_load(
+        key_hash, lambda: _load_api_client_context(db, key_hash)
+    )
+
+
+def get_current_client(
+    api_key: Optional[str] = Header(None, alias="X-API-Key"),
+    db: Session = Depends(get_db),
+) -> ApiClientContext:
+    # A missing header is rejected here rather than as a validation error:
+    # FastAPI defers those until every dependency has run, which would let
+    # later dependencies (e.g. ``conditional_get``) answer anonymous requests.
+    context = resolve_api_key(db, api_key) if api_key else None
+    if not context:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or inactive API key.",
+        )
+    return context
+
+
 def require_roles(*roles: Role):
     def _dependency(
         client: ApiClientContext = Depends(get_current_client),
@@ -153,7 +248,7 @@ def require_roles(*roles: Role):
     return _dependency
 
 
-def _dataset_access_config(db: Session) -> dict:
+def _load_dataset_access_config(db: Session) -> dict:
     setting = (
         db.query(AdminSetting)
         .filter(AdminSetting.key == DATASET_ACCESS_SETTING_KEY)
@@ -167,6 +262,85 @@ def _dataset_access_config(db: Session) -> dict:
     return setting.value
 
 
+class DatasetAccessConfigCache:
+    """
+    Process-local copy of the dataset-access map with a version number.
+
+    The version lives in Redis and is bumped whenever ``admin_setting`` is
+    written. Workers re-read the version at most every
+    ``DATASET_ACCESS_RECHECK_SECONDS`` and reload the map only when it has
+    changed. Without Redis the map is simply reloaded on that interval.
+    """
+
+    def __init__(self, recheck_seconds: float = DATASET_ACCESS_RECHECK_SECONDS) -> None:
+        self.recheck_seconds = recheck_seconds
+        self._lock = threading.Lock()
+        self._config: Optional[dict] = None
+        self._version: Optional[str] = None
+        self._next_check = 0.0
+        # Bumped on invalidation so a load racing with a write is not kept.
+        self._epoch = 0
+
+    @staticmethod
+    def _redis_version() -> Optional[str]:
+        client = get_redis_client()
+        if client is None:
+            return None
+        try:
+            return client.get(DATASET_ACCESS_VERSION_KEY) or "0"
+        except (RedisError, Exception) as e:
+            logger.warning(f"Dataset access version read failed: {e}")
+            return None
+
+    def get(self, db: Session) -> dict:
+        now = time.monotonic()
+        config = self._config
+        if config is not None and now < self._next_check:
+            return config
+
+        version = self._redis_version()
+        if config is not None and version is not None and version == self._version:
+            self._next_check = now + self.recheck_seconds
+            return config
+
+        epoch = self._epoch
+        config = _load_dataset_access_config(db)
+        with self._lock:
+            if epoch == self._epoch:
+                self._config = config
+                self._version = version
+                self._next_check = now + self.recheck_seconds
+        return config
+
+    def invalidate(self, bump_version: bool = True) -> None:
+        with self._lock:
+            self._config = None
+            self._version = None
+            self._epoch += 1
+        if not bump_version:
+            return
+        client = get_redis_client()
+        if client is None:
+            return
+        try:
+            client.incr(DATASET_ACCESS_VERSION_KEY)
+        except (RedisError, Exception) as e:
+            logger.warning(f"Dataset access version bump failed: {e}")
+
+
+dataset_access_cache = DatasetAccessConfigCache()
+
+
+@on_tables_committed
+def _bump_dataset_access_version(tables) -> None:
+    if AdminSetting.__tablename__ in tables:
+        dataset_access_cache.invalidate()
+
+
+def _dataset_access_config(db: Session) -> dict:
+    return dataset_access_cache.get(db)
+
+
 def ensure_dataset_access(
     db: Session,
     client: ApiClientContext,
@@ -195,11 +369,33 @@ def ensure_driver_access(client: ApiClientContext, driver_id: UUID) -> None:
         )
 
 
+def driver_scope_subquery(client: ApiClientContext) -> Optional[Select]:
+    """
+    Select the driver ids in the client's fleet or partner scope straight
+    from the assignment table, or None if the scope is not table-backed.
+    """
+    if client.role == Role.FLEET_MANAGER and client.fleet_id:
+        return select(OldDriverFleetAssignment.driverProfileId).where(
+            OldDriverFleetAssignment.fleet_id == client.fleet_id
+        )
+    if client.role == Role.INSURANCE_PARTNER and client.insurance_partner_id:
+        return select(InsurancePartnerDriver.driverProfileId).where(
+            InsurancePartnerDriver.partner_id == client.insurance_partner_id
+        )
+    return None
+
+
 def filter_query_by_driver_ids(query, driver_column, client: ApiClientContext):
     if client.role in {Role.ADMIN, Role.RESEARCHER}:
         return query
     if not client.allowed_driver_ids:
         return query.filter(false())
+    if len(client.allowed_driver_ids) > DRIVER_SCOPE_INLINE_LIMIT:
+        # A semi-join against the assignment index instead of thousands of
+        # bound parameters per statement.
+        scope = driver_scope_subquery(client)
+        if scope is not None:
+            return query.filter(driver_column.in_(scope))
     return query.filter(driver_column.in_(client.allowed_driver_ids))
 
 
@@ -218,59 +414,27 @@ def get_current_client_or_driver(
     """
     # Try API Key first
     if api_key:
-        key_hash = hash_api_key(api_key)
-        client = (
-            db.query(ApiClient)
-            .filter(ApiClient.api_key_hash == key_hash, ApiClient.active.is_(True))
-            .first()
-        )
-        if client:
-            try:
-                role = Role(client.role)
-            except ValueError as exc:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="Unsupported role for this API key.",
-                ) from exc
-            allowed_driver_ids = _load_allowed_driver_ids(db, role, client)
-            return ApiClientContext(
-                id=client.id,
-                name=client.name,
-                role=role,
-                driver_profile_id=client.driverProfileId,
-                fleet_id=client.fleet_id,
-                insurance_partner_id=client.insurance_partner_id,
-                allowed_driver_ids=allowed_driver_ids,
-            )
-    
+        context = resolve_api_key(db, api_key)
+        if context:
+            return context
+
     # Try JWT token
     if credentials and credentials.credentials:
-        from safedrive.core.jwt_auth import decode_token
+        from safedrive.core.jwt_auth import decode_driver_token
         
         try:
-            payload = decode_token(credentials.credentials)
-            driver_id = UUID(payload.get("sub"))
-            
-            # Get driver profile from database
-            driver = db.query(DriverProfile).filter(
-                DriverProfile.driverProfileId == driver_id
-            ).first()
-            
-            if not driver:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Driver not found.",
-                )
-            
-            # Return ApiClientContext for driver
+            # The token carries everything the context needs and revocation
+            # is checked against the denylist, so no profile lookup is made.
+            payload = decode_driver_token(credentials.credentials)
+            driver_id = UUID(payload["sub"])
             return ApiClientContext(
                 id=driver_id,  # Use driver ID as client ID
-                name=driver.email,
+                name=payload.get("email") or str(driver_id),
                 role=Role.DRIVER,
                 driver_profile_id=driver_id,
                 fleet_id=None,
                 insurance_partner_id=None,
-                allowed_driver_ids={driver_id},
+                allowed_driver_ids=frozenset({driver_id}),
             )
         except HTTPException:
             raise
@@ -0,0 +1,284 @@
+"""
+Speeding episode detection at ingest.
+
+Alert feeds used to find speed violations by scanning every location joined
+through ``raw_sensor_data`` with no time bound. Episodes are now detected
+once, when sensor rows link locations to a trip (locations carry no trip or
+driver of their own), and stored in ``speeding_event``, indexed by
+``(driverProfileId, timestamp)``.
+
+An episode is a run of consecutive over-limit locations of a trip, ordered
+by timestamp; it ends at the first location within the limit. Detection is
+incremental: only the tail of the trip from the earliest affected episode
+onwards is re-read, and changed episodes there are replaced, so late or
+repeated uploads converge on the same result.
+
+The same pass keeps each driver's lifetime location and speeding totals in
+``driver_speed_stats`` (the driver monitor's speed compliance ratio): the
+locations an upload links to a trip for the first time are added with
+``UPDATE ... SET location_count = location_count + :n``. A driver's row is
+created from the trip metrics on first read (``driver_speed_totals``);
+``scripts/backfill_speeding_events.py`` recomputes all rows, e.g. after
+sensor rows or trips were deleted.
+"""
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import case, delete, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from safedrive.core.driver_reports import DriverMetrics, driver_metrics, speeding_condition
+from safedrive.models.driver_speed_stats import DriverSpeedStats
+from safedrive.models.location import Location
+from safedrive.models.raw_sensor_data import RawSensorData
+from safedrive.models.speeding_event import SpeedingEvent
+from safedrive.models.trip import Trip
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Episode:
+    timestamp: int
+    end_timestamp: int
+    point_count: int
+    max_speed: float
+    speed_limit: float
+    max_overspeed: float
+
+
+def _episodes(points: Iterable[Tuple[int, float, float, bool]]) -> List[_Episode]:
+    """Merge runs of over-limit ``(timestamp, speed, limit, speeding)`` points."""
+    episodes: List[_Episode] = []
+    current: Optional[_Episode] = None
+    for timestamp, speed, limit, speeding in points:
+        if not speeding:
+            current = None
+            continue
+        overspeed = speed - limit
+        if current is None:
+            current = _Episode(timestamp, timestamp, 1, speed, limit, overspeed)
+            episodes.append(current)
+            continue
+        current.end_timestamp = timestamp
+        current.point_count += 1
+        if overspeed > current.max_overspeed:
+            current.max_speed, current.speed_limit = speed, limit
+            current.max_overspeed = overspeed
+    return episodes
+
+
+def _episode_key(episode) -> tuple:
+    # Rounded: a single-precision FLOAT column does not round-trip doubles.
+    return (
+        int(episode.timestamp),
+        int(episode.end_timestamp),
+        int(episode.point_count),
+        round(float(episode.max_overspeed), 2),
+    )
+
+
+def detect_trip_speeding(
+    db: Session, trip_id: UUID, driver_id: UUID, since: int
+) -> List[SpeedingEvent]:
+    """
+    Re-detect the episodes of ``trip_id`` affected by locations at or after
+    ``since`` (epoch ms) and return the new or changed ones. The caller
+    commits.
+    """
+    # New points can extend the episode in progress at ``since``; restart
+    # from its first point so it is rebuilt whole.
+    anchor = db.execute(
+        select(func.max(SpeedingEvent.timestamp)).where(
+            SpeedingEvent.trip_id == trip_id, SpeedingEvent.timestamp <= since
+        )
+    ).scalar()
+    resume_from = since if anchor is None else min(since, anchor)
+
+    pairs = (
+        select(RawSensorData.location_id)
+        .where(RawSensorData.trip_id == trip_id, RawSensorData.location_id.isnot(None))
+        .distinct()
+        .subquery()
+    )
+    points = db.execute(
+        select(
+            Location.timestamp,
+            Location.speed,
+            Location.speedLimit,
+            speeding_condition(),
+        )
+        .join(pairs, pairs.c.location_id == Location.id)
+        .where(Location.timestamp >= resume_from)
+        .order_by(Location.timestamp, Location.id)
+    )
+    episodes = _episodes(
+        (int(ts), float(speed), float(limit), bool(speeding))
+        for ts, speed, limit, speeding in points
+    )
+
+    # Keep unchanged episodes so re-detection does not churn rows (or
+    # re-announce them to alert subscribers).
+    existing = {
+        _episode_key(event): event
+        for event in db.query(SpeedingEvent).filter(
+            SpeedingEvent.trip_id == trip_id, SpeedingEvent.timestamp >= resume_from
+        )
+    }
+    events = []
+    for episode in episodes:
+        if existing.pop(_episode_key(episode), None) is not None:
+            continue
+        events.append(
+            SpeedingEvent(
+                driverProfileId=driver_id,
+                trip_id=trip_id,
+                timestamp=episode.timestamp,
+                end_timestamp=episode.end_timestamp,
+                point_count=episode.point_count,
+                max_speed=episode.max_speed,
+                speed_limit=episode.speed_limit,
+                max_overspeed=episode.max_overspeed,
+            )
+        )
+    if existing:
+        db.execute(
+            delete(SpeedingEvent).where(
+                SpeedingEvent.id.in_([event.id for event in existing.values()])
+            )
+        )
+    db.add_all(events)
+    return events
+
+
+def driver_speed_totals(db: Session, driver_id: UUID) -> Tuple[int, int]:
+    """
+    ``(location_count, speeding_count)`` of ``driver_id`` from its
+    ``driver_speed_stats`` row, creating the row from the trip metrics on
+    first use (and committing it).
+    """
+    row = db.get(DriverSpeedStats, driver_id)
+    if row is None:
+        metrics = driver_metrics(db, [Trip.driverProfileId == driver_id]).get(
+            driver_id, DriverMetrics()
+        )
+        row = DriverSpeedStats(
+            driverProfileId=driver_id,
+            location_count=metrics.location_count,
+            speeding_count=metrics.speeding_events,
+        )
+        db.add(row)
+        try:
+            db.commit()
+        except IntegrityError:
+            # Created by a concurrent first read.
+            db.rollback()
+            row = db.get(DriverSpeedStats, driver_id)
+    return int(row.location_count), int(row.speeding_count)
+
+
+def _first_linked_locations(
+    db: Session, pairs: "Counter[Tuple[UUID, UUID]]"
+) -> Dict[UUID, Set[UUID]]:
+    """
+    Per trip, the locations no sensor row outside ``pairs`` (committed
+    ``(trip_id, location_id)`` pairs with their row counts) links to it.
+    """
+    stored = db.execute(
+        select(RawSensorData.trip_id, RawSensorData.location_id, func.count(RawSensorData.id))
+        .where(
+            RawSensorData.trip_id.in_({trip_id for trip_id, _ in pairs}),
+            RawSensorData.location_id.in_({location_id for _, location_id in pairs}),
+        )
+        .group_by(RawSensorData.trip_id, RawSensorData.location_id)
+    )
+    first: Dict[UUID, Set[UUID]] = {}
+    for trip_id, location_id, count in stored:
+        if pairs.get((trip_id, location_id)) == count:
+            first.setdefault(trip_id, set()).add(location_id)
+    return first
+
+
+def _add_driver_speed_totals(
+    db: Session, drivers: Dict[UUID, UUID], first_linked: Dict[UUID, Set[UUID]]
+) -> None:
+    totals: Dict[UUID, Tuple[int, int]] = {}
+    for trip_id, location_ids in first_linked.items():
+        driver_id = drivers.get(trip_id)
+        if driver_id is None:
+            continue
+        locations, speeding = db.execute(
+            select(
+                func.count(Location.id),
+                func.coalesce(func.sum(case((speeding_condition(), 1), else_=0)), 0),
+            ).where(Location.id.in_(location_ids))
+        ).one()
+        previous = totals.get(driver_id, (0, 0))
+        totals[driver_id] = (previous[0] + int(locations), previous[1] + int(speeding))
+
+    for driver_id, (locations, speeding) in totals.items():
+        # A driver without a row yet gets one, these locations included,
+        # from the trip metrics on first read.
+        db.execute(
+            update(DriverSpeedStats)
+            .where(DriverSpeedStats.driverProfileId == driver_id)
+            .values(
+                location_count=DriverSpeedStats.location_count + locations,
+                speeding_count=DriverSpeedStats.speeding_count + speeding,
+                updated_at=datetime.utcnow(),
+            )
+        )
+
+
+def record_speeding_events(db: Session, rows: Iterable[RawSensorData]) -> int:
+    """
+    Detect episodes for the trips newly linked to locations by ``rows``, and
+    add locations linked for the first time to their drivers' totals.
+
+    Runs in its own session so committing the episodes does not expire the
+    caller's freshly loaded rows.
+    """
+    pairs: "Counter[Tuple[UUID, UUID]]" = Counter()
+    locations_by_trip: Dict[UUID, set] = {}
+    for row in rows:
+        if row.trip_id is not None and row.location_id is not None:
+            pairs[(row.trip_id, row.location_id)] += 1
+            locations_by_trip.setdefault(row.trip_id, set()).add(row.location_id)
+    if not locations_by_trip:
+        return 0
+
+    detected = 0
+    with Session(bind=db.get_bind()) as session:
+        try:
+            drivers = dict(
+                session.execute(
+                    select(Trip.id, Trip.driverProfileId).where(
+                        Trip.id.in_(locations_by_trip)
+                    )
+                ).all()
+            )
+            for trip_id, location_ids in locations_by_trip.items():
+                driver_id = drivers.get(trip_id)
+                if driver_id is None:
+                    continue
+                since = session.execute(
+                    select(func.min(Location.timestamp)).where(Location.id.in_(location_ids))
+                ).scalar()
+                if since is None:
+                    continue
+                detected += len(detect_trip_speeding(session, trip_id, driver_id, since))
+            _add_driver_speed_totals(session, drivers, _first_linked_locations(session, pairs))
+            session.commit()
+        except Exception:
+            # The sensor rows are already committed; a failed detection must
+            # not fail their upload. scripts/backfill_speeding_events.py
+            # catches up.
+            session.rollback()
+            logger.exception("Speeding event detection failed")
+            return 0
+    return detected
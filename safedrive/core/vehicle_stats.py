@@ -0,0 +1,279 @@
+"""
+The ``vehicle_day_stats`` rollup behind ``/vehicles/{id}/stats``.
+
+Vehicle statistics used to load every trip id of the vehicle and run six
+queries over them on each request. Usage is now rolled up per vehicle, UTC
+day and driver as trips, sensor rows and unsafe behaviours are written, and
+a period is answered with one range query over the rollup.
+
+A bucket is rebuilt whole from its trips, with the grouped ``trip_metrics``
+queries. Rebuilds are idempotent and touch a single vehicle-day, so repeated
+or late uploads converge on the same rows. Trips without a vehicle are not
+rolled up. ``scripts/rebuild_vehicle_day_stats.py`` rebuilds everything,
+e.g. after trips are assigned to vehicles in bulk.
+
+Writes do not rebuild inline: a rebuild reads the whole day, and a trip
+uploads many sensor batches. A write marks its vehicle-days in
+``vehicle_day_dirty``; a background thread rebuilds each marked day once it
+has been marked for ``VEHICLE_STATS_DEBOUNCE_SECONDS``, so a burst of
+uploads to one day costs one rebuild. Every write bumps the queue row's
+``version``, even when the day is already queued. The rebuild locks the row
+(``SELECT ... FOR UPDATE``), so workers never rebuild one day concurrently,
+and deletes it only if ``version`` is still the one it read: a write
+committed during a rebuild leaves the day queued for another pass.
+``VEHICLE_STATS_DEBOUNCE_SECONDS=0`` rebuilds inline after each write.
+"""
+import logging
+import os
+import threading
+import time as clock
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from safedrive.core.driver_reports import trip_metrics
+from safedrive.models.trip import Trip
+from safedrive.models.vehicle_day_stats import VehicleDayDirty, VehicleDayStats
+
+logger = logging.getLogger(__name__)
+
+VEHICLE_STATS_DEBOUNCE_SECONDS = int(os.getenv("VEHICLE_STATS_DEBOUNCE_SECONDS", "30"))
+# Vehicle-days rebuilt per pass of the background thread.
+VEHICLE_STATS_REBUILD_BATCH = int(os.getenv("VEHICLE_STATS_REBUILD_BATCH", "200"))
+
+VehicleDay = Tuple[UUID, date]
+
+
+def trip_day(start_time: Optional[int], start_date: Optional[datetime]) -> Optional[date]:
+    """The UTC day a trip is rolled up under."""
+    if start_time is not None:
+        return datetime.utcfromtimestamp(start_time / 1000).date()
+    return start_date.date() if start_date else None
+
+
+def _started_on(day: date):
+    start = datetime.combine(day, time.min)
+    end = start + timedelta(days=1)
+    epoch = datetime(1970, 1, 1)
+    start_ms = int((start - epoch).total_seconds() * 1000)
+    end_ms = int((end - epoch).total_seconds() * 1000)
+    return or_(
+        and_(Trip.start_time >= start_ms, Trip.start_time < end_ms),
+        and_(Trip.start_time.is_(None), Trip.start_date >= start, Trip.start_date < end),
+    )
+
+
+def vehicle_days(db: Session, trip_ids: Iterable[UUID]) -> Set[VehicleDay]:
+    """The buckets ``trip_ids`` currently belong to."""
+    trip_ids = list(trip_ids)
+    if not trip_ids:
+        return set()
+    rows = db.execute(
+        select(Trip.vehicle_id, Trip.start_time, Trip.start_date).where(
+            Trip.id.in_(trip_ids), Trip.vehicle_id.isnot(None)
+        )
+    )
+    days = set()
+    for vehicle_id, start_time, start_date in rows:
+        day = trip_day(start_time, start_date)
+        if day is not None:
+            days.add((vehicle_id, day))
+    return days
+
+
+def rebuild_vehicle_days(db: Session, days: Iterable[VehicleDay]) -> int:
+    """Recompute the buckets of ``days`` from their trips. The caller commits."""
+    rebuilt = 0
+    for vehicle_id, day in days:
+        trips = db.execute(
+            select(Trip.id, Trip.driverProfileId, Trip.start_time, Trip.end_time).where(
+                Trip.vehicle_id == vehicle_id, _started_on(day)
+            )
+        ).all()
+        metrics = trip_metrics(db, [trip.id for trip in trips])
+
+        buckets: Dict[UUID, VehicleDayStats] = {}
+        for trip_id, driver_id, start_time, end_time in trips:
+            bucket = buckets.get(driver_id)
+            if bucket is None:
+                bucket = buckets[driver_id] = VehicleDayStats(
+                    vehicle_id=vehicle_id,
+                    day=day,
+                    driverProfileId=driver_id,
+                    trip_count=0,
+                    distance_m=0.0,
+                    duration_ms=0,
+                    unsafe_count=0,
+                )
+            bucket.trip_count += 1
+            bucket.distance_m += metrics[trip_id].distance_m
+            bucket.unsafe_count += metrics[trip_id].unsafe_count
+            if start_time is not None and end_time is not None:
+                bucket.duration_ms += end_time - start_time
+
+        db.execute(
+            delete(VehicleDayStats).where(
+                VehicleDayStats.vehicle_id == vehicle_id, VehicleDayStats.day == day
+            )
+        )
+        db.add_all(buckets.values())
+        rebuilt += 1
+    return rebuilt
+
+
+def mark_vehicle_days(db: Session, days: Iterable[VehicleDay]) -> int:
+    """
+    Queue ``days`` for a rebuild, bumping the version of days already
+    queued; their ``marked_at`` is kept so the debounce still ends. Commits.
+    Returns the days newly queued.
+    """
+    marked = 0
+    for vehicle_id, day in set(days):
+        key = and_(VehicleDayDirty.vehicle_id == vehicle_id, VehicleDayDirty.day == day)
+        bump = (
+            update(VehicleDayDirty)
+            .where(key)
+            .values(version=VehicleDayDirty.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        # Waits for a rebuild holding the row's lock; once it commits the
+        # row is gone (or still queued) and the write is never lost.
+        if db.execute(bump).rowcount:
+            db.commit()
+            continue
+        try:
+            db.add(VehicleDayDirty(vehicle_id=vehicle_id, day=day))
+            db.commit()
+            marked += 1
+        except IntegrityError:
+            # Marked by a concurrent write since the update above.
+            db.rollback()
+            db.execute(bump)
+            db.commit()
+    return marked
+
+
+def rebuild_dirty_vehicle_days(
+    db: Session,
+    marked_before: Optional[datetime] = None,
+    limit: Optional[int] = VEHICLE_STATS_REBUILD_BATCH,
+) -> int:
+    """
+    Rebuild up to ``limit`` queued vehicle-days marked before
+    ``marked_before`` (all of them by default), one transaction each.
+    """
+    query = select(VehicleDayDirty.vehicle_id, VehicleDayDirty.day)
+    if marked_before is not None:
+        query = query.where(VehicleDayDirty.marked_at <= marked_before)
+    days = db.execute(query.order_by(VehicleDayDirty.marked_at).limit(limit)).all()
+    db.rollback()
+
+    rebuilt = 0
+    for vehicle_id, day in days:
+        claim = and_(VehicleDayDirty.vehicle_id == vehicle_id, VehicleDayDirty.day == day)
+        try:
+            # Another worker holding this lock rebuilds the day; once it
+            # commits the row is gone and this one skips it.
+            version = db.execute(
+                select(VehicleDayDirty.version).where(claim).with_for_update()
+            ).scalar()
+            if version is not None:
+                rebuild_vehicle_days(db, [(vehicle_id, day)])
+                # A write marked since the read bumped the version; the day
+                # stays queued so its change is rolled up on the next pass.
+                db.execute(
+                    delete(VehicleDayDirty).where(claim, VehicleDayDirty.version == version)
+                )
+                rebuilt += 1
+            db.commit()
+        except Exception:
+            # The day stays queued and is retried on the next pass.
+            db.rollback()
+            logger.exception(f"Vehicle day stats rebuild failed for {vehicle_id} on {day}")
+    return rebuilt
+
+
+def _pending(db: Session) -> bool:
+    return db.execute(select(VehicleDayDirty.day).limit(1)).first() is not None
+
+
+class VehicleDayRefresher:
+    """
+    Rebuilds queued vehicle-days on a background thread, started on demand
+    and stopped once the queue is empty; ``debounce_seconds=0`` rebuilds
+    inline.
+    """
+
+    def __init__(self, debounce_seconds: int = VEHICLE_STATS_DEBOUNCE_SECONDS) -> None:
+        self.debounce_seconds = debounce_seconds
+        self._bind: Optional[Engine] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def schedule(self, bind: Engine) -> None:
+        if self.debounce_seconds <= 0:
+            with Session(bind=bind) as session:
+                rebuild_dirty_vehicle_days(session, limit=None)
+            return
+        with self._lock:
+            self._bind = bind
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="vehicle-day-stats", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            clock.sleep(self.debounce_seconds)
+            with Session(bind=self._bind) as session:
+                try:
+                    cutoff = datetime.utcnow() - timedelta(seconds=self.debounce_seconds)
+                    while rebuild_dirty_vehicle_days(session, marked_before=cutoff):
+                        pass
+                    # Decided under the lock so a day marked meanwhile either
+                    # is seen here or starts a new thread in ``schedule``.
+                    with self._lock:
+                        if not _pending(session):
+                            self._thread = None
+                            return
+                except Exception:
+                    session.rollback()
+                    logger.exception("Vehicle day stats refresh failed")
+
+
+vehicle_day_refresher = VehicleDayRefresher()
+
+
+def refresh_vehicle_day_stats(
+    db: Session, trip_ids: Iterable[UUID], previous_days: Iterable[VehicleDay] = ()
+) -> int:
+    """
+    Queue the buckets of ``trip_ids`` for a rebuild after their trips,
+    sensor rows or unsafe behaviours were committed, plus ``previous_days``
+    the trips were in before an update or delete. Returns the days newly
+    queued.
+
+    Runs in its own session so the caller's loaded rows are not expired.
+    """
+    trip_ids = {trip_id for trip_id in trip_ids if trip_id is not None}
+    previous_days = set(previous_days)
+    if not trip_ids and not previous_days:
+        return 0
+
+    with Session(bind=db.get_bind()) as session:
+        try:
+            marked = mark_vehicle_days(session, vehicle_days(session, trip_ids) | previous_days)
+        except Exception:
+            # The ingested rows are already committed; the rollup catches up
+            # on the next write to the bucket or a rebuild.
+            session.rollback()
+            logger.exception("Vehicle day stats refresh failed")
+            return 0
+    vehicle_day_refresher.schedule(db.get_bind())
+    return marked
@@ -5,6 +5,7 @@ from uuid import UUID
 from typing import List, Optional
 import logging
 
+from safedrive.core.cold_archive import delete_archived_driver
 from safedrive.models.driver_profile import DriverProfile
 from safedrive.schemas.driver_profile import DriverProfileCreate, DriverProfileUpdate
 
@@ -125,7 +126,7 @@ class CRUDDriverProfile:
             db.delete(obj)
             try:
                 db.commit()
-                db.refresh(obj)
+                delete_archived_driver(db, id)
                 logger.info(f"Deleted DriverProfile with ID: {id}")
             except Exception as e:
                 db.rollback()
@@ -142,6 +143,7 @@ class CRUDDriverProfile:
 
         db.delete(profile)
         db.commit()
+        delete_archived_driver(db, profile.driverProfileId)
         return profile
 
     def batch_delete(self, db: Session, ids: List[UUID]) -> int:
@@ -152,6 +154,8 @@ class CRUDDriverProfile:
                 .delete(synchronize_session=False)
             )
             db.commit()
+            for driver_id in ids:
+                delete_archived_driver(db, driver_id)
             logger.info(f"Batch deleted {deleted} DriverProfile records.")
             return deleted
         except Exception as e:
@@ -5,6 +5,8 @@ from uuid import UUID
 from typing import List, Optional
 import logging
 
+from safedrive.core.speeding import record_speeding_events
+from safedrive.core.vehicle_stats import refresh_vehicle_day_stats
 from safedrive.models.raw_sensor_data import RawSensorData
 from safedrive.schemas.raw_sensor_data import RawSensorDataCreate, RawSensorDataUpdate
 
@@ -62,6 +64,8 @@ class CRUDRawSensorData:
 
         for obj in db_objs:
             db.refresh(obj)
+        record_speeding_events(db, db_objs)
+        refresh_vehicle_day_stats(db, {obj.trip_id for obj in db_objs if obj.location_id})
 
         inserted_count = len(db_objs)
         logger.info(f"Batch inserted {inserted_count} RawSensorData records. Skipped {skipped_count}.")
@@ -84,6 +88,9 @@ class CRUDRawSensorData:
             db.add(db_obj)
             db.commit()
             db.refresh(db_obj)
+            record_speeding_events(db, [db_obj])
+            if db_obj.location_id:
+                refresh_vehicle_day_stats(db, [db_obj.trip_id])
             logger.info(f"Created RawSensorData with ID: {db_obj.id}")
             return db_obj
 
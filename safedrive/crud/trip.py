@@ -5,7 +5,9 @@ from uuid import UUID
 from typing import List, Optional
 import logging
 
+from safedrive.core.vehicle_stats import refresh_vehicle_day_stats, vehicle_days
 from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.raw_sensor_data import RawSensorData
 from safedrive.models.trip import Trip
 from safedrive.schemas.trip import TripCreate, TripUpdate
 
@@ -90,6 +92,7 @@ class CRUDTrip:
         for db_obj in db_objs:
             db.refresh(db_obj)
             logger.debug(f"[batch_create] Refreshed Trip after commit: ID = {db_obj.id_uuid}")
+        refresh_vehicle_day_stats(db, [db_obj.id for db_obj in db_objs])
 
         # 7) Final summary
         logger.info(f"[batch_create] Successfully inserted {len(db_objs)} Trip records. Skipped {skipped_count}.")
@@ -101,8 +104,15 @@ class CRUDTrip:
         All-or-nothing batch delete. 
         """
         try:
+            previous_days = vehicle_days(db, ids)
+            # Partitioned raw_sensor_data has no foreign key (and so no
+            # ON DELETE CASCADE) on MySQL; remove the trips' rows here.
+            db.query(RawSensorData).filter(RawSensorData.trip_id.in_(ids)).delete(
+                synchronize_session=False
+            )
             db.query(self.model).filter(self.model.id.in_(ids)).delete(synchronize_session=False)
             db.commit()
+            refresh_vehicle_day_stats(db, [], previous_days)
             logger.info(f"Batch deleted {len(ids)} Trip records.")
         except Exception as e:
             db.rollback()
@@ -129,6 +139,7 @@ class CRUDTrip:
             db.add(db_obj)
             db.commit()
             db.refresh(db_obj)
+            refresh_vehicle_day_stats(db, [db_obj.id])
             logger.info(f"Created trip with ID: {db_obj.id}")
             return db_obj
         except Exception as e:
@@ -225,13 +236,15 @@ class CRUDTrip:
                         detail="No matching driver profile found for provided driverProfileId."
                     )
 
-            # 5) Update fields on db_obj
+            # 5) Update fields on db_obj, remembering its rollup bucket
+            previous_days = vehicle_days(db, [db_obj.id])
             for field, value in obj_data.items():
                 setattr(db_obj, field, value)
 
             # 6) Commit & refresh
             db.commit()
             db.refresh(db_obj)
+            refresh_vehicle_day_stats(db, [db_obj.id], previous_days)
 
             logger.info(f"Updated trip with ID: {db_obj.id_uuid} (db primary key bytes={db_obj.id}).")
             return db_obj
@@ -262,8 +275,10 @@ class CRUDTrip:
         try:
             obj = db.query(self.model).filter(self.model.id == id).first()
             if obj:
+                previous_days = vehicle_days(db, [obj.id])
                 db.delete(obj)
                 db.commit()
+                refresh_vehicle_day_stats(db, [], previous_days)
                 db.refresh(obj)
                 logger.info(f"Deleted trip with ID: {id}")
                 return obj
@@ -6,6 +6,7 @@ from typing import List, Optional
 from datetime import datetime
 import logging
 
+from safedrive.core.vehicle_stats import refresh_vehicle_day_stats
 from safedrive.models.unsafe_behaviour import UnsafeBehaviour
 from safedrive.schemas.unsafe_behaviour import UnsafeBehaviourCreate, UnsafeBehaviourUpdate
 
@@ -63,6 +64,7 @@ class CRUDUnsafeBehaviour:
 
         for obj in db_objs:
             db.refresh(obj)
+        refresh_vehicle_day_stats(db, {obj.trip_id for obj in db_objs})
 
         inserted_count = len(db_objs)
         logger.info(f"Batch inserted {inserted_count} UnsafeBehaviour records. Skipped {skipped_count} duplicates.")
@@ -73,8 +75,13 @@ class CRUDUnsafeBehaviour:
         All-or-nothing batch delete. 
         """
         try:
+            trip_ids = {
+                trip_id
+                for (trip_id,) in db.query(self.model.trip_id).filter(self.model.id.in_(ids))
+            }
             db.query(self.model).filter(self.model.id.in_(ids)).delete(synchronize_session=False)
             db.commit()
+            refresh_vehicle_day_stats(db, trip_ids)
             logger.info(f"Batch deleted {len(ids)} UnsafeBehaviour records.")
         except Exception as e:
             db.rollback()
@@ -101,6 +108,7 @@ class CRUDUnsafeBehaviour:
             db.add(db_obj)
             db.commit()
             db.refresh(db_obj)
+            refresh_vehicle_day_stats(db, [db_obj.trip_id])
             logger.info(f"Created unsafe behaviour with ID: {db_obj.id}")
             return db_obj
 
@@ -189,6 +197,7 @@ class CRUDUnsafeBehaviour:
         :return: The updated unsafe behaviour.
         """
         try:
+            previous_trip_id = db_obj.trip_id
             obj_data = obj_in.dict(exclude_unset=True)
             for field in obj_data:
                 if field in ['trip_id', 'location_id'] and isinstance(obj_data[field], UUID):
@@ -197,6 +206,7 @@ class CRUDUnsafeBehaviour:
                     setattr(db_obj, field, obj_data[field])
             db.commit()
             db.refresh(db_obj)
+            refresh_vehicle_day_stats(db, {previous_trip_id, db_obj.trip_id})
             logger.info(f"Updated unsafe behaviour with ID: {db_obj.id}")
             return db_obj
         except Exception as e:
@@ -215,8 +225,10 @@ class CRUDUnsafeBehaviour:
         try:
             obj = db.query(self.model).filter(self.model.id == id).first()
             if obj:
+                trip_id = obj.trip_id
                 db.delete(obj)
                 db.commit()
+                refresh_vehicle_day_stats(db, [trip_id])
                 db.refresh(obj)
                 logger.info(f"Deleted unsafe behaviour with ID: {id}")
                 return obj
@@ -0,0 +1,122 @@
+"""
+Async engine and sessions for the hottest read endpoints.
+
+Synchronous endpoints run in Starlette's worker threadpool, so under load
+requests queue for a thread before they queue for a connection. The trip
+and sensor lists, the driver monitor and the alert feed are ``async def``
+instead and take ``get_async_db`` (or ``get_async_read_db``): their
+queries run on an ``AsyncEngine`` and the event loop serves other
+requests while they wait.
+
+The async URL is derived from ``DATABASE_URL`` (``mysql+pymysql`` becomes
+``mysql+aiomysql``, ``sqlite`` becomes ``sqlite+aiosqlite``) unless
+``ASYNC_DATABASE_URL`` is set. Its pool is sized by ``ASYNC_POOL_SIZE`` and
+``ASYNC_MAX_OVERFLOW``.
+
+Sync helpers (dataset access checks, monitor counters) talk to Redis and
+use sync sessions; never call them on the event loop, directly or via
+``AsyncSession.run_sync``. Access checks run in sync dependencies, which
+FastAPI runs in the threadpool; the driver monitor calls its counters
+through ``anyio.to_thread.run_sync``. Such an endpoint therefore also holds
+a ``get_db`` session, though it only checks out a pooled connection when
+the access cache or counters miss. Everything else stays synchronous;
+``THREADPOOL_SIZE`` sets how many of those requests, dependencies and
+helper calls run at once.
+"""
+import os
+from typing import AsyncIterator, Dict
+
+import anyio
+from fastapi import Depends
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from safedrive.database.base import engine
+from safedrive.database.query_log import sql_echo_setting
+from safedrive.database.replicas import READ_LAG_ALLOWANCE_KEY, read_replicas
+
+ASYNC_POOL_SIZE = int(os.getenv("ASYNC_POOL_SIZE", "20"))
+ASYNC_MAX_OVERFLOW = int(os.getenv("ASYNC_MAX_OVERFLOW", "10"))
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "40"))
+
+_ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "mysql+mysqldb": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
+def async_database_url(url: str) -> str:
+    """``url`` with its driver swapped for the async one."""
+    parsed = make_url(url)
+    driver = _ASYNC_DRIVERS.get(parsed.drivername)
+    if driver is None:
+        return url
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def create_async_db_engine(url: str):
+    url = async_database_url(url)
+    options = {"pool_pre_ping": True, "echo": sql_echo_setting()}
+    if not make_url(url).drivername.startswith("sqlite"):
+        options.update(
+            pool_recycle=3600, pool_size=ASYNC_POOL_SIZE, max_overflow=ASYNC_MAX_OVERFLOW
+        )
+    return create_async_engine(url, **options)
+
+
+async_engine = create_async_db_engine(
+    os.getenv("ASYNC_DATABASE_URL") or engine.url.render_as_string(hide_password=False)
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+# Async sessions per replica URL, created on first use.
+_replica_sessions: Dict[str, async_sessionmaker] = {}
+
+
+def _replica_sessionmaker(url) -> async_sessionmaker:
+    key = url.render_as_string(hide_password=False)
+    sessions = _replica_sessions.get(key)
+    if sessions is None:
+        sessions = async_sessionmaker(
+            create_async_db_engine(key), autoflush=False, expire_on_commit=False
+        )
+        _replica_sessions[key] = sessions
+    return sessions
+
+
+def configure_threadpool(size: int = THREADPOOL_SIZE) -> None:
+    """Let up to ``size`` synchronous endpoints and dependencies run at once."""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = size
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Dependency to get an ``AsyncSession``; closed after the response.
+
+    Yields:
+        db (AsyncSession): async SQLAlchemy session.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db(
+    primary: AsyncSession = Depends(get_async_db),
+) -> AsyncIterator[AsyncSession]:
+    """
+    ``get_read_db`` for async endpoints: a session on a read replica within
+    the lag limit, or the primary session. Never write through it.
+    """
+    replica = None
+    if read_replicas.configured:
+        # Lag checks use the sync engines; keep them off the event loop.
+        replica = await anyio.to_thread.run_sync(read_replicas.choose, engine)
+    if replica is None:
+        yield primary
+        return
+    async with _replica_sessionmaker(replica.engine.url)() as db:
+        db.info[READ_LAG_ALLOWANCE_KEY] = read_replicas.lag_allowance
+        yield db
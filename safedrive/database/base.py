@@ -7,6 +7,9 @@ import dotenv
 # Load the .env file
 dotenv.load_dotenv()
 
+# After .env is loaded: the slow query thresholds are read at import.
+from safedrive.database.query_log import sql_echo_setting
+
 # Database URL from environment variables
 DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
@@ -16,7 +19,7 @@ if not DATABASE_URL:
 engine = create_engine(DATABASE_URL, 
                        pool_pre_ping=True,   # ✅ Checks connection before using
                        pool_recycle=3600,
-                       echo=True)
+                       echo=sql_echo_setting())  # SQL_ECHO; slow queries are logged regardless
                        
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -2,8 +2,11 @@
 
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from fastapi import Depends
+
 from safedrive.database.base import SessionLocal
+from safedrive.database.replicas import read_replicas
 
 def get_db():
     """
@@ -18,3 +21,19 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_read_db(primary: Session = Depends(get_db)):
+    """
+    Dependency for read-only endpoints: a session on a read replica within
+    the lag limit, or the primary session when there is none (see
+    ``safedrive.database.replicas``). Never write through it.
+    """
+    db = read_replicas.session(primary.get_bind())
+    if db is None:
+        yield primary
+        return
+    try:
+        yield db
+    finally:
+        db.close()
@@ -0,0 +1,106 @@
+"""
+Commit-time notifications of which tables a session wrote to.
+
+ORM flushes and bulk ``insert``/``update``/``delete`` statements record the
+affected table names on the session; once the transaction commits, every
+registered hook is called with that set. Rolled back work is discarded.
+
+Hooks registered with ``on_inserts_committed`` additionally receive the
+column values of the ORM objects inserted into their table. Only objects
+added to a session are seen; bulk ``insert()`` statements are not.
+
+Writes issued as raw SQL (``db.execute(text(...))``) are not tracked.
+"""
+import logging
+from typing import Callable, Dict, List, Set
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+_PENDING_TABLES_KEY = "pending_write_tables"
+_PENDING_INSERTS_KEY = "pending_inserted_rows"
+
+_commit_hooks: List[Callable[[Set[str]], None]] = []
+_insert_hooks: Dict[str, List[Callable[[List[dict]], None]]] = {}
+
+
+def on_tables_committed(hook: Callable[[Set[str]], None]) -> Callable[[Set[str]], None]:
+    """Register ``hook(tables)`` to run after each commit that wrote to tables."""
+    _commit_hooks.append(hook)
+    return hook
+
+
+def on_inserts_committed(table: str):
+    """Register ``hook(rows)`` to run with the rows committed into ``table``."""
+
+    def register(hook: Callable[[List[dict]], None]) -> Callable[[List[dict]], None]:
+        _insert_hooks.setdefault(table, []).append(hook)
+        return hook
+
+    return register
+
+
+def _pending_tables(session: Session) -> set:
+    return session.info.setdefault(_PENDING_TABLES_KEY, set())
+
+
+def _column_values(obj) -> dict:
+    # Read the loaded state only: attribute access could emit SQL mid-flush.
+    state = inspect(obj)
+    return {attr.key: state.dict.get(attr.key) for attr in state.mapper.column_attrs}
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_tables(session: Session, flush_context) -> None:
+    pending = _pending_tables(session)
+    for collection in (session.new, session.dirty, session.deleted):
+        for obj in collection:
+            table = getattr(obj, "__tablename__", None)
+            if table:
+                pending.add(table)
+    for obj in session.new:
+        table = getattr(obj, "__tablename__", None)
+        if table in _insert_hooks:
+            inserts = session.info.setdefault(_PENDING_INSERTS_KEY, {})
+            inserts.setdefault(table, []).append(_column_values(obj))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_writes(orm_execute_state) -> None:
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None:
+        _pending_tables(orm_execute_state.session).add(mapper.local_table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_committed_tables(session: Session) -> None:
+    inserts = session.info.pop(_PENDING_INSERTS_KEY, None) or {}
+    for table, rows in inserts.items():
+        for hook in _insert_hooks.get(table, ()):
+            try:
+                hook(rows)
+            except Exception as e:
+                logger.warning(f"Insert hook {hook.__name__} failed for {table}: {e}")
+
+    tables = session.info.pop(_PENDING_TABLES_KEY, None)
+    if not tables:
+        return
+    for hook in _commit_hooks:
+        try:
+            hook(tables)
+        except Exception as e:
+            logger.warning(f"Commit hook {hook.__name__} failed for {sorted(tables)}: {e}")
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_tables(session: Session) -> None:
+    session.info.pop(_PENDING_TABLES_KEY, None)
+    session.info.pop(_PENDING_INSERTS_KEY, None)
@@ -0,0 +1,177 @@
+"""
+Slow-query logging and per-request database totals.
+
+The engine used to run with ``echo=True``, logging every statement and its
+parameters. Echo is now off unless ``SQL_ECHO`` is set, and these engine
+hooks time each statement instead:
+
+* Statements taking at least ``SLOW_QUERY_MS`` are logged as warnings with
+  the elapsed time, row count and request id. Literals are redacted and
+  bound parameters are never logged.
+* A ``SLOW_QUERY_SAMPLE_RATE`` fraction of the faster statements is logged
+  at info level, to see the everyday mix without echoing everything.
+* ``QueryStatsMiddleware`` gives each request an id (``X-Request-ID``, taken
+  from the client when sent) and totals its statements and database time.
+  The totals are returned in a ``Server-Timing`` header and logged when they
+  reach ``SLOW_REQUEST_DB_MS``.
+
+The hooks are registered on ``Engine``, so every engine in the process is
+covered.
+"""
+import logging
+import os
+import random
+import re
+import time
+import uuid
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "500"))
+SLOW_QUERY_SAMPLE_RATE = float(os.getenv("SLOW_QUERY_SAMPLE_RATE", "0"))
+SLOW_QUERY_MAX_CHARS = int(os.getenv("SLOW_QUERY_MAX_CHARS", "2000"))
+SLOW_REQUEST_DB_MS = float(os.getenv("SLOW_REQUEST_DB_MS", "1000"))
+
+REQUEST_ID_HEADER = "X-Request-ID"
+_QUERY_START_KEY = "query_log_start"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\((?:\s*(?:\?|%s|:\w+)\s*,){3,}\s*(?:\?|%s|:\w+)\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def sql_echo_setting():
+    """``create_engine(echo=...)`` from ``SQL_ECHO``: off, on or ``debug``."""
+    value = os.getenv("SQL_ECHO", "false").strip().lower()
+    if value == "debug":
+        return "debug"
+    return value in ("1", "true", "yes")
+
+
+@dataclass
+class QueryStats:
+    """Statements run and time spent in the database by one request."""
+
+    request_id: str
+    count: int = 0
+    total_ms: float = 0.0
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+def redact_statement(statement: str, max_chars: int = SLOW_QUERY_MAX_CHARS) -> str:
+    """``statement`` with literals replaced by ``?`` and long placeholder lists folded."""
+    redacted = _STRING_LITERAL.sub("?", statement)
+    redacted = _NUMBER_LITERAL.sub("?", redacted)
+    redacted = _PLACEHOLDER_LIST.sub("(?, ...)", redacted)
+    redacted = _WHITESPACE.sub(" ", redacted).strip()
+    if len(redacted) > max_chars:
+        redacted = redacted[:max_chars] + "..."
+    return redacted
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault(_QUERY_START_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_query(conn, cursor, statement, parameters, context, executemany) -> None:
+    starts = conn.info.get(_QUERY_START_KEY)
+    if not starts:
+        return
+    elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.total_ms += elapsed_ms
+
+    if elapsed_ms >= SLOW_QUERY_MS:
+        log = logger.warning
+        label = "Slow query"
+    elif SLOW_QUERY_SAMPLE_RATE > 0 and random.random() < SLOW_QUERY_SAMPLE_RATE:
+        log = logger.info
+        label = "Sampled query"
+    else:
+        return
+    log(
+        f"{label} {elapsed_ms:.1f} ms rows={cursor.rowcount} "
+        f"request={stats.request_id if stats else '-'}: {redact_statement(statement)}"
+    )
+
+
+@event.listens_for(Engine, "handle_error")
+def _discard_timer(exception_context) -> None:
+    # A failed statement never reaches after_cursor_execute.
+    conn = exception_context.connection
+    if conn is not None:
+        starts = conn.info.get(_QUERY_START_KEY)
+        if starts:
+            starts.pop()
+
+
+def _request_id(scope) -> str:
+    for key, value in scope.get("headers", []):
+        if key == b"x-request-id":
+            candidate = value.decode("latin-1").strip()
+            # Client ids end up in logs; accept only short, plain tokens.
+            if 0 < len(candidate) <= 64 and re.fullmatch(r"[\w.\-]+", candidate):
+                return candidate
+            break
+    return uuid.uuid4().hex
+
+
+class QueryStatsMiddleware:
+    """Assigns request ids and reports each request's database totals."""
+
+    def __init__(self, app, slow_request_ms: float = SLOW_REQUEST_DB_MS):
+        self.app = app
+        self.slow_request_ms = slow_request_ms
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Mutated in place, so statements run in worker threads (which get a
+        # copy of the context) still add to it.
+        stats = QueryStats(request_id=_request_id(scope))
+        token = _current_stats.set(stats)
+
+        async def _send(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-request-id", stats.request_id.encode("latin-1")))
+                headers.append(
+                    (
+                        b"server-timing",
+                        f'db;dur={stats.total_ms:.1f};desc="{stats.count} queries"'.encode(
+                            "latin-1"
+                        ),
+                    )
+                )
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            _current_stats.reset(token)
+            if stats.total_ms >= self.slow_request_ms:
+                logger.warning(
+                    f"Slow request {scope['method']} {scope['path']} request={stats.request_id}: "
+                    f"{stats.count} queries, {stats.total_ms:.1f} ms in the database"
+                )
@@ -0,0 +1,155 @@
+"""
+Read replicas for the read-only analytics, researcher and report routers.
+
+``DATABASE_REPLICA_URLS`` lists replica databases, comma separated. Routers
+that only read take ``get_read_db`` instead of ``get_db``; each request gets
+a session on the next replica in round-robin order, skipping replicas that
+are unreachable or lag the primary by more than ``REPLICA_MAX_LAG_SECONDS``.
+Without a usable replica the request reads from the primary.
+
+Lag is the distance between the newest ``raw_sensor_data.ingested_at`` on
+the primary and on the replica, so it needs no replication privileges and
+works on any backend. While uploads are idle it reads as zero, which is
+harmless: there is nothing to miss. Each replica is re-measured at most
+every ``REPLICA_LAG_CHECK_SECONDS``.
+
+Replica sessions carry the lag they may still have in
+``session.info[READ_LAG_ALLOWANCE_KEY]`` (seconds), so change cursors can
+trail it.
+"""
+import itertools
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
+
+from safedrive.models.raw_sensor_data import RawSensorData
+
+logger = logging.getLogger(__name__)
+
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("REPLICA_MAX_LAG_SECONDS", "30"))
+REPLICA_LAG_CHECK_SECONDS = float(os.getenv("REPLICA_LAG_CHECK_SECONDS", "5"))
+
+READ_LAG_ALLOWANCE_KEY = "read_lag_allowance"
+
+
+def _replica_urls() -> List[str]:
+    return [
+        url.strip()
+        for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",")
+        if url.strip()
+    ]
+
+
+def _watermark(connection):
+    return connection.execute(select(func.max(RawSensorData.ingested_at))).scalar()
+
+
+@dataclass
+class _Replica:
+    engine: Engine
+    sessions: sessionmaker
+    lag: Optional[float] = None
+    checked_at: float = float("-inf")
+
+
+class ReadReplicas:
+    """Round-robin choice among replicas within the lag limit."""
+
+    def __init__(
+        self,
+        urls: Optional[List[str]] = None,
+        max_lag: float = REPLICA_MAX_LAG_SECONDS,
+        check_interval: float = REPLICA_LAG_CHECK_SECONDS,
+    ) -> None:
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._replicas: List[_Replica] = []
+        self._rotation = itertools.count()
+        self.configure(urls or [])
+
+    def configure(self, urls: List[str]) -> None:
+        """Replace the replica set, disposing engines that are no longer used."""
+        with self._lock:
+            previous = self._replicas
+            self._replicas = []
+            for url in urls:
+                engine = create_engine(url, pool_pre_ping=True, pool_recycle=3600)
+                self._replicas.append(
+                    _Replica(
+                        engine=engine,
+                        sessions=sessionmaker(autocommit=False, autoflush=False, bind=engine),
+                    )
+                )
+        for replica in previous:
+            replica.engine.dispose()
+
+    def _measure(self, replica: _Replica, primary: Engine) -> None:
+        try:
+            with primary.connect() as connection:
+                primary_mark = _watermark(connection)
+            with replica.engine.connect() as connection:
+                replica_mark = _watermark(connection)
+        except SQLAlchemyError as e:
+            logger.warning(f"Replica {replica.engine.url!r} unavailable: {e}")
+            replica.lag = None
+            return
+        if primary_mark is None or (replica_mark is not None and replica_mark >= primary_mark):
+            replica.lag = 0.0
+        elif replica_mark is None:
+            replica.lag = float("inf")
+        else:
+            replica.lag = (primary_mark - replica_mark).total_seconds()
+
+    def _usable(self, replica: _Replica, primary: Engine) -> bool:
+        now = time.monotonic()
+        if now - replica.checked_at >= self.check_interval:
+            with self._lock:
+                # One thread re-measures; the others use the last reading.
+                stale = now - replica.checked_at >= self.check_interval
+                if stale:
+                    replica.checked_at = now
+            if stale:
+                self._measure(replica, primary)
+        return replica.lag is not None and replica.lag <= self.max_lag
+
+    @property
+    def configured(self) -> bool:
+        return bool(self._replicas)
+
+    @property
+    def lag_allowance(self) -> float:
+        """Seconds a replica chosen now may trail the primary by."""
+        return self.max_lag + self.check_interval
+
+    def choose(self, primary: Engine) -> Optional[_Replica]:
+        """The next usable replica, or None to use the primary."""
+        replicas = self._replicas
+        if not replicas:
+            return None
+        start = next(self._rotation)
+        for offset in range(len(replicas)):
+            replica = replicas[(start + offset) % len(replicas)]
+            if self._usable(replica, primary):
+                return replica
+        return None
+
+    def session(self, primary: Engine) -> Optional[Session]:
+        """A session on the next usable replica, or None to use the primary."""
+        replica = self.choose(primary)
+        if replica is None:
+            return None
+        db = replica.sessions()
+        db.info[READ_LAG_ALLOWANCE_KEY] = self.lag_allowance
+        return db
+
+
+read_replicas = ReadReplicas(_replica_urls())
@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey
+from sqlalchemy_utils import UUIDType
+
+from safedrive.database.base import Base
+
+
+class DriverSpeedStats(Base):
+    """
+    Lifetime location and speeding totals of a driver, kept at ingest.
+
+    Attributes:
+    - **driverProfileId**: The driver.
+    - **location_count**: Distinct ``(trip, location)`` pairs linked by the
+      driver's sensor rows, as counted by the trip metrics.
+    - **speeding_count**: Those of them over the speed limit.
+    - **updated_at**: When the totals last changed.
+    """
+
+    __tablename__ = "driver_speed_stats"
+
+    driverProfileId = Column(
+        UUIDType(binary=True),
+        ForeignKey("driver_profile.driverProfileId", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    location_count = Column(BigInteger, nullable=False, default=0)
+    speeding_count = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return (
+            f"<DriverSpeedStats(driverProfileId={self.driverProfileId}, "
+            f"location_count={self.location_count}, speeding_count={self.speeding_count})>"
+        )
@@ -0,0 +1,59 @@
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, JSON, String, Text
+from sqlalchemy_utils import UUIDType
+
+from safedrive.database.base import Base
+
+
+class ExportJob(Base):
+    """
+    A background export whose artifact is written to local storage.
+
+    Attributes:
+    - **id**: Unique identifier for the job.
+    - **dataset**: Registered export dataset (e.g. ``researcher_raw_sensor_export``).
+    - **export_format**: ``jsonl`` or ``csv``; artifacts are gzip-compressed.
+    - **params**: Filters the export was requested with.
+    - **params_hash**: Hash of dataset, format, requesting client and params,
+      used to hand identical requests the same job.
+    - **status**: ``pending``, ``running``, ``completed``, ``failed`` or ``expired``.
+    - **row_count** / **byte_size** / **checksum**: Artifact totals and SHA-256.
+    - **expires_at**: When the artifact is deleted.
+    - **lease_id**: Claim held by the runner writing the artifact; a runner
+      stops as soon as the job's lease is no longer its own.
+    """
+
+    __tablename__ = "export_job"
+
+    id = Column(UUIDType(binary=True), primary_key=True, default=uuid4)
+    dataset = Column(String(100), nullable=False)
+    export_format = Column(String(20), nullable=False)
+    params = Column(JSON, nullable=False)
+    params_hash = Column(String(64), nullable=False)
+    api_client_id = Column(UUIDType(binary=True), nullable=True)
+    status = Column(String(20), nullable=False, default="pending")
+    row_count = Column(BigInteger, nullable=False, default=0)
+    byte_size = Column(BigInteger, nullable=False, default=0)
+    checksum = Column(String(64), nullable=True)
+    artifact_path = Column(String(500), nullable=True)
+    error = Column(Text, nullable=True)
+    lease_id = Column(UUIDType(binary=True), nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+    )
+    completed_at = Column(DateTime, nullable=True)
+    expires_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_export_job_params_hash_status", "params_hash", "status"),
+        Index("ix_export_job_expires_at", "expires_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ExportJob(id={self.id}, dataset={self.dataset}, status={self.status})>"
@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import Column, String, Text, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy_utils import UUIDType
 
@@ -46,6 +46,9 @@ class VehicleGroup(Base):
 
 class OldDriverFleetAssignment(Base):
     __tablename__ = "driver_fleet_assignment"
+    __table_args__ = (
+        Index("ix_driver_fleet_assignment_fleet_driver", "fleet_id", "driverProfileId"),
+    )
 
     id = Column(UUIDType(binary=True), primary_key=True, default=uuid4)
     driverProfileId = Column(UUIDType(binary=True), ForeignKey("driver_profile.driverProfileId"), nullable=False)
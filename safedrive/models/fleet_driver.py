@@ -63,9 +63,6 @@ class DriverInvite(Base):
 
     # Indexes for efficient querying (MySQL compatible)
     __table_args__ = (
-        Index("ix_driver_invites_fleet_id", "fleet_id"),
-        Index("ix_driver_invites_email", "email"),
-        Index("ix_driver_invites_status", "status"),
         Index("ix_driver_invites_fleet_email_status", "fleet_id", "email", "status"),
     )
 
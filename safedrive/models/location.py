@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Float, DateTime, Boolean, BINARY, Integer
+from sqlalchemy import BigInteger, Column, Float, DateTime, Boolean, BINARY
 from sqlalchemy.orm import relationship
 from safedrive.database.base import Base
+from safedrive.database.ids import uuid7
 from sqlalchemy_utils import UUIDType
 from uuid import uuid4, UUID
 
@@ -29,10 +30,10 @@ class Location(Base):
 
     __tablename__ = 'location'
 
-    id = Column(UUIDType(binary=True), primary_key=True, default=uuid4)
+    id = Column(UUIDType(binary=True), primary_key=True, default=uuid7)
     latitude = Column(Float, nullable=False)
     longitude = Column(Float, nullable=False)
-    timestamp = Column(Integer, nullable=False)  # Epoch milliseconds
+    timestamp = Column(BigInteger, nullable=False)  # Epoch milliseconds; monthly partition key on MySQL
     date = Column(DateTime, nullable=False)
     altitude = Column(Float, nullable=False)
     speed = Column(Float, nullable=False)
@@ -1,4 +1,6 @@
+from datetime import datetime
 from sqlalchemy import Column, String, DateTime, Boolean, BINARY, ForeignKey
+from sqlalchemy.dialects import mysql
 from uuid import uuid4, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy_utils import UUIDType
@@ -20,6 +22,7 @@ class NLGReport(Base):
     - **report_text**: Text content of the generated report.
     - **generated_at**: Timestamp of report generation.
     - **synced**: Boolean indicating if the report is synced with a remote server.
+    - **ingested_at**: When the row was last written; drives ``since`` export cursors.
     """
     __tablename__ = "nlg_report"
 
@@ -30,6 +33,13 @@ class NLGReport(Base):
     report_text = Column(String(500), nullable=False)
     generated_at = Column(DateTime, nullable=False)
     sync = Column(Boolean, nullable=False, default=False)
+    ingested_at = Column(
+        DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        index=True,
+    )
     
     driver_profile=relationship("DriverProfile", back_populates="nlg_reports")
 
@@ -1,10 +1,13 @@
 from typing import Optional
-from sqlalchemy import JSON, Column, Integer, String, Float, DateTime, ForeignKey, Boolean
+from sqlalchemy import JSON, BigInteger, Column, Integer, String, Float, DateTime, ForeignKey, Boolean
+from sqlalchemy.dialects import mysql
 from sqlalchemy.dialects.mysql import BINARY
 from sqlalchemy.orm import relationship
 from sqlalchemy_utils import UUIDType
 from safedrive.database.base import Base
+from safedrive.database.ids import uuid7
 from uuid import uuid4, UUID
+from datetime import datetime
 import json
 
 def generate_uuid_binary():
@@ -25,20 +28,30 @@ class RawSensorData(Base):
     - **location_id**: Reference to the associated location.
     - **trip_id**: Reference to the associated trip.
     - **sync**: Indicates if the data has been synced.
+    - **ingested_at**: When the row was last written; drives ``since`` export cursors.
     """
 
     __tablename__ = "raw_sensor_data"
 
-    id = Column(UUIDType(binary=True), primary_key=True, default=uuid4)
+    # UUIDv7 when the client sends no id (safedrive.database.ids).
+    id = Column(UUIDType(binary=True), primary_key=True, default=uuid7)
     sensor_type = Column(Integer, nullable=False)
     sensor_type_name = Column(String(255), nullable=False)
     values = Column(JSON, nullable=False)  # Use JSON to store list data
-    timestamp = Column(Integer, nullable=False)
+    # Epoch ms; the monthly partition key on MySQL (safedrive.core.partitions).
+    timestamp = Column(BigInteger, nullable=False)
     date = Column(DateTime)
     accuracy = Column(Integer, nullable=False)
     location_id = Column(UUIDType(binary=True), ForeignKey('location.id'), nullable=True)
     trip_id = Column(UUIDType(binary=True), ForeignKey('trip.id',ondelete="CASCADE"))
     sync = Column(Boolean, nullable=False)
+    ingested_at = Column(
+        DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        index=True,
+    )
 
     # Relationships
     location = relationship("Location", back_populates="raw_sensor_data")
@@ -0,0 +1,54 @@
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import BigInteger, Column, Date, DateTime, Index, String
+from sqlalchemy_utils import UUIDType
+
+from safedrive.database.base import Base
+
+
+class SensorArchive(Base):
+    """
+    One Parquet file of sensor rows moved out of the hot tables.
+
+    Files are written by ``safedrive.core.cold_archive``, one or more per
+    table, month and driver; reads go through this catalog to find the files
+    overlapping a requested range.
+
+    Attributes:
+    - **id**: Unique identifier for the file.
+    - **table_name**: ``raw_sensor_data`` or ``location``.
+    - **month**: First day of the UTC month the rows were recorded in.
+    - **driverProfileId**: Driver the rows belong to; null for rows without
+      one. Not a foreign key: the hot rows are gone, and deleting the driver
+      removes these entries and their files in
+      ``cold_archive.delete_archived_driver``.
+    - **path**: File location relative to ``SENSOR_ARCHIVE_DIR``.
+    - **row_count** / **byte_size**: File totals.
+    - **min_timestamp** / **max_timestamp**: Epoch-ms range of the rows.
+    - **created_at**: When the file was written.
+    """
+
+    __tablename__ = "sensor_archive"
+
+    id = Column(UUIDType(binary=True), primary_key=True, default=uuid4)
+    table_name = Column(String(50), nullable=False)
+    month = Column(Date, nullable=False)
+    driverProfileId = Column(UUIDType(binary=True), nullable=True)
+    path = Column(String(500), nullable=False)
+    row_count = Column(BigInteger, nullable=False, default=0)
+    byte_size = Column(BigInteger, nullable=False, default=0)
+    min_timestamp = Column(BigInteger, nullable=False)
+    max_timestamp = Column(BigInteger, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_sensor_archive_table_driver_month", "table_name", "driverProfileId", "month"),
+        Index("ix_sensor_archive_table_max_timestamp", "table_name", "max_timestamp"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<SensorArchive(table_name={self.table_name}, month={self.month}, "
+            f"driverProfileId={self.driverProfileId}, row_count={self.row_count})>"
+        )
@@ -0,0 +1,49 @@
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import BigInteger, Column, DateTime, Float, ForeignKey, Index, Integer
+from sqlalchemy_utils import UUIDType
+
+from safedrive.database.base import Base
+
+
+class SpeedingEvent(Base):
+    """
+    A speeding episode: consecutive over-limit locations of one trip.
+
+    Attributes:
+    - **id**: Unique identifier for the episode.
+    - **driverProfileId** / **trip_id**: Owner and trip of the locations.
+    - **timestamp**: Epoch milliseconds of the first over-limit location.
+    - **end_timestamp**: Epoch milliseconds of the last over-limit location.
+    - **point_count**: Number of over-limit locations merged into the episode.
+    - **max_speed** / **speed_limit**: Speed and posted limit at the worst point.
+    - **max_overspeed**: Largest ``speed - speedLimit`` within the episode.
+    - **created_at**: When the episode was detected.
+    """
+
+    __tablename__ = "speeding_event"
+
+    id = Column(UUIDType(binary=True), primary_key=True, default=uuid4)
+    driverProfileId = Column(
+        UUIDType(binary=True), ForeignKey("driver_profile.driverProfileId"), nullable=False
+    )
+    trip_id = Column(UUIDType(binary=True), ForeignKey("trip.id"), nullable=False)
+    timestamp = Column(BigInteger, nullable=False)
+    end_timestamp = Column(BigInteger, nullable=False)
+    point_count = Column(Integer, nullable=False, default=1)
+    max_speed = Column(Float, nullable=False)
+    speed_limit = Column(Float, nullable=False)
+    max_overspeed = Column(Float, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_speeding_event_driver_timestamp", "driverProfileId", "timestamp"),
+        Index("ix_speeding_event_trip_timestamp", "trip_id", "timestamp"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<SpeedingEvent(id={self.id}, trip_id={self.trip_id}, "
+            f"timestamp={self.timestamp}, max_overspeed={self.max_overspeed})>"
+        )
@@ -1,8 +1,11 @@
 from sqlalchemy import Column, DateTime, ForeignKey, Integer, Boolean, BINARY, BigInteger, String, Float, Text
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import relationship, object_session
+from datetime import datetime
 from uuid import uuid4, UUID
 from sqlalchemy_utils import UUIDType
 from safedrive.database.base import Base
+from safedrive.database.ids import uuid7
 from safedrive.models.raw_sensor_data import RawSensorData
 
 
@@ -12,7 +15,7 @@ def generate_uuid_binary():
 class Trip(Base):
     __tablename__ = "trip"
 
-    id = Column(UUIDType(binary=True), primary_key=True, default=uuid4)
+    id = Column(UUIDType(binary=True), primary_key=True, default=uuid7)
     driverProfileId = Column(UUIDType(binary=True), ForeignKey('driver_profile.driverProfileId', ondelete="CASCADE"), nullable=False)
     vehicle_id = Column(UUIDType(binary=True), ForeignKey('vehicle.id', ondelete="SET NULL"), nullable=True, index=True)
     start_date = Column(DateTime)
@@ -24,6 +27,13 @@ class Trip(Base):
     sync = Column(Boolean, nullable=False)
     alcohol_probability = Column(Float, nullable=True)
     user_alcohol_response = Column(String(50), nullable=True)
+    ingested_at = Column(
+        DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        index=True,
+    )
 
     # Relationships
     ai_model_inputs = relationship("AIModelInput", back_populates="trip", cascade="all, delete-orphan")
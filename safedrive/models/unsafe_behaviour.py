@@ -1,8 +1,9 @@
 from typing import Optional
-from sqlalchemy import Column, Float, String, DateTime, Boolean, ForeignKey, BINARY, Integer
+from sqlalchemy import Column, Float, String, DateTime, Boolean, ForeignKey, BINARY, Index, Integer
 from sqlalchemy.orm import relationship
 from sqlalchemy_utils import UUIDType
 from safedrive.database.base import Base
+from safedrive.database.ids import uuid7
 from uuid import uuid4, UUID
 
 def generate_uuid_binary():
@@ -31,8 +32,11 @@ class UnsafeBehaviour(Base):
     """
 
     __tablename__ = "unsafe_behaviour"
+    __table_args__ = (
+        Index("ix_unsafe_behaviour_driver_timestamp", "driverProfileId", "timestamp"),
+    )
 
-    id = Column(UUIDType(binary=True), primary_key=True, default=uuid4)
+    id = Column(UUIDType(binary=True), primary_key=True, default=uuid7)
     trip_id = Column(UUIDType(binary=True), ForeignKey('trip.id'), nullable=True)
     driverProfileId = Column(UUIDType(binary=True), ForeignKey('driver_profile.driverProfileId'), nullable=False)
     location_id = Column(UUIDType(binary=True), ForeignKey('location.id'), nullable=True)
@@ -0,0 +1,75 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, Date, DateTime, Float, ForeignKey, Integer
+from sqlalchemy_utils import UUIDType
+
+from safedrive.database.base import Base
+
+
+class VehicleDayStats(Base):
+    """
+    Daily usage of a vehicle by one driver, rolled up at ingest.
+
+    Rows are keyed by driver as well as day so that distinct drivers and the
+    busiest driver of any day range can be read from the rollup; distinct
+    counts stored per day could not be summed across days.
+
+    Attributes:
+    - **vehicle_id** / **day** / **driverProfileId**: The bucket; ``day`` is
+      the UTC date the trips started.
+    - **trip_count**: Trips of the driver in the vehicle that day.
+    - **distance_m**: Distance of their locations, in metres.
+    - **duration_ms**: Summed duration of the finished trips.
+    - **unsafe_count**: Unsafe behaviours recorded on the trips.
+    - **updated_at**: When the bucket was last rebuilt.
+    """
+
+    __tablename__ = "vehicle_day_stats"
+
+    vehicle_id = Column(
+        UUIDType(binary=True), ForeignKey("vehicle.id", ondelete="CASCADE"), primary_key=True
+    )
+    day = Column(Date, primary_key=True)
+    driverProfileId = Column(
+        UUIDType(binary=True),
+        ForeignKey("driver_profile.driverProfileId", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    trip_count = Column(Integer, nullable=False, default=0)
+    distance_m = Column(Float, nullable=False, default=0.0)
+    duration_ms = Column(BigInteger, nullable=False, default=0)
+    unsafe_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return (
+            f"<VehicleDayStats(vehicle_id={self.vehicle_id}, day={self.day}, "
+            f"driverProfileId={self.driverProfileId}, trip_count={self.trip_count})>"
+        )
+
+
+class VehicleDayDirty(Base):
+    """
+    A vehicle-day whose ``vehicle_day_stats`` buckets are out of date.
+
+    Writes insert a row here, or bump its ``version``, instead of rebuilding
+    the buckets themselves; ``safedrive.core.vehicle_stats`` rebuilds each
+    marked day once the debounce window has passed, holding a lock on the
+    row so two workers never rebuild the same day at once, and removes it
+    unless a write bumped the version meanwhile.
+
+    Attributes:
+    - **vehicle_id** / **day**: The vehicle-day to rebuild.
+    - **marked_at**: When the day was first marked since its last rebuild.
+    - **version**: Incremented by every write to the day.
+    """
+
+    __tablename__ = "vehicle_day_dirty"
+
+    vehicle_id = Column(UUIDType(binary=True), primary_key=True)
+    day = Column(Date, primary_key=True)
+    marked_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+    version = Column(Integer, nullable=False, default=1)
+
+    def __repr__(self) -> str:
+        return f"<VehicleDayDirty(vehicle_id={self.vehicle_id}, day={self.day})>"
@@ -28,3 +28,21 @@ class BulkActionResponse(BaseModel):
     removed: int = 0
     skipped: int = 0
     errors: List[str] = Field(default_factory=list)
+
+
+class AuthCacheStats(BaseModel):
+    enabled: bool
+    redis_available: bool
+    ttl_seconds: int
+    entries: int
+    max_entries: int
+    local_hits: int
+    redis_hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    db_queries_saved: int
+    db_rows_saved: int
+    hit_rate: float
+    avg_load_ms: float
+    estimated_db_ms_saved: float
@@ -0,0 +1,30 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, computed_field
+
+
+class ExportJobResponse(BaseModel):
+    id: UUID
+    dataset: str
+    export_format: str
+    status: str
+    params: Dict[str, Any]
+    row_count: int
+    byte_size: int
+    checksum: Optional[str] = None
+    error: Optional[str] = None
+    created_at: datetime
+    completed_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+    @computed_field
+    @property
+    def download_url(self) -> Optional[str]:
+        if self.status != "completed":
+            return None
+        return f"/api/exports/{self.id}/download"
@@ -57,6 +57,8 @@ class InsuranceAlert(BaseModel):
     alert_type: str
     severity: Optional[float]
     timestamp: Optional[int]
+    end_timestamp: Optional[int] = None
+    max_overspeed: Optional[float] = None
     message: str
 
 
@@ -47,7 +47,7 @@ class RawSensorDataCreate(BaseModel):
     """
     Schema for creating a new Raw Sensor Data record.
     """
-    id: UUID=Field(..., description="The identifier for a particular raw_sensor instance")
+    id: Optional[UUID] = Field(None, description="The identifier for a particular raw_sensor instance; a UUIDv7 is generated when omitted.")
     sensor_type: int = Field(..., description="The type of sensor (e.g., accelerometer, gyroscope).")
     sensor_type_name: str = Field(..., description="The name of the sensor type.")
     values: List[float] = Field(..., description="A list of sensor readings.")
@@ -78,7 +78,9 @@ class TripCreate(BaseModel):
     """
     Schema for creating a new Trip record.
     """
-    id: UUID = Field(..., description="The UUID of the trip's profile.")
+    id: Optional[UUID] = Field(
+        None, description="The UUID of the trip; a UUIDv7 is generated when omitted."
+    )
     driverProfileId: UUID = Field(..., description="The UUID of the driver's profile.")
     start_date: Optional[datetime] = Field(
         None,
@@ -41,6 +41,7 @@ class UnsafeBehaviourCreate(BaseModel):
     """
     Schema for creating a new Unsafe Behaviour record.
     """
+    id: Optional[UUID] = Field(None, description="Unique identifier for the unsafe behaviour; a UUIDv7 is generated when omitted.")
     trip_id: UUID = Field(..., description="UUID of the trip associated with this unsafe behaviour.")
     location_id: Optional[UUID] = Field(None, description="UUID of the location associated with this behaviour.")
     driverProfileId: UUID = Field(..., description="UUID of the driving profile associated with this unsafe behaviour.")
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Move raw_sensor_data and location rows older than the hot window to Parquet.
+
+Months before the last SENSOR_ARCHIVE_AFTER_MONTHS are written to zstd
+Parquet files under SENSOR_ARCHIVE_DIR, one per table, month and driver,
+catalogued in sensor_archive and deleted from the hot tables. Researcher
+raw sensor exports and trip sensor reads read through to the files. Run it
+daily after rotate_partitions.py; months already archived only pick up rows
+synced late.
+
+Usage:
+    python scripts/archive_sensor_data.py [--dry-run] [--after-months 6] [--dir /srv/archive]
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from safedrive.core.cold_archive import (
+    SENSOR_ARCHIVE_AFTER_MONTHS,
+    SENSOR_ARCHIVE_DIR,
+    archive_months,
+    archive_sensor_data,
+    hot_window_start,
+    pending_rows,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dry-run", action="store_true", help="list the months only")
+    parser.add_argument(
+        "--after-months",
+        type=int,
+        default=SENSOR_ARCHIVE_AFTER_MONTHS,
+        help="months of sensor data kept hot; 0 disables archiving",
+    )
+    parser.add_argument("--dir", default=SENSOR_ARCHIVE_DIR, help="archive directory")
+    args = parser.parse_args()
+
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        print("ERROR: DATABASE_URL environment variable not set")
+        sys.exit(1)
+    if args.after_months <= 0:
+        print("Archiving is disabled; pass --after-months or set SENSOR_ARCHIVE_AFTER_MONTHS.")
+        return
+    SessionLocal = sessionmaker(autoflush=False, bind=create_engine(database_url))
+
+    with SessionLocal() as db:
+        if args.dry_run:
+            for month in archive_months(db, hot_window_start(after_months=args.after_months)):
+                counts = ", ".join(f"{table} {count}" for table, count in pending_rows(db, month).items())
+                print(f"{month:%Y-%m}: hot rows to archive: {counts}")
+            return
+
+        entries = archive_sensor_data(db, after_months=args.after_months, archive_dir=args.dir)
+        rows = sum(entry.row_count for entry in entries)
+        size = sum(entry.byte_size for entry in entries)
+        print(f"Archived {rows} rows into {len(entries)} files ({size} bytes) under {args.dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Detect speeding episodes for trips ingested before the speeding_event table.
+
+New sensor uploads detect episodes as they arrive; this re-runs detection
+over whole trips and then recomputes every driver's driver_speed_stats
+totals. It is idempotent: a trip's episodes and a driver's totals are
+replaced.
+
+Usage:
+    python scripts/backfill_speeding_events.py [--batch 500]
+"""
+import argparse
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from safedrive.core.driver_reports import driver_metrics
+from safedrive.core.speeding import detect_trip_speeding
+from safedrive.models.driver_speed_stats import DriverSpeedStats
+from safedrive.models.trip import Trip
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--batch", type=int, default=500, help="trips per commit")
+    args = parser.parse_args()
+
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        print("ERROR: DATABASE_URL environment variable not set")
+        sys.exit(1)
+    SessionLocal = sessionmaker(autoflush=False, bind=create_engine(database_url))
+
+    trips = detected = 0
+    last_id = None
+    with SessionLocal() as db:
+        while True:
+            query = select(Trip.id, Trip.driverProfileId).order_by(Trip.id).limit(args.batch)
+            if last_id is not None:
+                query = query.where(Trip.id > last_id)
+            batch = db.execute(query).all()
+            if not batch:
+                break
+            for trip_id, driver_id in batch:
+                detected += len(detect_trip_speeding(db, trip_id, driver_id, since=0))
+            db.commit()
+            trips += len(batch)
+            last_id = batch[-1][0]
+            print(f"{trips} trips, {detected} speeding events")
+
+        totals = driver_metrics(db, [])
+        for driver_id, metrics in totals.items():
+            db.merge(
+                DriverSpeedStats(
+                    driverProfileId=driver_id,
+                    location_count=metrics.location_count,
+                    speeding_count=metrics.speeding_events,
+                    updated_at=datetime.utcnow(),
+                )
+            )
+        db.commit()
+        print(f"{len(totals)} driver speed totals")
+
+
+if __name__ == "__main__":
+    main()
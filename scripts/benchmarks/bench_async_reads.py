@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Tail latency of the trip list under concurrent load, served by the async
+endpoint versus the same query in a synchronous endpoint.
+
+``--clients`` concurrent clients (500 by default) each fetch the trip list
+``--requests`` times in one event loop. The sync baseline is the previous
+``def`` implementation mounted on a benchmark-only route; every call to it
+waits for one of the ``--threads`` worker threads (``THREADPOOL_SIZE``),
+while the async endpoint only holds a thread for the API-key check.
+
+SQLite answers in microseconds from the same process, which hides what
+async buys: overlapping waits on a networked database. ``--db-latency-ms``
+adds that wait back by sleeping in SQLite's statement trace callback, which
+runs on the thread executing the statement (the worker thread for the sync
+path, aiosqlite's connection thread for the async one). Use 0 to measure
+raw SQLite.
+
+Usage:
+    python scripts/benchmarks/bench_async_reads.py [--clients 500] [--requests 4] [--threads 40]
+        [--db-latency-ms 10]
+"""
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta
+from typing import List
+from uuid import uuid4
+
+# Every statement waits on the simulated round trip; don't log them all.
+os.environ.setdefault("SLOW_QUERY_MS", "60000")
+
+import common
+
+import httpx
+from fastapi import Depends
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from safedrive.core.security import (
+    ApiClientContext,
+    Role,
+    filter_query_by_driver_ids,
+    require_roles_or_jwt,
+)
+from safedrive.database.async_db import async_engine, configure_threadpool
+from safedrive.database.base import engine
+from safedrive.database.db import get_db
+from safedrive.main import app
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.trip import Trip
+from safedrive.schemas.trip import TripResponse
+
+SYNC_PATH = "/bench/trips-sync"
+
+
+@app.get(SYNC_PATH)
+def sync_trips(
+    skip: int = 0,
+    limit: int = 5000,
+    db: Session = Depends(get_db),
+    current_client: ApiClientContext = Depends(require_roles_or_jwt(Role.ADMIN, Role.DRIVER)),
+):
+    query = filter_query_by_driver_ids(db.query(Trip), Trip.driverProfileId, current_client)
+    return [TripResponse.model_validate(trip) for trip in query.offset(skip).limit(limit).all()]
+
+
+def _seed(trips: int) -> str:
+    common.reset_database()
+    with common.SessionLocal() as db:
+        driver_id = uuid4()
+        db.add(DriverProfile(driverProfileId=driver_id, email=f"{driver_id}@bench.example", sync=True))
+        started = datetime.utcnow()
+        db.add_all(
+            Trip(
+                id=uuid4(),
+                driverProfileId=driver_id,
+                start_date=started - timedelta(hours=offset),
+                sync=True,
+            )
+            for offset in range(trips)
+        )
+        db.commit()
+        return common.create_api_key(db, "driver", driverProfileId=driver_id)
+
+
+def _add_latency(sync_engine, latency_ms: float) -> None:
+    """Sleep ``latency_ms`` per statement on connections opened from now on."""
+    if latency_ms <= 0:
+        return
+
+    def _round_trip(statement) -> None:
+        time.sleep(latency_ms / 1000.0)
+
+    @event.listens_for(sync_engine, "connect")
+    def _trace(dbapi_connection, connection_record) -> None:
+        if hasattr(dbapi_connection, "run_async"):
+            dbapi_connection.run_async(lambda conn: conn.set_trace_callback(_round_trip))
+        else:
+            dbapi_connection.set_trace_callback(_round_trip)
+
+    sync_engine.dispose()
+
+
+async def _run(path: str, api_key: str, clients: int, requests: int, threads: int) -> List[float]:
+    configure_threadpool(threads)
+    samples: List[float] = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+
+        async def _client() -> None:
+            for _ in range(requests):
+                started = time.perf_counter()
+                response = await http.get(path, headers={"X-API-Key": api_key})
+                samples.append((time.perf_counter() - started) * 1000.0)
+                response.raise_for_status()
+
+        await asyncio.gather(*(_client() for _ in range(clients)))
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=40)
+    parser.add_argument("--trips", type=int, default=20)
+    parser.add_argument("--db-latency-ms", type=float, default=10.0)
+    args = parser.parse_args()
+
+    api_key = _seed(args.trips)
+    # The app's own engines already point at the benchmark database; no
+    # dependency overrides, which FastAPI re-resolves on every request.
+    _add_latency(engine, args.db_latency_ms)
+    _add_latency(async_engine.sync_engine, args.db_latency_ms)
+
+    rows = []
+    for label, path in (("sync def", SYNC_PATH), ("async def", "/api/trips/")):
+        started = time.perf_counter()
+        samples = asyncio.run(_run(path, api_key, args.clients, args.requests, args.threads))
+        elapsed = time.perf_counter() - started
+        rows.append(
+            {
+                "endpoint": label,
+                "requests": len(samples),
+                "req_per_s": len(samples) / elapsed,
+                **common.summarize(samples),
+            }
+        )
+
+    common.print_table(
+        f"{args.clients} concurrent clients x {args.requests} trip list calls "
+        f"({args.trips} trips, {args.threads} worker threads, "
+        f"{args.db_latency_ms:g} ms per statement)",
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Cost of API-key authentication for a scoped key with and without the auth
+context cache.
+
+An insurance partner with ``--drivers`` assigned drivers resolves its key
+``--requests`` times, once through ``resolve_api_key`` directly and once
+through a cheap HTTP endpoint. With the cache disabled every call reloads
+the full driver scope.
+
+Usage:
+    python scripts/benchmarks/bench_auth_cache.py [--drivers 2000] [--requests 500]
+"""
+import argparse
+from uuid import uuid4
+
+import common
+
+from safedrive.core import auth_cache
+from safedrive.core.security import auth_context_cache, resolve_api_key
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.insurance_partner import InsurancePartner, InsurancePartnerDriver
+
+
+def _seed(drivers: int) -> str:
+    common.reset_database()
+    with common.SessionLocal() as db:
+        partner = InsurancePartner(name="Bench Insurer", label="bench-insurer", active=True)
+        db.add(partner)
+        db.flush()
+        driver_ids = [uuid4() for _ in range(drivers)]
+        db.add_all(
+            DriverProfile(driverProfileId=driver_id, email=f"{driver_id}@bench.example", sync=True)
+            for driver_id in driver_ids
+        )
+        db.flush()
+        db.add_all(
+            InsurancePartnerDriver(partner_id=partner.id, driverProfileId=driver_id)
+            for driver_id in driver_ids
+        )
+        db.commit()
+        return common.create_api_key(db, "insurance_partner", insurance_partner_id=partner.id)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--drivers", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    api_key = _seed(args.drivers)
+    client = common.make_client()
+    headers = {"X-API-Key": api_key}
+    rows = []
+    for enabled in (False, True):
+        auth_cache.AUTH_CACHE_ENABLED = enabled
+        auth_context_cache.invalidate_all()
+        auth_context_cache.reset_stats()
+        mode = "cached" if enabled else "uncached"
+
+        with common.SessionLocal() as db:
+            samples = common.measure(lambda: resolve_api_key(db, api_key), args.requests)
+        rows.append({"path": "resolve_api_key", "mode": mode, **common.summarize(samples)})
+
+        samples = common.measure(
+            lambda: client.get("/api/insurance/telematics/trips", headers=headers),
+            args.requests,
+        )
+        rows.append({"path": "GET telematics", "mode": mode, **common.summarize(samples)})
+
+    common.print_table(
+        f"{args.requests} authenticated calls, {args.drivers} drivers in scope", rows
+    )
+    stats = auth_context_cache.stats()
+    print(
+        f"\ncache: hit_rate={stats['hit_rate']}% "
+        f"db_queries_saved={stats['db_queries_saved']:,} "
+        f"db_rows_saved={stats['db_rows_saved']:,} "
+        f"estimated_db_ms_saved={stats['estimated_db_ms_saved']:,}"
+    )
+
+
+if __name__ == "__main__":
+    main()
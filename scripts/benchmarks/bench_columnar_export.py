@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Raw sensor export as JSONL versus Parquet and Arrow IPC.
+
+``--rows`` accelerometer readings are seeded and exported through
+``/api/researcher/raw_sensor_data/export`` in each format. For every format
+the script reports the export time, the response size and how long a
+researcher would wait to load the file into pandas.
+
+Usage:
+    python scripts/benchmarks/bench_columnar_export.py [--rows 1000000]
+"""
+import argparse
+import io
+import random
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import common
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import insert
+
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.raw_sensor_data import RawSensorData
+from safedrive.models.trip import Trip
+
+
+def _seed(rows: int) -> str:
+    common.reset_database()
+    started = datetime(2025, 1, 1)
+    rng = random.Random(7)
+    with common.SessionLocal() as db:
+        driver_id = uuid4()
+        trip_id = uuid4()
+        db.add(DriverProfile(driverProfileId=driver_id, email="bench@example.com", sync=True))
+        db.add(Trip(id=trip_id, driverProfileId=driver_id, start_date=started, sync=True))
+        db.flush()
+        for offset in range(0, rows, 50000):
+            db.execute(
+                insert(RawSensorData),
+                [
+                    {
+                        "id": uuid4(),
+                        "sensor_type": 1,
+                        "sensor_type_name": "accelerometer",
+                        "values": [round(rng.uniform(-20, 20), 4) for _ in range(3)],
+                        "timestamp": n * 20,
+                        "date": started + timedelta(milliseconds=n * 20),
+                        "accuracy": 3,
+                        "trip_id": trip_id,
+                        "sync": True,
+                    }
+                    for n in range(offset, min(offset + 50000, rows))
+                ],
+            )
+        db.commit()
+        return common.create_api_key(db, "researcher")
+
+
+def _load(export_format: str, content: bytes) -> pd.DataFrame:
+    if export_format == "parquet":
+        return pq.read_table(io.BytesIO(content)).to_pandas()
+    if export_format == "arrow":
+        return pa.ipc.open_stream(content).read_all().to_pandas()
+    return pd.read_json(io.BytesIO(content), lines=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1000000)
+    args = parser.parse_args()
+
+    with common.timed("seed"):
+        api_key = _seed(args.rows)
+
+    client = common.make_client()
+    rows = []
+    for export_format in ("jsonl", "parquet", "arrow"):
+        started = time.perf_counter()
+        response = client.get(
+            f"/api/researcher/raw_sensor_data/export?format={export_format}",
+            headers={"X-API-Key": api_key},
+        )
+        export_ms = (time.perf_counter() - started) * 1000.0
+        assert response.status_code == 200, response.text
+
+        started = time.perf_counter()
+        frame = _load(export_format, response.content)
+        load_ms = (time.perf_counter() - started) * 1000.0
+        assert len(frame) == args.rows, "row count mismatch"
+
+        rows.append(
+            {
+                "format": export_format,
+                "export_ms": export_ms,
+                "size_mb": len(response.content) / 1e6,
+                "pandas_load_ms": load_ms,
+            }
+        )
+
+    common.print_table(f"{args.rows:,} raw sensor rows", rows)
+
+
+if __name__ == "__main__":
+    main()
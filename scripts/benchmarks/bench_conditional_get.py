@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Bandwidth and latency of a typical polling pattern with and without
+conditional GET.
+
+A client polls ``/api/driving_tips/`` and ``/api/admin/dataset-access``
+repeatedly while the data changes only occasionally. The "plain" client
+ignores ETags; the "conditional" client replays the last ETag in
+``If-None-Match``.
+
+Usage:
+    python scripts/benchmarks/bench_conditional_get.py [--tips 200] [--polls 300]
+"""
+import argparse
+from datetime import datetime
+from uuid import uuid4
+
+import common
+
+from safedrive.core import etag
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.driving_tip import DrivingTip
+
+
+def _seed(tips: int):
+    common.reset_database()
+    with common.SessionLocal() as db:
+        driver = DriverProfile(driverProfileId=uuid4(), email="bench@example.com", sync=True)
+        db.add(driver)
+        db.flush()
+        db.add_all(
+            DrivingTip(
+                tip_id=uuid4(),
+                title=f"Tip {i}",
+                meaning="Maintain a safe following distance at all times." * 2,
+                summary_tip="Leave a three second gap.",
+                sync=True,
+                date=datetime.utcnow(),
+                profile_id=driver.driverProfileId,
+                llm="bench",
+            )
+            for i in range(tips)
+        )
+        db.commit()
+        return driver.driverProfileId, common.create_api_key(db, "admin")
+
+
+def _poll(client, url, headers, polls, conditional, change_every, driver_id):
+    state = {"etag": None, "bytes": 0, "not_modified": 0, "polls": 0}
+
+    def _request():
+        state["polls"] += 1
+        if change_every and state["polls"] % change_every == 0:
+            with common.SessionLocal() as db:
+                db.add(
+                    DrivingTip(
+                        tip_id=uuid4(),
+                        title="New tip",
+                        sync=True,
+                        date=datetime.utcnow(),
+                        profile_id=driver_id,
+                    )
+                )
+                db.commit()
+        request_headers = dict(headers)
+        if conditional and state["etag"]:
+            request_headers["If-None-Match"] = state["etag"]
+        response = client.get(url, headers=request_headers)
+        state["bytes"] += len(response.content)
+        if response.status_code == 304:
+            state["not_modified"] += 1
+        state["etag"] = response.headers.get("ETag", state["etag"])
+
+    samples = common.measure(_request, polls)
+    return state, common.summarize(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tips", type=int, default=200)
+    parser.add_argument("--polls", type=int, default=300)
+    parser.add_argument("--change-every", type=int, default=50)
+    args = parser.parse_args()
+
+    etag.ETAG_LOCAL_VERSIONS = True
+    client = common.make_client()
+    rows = []
+    for url in ("/api/driving_tips/?limit=200", "/api/admin/dataset-access"):
+        for conditional in (False, True):
+            driver_id, api_key = _seed(args.tips)
+            state, stats = _poll(
+                client,
+                url,
+                {"X-API-Key": api_key},
+                args.polls,
+                conditional,
+                args.change_every,
+                driver_id,
+            )
+            rows.append(
+                {
+                    "endpoint": url.split("?")[0],
+                    "mode": "conditional" if conditional else "plain",
+                    "bytes": state["bytes"],
+                    "304s": state["not_modified"],
+                    **stats,
+                }
+            )
+    common.print_table(
+        f"{args.polls} polls, one write every {args.change_every} polls", rows
+    )
+
+
+if __name__ == "__main__":
+    main()
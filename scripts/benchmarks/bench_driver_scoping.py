@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Inline ``IN (...)`` driver lists versus an assignment-table subquery for
+large fleet scopes.
+
+A fleet of ``--drivers`` drivers (plus as many drivers outside it) with
+``--trips`` trips each is queried through ``filter_query_by_driver_ids``
+using both strategies: a paginated trip list and a scoped count.
+
+Usage:
+    python scripts/benchmarks/bench_driver_scoping.py [--drivers 10000] [--trips 2]
+"""
+import argparse
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import common
+from sqlalchemy import func, insert
+
+from safedrive.core import security
+from safedrive.core.security import filter_query_by_driver_ids, resolve_api_key
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.fleet import Fleet, OldDriverFleetAssignment
+from safedrive.models.trip import Trip
+
+
+def _seed(drivers: int, trips: int) -> str:
+    common.reset_database()
+    now = datetime.utcnow()
+    with common.SessionLocal() as db:
+        fleet = Fleet(name="Bench Fleet", region="Accra")
+        db.add(fleet)
+        db.flush()
+        in_fleet = [uuid4() for _ in range(drivers)]
+        outside = [uuid4() for _ in range(drivers)]
+        db.execute(
+            insert(DriverProfile),
+            [
+                {"driverProfileId": driver_id, "email": f"{driver_id}@bench.example", "sync": True}
+                for driver_id in in_fleet + outside
+            ],
+        )
+        db.execute(
+            insert(OldDriverFleetAssignment),
+            [
+                {"id": uuid4(), "driverProfileId": driver_id, "fleet_id": fleet.id, "assigned_at": now}
+                for driver_id in in_fleet
+            ],
+        )
+        db.execute(
+            insert(Trip),
+            [
+                {
+                    "id": uuid4(),
+                    "driverProfileId": driver_id,
+                    "start_date": now - timedelta(hours=n),
+                    "start_time": int((now - timedelta(hours=n)).timestamp() * 1000),
+                    "sync": True,
+                }
+                for driver_id in in_fleet + outside
+                for n in range(trips)
+            ],
+        )
+        db.commit()
+        return common.create_api_key(db, "fleet_manager", fleet_id=fleet.id)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--drivers", type=int, default=10000)
+    parser.add_argument("--trips", type=int, default=2)
+    parser.add_argument("--iterations", type=int, default=30)
+    args = parser.parse_args()
+
+    with common.timed("seed"):
+        api_key = _seed(args.drivers, args.trips)
+
+    rows = []
+    with common.SessionLocal() as db:
+        context = resolve_api_key(db, api_key)
+        for mode, limit in (("inline IN list", len(context.allowed_driver_ids)), ("subquery", 0)):
+            security.DRIVER_SCOPE_INLINE_LIMIT = limit
+
+            def _page():
+                query = filter_query_by_driver_ids(db.query(Trip), Trip.driverProfileId, context)
+                return query.order_by(Trip.start_date.desc()).limit(200).all()
+
+            def _count():
+                query = filter_query_by_driver_ids(
+                    db.query(func.count(Trip.id)), Trip.driverProfileId, context
+                )
+                return query.scalar()
+
+            expected = args.drivers * args.trips
+            assert _count() == expected, "scoped count mismatch"
+            for label, fn in (("page of 200", _page), ("count", _count)):
+                samples = common.measure(fn, args.iterations)
+                rows.append({"query": label, "mode": mode, **common.summarize(samples)})
+
+    common.print_table(
+        f"{args.drivers:,}-driver fleet, {args.trips} trips per driver, "
+        f"{args.drivers:,} drivers outside the fleet",
+        sorted(rows, key=lambda row: row["query"]),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Export serialization throughput: per-row ``json.dumps``/``csv`` writes versus
+the chunked orjson/CSV serializers in ``safedrive.core.exports``.
+
+``--rows`` raw-sensor-shaped payloads (UUID strings, a datetime and a list of
+readings) are serialized both ways. ``chunks`` is the number of pieces the
+response would hand to the ASGI server; each one is a send (and, for sync
+iterators, a threadpool hop).
+
+Usage:
+    python scripts/benchmarks/bench_export_serialization.py [--rows 500000]
+"""
+import argparse
+import csv
+import io
+import json
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import common
+
+from safedrive.core.exports import csv_chunks, json_cell, jsonl_chunks
+
+HEADER = ["id", "driverProfileId", "sensor_type", "values", "timestamp", "date", "sync"]
+
+
+def _payloads(rows: int):
+    driver_id = str(uuid4())
+    started = datetime(2025, 1, 1)
+    return [
+        {
+            "id": str(uuid4()),
+            "driverProfileId": driver_id,
+            "sensor_type": 1,
+            "values": [n * 0.001, -n * 0.002, 9.80665],
+            "timestamp": 1_735_689_600_000 + n * 20,
+            "date": started + timedelta(milliseconds=n * 20),
+            "sync": True,
+        }
+        for n in range(rows)
+    ]
+
+
+def _csv_row(payload: dict, values: str):
+    return [
+        payload["id"],
+        payload["driverProfileId"],
+        str(payload["sensor_type"]),
+        values,
+        str(payload["timestamp"]),
+        str(payload["date"]),
+        str(payload["sync"]),
+    ]
+
+
+def _per_row_jsonl(payloads):
+    for payload in payloads:
+        yield (json.dumps(payload, default=str) + "\n").encode("utf-8")
+
+
+def _per_row_csv(payloads):
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(HEADER)
+    yield output.getvalue()
+    output.seek(0)
+    output.truncate(0)
+    for payload in payloads:
+        writer.writerow(_csv_row(payload, json.dumps(payload["values"], default=str)))
+        yield output.getvalue()
+        output.seek(0)
+        output.truncate(0)
+
+
+def _chunked_csv(payloads):
+    return csv_chunks(
+        HEADER, (_csv_row(payload, json_cell(payload["values"])) for payload in payloads)
+    )
+
+
+def _run(label: str, fn, payloads) -> dict:
+    started = time.perf_counter()
+    chunks = 0
+    size = 0
+    for chunk in fn(payloads):
+        chunks += 1
+        size += len(chunk)
+    elapsed = time.perf_counter() - started
+    return {
+        "serializer": label,
+        "rows_per_s": int(len(payloads) / elapsed),
+        "chunks": chunks,
+        "mb": size / 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=500000)
+    args = parser.parse_args()
+
+    payloads = _payloads(args.rows)
+    rows = [
+        _run("jsonl per-row json.dumps", _per_row_jsonl, payloads),
+        _run("jsonl chunked orjson", jsonl_chunks, payloads),
+        _run("csv per-row", _per_row_csv, payloads),
+        _run("csv chunked", _chunked_csv, payloads),
+    ]
+    common.print_table(f"{args.rows:,} raw sensor payloads", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Per-request cost of JWT driver authentication.
+
+"profile lookup" reproduces the previous behaviour (decode the token, then
+load the ``DriverProfile`` row); "stateless" is the current
+``get_current_client_or_driver`` path, which builds the context from the
+claims and only consults the revocation denylist.
+
+Usage:
+    python scripts/benchmarks/bench_jwt_auth.py [--drivers 5000] [--requests 2000]
+"""
+import argparse
+from uuid import UUID, uuid4
+
+import common
+from fastapi.security import HTTPAuthorizationCredentials
+
+from safedrive.core.jwt_auth import create_access_token, decode_token
+from safedrive.core.security import get_current_client_or_driver
+from safedrive.models.driver_profile import DriverProfile
+
+
+def _seed(drivers: int):
+    common.reset_database()
+    with common.SessionLocal() as db:
+        driver_ids = [uuid4() for _ in range(drivers)]
+        db.add_all(
+            DriverProfile(driverProfileId=driver_id, email=f"{driver_id}@bench.example", sync=True)
+            for driver_id in driver_ids
+        )
+        db.commit()
+    driver_id = driver_ids[len(driver_ids) // 2]
+    return create_access_token(driver_id, f"{driver_id}@bench.example")
+
+
+def _profile_lookup(db, token: str):
+    payload = decode_token(token)
+    driver_id = UUID(payload.get("sub"))
+    return db.query(DriverProfile).filter(DriverProfile.driverProfileId == driver_id).first()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--drivers", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    token = _seed(args.drivers)
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    rows = []
+    with common.SessionLocal() as db:
+        samples = common.measure(lambda: _profile_lookup(db, token), args.requests)
+        rows.append({"mode": "profile lookup", **common.summarize(samples)})
+        samples = common.measure(
+            lambda: get_current_client_or_driver(api_key=None, credentials=credentials, db=db),
+            args.requests,
+        )
+        rows.append({"mode": "stateless", **common.summarize(samples)})
+
+    common.print_table(
+        f"{args.requests} JWT verifications, {args.drivers} driver profiles", rows
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Login throughput with inline bcrypt versus the password-hashing process pool.
+
+``--concurrency`` request threads verify ``--logins`` passwords in total,
+the way a login storm hits a worker's threadpool. A probe thread meanwhile
+runs a small pure-Python task in a loop; its latency shows how much the
+hashing starves everything else in the process. Throughput gains need more
+than one core.
+
+Usage:
+    python scripts/benchmarks/bench_password_hashing.py [--rounds 12] [--logins 64]
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import common
+
+from safedrive.core import passwords
+
+
+def _probe(stop: threading.Event, samples: list) -> None:
+    payload = {"trip": list(range(200))}
+    while not stop.is_set():
+        started = time.perf_counter()
+        json.dumps(payload)
+        samples.append((time.perf_counter() - started) * 1000.0)
+        time.sleep(0.005)
+
+
+def _run(hasher, hashed: str, logins: int, concurrency: int) -> dict:
+    stop = threading.Event()
+    probe_samples: list = []
+    probe = threading.Thread(target=_probe, args=(stop, probe_samples))
+    probe.start()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(
+            pool.map(
+                lambda _: common.measure(
+                    lambda: hasher.verify_and_update("s3cret-pass", hashed), 1
+                )[0],
+                range(logins),
+            )
+        )
+    elapsed = time.perf_counter() - started
+    stop.set()
+    probe.join()
+    login_stats = common.summarize(latencies)
+    return {
+        "logins_per_s": logins / elapsed,
+        "login_p50_ms": login_stats["p50_ms"],
+        "login_p99_ms": login_stats["p99_ms"],
+        "probe_p99_ms": common.summarize(probe_samples)["p99_ms"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    args = parser.parse_args()
+
+    hashed = passwords.build_context(args.rounds).hash("s3cret-pass")
+    rows = []
+    for label, workers in (("inline", 0), (f"process pool ({args.workers})", args.workers)):
+        hasher = passwords.PasswordHasher(
+            workers=workers, rounds=args.rounds, max_pending=args.logins
+        )
+        try:
+            hasher.verify_and_update("warm-up", hashed)
+            rows.append({"mode": label, **_run(hasher, hashed, args.logins, args.concurrency)})
+        finally:
+            hasher.shutdown()
+
+    common.print_table(
+        f"{args.logins} logins, {args.concurrency} request threads, bcrypt cost {args.rounds}",
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
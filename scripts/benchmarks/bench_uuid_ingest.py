@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Ingest rate and primary-key fragmentation with uuid4 versus UUIDv7 ids.
+
+``--rows`` raw sensor readings are inserted in ``--batch`` row commits into
+an empty copy of ``raw_sensor_data`` (same columns, no foreign keys), once
+with random ``uuid4`` ids and once with ``uuid7`` (``safedrive.database.ids``).
+The copy is clustered on its primary key like an InnoDB table (``WITHOUT
+ROWID`` on SQLite), so random keys scatter writes over the whole table.
+The insert rate is reported overall and for the first and last of
+``--segments`` slices of the load: random keys slow down once the table
+outgrows the page cache (``--cache-mb`` on SQLite, the buffer pool on MySQL).
+
+Fragmentation of the primary key B-tree after the load:
+
+* SQLite (default, a throwaway file): leaf pages and their average fill
+  from ``dbstat``, and pages written per commit (WAL frames). SQLite
+  rebalances leaves with their siblings, so fill stays similar for both;
+  the write amplification is what random keys cost there.
+* MySQL (``--database-url mysql+pymysql://...`` of a scratch database; the
+  ``bench_uuid_ingest`` table is dropped and recreated): leaf pages from
+  ``mysql.innodb_index_stats`` after ``ANALYZE TABLE``.
+
+Usage:
+    python scripts/benchmarks/bench_uuid_ingest.py [--rows 1000000] [--batch 5000]
+        [--segments 10] [--cache-mb 8] [--database-url URL]
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+from uuid import UUID, uuid4
+
+import common
+from sqlalchemy import Column, MetaData, Table, create_engine, event, text
+from sqlalchemy.engine import Connection
+
+from safedrive.database.ids import uuid7
+from safedrive.models.raw_sensor_data import RawSensorData
+
+TABLE = "bench_uuid_ingest"
+
+
+def _bench_table() -> Table:
+    return Table(
+        TABLE,
+        MetaData(),
+        *(
+            Column(column.name, column.type, primary_key=column.primary_key, nullable=column.nullable)
+            for column in RawSensorData.__table__.columns
+        ),
+        sqlite_with_rowid=False,
+        mysql_engine="InnoDB",
+    )
+
+
+def _sqlite_fragmentation(
+    connection: Connection, rows: int, pages_written: int, commits: int
+) -> Dict[str, float]:
+    pages = connection.execute(
+        text(
+            "SELECT pageno, pgsize, unused FROM dbstat "
+            "WHERE name = :name AND pagetype = 'leaf' ORDER BY path"
+        ),
+        {"name": TABLE},
+    ).all()
+    return {
+        "leaf_pages": len(pages),
+        "rows_per_leaf": rows / len(pages),
+        "leaf_fill_pct": 100.0 * sum(p.pgsize - p.unused for p in pages) / sum(p.pgsize for p in pages),
+        "pages_per_commit": pages_written / commits,
+    }
+
+
+def _mysql_fragmentation(connection: Connection, rows: int) -> Dict[str, float]:
+    connection.execute(text(f"ANALYZE TABLE {TABLE}"))
+    stats = dict(
+        connection.execute(
+            text(
+                "SELECT stat_name, stat_value FROM mysql.innodb_index_stats "
+                "WHERE database_name = DATABASE() AND table_name = :table "
+                "AND index_name = 'PRIMARY' AND stat_name IN ('n_leaf_pages', 'size')"
+            ),
+            {"table": TABLE},
+        ).all()
+    )
+    return {
+        "leaf_pages": int(stats["n_leaf_pages"]),
+        "rows_per_leaf": rows / int(stats["n_leaf_pages"]),
+        "index_pages": int(stats["size"]),
+    }
+
+
+def _load(
+    engine, new_id: Callable[[], UUID], rows: int, batch: int, segments: int
+) -> Dict[str, object]:
+    table = _bench_table()
+    table.drop(engine, checkfirst=True)
+    table.create(engine)
+
+    started = datetime(2026, 1, 1)
+    rates: List[float] = []
+    segment_rows = max(batch, rows // segments)
+    load_started = segment_started = time.perf_counter()
+    done = commits = pages_written = 0
+    sqlite = engine.dialect.name == "sqlite"
+    with engine.connect() as connection:
+        while done < rows:
+            count = min(batch, rows - done)
+            connection.execute(
+                table.insert(),
+                [
+                    {
+                        "id": new_id(),
+                        "sensor_type": 1,
+                        "sensor_type_name": "accelerometer",
+                        "values": [0.1, 0.2, 9.8],
+                        "timestamp": n * 20,
+                        "date": started + timedelta(milliseconds=n * 20),
+                        "accuracy": 3,
+                        "sync": True,
+                        "ingested_at": started,
+                    }
+                    for n in range(done, done + count)
+                ],
+            )
+            connection.commit()
+            if sqlite:
+                # WAL frames since the last checkpoint: pages this commit wrote.
+                pages_written += connection.exec_driver_sql(
+                    "PRAGMA wal_checkpoint(PASSIVE)"
+                ).one()[1]
+            commits += 1
+            done += count
+            if done % segment_rows == 0 or done == rows:
+                now = time.perf_counter()
+                rates.append(segment_rows / (now - segment_started))
+                segment_started = now
+        elapsed = time.perf_counter() - load_started
+
+        if sqlite:
+            fragmentation = _sqlite_fragmentation(connection, rows, pages_written, commits)
+        else:
+            fragmentation = _mysql_fragmentation(connection, rows)
+    table.drop(engine)
+    return {
+        "rows_per_s": rows / elapsed,
+        "first_slice_rows_per_s": rates[0],
+        "last_slice_rows_per_s": rates[-1],
+        **fragmentation,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--batch", type=int, default=5000)
+    parser.add_argument("--segments", type=int, default=10)
+    parser.add_argument("--cache-mb", type=int, default=8, help="SQLite page cache")
+    parser.add_argument("--database-url", help="scratch MySQL database instead of SQLite")
+    args = parser.parse_args()
+
+    if args.database_url:
+        engine = create_engine(args.database_url)
+        cache = "buffer pool"
+    else:
+        engine = common.engine
+
+        @event.listens_for(engine, "connect")
+        def _cache_size(dbapi_connection, connection_record) -> None:
+            # Negative cache_size is in KiB.
+            dbapi_connection.execute(f"PRAGMA cache_size = -{args.cache_mb * 1024}")
+            dbapi_connection.execute("PRAGMA journal_mode = WAL")
+            dbapi_connection.execute("PRAGMA wal_autocheckpoint = 0")
+
+        engine.dispose()
+        cache = f"{args.cache_mb} MB page cache"
+
+    results = []
+    for label, new_id in (("uuid4", uuid4), ("uuid7", uuid7)):
+        with common.timed(f"{label} load"):
+            results.append({"ids": label, **_load(engine, new_id, args.rows, args.batch, args.segments)})
+
+    common.print_table(
+        f"{args.rows:,} raw sensor inserts in {args.batch:,}-row commits "
+        f"({engine.dialect.name}, {cache})",
+        results,
+    )
+
+
+if __name__ == "__main__":
+    main()
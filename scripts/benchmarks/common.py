@@ -0,0 +1,125 @@
+"""
+Shared harness for the benchmark scripts in this directory.
+
+Benchmarks run the real FastAPI app against a throwaway SQLite database so
+they can be executed anywhere:
+
+    python scripts/benchmarks/bench_conditional_get.py
+
+Numbers are indicative only; compare before/after on the same machine.
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+_DB_DIR = tempfile.mkdtemp(prefix="safedrive-bench-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_DB_DIR, 'bench.db')}")
+os.environ.setdefault("ENVIRONMENT", "benchmark")
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from safedrive.database.base import Base  # noqa: E402
+
+engine = create_engine(
+    os.environ["DATABASE_URL"],
+    connect_args={"check_same_thread": False},
+)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def reset_database() -> None:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def make_client():
+    """Return a TestClient for the app wired to the benchmark database."""
+    from fastapi.testclient import TestClient
+
+    from safedrive.database.db import get_db
+    from safedrive.main import app
+
+    def _get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = _get_db
+    return TestClient(app)
+
+
+def create_api_key(db, role: str, **scope) -> str:
+    from uuid import uuid4
+
+    from safedrive.core.security import hash_api_key
+    from safedrive.models.auth import ApiClient
+
+    raw_key = f"bench-{role}-{uuid4()}"
+    db.add(
+        ApiClient(
+            name=f"{role}-bench",
+            role=role,
+            active=True,
+            api_key_hash=hash_api_key(raw_key),
+            **scope,
+        )
+    )
+    db.commit()
+    return raw_key
+
+
+def measure(fn: Callable[[], object], iterations: int) -> List[float]:
+    """Run ``fn`` ``iterations`` times and return per-call latencies in ms."""
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000.0)
+    return samples
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "mean_ms": statistics.fmean(ordered),
+        "p50_ms": ordered[len(ordered) // 2],
+        "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+    }
+
+
+def print_table(title: str, rows: List[Dict[str, object]]) -> None:
+    print(f"\n{title}")
+    if not rows:
+        return
+    columns = list(rows[0].keys())
+    widths = {
+        col: max(len(col), *(len(_fmt(row[col])) for row in rows)) for col in columns
+    }
+    print("  ".join(col.ljust(widths[col]) for col in columns))
+    for row in rows:
+        print("  ".join(_fmt(row[col]).ljust(widths[col]) for col in columns))
+
+
+def _fmt(value) -> str:
+    if isinstance(value, float):
+        return f"{value:,.2f}"
+    if isinstance(value, int):
+        return f"{value:,}"
+    return str(value)
+
+
+@contextmanager
+def timed(label: str):
+    started = time.perf_counter()
+    yield
+    print(f"{label}: {(time.perf_counter() - started) * 1000.0:,.1f} ms")
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Rebuild the vehicle_day_stats rollup from trips, sensor rows and unsafe behaviours.
+
+Ingest keeps the rollup current; run this to populate it after the
+migration, or after trips were assigned to vehicles outside the API. It is
+idempotent: every bucket is recomputed and replaced.
+
+Usage:
+    python scripts/rebuild_vehicle_day_stats.py [--batch 200]
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from safedrive.core.vehicle_stats import rebuild_vehicle_days, trip_day
+from safedrive.models.trip import Trip
+from safedrive.models.vehicle_day_stats import VehicleDayStats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--batch", type=int, default=200, help="vehicle-days per commit")
+    args = parser.parse_args()
+
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        print("ERROR: DATABASE_URL environment variable not set")
+        sys.exit(1)
+    SessionLocal = sessionmaker(autoflush=False, bind=create_engine(database_url))
+
+    with SessionLocal() as db:
+        # Existing buckets too, so ones whose trips are gone are emptied.
+        days = set(
+            db.execute(select(VehicleDayStats.vehicle_id, VehicleDayStats.day).distinct()).all()
+        )
+        trips = db.execute(
+            select(Trip.vehicle_id, Trip.start_time, Trip.start_date).where(
+                Trip.vehicle_id.isnot(None)
+            )
+        )
+        for vehicle_id, start_time, start_date in trips:
+            day = trip_day(start_time, start_date)
+            if day is not None:
+                days.add((vehicle_id, day))
+
+        days = sorted(days)
+        for offset in range(0, len(days), args.batch):
+            rebuild_vehicle_days(db, days[offset:offset + args.batch])
+            db.commit()
+            print(f"{min(offset + args.batch, len(days))}/{len(days)} vehicle-days")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Rotate the monthly raw_sensor_data and location partitions (MySQL).
+
+Splits the next PARTITION_MONTHS_AHEAD months out of the catch-all
+partition and retires months older than SENSOR_RETENTION_MONTHS by dropping
+them or, with SENSOR_RETENTION_ACTION=archive, moving them into
+<table>_archive_pYYYYMM tables first. Run it daily; it is idempotent.
+
+Usage:
+    python scripts/rotate_partitions.py [--dry-run] [--months-ahead 3]
+        [--retention-months 24] [--action archive|drop]
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+
+from safedrive.core.partitions import (
+    PARTITION_MONTHS_AHEAD,
+    SENSOR_RETENTION_ACTION,
+    SENSOR_RETENTION_MONTHS,
+    partition_name,
+    rotate_partitions,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dry-run", action="store_true", help="print the plan only")
+    parser.add_argument("--months-ahead", type=int, default=PARTITION_MONTHS_AHEAD)
+    parser.add_argument(
+        "--retention-months",
+        type=int,
+        default=SENSOR_RETENTION_MONTHS,
+        help="months of sensor data to keep; 0 keeps everything",
+    )
+    parser.add_argument("--action", choices=("archive", "drop"), default=SENSOR_RETENTION_ACTION)
+    args = parser.parse_args()
+
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        print("ERROR: DATABASE_URL environment variable not set")
+        sys.exit(1)
+
+    plans = rotate_partitions(
+        create_engine(database_url),
+        months_ahead=args.months_ahead,
+        retention_months=args.retention_months,
+        action=args.action,
+        dry_run=args.dry_run,
+    )
+    for plan in plans:
+        created = ", ".join(partition_name(month) for month in plan.create) or "-"
+        expired = ", ".join(partition_name(month) for month in plan.expire) or "-"
+        verb = "would" if args.dry_run else "did"
+        print(f"{plan.table}: {verb} add {created}; {verb} {args.action} {expired}")
+
+
+if __name__ == "__main__":
+    main()
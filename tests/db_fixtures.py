@@ -1,19 +1,26 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 
 from fastapi.testclient import TestClient
 
 from safedrive.database.base import Base
+from safedrive.database.async_db import get_async_db
 from safedrive.database.db import get_db
 from safedrive.main import app
-from safedrive.core.security import hash_api_key
+from safedrive.core import jwt_auth
+from safedrive.core.security import dataset_access_cache, hash_api_key
+from safedrive.core.vehicle_stats import vehicle_day_refresher
 from safedrive.models.admin_setting import AdminSetting
 from safedrive.models.auth import ApiClient
 from safedrive.models.insurance_partner import InsurancePartner, InsurancePartnerDriver
 from uuid import uuid4
 
-TEST_DATABASE_URL = "sqlite:///:memory:"
+# A named in-memory database in shared-cache mode, so the async endpoints'
+# aiosqlite connections see the same tables as the sync session.
+TEST_DATABASE_URL = "sqlite:///file:safedrive_tests?mode=memory&cache=shared&uri=true"
+TEST_ASYNC_DATABASE_URL = TEST_DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://")
 
 engine = create_engine(
     TEST_DATABASE_URL,
@@ -21,6 +28,16 @@ engine = create_engine(
     poolclass=StaticPool,
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Rebuild vehicle-day rollups inline so tests read them right after a write.
+vehicle_day_refresher.debounce_seconds = 0
+# Tests run one worker without Redis; trust in-process token revocations.
+jwt_auth.TOKEN_REVOCATION_LOCAL = True
+
+# NullPool: TestClient starts a new event loop per request.
+async_engine = create_async_engine(TEST_ASYNC_DATABASE_URL, poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
 
 
 def override_get_db():
@@ -31,7 +48,13 @@ def override_get_db():
         db.close()
 
 
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_async_db] = override_get_async_db
 client = TestClient(app)
 
 
@@ -41,6 +64,7 @@ def create_tables():
 
 def drop_tables():
     Base.metadata.drop_all(bind=engine)
+    dataset_access_cache.invalidate(bump_version=False)
 
 
 def create_api_client(
@@ -0,0 +1,181 @@
+import asyncio
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+from safedrive.api.v1.endpoints import alerts
+from safedrive.api.v1.endpoints.alerts import sse_alert_events
+from safedrive.core import alert_stream
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.insurance_partner import InsurancePartner, InsurancePartnerDriver
+from safedrive.models.unsafe_behaviour import UnsafeBehaviour
+from tests.db_fixtures import (
+    TestingSessionLocal,
+    client,
+    create_api_client,
+    create_tables,
+    drop_tables,
+)
+
+
+@pytest.fixture(autouse=True)
+def prepare_database(monkeypatch):
+    monkeypatch.setattr(alert_stream, "get_redis_client", lambda: None)
+    create_tables()
+    try:
+        yield
+    finally:
+        drop_tables()
+
+
+def _add_driver(db):
+    driver_id = uuid4()
+    db.add(DriverProfile(driverProfileId=driver_id, email=f"{driver_id}@example.com", sync=True))
+    db.commit()
+    return driver_id
+
+
+def _ingest(driver_id, severity=0.9, behaviour_type="hard_brake"):
+    with TestingSessionLocal() as db:
+        db.add(
+            UnsafeBehaviour(
+                id=uuid4(),
+                driverProfileId=driver_id,
+                behaviour_type=behaviour_type,
+                severity=severity,
+                timestamp=int(datetime.utcnow().timestamp() * 1000),
+            )
+        )
+        db.commit()
+
+
+def _connect(api_key, **params):
+    query = "&".join(f"{key}={value}" for key, value in params.items())
+    return client.websocket_connect(f"/api/alerts/ws?{query}", headers={"X-API-Key": api_key})
+
+
+def test_websocket_pushes_scoped_alerts_as_they_are_ingested():
+    with TestingSessionLocal() as db:
+        partner = InsurancePartner(name="Stream Insurer", label="stream-insurer", active=True)
+        db.add(partner)
+        db.flush()
+        covered = _add_driver(db)
+        other = _add_driver(db)
+        db.add(InsurancePartnerDriver(partner_id=partner.id, driverProfileId=covered))
+        db.commit()
+        api_key = create_api_client(db, role="insurance_partner", insurance_partner_id=partner.id)
+
+    with _connect(api_key) as websocket:
+        _ingest(other)
+        _ingest(covered, severity=0.2)
+        _ingest(covered, behaviour_type="swerve")
+        alert = websocket.receive_json()
+
+    assert alert["alert_type"] == "unsafe_behaviour"
+    assert alert["driverProfileId"] == str(covered)
+    assert alert["message"].startswith("Unsafe behaviour swerve")
+    assert isinstance(alert["id"], int)
+
+
+def test_websocket_resumes_after_last_event_id():
+    with TestingSessionLocal() as db:
+        driver_id = _add_driver(db)
+        api_key = create_api_client(db, role="admin")
+
+    with _connect(api_key) as websocket:
+        _ingest(driver_id, behaviour_type="first")
+        first = websocket.receive_json()
+
+    _ingest(driver_id, behaviour_type="missed-1")
+    _ingest(driver_id, behaviour_type="missed-2")
+
+    with _connect(api_key, lastEventId=first["id"]) as websocket:
+        replayed = [websocket.receive_json(), websocket.receive_json()]
+    assert [alert["message"].split()[2] for alert in replayed] == ["missed-1", "missed-2"]
+    assert first["id"] < replayed[0]["id"] < replayed[1]["id"]
+
+
+def test_websocket_rejects_unauthorized_clients():
+    with TestingSessionLocal() as db:
+        researcher_key = create_api_client(db, role="researcher")
+
+    for api_key in ("not-a-key", researcher_key):
+        with pytest.raises(WebSocketDisconnect) as excinfo:
+            with _connect(api_key) as websocket:
+                websocket.receive_json()
+        assert excinfo.value.code == 1008
+
+
+
+def test_stream_authorization_runs_off_the_event_loop(monkeypatch):
+    with TestingSessionLocal() as db:
+        api_key = create_api_client(db, role="admin")
+
+    on_loop = []
+    ensure_dataset_access = alerts.ensure_dataset_access
+
+    def _record_thread(*args):
+        try:
+            asyncio.get_running_loop()
+            on_loop.append(True)
+        except RuntimeError:
+            on_loop.append(False)
+        return ensure_dataset_access(*args)
+
+    monkeypatch.setattr(alerts, "ensure_dataset_access", _record_thread)
+    with _connect(api_key) as websocket:
+        websocket.close()
+    assert on_loop == [False]
+
+def _alert(driver_id, severity=0.9):
+    return {
+        "alert_type": "unsafe_behaviour",
+        "driverProfileId": str(driver_id),
+        "trip_id": None,
+        "severity": severity,
+        "timestamp": 0,
+        "message": "test",
+    }
+
+
+def test_slow_subscriber_is_cut_off_instead_of_buffering(monkeypatch):
+    monkeypatch.setattr(alert_stream, "ALERT_STREAM_QUEUE_SIZE", 2)
+    driver_id = uuid4()
+
+    async def scenario():
+        broker = alert_stream.AlertBroker()
+        subscription = broker.subscribe(alert_stream.AlertFilter(None, 0.5))
+        broker.publish([_alert(driver_id) for _ in range(5)])
+        await asyncio.sleep(0)
+        # Queued alerts are dropped too: the client resumes from its last id.
+        with pytest.raises(alert_stream.AlertStreamOverflow):
+            await subscription.next_alert(0.1)
+        return subscription.queue.qsize()
+
+    assert asyncio.run(scenario()) == 2
+
+
+def test_sse_frames_carry_event_ids(monkeypatch):
+    driver_id = uuid4()
+
+    async def scenario():
+        subscription = alert_stream.alert_broker.subscribe(
+            alert_stream.AlertFilter(frozenset({str(driver_id)}), 0.5)
+        )
+        frames = sse_alert_events(subscription, keepalive=0.05)
+        retry = await frames.__anext__()
+        keepalive = await frames.__anext__()
+        alert_stream.alert_broker.publish([_alert(driver_id)])
+        frame = await frames.__anext__()
+        await frames.aclose()
+        return retry, keepalive, frame
+
+    retry, keepalive, frame = asyncio.run(scenario())
+    assert retry == b"retry: 3000\n\n"
+    assert keepalive == b": keepalive\n\n"
+    lines = frame.decode().split("\n")
+    assert lines[0].startswith("id: ")
+    assert lines[1] == "event: unsafe_behaviour"
+    assert lines[2].startswith("data: {")
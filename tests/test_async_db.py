@@ -0,0 +1,107 @@
+from datetime import datetime
+from uuid import uuid4
+
+import anyio
+import pytest
+
+from safedrive.database.async_db import async_database_url, configure_threadpool
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.location import Location
+from safedrive.models.raw_sensor_data import RawSensorData
+from safedrive.models.trip import Trip
+from tests.db_fixtures import (
+    TestingSessionLocal,
+    client,
+    create_api_client,
+    create_tables,
+    drop_tables,
+)
+
+
+@pytest.fixture(autouse=True)
+def prepare_database():
+    create_tables()
+    try:
+        yield
+    finally:
+        drop_tables()
+
+
+def _add_driver(db, trips=2):
+    driver_id = uuid4()
+    db.add(DriverProfile(driverProfileId=driver_id, email=f"{driver_id}@example.com", sync=True))
+    for _ in range(trips):
+        trip_id = uuid4()
+        location = Location(
+            id=uuid4(),
+            latitude=0.0,
+            longitude=0.0,
+            timestamp=0,
+            date=datetime.utcnow(),
+            altitude=0.0,
+            speed=10.0,
+            speedLimit=50.0,
+            distance=100.0,
+            sync=True,
+        )
+        db.add(Trip(id=trip_id, driverProfileId=driver_id, start_date=datetime.utcnow(), sync=True))
+        db.add(location)
+        db.add(
+            RawSensorData(
+                id=uuid4(),
+                sensor_type=1,
+                sensor_type_name="accelerometer",
+                values=[0.0],
+                timestamp=0,
+                accuracy=3,
+                location_id=location.id,
+                trip_id=trip_id,
+                sync=True,
+            )
+        )
+    db.commit()
+    return driver_id
+
+
+def test_async_url_swaps_driver():
+    assert async_database_url("mysql+pymysql://user:secret@db:3306/safedrive") == (
+        "mysql+aiomysql://user:secret@db:3306/safedrive"
+    )
+    assert async_database_url("sqlite:///./local.db") == "sqlite+aiosqlite:///./local.db"
+    assert async_database_url("postgresql+asyncpg://db/safedrive") == (
+        "postgresql+asyncpg://db/safedrive"
+    )
+
+
+def test_async_lists_are_scoped_and_counted():
+    with TestingSessionLocal() as db:
+        driver_id = _add_driver(db)
+        _add_driver(db, trips=3)
+        admin_key = create_api_client(db, role="admin")
+        driver_key = create_api_client(db, role="driver", driver_profile_id=driver_id)
+
+    admin = client.get("/api/trips/", headers={"X-API-Key": admin_key})
+    assert admin.status_code == 200
+    assert len(admin.json()) == 5
+    # Statements on the async engine still reach the per-request totals.
+    assert int(admin.headers["Server-Timing"].split('desc="')[1].split(" ")[0]) > 0
+
+    own = client.get("/api/trips/", headers={"X-API-Key": driver_key})
+    assert {trip["driverProfileId"] for trip in own.json()} == {str(driver_id)}
+    assert len(own.json()) == 2
+
+    sensors = client.get(
+        "/api/raw_sensor_data/", params={"limit": 1}, headers={"X-API-Key": driver_key}
+    )
+    assert sensors.status_code == 200
+    assert len(sensors.json()) == 1
+    own_trips = {trip["id"] for trip in own.json()}
+    assert sensors.json()[0]["trip_id"] in own_trips
+
+
+def test_threadpool_size_is_configurable():
+    async def _configured_tokens():
+        configure_threadpool(64)
+        return anyio.to_thread.current_default_thread_limiter().total_tokens
+
+    assert anyio.run(_configured_tokens) == 64
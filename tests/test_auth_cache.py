@@ -0,0 +1,162 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from safedrive.core import auth_cache
+from safedrive.core.security import auth_context_cache, hash_api_key, resolve_api_key
+from safedrive.models.auth import ApiClient
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.insurance_partner import InsurancePartner, InsurancePartnerDriver
+from tests.db_fixtures import (
+    TestingSessionLocal,
+    client,
+    create_api_client,
+    create_tables,
+    drop_tables,
+    engine,
+)
+
+
+@pytest.fixture(autouse=True)
+def prepare_database(monkeypatch):
+    monkeypatch.setattr(auth_cache, "get_redis_client", lambda: None)
+    create_tables()
+    auth_context_cache.invalidate_all()
+    auth_context_cache.reset_stats()
+    try:
+        yield
+    finally:
+        drop_tables()
+
+
+def _seed_partner(db, drivers=2):
+    partner = InsurancePartner(name="Cache Insurer", label="cache-insurer", active=True)
+    db.add(partner)
+    db.flush()
+    driver_ids = []
+    for _ in range(drivers):
+        driver = DriverProfile(
+            driverProfileId=uuid4(), email=f"{uuid4()}@example.com", sync=True
+        )
+        db.add(driver)
+        db.flush()
+        db.add(
+            InsurancePartnerDriver(
+                partner_id=partner.id, driverProfileId=driver.driverProfileId
+            )
+        )
+        driver_ids.append(driver.driverProfileId)
+    db.commit()
+    return partner.id, driver_ids
+
+
+def _count_queries():
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    return statements, lambda: event.remove(engine, "before_cursor_execute", _record)
+
+
+def test_cached_context_skips_database():
+    with TestingSessionLocal() as db:
+        partner_id, driver_ids = _seed_partner(db)
+        key = create_api_client(db, role="insurance_partner", insurance_partner_id=partner_id)
+
+    with TestingSessionLocal() as db:
+        first = resolve_api_key(db, key)
+        statements, stop = _count_queries()
+        try:
+            second = resolve_api_key(db, key)
+        finally:
+            stop()
+
+    assert first == second
+    assert first.allowed_driver_ids == set(driver_ids)
+    assert statements == []
+    stats = auth_context_cache.stats()
+    assert stats["misses"] == 1
+    assert stats["local_hits"] == 1
+    assert stats["db_queries_saved"] == 2
+    assert stats["db_rows_saved"] == 1 + len(driver_ids)
+
+
+def test_unknown_keys_are_not_cached():
+    with TestingSessionLocal() as db:
+        assert resolve_api_key(db, "not-a-key") is None
+        assert resolve_api_key(db, "not-a-key") is None
+    stats = auth_context_cache.stats()
+    assert stats["misses"] == 2
+    assert stats["entries"] == 0
+
+
+def test_deactivation_invalidates_cached_context():
+    with TestingSessionLocal() as db:
+        admin_key = create_api_client(db, role="admin")
+        researcher_key = create_api_client(db, role="researcher")
+        researcher_id = (
+            db.query(ApiClient.id)
+            .filter(ApiClient.api_key_hash == hash_api_key(researcher_key))
+            .scalar()
+        )
+
+    admin_headers = {"X-API-Key": admin_key}
+    researcher_headers = {"X-API-Key": researcher_key}
+    status_url = "/api/researcher/ingestion/status"
+    assert client.get(status_url, headers=researcher_headers).status_code != 401
+    assert auth_context_cache.stats()["entries"] == 1
+
+    response = client.patch(
+        f"/api/admin/api-clients/{researcher_id}",
+        json={"active": False},
+        headers=admin_headers,
+    )
+    assert response.status_code == 200
+    assert client.get(status_url, headers=researcher_headers).status_code == 401
+
+
+def test_assignment_change_refreshes_driver_scope():
+    with TestingSessionLocal() as db:
+        partner_id, driver_ids = _seed_partner(db, drivers=1)
+        partner_key = create_api_client(
+            db, role="insurance_partner", insurance_partner_id=partner_id
+        )
+        admin_key = create_api_client(db, role="admin")
+        new_driver = DriverProfile(
+            driverProfileId=uuid4(), email="late.driver@example.com", sync=True
+        )
+        db.add(new_driver)
+        db.commit()
+        new_driver_id = new_driver.driverProfileId
+
+    with TestingSessionLocal() as db:
+        assert resolve_api_key(db, partner_key).allowed_driver_ids == set(driver_ids)
+
+    response = client.post(
+        f"/api/admin/insurance-partners/{partner_id}/drivers",
+        json={"driverProfileId": str(new_driver_id)},
+        headers={"X-API-Key": admin_key},
+    )
+    assert response.status_code == 201
+
+    with TestingSessionLocal() as db:
+        scope = resolve_api_key(db, partner_key).allowed_driver_ids
+    assert scope == {*driver_ids, new_driver_id}
+
+
+def test_auth_cache_stats_endpoint():
+    with TestingSessionLocal() as db:
+        admin_key = create_api_client(db, role="admin")
+
+    headers = {"X-API-Key": admin_key}
+    client.get("/api/admin/auth-cache", headers=headers)
+    stats = client.get("/api/admin/auth-cache", headers=headers).json()
+    assert stats["misses"] == 1
+    assert stats["local_hits"] >= 1
+    assert stats["hit_rate"] > 0
+
+    assert client.delete("/api/admin/auth-cache", headers=headers).status_code == 204
+    assert auth_context_cache.stats()["entries"] == 0
@@ -0,0 +1,254 @@
+import json
+import os
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from safedrive.core import cold_archive
+from safedrive.core.cold_archive import archive_sensor_data, archived_rows, reads_archive
+from safedrive.core.partitions import epoch_ms
+from safedrive.crud.driver_profile import driver_profile_crud
+from safedrive.crud.trip import trip_crud
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.location import Location
+from safedrive.models.raw_sensor_data import RawSensorData
+from safedrive.models.sensor_archive import SensorArchive
+from safedrive.models.trip import Trip
+from safedrive.models.unsafe_behaviour import UnsafeBehaviour
+from tests.db_fixtures import (
+    TestingSessionLocal,
+    client,
+    create_api_client,
+    create_tables,
+    drop_tables,
+)
+
+TODAY = date(2026, 10, 19)
+OLD = datetime(2026, 3, 10, 12, 0)
+RECENT = datetime(2026, 10, 1, 12, 0)
+
+
+@pytest.fixture(autouse=True)
+def prepare_database(tmp_path, monkeypatch):
+    monkeypatch.setattr(cold_archive, "SENSOR_ARCHIVE_DIR", str(tmp_path))
+    create_tables()
+    try:
+        yield
+    finally:
+        drop_tables()
+
+
+def _add_reading(db, trip_id, recorded: datetime, sensor_type=1):
+    location = Location(
+        id=uuid4(),
+        latitude=0.0,
+        longitude=0.0,
+        timestamp=epoch_ms(recorded),
+        date=recorded,
+        altitude=0.0,
+        speed=10.0,
+        speedLimit=50.0,
+        distance=100.0,
+        sync=True,
+    )
+    db.add(location)
+    db.add(
+        RawSensorData(
+            id=uuid4(),
+            sensor_type=sensor_type,
+            sensor_type_name="accelerometer",
+            values=[0.5, 1.5],
+            timestamp=location.timestamp,
+            date=recorded,
+            accuracy=3,
+            location_id=location.id,
+            trip_id=trip_id,
+            sync=True,
+        )
+    )
+    return location
+
+
+def _add_trip(db, started: datetime):
+    driver_id, trip_id = uuid4(), uuid4()
+    db.add(DriverProfile(driverProfileId=driver_id, email=f"{driver_id}@example.com", sync=True))
+    db.add(
+        Trip(
+            id=trip_id,
+            driverProfileId=driver_id,
+            start_date=started,
+            start_time=epoch_ms(started),
+            sync=True,
+        )
+    )
+    return driver_id, trip_id
+
+
+def test_old_months_move_to_parquet_and_catalog(tmp_path):
+    with TestingSessionLocal() as db:
+        driver_id, trip_id = _add_trip(db, OLD)
+        _add_reading(db, trip_id, OLD)
+        _add_reading(db, trip_id, OLD + timedelta(minutes=1))
+        flagged = _add_reading(db, trip_id, OLD + timedelta(minutes=2))
+        db.add(
+            UnsafeBehaviour(
+                id=uuid4(),
+                trip_id=trip_id,
+                location_id=flagged.id,
+                driverProfileId=driver_id,
+                behaviour_type="speeding",
+                severity=0.5,
+                timestamp=flagged.timestamp,
+                date=OLD,
+                sync=True,
+            )
+        )
+        _, recent_trip = _add_trip(db, RECENT)
+        _add_reading(db, recent_trip, RECENT)
+        db.commit()
+
+        entries = archive_sensor_data(db, today=TODAY, after_months=6, archive_dir=str(tmp_path))
+
+        assert {(entry.table_name, entry.month, entry.row_count) for entry in entries} == {
+            ("raw_sensor_data", date(2026, 3, 1), 3),
+            # The location an unsafe behaviour points at stays hot.
+            ("location", date(2026, 3, 1), 2),
+        }
+        for entry in entries:
+            assert entry.driverProfileId == driver_id
+            assert entry.path.startswith(
+                os.path.join(entry.table_name, "month=2026-03", f"driver={driver_id}")
+            )
+            assert os.path.getsize(tmp_path / entry.path) == entry.byte_size
+        assert db.query(RawSensorData).count() == 1
+        assert db.query(Location).count() == 2
+        assert db.query(SensorArchive).count() == 2
+
+        rows = list(archived_rows(db, "raw_sensor_data", trip_id=trip_id, archive_dir=str(tmp_path)))
+        assert [row["timestamp"] for row in rows] == sorted(row["timestamp"] for row in rows)
+        assert rows[0]["values"] == [0.5, 1.5]
+        assert rows[0]["driverProfileId"] == str(driver_id)
+
+        # A second run has nothing left to move.
+        assert archive_sensor_data(db, today=TODAY, after_months=6, archive_dir=str(tmp_path)) == []
+
+
+def test_hot_window_ranges_skip_the_catalog():
+    assert reads_archive(None, after_months=6)
+    assert reads_archive(epoch_ms(datetime(2000, 1, 1)), after_months=6)
+    assert not reads_archive(epoch_ms(datetime.utcnow()), after_months=6)
+
+
+def test_reads_go_through_to_the_archive():
+    with TestingSessionLocal() as db:
+        driver_id, trip_id = _add_trip(db, OLD)
+        _add_reading(db, trip_id, OLD)
+        _add_reading(db, trip_id, OLD + timedelta(minutes=1), sensor_type=2)
+        db.commit()
+        archive_sensor_data(db, today=TODAY, after_months=6)
+        _add_reading(db, trip_id, OLD + timedelta(minutes=2))
+        db.commit()
+        driver_key = create_api_client(db, role="driver", driver_profile_id=driver_id)
+        researcher_key = create_api_client(db, role="researcher")
+
+    trip_rows = client.get(
+        f"/api/trips/{trip_id}/raw_sensor_data", headers={"X-API-Key": driver_key}
+    )
+    assert trip_rows.status_code == 200
+    assert [row["timestamp"] for row in trip_rows.json()] == [
+        epoch_ms(OLD + timedelta(minutes=offset)) for offset in range(3)
+    ]
+
+    export = client.get(
+        "/api/researcher/raw_sensor_data/export",
+        params={"driverProfileId": str(driver_id), "sensorType": 1},
+        headers={"X-API-Key": researcher_key},
+    )
+    assert export.status_code == 200
+    exported = [json.loads(line) for line in export.text.splitlines()]
+    assert [row["timestamp"] for row in exported] == [
+        epoch_ms(OLD), epoch_ms(OLD + timedelta(minutes=2))
+    ]
+    assert exported[0]["driverProfileId"] == str(driver_id)
+
+    recent_only = client.get(
+        "/api/researcher/raw_sensor_data/export",
+        params={"startDate": RECENT.isoformat()},
+        headers={"X-API-Key": researcher_key},
+    )
+    assert recent_only.text == ""
+
+
+def test_trip_reads_stream_only_the_trip_drivers_row_groups(tmp_path, monkeypatch):
+    monkeypatch.setattr(cold_archive, "ARCHIVE_BATCH_ROWS", 2)
+    monkeypatch.setattr(cold_archive, "ARCHIVE_READ_BATCH_ROWS", 1)
+    monkeypatch.setattr(cold_archive, "PARTITION_PRUNING_SLACK_MS", 0)
+    with TestingSessionLocal() as db:
+        driver_id, trip_id = _add_trip(db, OLD)
+        _, other_trip = _add_trip(db, OLD)
+        for minute in range(6):
+            _add_reading(db, trip_id, OLD + timedelta(minutes=minute))
+            _add_reading(db, other_trip, OLD + timedelta(minutes=minute))
+        db.flush()
+        db.get(Trip, trip_id).end_time = epoch_ms(OLD + timedelta(minutes=1))
+        db.commit()
+        archive_sensor_data(db, today=TODAY, after_months=6, archive_dir=str(tmp_path))
+
+        opened, groups = [], []
+        row_groups = cold_archive._row_groups
+
+        def _record_row_groups(parquet, start_ms, end_ms):
+            selected = row_groups(parquet, start_ms, end_ms)
+            groups.append((parquet.num_row_groups, selected))
+            return selected
+
+        read_part = cold_archive._read_part
+        monkeypatch.setattr(cold_archive, "_row_groups", _record_row_groups)
+        monkeypatch.setattr(
+            cold_archive,
+            "_read_part",
+            lambda path, *args: opened.append(path) or read_part(path, *args),
+        )
+        rows = list(archived_rows(db, "raw_sensor_data", trip_id=trip_id, archive_dir=str(tmp_path)))
+
+    assert [row["timestamp"] for row in rows] == [epoch_ms(OLD), epoch_ms(OLD + timedelta(minutes=1))]
+    # Only the trip driver's file, and of its three row groups only the first.
+    assert len(opened) == 1 and f"driver={driver_id}" in opened[0]
+    assert groups == [(3, [0])]
+
+
+def test_deleted_drivers_and_trips_leave_the_archive(tmp_path):
+    with TestingSessionLocal() as db:
+        deleted_driver, deleted_drivers_trip = _add_trip(db, OLD)
+        _add_reading(db, deleted_drivers_trip, OLD)
+        _, deleted_trip = _add_trip(db, OLD)
+        _add_reading(db, deleted_trip, OLD + timedelta(minutes=1))
+        _, kept_trip = _add_trip(db, OLD)
+        _add_reading(db, kept_trip, OLD + timedelta(minutes=2))
+        db.commit()
+        archive_sensor_data(db, today=TODAY, after_months=6)
+        paths = [
+            tmp_path / entry.path
+            for entry in db.query(SensorArchive).filter_by(driverProfileId=deleted_driver)
+        ]
+        assert paths and all(path.exists() for path in paths)
+
+        driver_profile_crud.delete(db, deleted_driver)
+        trip_crud.batch_delete(db, [deleted_trip])
+        researcher_key = create_api_client(db, role="researcher")
+
+        assert db.query(SensorArchive).filter_by(driverProfileId=deleted_driver).count() == 0
+    assert not any(path.exists() for path in paths)
+
+    def _export(**params):
+        response = client.get(
+            "/api/researcher/raw_sensor_data/export",
+            params=params,
+            headers={"X-API-Key": researcher_key},
+        )
+        assert response.status_code == 200
+        return [json.loads(line) for line in response.text.splitlines()]
+
+    assert _export(driverProfileId=str(deleted_driver)) == []
+    assert [row["trip_id"] for row in _export()] == [str(kept_trip)]
@@ -0,0 +1,181 @@
+import io
+import json
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from safedrive.core import exports
+from safedrive.models.alcohol_questionnaire import AlcoholQuestionnaire
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.nlg_report import NLGReport
+from safedrive.models.raw_sensor_data import RawSensorData
+from safedrive.models.trip import Trip
+from tests.db_fixtures import (
+    TestingSessionLocal,
+    client,
+    create_api_client,
+    create_tables,
+    drop_tables,
+)
+
+
+@pytest.fixture(autouse=True)
+def prepare_database():
+    create_tables()
+    try:
+        yield
+    finally:
+        drop_tables()
+
+
+def _seed(readings=7):
+    started = datetime(2025, 3, 4, 8, 0)
+    with TestingSessionLocal() as db:
+        driver = DriverProfile(
+            driverProfileId=uuid4(), email="columnar.driver@example.com", sync=True
+        )
+        db.add(driver)
+        db.flush()
+        trip = Trip(
+            id=uuid4(),
+            driverProfileId=driver.driverProfileId,
+            start_date=started,
+            start_time=int(started.timestamp() * 1000),
+            sync=True,
+        )
+        db.add(trip)
+        for n in range(readings):
+            db.add(
+                RawSensorData(
+                    id=uuid4(),
+                    sensor_type=1,
+                    sensor_type_name="accelerometer",
+                    values=[n + 0.5, -1.25, 9.75] if n % 2 else json.dumps([n, 0, 1]),
+                    timestamp=int(started.timestamp() * 1000) + n,
+                    date=started + timedelta(milliseconds=n),
+                    accuracy=3,
+                    trip_id=trip.id,
+                    sync=True,
+                )
+            )
+        db.add(
+            AlcoholQuestionnaire(
+                id=uuid4(),
+                driverProfileId=driver.driverProfileId,
+                drankAlcohol=True,
+                selectedAlcoholTypes="Beer",
+                beerQuantity="2",
+                wineQuantity="0",
+                spiritsQuantity="0",
+                firstDrinkTime="18:00",
+                lastDrinkTime="19:30",
+                emptyStomach=False,
+                caffeinatedDrink=False,
+                impairmentLevel=1,
+                date=started,
+                plansToDrive=True,
+                sync=True,
+            )
+        )
+        db.add(
+            NLGReport(
+                id=uuid4(),
+                driverProfileId=driver.driverProfileId,
+                start_date=started,
+                end_date=started + timedelta(days=1),
+                report_text="Smooth braking all week.",
+                generated_at=started + timedelta(days=1),
+                sync=True,
+            )
+        )
+        db.commit()
+        return create_api_client(db, role="researcher")
+
+
+def _read(response, export_format):
+    if export_format == "parquet":
+        return pq.read_table(io.BytesIO(response.content))
+    return pa.ipc.open_stream(response.content).read_all()
+
+
+def _jsonl(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+@pytest.mark.parametrize("export_format", ["parquet", "arrow"])
+def test_raw_sensor_columnar_export_matches_jsonl(monkeypatch, export_format):
+    monkeypatch.setattr(exports, "COLUMNAR_EXPORT_BATCH_ROWS", 3)
+    headers = {"X-API-Key": _seed()}
+    url = "/api/researcher/raw_sensor_data/export"
+
+    response = client.get(f"{url}?format={export_format}", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == exports.COLUMNAR_FORMATS[export_format][0]
+    table = _read(response, export_format)
+    expected = _jsonl(client.get(f"{url}?format=jsonl", headers=headers))
+
+    assert table.schema.field("values").type == pa.list_(pa.float32())
+    assert table.num_rows == len(expected) == 7
+    rows = table.to_pylist()
+    for row, payload in zip(rows, expected):
+        values = payload["values"]
+        if isinstance(values, str):
+            values = json.loads(values)
+        assert row["values"] == pytest.approx(values)
+        assert row["id"] == payload["id"]
+        assert row["timestamp"] == payload["timestamp"]
+        assert row["driverProfileId"] == payload["driverProfileId"]
+
+
+def test_parquet_export_writes_one_row_group_per_batch(monkeypatch):
+    monkeypatch.setattr(exports, "COLUMNAR_EXPORT_BATCH_ROWS", 3)
+    headers = {"X-API-Key": _seed()}
+    response = client.get(
+        "/api/researcher/raw_sensor_data/export?format=parquet", headers=headers
+    )
+    assert pq.ParquetFile(io.BytesIO(response.content)).metadata.num_row_groups == 3
+
+
+@pytest.mark.parametrize("export_format", ["parquet", "arrow"])
+def test_trip_and_report_columnar_exports(export_format):
+    headers = {"X-API-Key": _seed()}
+
+    trips = _read(
+        client.get(f"/api/researcher/trips/export?format={export_format}", headers=headers),
+        export_format,
+    ).to_pylist()
+    assert len(trips) == 1
+    questionnaire = trips[0]["matchedQuestionnaire"]
+    assert questionnaire["drankAlcohol"] is True
+    assert questionnaire["beerQuantity"] == "2"
+
+    reports = _read(
+        client.get(
+            f"/api/researcher/nlg_reports/export?format={export_format}", headers=headers
+        ),
+        export_format,
+    ).to_pylist()
+    assert [report["report_text"] for report in reports] == ["Smooth braking all week."]
+
+
+def test_empty_columnar_export_is_readable():
+    headers = {"X-API-Key": _seed(readings=0)}
+    response = client.get(
+        "/api/researcher/raw_sensor_data/export?format=parquet&sensorType=99",
+        headers=headers,
+    )
+    assert response.status_code == 200
+    table = _read(response, "parquet")
+    assert table.num_rows == 0
+    assert "values" in table.column_names
+
+
+def test_unknown_export_format_is_rejected():
+    headers = {"X-API-Key": _seed(readings=0)}
+    response = client.get(
+        "/api/researcher/raw_sensor_data/export?format=xlsx", headers=headers
+    )
+    assert response.status_code == 400
@@ -0,0 +1,156 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from safedrive.core import etag
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.driving_tip import DrivingTip
+from tests.db_fixtures import (
+    TestingSessionLocal,
+    client,
+    create_api_client,
+    create_tables,
+    drop_tables,
+)
+
+
+@pytest.fixture(autouse=True)
+def prepare_database(monkeypatch):
+    monkeypatch.setattr(etag, "get_redis_client", lambda: None)
+    create_tables()
+    try:
+        yield
+    finally:
+        drop_tables()
+
+
+def _seed_tip(db, driver_id, title="Keep your distance"):
+    tip = DrivingTip(
+        tip_id=uuid4(),
+        title=title,
+        sync=True,
+        date=datetime.utcnow(),
+        profile_id=driver_id,
+    )
+    db.add(tip)
+    db.commit()
+    return tip
+
+
+def _seed_driver(db):
+    driver = DriverProfile(driverProfileId=uuid4(), email="etag@example.com", sync=True)
+    db.add(driver)
+    db.commit()
+    _seed_tip(db, driver.driverProfileId)
+    return driver.driverProfileId
+
+
+def test_etag_matching_rules():
+    tag = etag.compute_etag("a", "b")
+    assert tag.startswith('"') and tag.endswith('"')
+    assert tag == etag.compute_etag("a", "b")
+    assert tag != etag.compute_etag("a", "c")
+    assert etag.etag_matches(tag, tag)
+    assert etag.etag_matches(f'"other", W/{tag}', tag)
+    assert etag.etag_matches("*", tag)
+    assert not etag.etag_matches('"other"', tag)
+    assert not etag.etag_matches(None, tag)
+
+
+def test_version_etag_returns_304_until_table_changes(monkeypatch):
+    monkeypatch.setattr(etag, "ETAG_LOCAL_VERSIONS", True)
+    with TestingSessionLocal() as db:
+        driver_id = _seed_driver(db)
+        admin_key = create_api_client(db, role="admin")
+        other_admin_key = create_api_client(db, role="admin")
+
+    headers = {"X-API-Key": admin_key}
+    first = client.get("/api/driving_tips/", headers=headers)
+    assert first.status_code == 200
+    tag = first.headers["ETag"]
+    assert "Last-Modified" in first.headers
+
+    cached = client.get("/api/driving_tips/", headers={**headers, "If-None-Match": tag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == tag
+
+    other_query = client.get("/api/driving_tips/?limit=5", headers=headers)
+    assert other_query.headers["ETag"] != tag
+
+    other_client = client.get("/api/driving_tips/", headers={"X-API-Key": other_admin_key})
+    assert other_client.headers["ETag"] != tag
+
+    with TestingSessionLocal() as db:
+        _seed_tip(db, driver_id, title="Slow down near schools")
+
+    changed = client.get("/api/driving_tips/", headers={**headers, "If-None-Match": tag})
+    assert changed.status_code == 200
+    assert len(changed.json()) == 2
+    assert changed.headers["ETag"] != tag
+
+    # Last-Modified has one-second resolution; the write above is likely in
+    # the same second, so If-Modified-Since alone must not yield a 304.
+    since = client.get(
+        "/api/driving_tips/",
+        headers={**headers, "If-Modified-Since": first.headers["Last-Modified"]},
+    )
+    assert since.status_code == 200
+    assert len(since.json()) == 2
+
+
+def test_dataset_access_etag_changes_after_update(monkeypatch):
+    monkeypatch.setattr(etag, "ETAG_LOCAL_VERSIONS", True)
+    with TestingSessionLocal() as db:
+        admin_key = create_api_client(db, role="admin")
+
+    headers = {"X-API-Key": admin_key}
+    first = client.get("/api/admin/dataset-access", headers=headers)
+    tag = first.headers["ETag"]
+    assert client.get(
+        "/api/admin/dataset-access", headers={**headers, "If-None-Match": tag}
+    ).status_code == 304
+
+    update = client.put(
+        "/api/admin/dataset-access",
+        json={"datasets": {"behaviour_metrics": ["admin"]}},
+        headers=headers,
+    )
+    assert update.status_code == 200
+
+    refreshed = client.get(
+        "/api/admin/dataset-access", headers={**headers, "If-None-Match": tag}
+    )
+    assert refreshed.status_code == 200
+    assert refreshed.json()["datasets"] == {"behaviour_metrics": ["admin"]}
+
+
+
+def test_preconditions_are_not_evaluated_before_authentication(monkeypatch):
+    monkeypatch.setattr(etag, "ETAG_LOCAL_VERSIONS", True)
+    with TestingSessionLocal() as db:
+        driver_key = create_api_client(db, role="driver", driver_profile_id=uuid4())
+
+    anonymous = client.get("/api/admin/dataset-access", headers={"If-None-Match": "*"})
+    assert anonymous.status_code == 401
+    wrong_role = client.get(
+        "/api/admin/dataset-access", headers={"X-API-Key": driver_key, "If-None-Match": "*"}
+    )
+    assert wrong_role.status_code == 403
+    assert client.get("/api/roads/", headers={"If-None-Match": "*"}).status_code == 401
+
+def test_content_hash_fallback_without_shared_versions(monkeypatch):
+    monkeypatch.setattr(etag, "ETAG_LOCAL_VERSIONS", False)
+    with TestingSessionLocal() as db:
+        _seed_driver(db)
+        admin_key = create_api_client(db, role="admin")
+
+    headers = {"X-API-Key": admin_key}
+    first = client.get("/api/driving_tips/", headers=headers)
+    assert first.status_code == 200
+    tag = first.headers["ETag"]
+
+    cached = client.get("/api/driving_tips/", headers={**headers, "If-None-Match": tag})
+    assert cached.status_code == 304
+    assert cached.content == b""
@@ -0,0 +1,98 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from safedrive.core import security
+from safedrive.core.security import (
+    ApiClientContext,
+    DatasetAccessConfigCache,
+    Role,
+    dataset_access_cache,
+    ensure_dataset_access,
+)
+from safedrive.models.admin_setting import AdminSetting
+from tests.db_fixtures import (
+    TestingSessionLocal,
+    client,
+    create_api_client,
+    create_tables,
+    drop_tables,
+    engine,
+)
+
+RESEARCHER = ApiClientContext(
+    id=None,
+    name="researcher",
+    role=Role.RESEARCHER,
+    driver_profile_id=None,
+    fleet_id=None,
+    insurance_partner_id=None,
+    allowed_driver_ids=None,
+)
+
+
+@pytest.fixture(autouse=True)
+def prepare_database(monkeypatch):
+    monkeypatch.setattr(security, "get_redis_client", lambda: None)
+    create_tables()
+    try:
+        yield
+    finally:
+        drop_tables()
+
+
+def _restrict_trips_export(db):
+    db.add(
+        AdminSetting(
+            key=security.DATASET_ACCESS_SETTING_KEY,
+            value={"datasets": {"researcher_trips_export": ["admin"]}},
+        )
+    )
+    db.commit()
+
+
+def test_dataset_access_is_served_from_memory():
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with TestingSessionLocal() as db:
+        ensure_dataset_access(db, RESEARCHER, "researcher_trips_export")
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            for _ in range(5):
+                ensure_dataset_access(db, RESEARCHER, "researcher_trips_export")
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+    assert statements == []
+
+
+def test_update_is_visible_immediately_in_process():
+    with TestingSessionLocal() as db:
+        admin_key = create_api_client(db, role="admin")
+        ensure_dataset_access(db, RESEARCHER, "researcher_trips_export")
+
+    response = client.put(
+        "/api/admin/dataset-access",
+        json={"datasets": {"researcher_trips_export": ["admin"]}},
+        headers={"X-API-Key": admin_key},
+    )
+    assert response.status_code == 200
+
+    with TestingSessionLocal() as db:
+        with pytest.raises(HTTPException) as exc:
+            ensure_dataset_access(db, RESEARCHER, "researcher_trips_export")
+    assert exc.value.status_code == 403
+
+
+def test_other_workers_refresh_after_recheck_interval():
+    worker = DatasetAccessConfigCache(recheck_seconds=60)
+    with TestingSessionLocal() as db:
+        assert worker.get(db) == security.DEFAULT_DATASET_ACCESS
+        _restrict_trips_export(db)
+        # Another worker's cache is not told about the commit directly.
+        assert worker.get(db) == security.DEFAULT_DATASET_ACCESS
+        worker._next_check = 0.0
+        assert worker.get(db) == {"researcher_trips_export": ["admin"]}
+        assert dataset_access_cache.get(db) == {"researcher_trips_export": ["admin"]}
@@ -0,0 +1,138 @@
+import json
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from safedrive.core import exports
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.insurance_partner import InsurancePartner, InsurancePartnerDriver
+from safedrive.models.nlg_report import NLGReport
+from safedrive.models.raw_sensor_data import RawSensorData
+from safedrive.models.trip import Trip
+from tests.db_fixtures import (
+    TestingSessionLocal,
+    client,
+    create_api_client,
+    create_tables,
+    drop_tables,
+)
+
+
+@pytest.fixture(autouse=True)
+def prepare_database(monkeypatch):
+    monkeypatch.setattr(exports, "EXPORT_CURSOR_LAG_SECONDS", 0)
+    create_tables()
+    try:
+        yield
+    finally:
+        drop_tables()
+
+
+def _add_readings(db, trip_id, timestamps):
+    for timestamp in timestamps:
+        db.add(
+            RawSensorData(
+                id=uuid4(),
+                sensor_type=1,
+                sensor_type_name="accelerometer",
+                values=[0.1, 0.2, 9.8],
+                timestamp=timestamp,
+                date=datetime.utcnow(),
+                accuracy=3,
+                trip_id=trip_id,
+                sync=True,
+            )
+        )
+
+
+def _seed():
+    with TestingSessionLocal() as db:
+        partner = InsurancePartner(name="Delta Insurer", label="delta-insurer", active=True)
+        driver = DriverProfile(driverProfileId=uuid4(), email="delta@example.com", sync=True)
+        db.add_all([partner, driver])
+        db.flush()
+        db.add(InsurancePartnerDriver(partner_id=partner.id, driverProfileId=driver.driverProfileId))
+        trip = Trip(id=uuid4(), driverProfileId=driver.driverProfileId, start_date=datetime.utcnow(), sync=True)
+        db.add(trip)
+        db.add(
+            NLGReport(
+                id=uuid4(),
+                driverProfileId=driver.driverProfileId,
+                report_text="first",
+                generated_at=datetime.utcnow(),
+                sync=True,
+            )
+        )
+        _add_readings(db, trip.id, [1, 2, 3])
+        db.commit()
+        researcher = {"X-API-Key": create_api_client(db, role="researcher")}
+        insurer = {
+            "X-API-Key": create_api_client(db, role="insurance_partner", insurance_partner_id=partner.id)
+        }
+        return researcher, insurer, driver.driverProfileId, trip.id
+
+
+def _timestamps(response):
+    return sorted(json.loads(line)["timestamp"] for line in response.text.splitlines())
+
+
+@pytest.mark.parametrize(
+    "url, role",
+    [
+        ("/api/researcher/raw_sensor_data/export", 0),
+        ("/api/insurance/raw_sensor_data/export", 1),
+    ],
+)
+def test_since_cursor_returns_only_new_and_updated_rows(url, role):
+    keys = _seed()
+    headers, trip_id = keys[role], keys[3]
+
+    full = client.get(url, headers=headers)
+    assert _timestamps(full) == [1, 2, 3]
+    cursor = full.headers[exports.NEXT_CURSOR_HEADER]
+
+    empty = client.get(url, params={"since": cursor}, headers=headers)
+    assert empty.text == ""
+
+    with TestingSessionLocal() as db:
+        _add_readings(db, trip_id, [4, 5])
+        db.query(RawSensorData).filter(RawSensorData.timestamp == 2).one().accuracy = 1
+        db.commit()
+
+    delta = client.get(url, params={"since": cursor}, headers=headers)
+    assert _timestamps(delta) == [2, 4, 5]
+    assert client.get(
+        url, params={"since": delta.headers[exports.NEXT_CURSOR_HEADER]}, headers=headers
+    ).text == ""
+
+
+def test_trip_and_report_exports_accept_since():
+    headers, _, driver_id, trip_id = _seed()
+    cursors = {}
+    for dataset in ("trips", "nlg_reports"):
+        response = client.get(f"/api/researcher/{dataset}/export", headers=headers)
+        assert len(response.text.splitlines()) == 1
+        cursors[dataset] = response.headers[exports.NEXT_CURSOR_HEADER]
+
+    with TestingSessionLocal() as db:
+        db.get(Trip, trip_id).trip_notes = "edited"
+        db.commit()
+
+    trips = client.get("/api/researcher/trips/export", params={"since": cursors["trips"]}, headers=headers)
+    assert [json.loads(line)["tripNotes"] for line in trips.text.splitlines()] == ["edited"]
+    reports = client.get(
+        "/api/researcher/nlg_reports/export",
+        params={"since": cursors["nlg_reports"], "format": "parquet"},
+        headers=headers,
+    )
+    assert reports.status_code == 200
+    assert exports.NEXT_CURSOR_HEADER.lower() in reports.headers
+
+
+def test_invalid_since_cursor_is_rejected():
+    headers = _seed()[0]
+    response = client.get(
+        "/api/researcher/raw_sensor_data/export", params={"since": "not-a-cursor"}, headers=headers
+    )
+    assert response.status_code == 400
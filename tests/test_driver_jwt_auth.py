@@ -0,0 +1,131 @@
+from uuid import uuid4
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from redis.exceptions import RedisError
+from sqlalchemy import event
+
+from safedrive.core import jwt_auth
+from safedrive.core.security import Role, get_current_client_or_driver
+from tests.db_fixtures import (
+    TestingSessionLocal,
+    client,
+    create_tables,
+    drop_tables,
+    engine,
+)
+
+
+@pytest.fixture(autouse=True)
+def prepare_database(monkeypatch):
+    monkeypatch.setattr(jwt_auth, "get_redis_client", lambda: None)
+    create_tables()
+    try:
+        yield
+    finally:
+        drop_tables()
+
+
+def _register(email="jwt.driver@example.com"):
+    response = client.post(
+        "/api/auth/driver/register",
+        json={
+            "driverProfileId": str(uuid4()),
+            "email": email,
+            "password": "s3cret-pass",
+            "sync": True,
+        },
+    )
+    assert response.status_code == 201
+    body = response.json()
+    return body["driver_profile_id"], body["access_token"]
+
+
+def _bearer(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_token_carries_context_claims():
+    driver_id, token = _register()
+    claims = jwt_auth.decode_token(token)
+    assert claims["sub"] == driver_id
+    assert claims["type"] == jwt_auth.DRIVER_TOKEN_TYPE
+    assert claims["jti"] and claims["iat"] <= claims["exp"]
+
+
+def test_jwt_auth_makes_no_database_queries():
+    driver_id, token = _register()
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        with TestingSessionLocal() as db:
+            context = get_current_client_or_driver(
+                api_key=None,
+                credentials=HTTPAuthorizationCredentials(scheme="Bearer", credentials=token),
+                db=db,
+            )
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert statements == []
+    assert context.role == Role.DRIVER
+    assert str(context.driver_profile_id) == driver_id
+    assert context.name == "jwt.driver@example.com"
+
+
+def test_logout_revokes_only_that_token():
+    _, token = _register()
+    login = client.post(
+        "/api/auth/driver/login",
+        json={"email": "jwt.driver@example.com", "password": "s3cret-pass"},
+    )
+    other_token = login.json()["access_token"]
+
+    assert client.get("/api/trips/", headers=_bearer(token)).status_code == 200
+    assert client.post("/api/auth/driver/logout", headers=_bearer(token)).status_code == 204
+    assert client.get("/api/trips/", headers=_bearer(token)).status_code == 401
+    assert client.get("/api/trips/", headers=_bearer(other_token)).status_code == 200
+
+
+def test_deleting_profile_revokes_driver_tokens():
+    driver_id, token = _register()
+    response = client.delete(f"/api/driver_profiles/{driver_id}", headers=_bearer(token))
+    assert response.status_code == 200
+    assert client.get("/api/trips/", headers=_bearer(token)).status_code == 401
+
+
+def test_revocation_lookup_failures_refuse_the_token(monkeypatch):
+    _, token = _register()
+
+    class _UnreachableRedis:
+        def mget(self, *keys):
+            raise RedisError("connection reset")
+
+    monkeypatch.setattr(jwt_auth, "TOKEN_REVOCATION_LOCAL", False)
+    for redis_client in (_UnreachableRedis(), None):
+        monkeypatch.setattr(jwt_auth, "get_redis_client", lambda: redis_client)
+        response = client.get("/api/trips/", headers=_bearer(token))
+        assert response.status_code == 503
+        assert "Retry-After" in response.headers
+
+
+def test_tokens_issued_right_after_a_driver_revocation_stay_valid():
+    driver_id, token = _register()
+    jwt_auth.token_revocations.revoke_driver(driver_id)
+    fresh = jwt_auth.create_access_token(driver_id, "jwt.driver@example.com")
+
+    assert client.get("/api/trips/", headers=_bearer(token)).status_code == 401
+    assert client.get("/api/trips/", headers=_bearer(fresh)).status_code == 200
+
+
+def test_rejects_non_driver_tokens():
+    token = jwt_auth.jwt.encode(
+        {"sub": str(uuid4()), "type": "something_else"},
+        jwt_auth.SECRET_KEY,
+        algorithm=jwt_auth.ALGORITHM,
+    )
+    assert client.get("/api/trips/", headers=_bearer(token)).status_code == 401
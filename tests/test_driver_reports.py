@@ -0,0 +1,246 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from safedrive.core import etag, report_snapshots
+from safedrive.core.driver_reports import build_driver_report
+from safedrive.models.alcohol_questionnaire import AlcoholQuestionnaire
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.insurance_partner import InsurancePartner, InsurancePartnerDriver
+from safedrive.models.location import Location
+from safedrive.models.raw_sensor_data import RawSensorData
+from safedrive.models.trip import Trip
+from safedrive.models.unsafe_behaviour import UnsafeBehaviour
+from tests.db_fixtures import (
+    TestingSessionLocal,
+    client,
+    create_api_client,
+    create_tables,
+    drop_tables,
+    engine,
+)
+
+SENSORS_PER_LOCATION = 3
+
+
+@pytest.fixture(autouse=True)
+def prepare_database():
+    create_tables()
+    try:
+        yield
+    finally:
+        drop_tables()
+
+
+def _add_driver(db, trips):
+    """Each trip: two locations (100 m + 250 m, one speeding), three sensor rows per location and two unsafe events."""
+    driver_id = uuid4()
+    db.add(DriverProfile(driverProfileId=driver_id, email=f"{driver_id}@example.com", sync=True))
+    db.flush()
+    now = datetime.utcnow()
+    for n in range(trips):
+        trip = Trip(id=uuid4(), driverProfileId=driver_id, start_date=now, start_time=1_700_000_000_000 + n, sync=True)
+        db.add(trip)
+        for distance, speed in ((100.0, 30.0), (250.0, 15.0)):
+            location = Location(
+                id=uuid4(),
+                latitude=0.0,
+                longitude=0.0,
+                timestamp=n,
+                date=now,
+                altitude=0.0,
+                speed=speed,
+                speedLimit=20.0,
+                distance=distance,
+                sync=True,
+            )
+            db.add(location)
+            for sensor_type in range(SENSORS_PER_LOCATION):
+                db.add(
+                    RawSensorData(
+                        id=uuid4(),
+                        sensor_type=sensor_type,
+                        sensor_type_name=f"sensor-{sensor_type}",
+                        values=[0.0],
+                        timestamp=n,
+                        date=now,
+                        accuracy=3,
+                        location_id=location.id,
+                        trip_id=trip.id,
+                        sync=True,
+                    )
+                )
+        for severity in (0.4, 0.8):
+            db.add(
+                UnsafeBehaviour(
+                    id=uuid4(),
+                    trip_id=trip.id,
+                    driverProfileId=driver_id,
+                    behaviour_type="hard_brake",
+                    severity=severity,
+                    timestamp=n,
+                )
+            )
+    return driver_id
+
+
+def _count_statements(fn):
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+    return result, len(statements)
+
+
+def test_driver_report_counts_each_location_once():
+    with TestingSessionLocal() as db:
+        driver_id = _add_driver(db, trips=3)
+        db.commit()
+        report = build_driver_report(db, driver_id)
+
+    assert len(report["trips"]) == 3
+    for trip in report["trips"]:
+        assert trip["distance_km"] == pytest.approx(0.35)
+        assert trip["speeding_events"] == 1
+        assert trip["unsafe_count"] == 2
+        assert trip["avg_severity"] == pytest.approx(0.6)
+    assert report["speed_compliance"] == {
+        "total_records": 6,
+        "speeding_events": 3,
+        "compliance_ratio": 0.5,
+    }
+
+
+def test_driver_report_query_count_is_independent_of_trip_count():
+    with TestingSessionLocal() as db:
+        few = _add_driver(db, trips=2)
+        many = _add_driver(db, trips=25)
+        db.commit()
+        _, few_queries = _count_statements(lambda: build_driver_report(db, few))
+        report, many_queries = _count_statements(lambda: build_driver_report(db, many))
+
+    assert len(report["trips"]) == 25
+    assert many_queries == few_queries
+    assert many_queries <= 6
+
+
+def test_insurance_telematics_uses_deduplicated_metrics():
+    with TestingSessionLocal() as db:
+        partner = InsurancePartner(name="Report Insurer", label="report-insurer", active=True)
+        db.add(partner)
+        db.flush()
+        driver_id = _add_driver(db, trips=2)
+        db.add(InsurancePartnerDriver(partner_id=partner.id, driverProfileId=driver_id))
+        db.commit()
+        api_key = create_api_client(db, role="insurance_partner", insurance_partner_id=partner.id)
+
+    headers = {"X-API-Key": api_key}
+    trips = client.get("/api/insurance/telematics/trips", headers=headers).json()["trips"]
+    assert [trip["distance_km"] for trip in trips] == pytest.approx([0.35, 0.35])
+    assert {trip["speed_compliance_ratio"] for trip in trips} == {0.5}
+
+    report = client.get(f"/api/insurance/reports/{driver_id}", headers=headers).json()
+    assert report["speed_compliance"]["total_records"] == 4
+    aggregate = client.get("/api/insurance/reports/aggregate", headers=headers).json()
+    assert aggregate["total_distance_km"] == pytest.approx(0.7)
+    assert aggregate["total_speeding_events"] == 2
+
+
+@pytest.fixture
+def snapshot_versions(monkeypatch):
+    monkeypatch.setattr(etag, "get_redis_client", lambda: None)
+    monkeypatch.setattr(etag, "ETAG_LOCAL_VERSIONS", True)
+    monkeypatch.setattr(report_snapshots, "get_redis_client", lambda: None)
+    report_snapshots.report_snapshots.clear()
+    yield
+    report_snapshots.report_snapshots.clear()
+
+
+def _seed_partner(db, trips_per_driver):
+    label = f"aggregate-{uuid4().hex[:8]}"
+    partner = InsurancePartner(name=label, label=label, active=True)
+    db.add(partner)
+    db.flush()
+    for trips in trips_per_driver:
+        driver_id = _add_driver(db, trips=trips)
+        db.add(InsurancePartnerDriver(partner_id=partner.id, driverProfileId=driver_id))
+        db.add(
+            AlcoholQuestionnaire(
+                id=uuid4(),
+                driverProfileId=driver_id,
+                drankAlcohol=True,
+                selectedAlcoholTypes="beer",
+                beerQuantity="1",
+                wineQuantity="0",
+                spiritsQuantity="0",
+                firstDrinkTime="18:00",
+                lastDrinkTime="19:00",
+                emptyStomach=False,
+                caffeinatedDrink=False,
+                impairmentLevel=1,
+                plansToDrive=False,
+                date=datetime.utcnow(),
+                sync=True,
+            )
+        )
+    db.commit()
+    return create_api_client(db, role="insurance_partner", insurance_partner_id=partner.id)
+
+
+def test_aggregate_report_query_count_is_independent_of_trip_count(monkeypatch):
+    monkeypatch.setattr(etag, "get_redis_client", lambda: None)
+    monkeypatch.setattr(etag, "ETAG_LOCAL_VERSIONS", False)
+    with TestingSessionLocal() as db:
+        few = _seed_partner(db, [1])
+        many = _seed_partner(db, [10, 15])
+
+    url = "/api/insurance/reports/aggregate"
+    for api_key in (few, many):
+        # Warm the per-client auth lookups so only the report is counted.
+        client.get(url, headers={"X-API-Key": api_key})
+    _, few_queries = _count_statements(lambda: client.get(url, headers={"X-API-Key": few}))
+    response, many_queries = _count_statements(
+        lambda: client.get(url, headers={"X-API-Key": many})
+    )
+
+    report = response.json()
+    assert report["total_drivers"] == 2
+    assert report["total_trips"] == 25
+    assert report["total_distance_km"] == pytest.approx(25 * 0.35)
+    assert report["total_unsafe_events"] == 50
+    assert report["avg_unsafe_severity"] == pytest.approx(0.6)
+    assert report["total_speeding_events"] == 25
+    assert report["alcohol_positive_responses"] == 2
+    assert [driver["trip_count"] for driver in report["drivers"]] == [15, 10]
+    assert many_queries == few_queries
+
+
+def test_aggregate_report_snapshot_is_shared_until_a_write(snapshot_versions):
+    with TestingSessionLocal() as db:
+        api_key = _seed_partner(db, [2])
+    headers = {"X-API-Key": api_key}
+    url = "/api/insurance/reports/aggregate"
+
+    first, built_queries = _count_statements(lambda: client.get(url, headers=headers))
+    again, cached_queries = _count_statements(lambda: client.get(url, headers=headers))
+    download, _ = _count_statements(lambda: client.get(f"{url}/download", headers=headers))
+
+    assert cached_queries < built_queries
+    assert again.json() == first.json()
+    assert download.json() == first.json()
+    assert first.json()["total_trips"] == 2
+
+    with TestingSessionLocal() as db:
+        driver_id = db.query(InsurancePartnerDriver.driverProfileId).scalar()
+        db.add(Trip(id=uuid4(), driverProfileId=driver_id, start_date=datetime.utcnow(), sync=True))
+        db.commit()
+
+    assert client.get(url, headers=headers).json()["total_trips"] == 3
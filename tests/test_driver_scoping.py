@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from safedrive.core import auth_cache, security
+from safedrive.core.security import filter_query_by_driver_ids, resolve_api_key
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.fleet import Fleet, OldDriverFleetAssignment
+from safedrive.models.insurance_partner import InsurancePartner, InsurancePartnerDriver
+from safedrive.models.trip import Trip
+from tests.db_fixtures import (
+    TestingSessionLocal,
+    client,
+    create_api_client,
+    create_tables,
+    drop_tables,
+)
+
+
+@pytest.fixture(autouse=True)
+def prepare_database(monkeypatch):
+    monkeypatch.setattr(auth_cache, "get_redis_client", lambda: None)
+    create_tables()
+    try:
+        yield
+    finally:
+        drop_tables()
+
+
+def _add_driver_with_trips(db, trips=2):
+    driver = DriverProfile(driverProfileId=uuid4(), email=f"{uuid4()}@example.com", sync=True)
+    db.add(driver)
+    db.flush()
+    started = datetime.utcnow()
+    for offset in range(trips):
+        start = started - timedelta(hours=offset)
+        db.add(
+            Trip(
+                id=uuid4(),
+                driverProfileId=driver.driverProfileId,
+                start_date=start,
+                start_time=int(start.timestamp() * 1000),
+                sync=True,
+            )
+        )
+    return driver.driverProfileId
+
+
+def _seed_scopes(db, scoped=6, outside=4):
+    fleet = Fleet(name="Scope Fleet", region="Nairobi")
+    partner = InsurancePartner(name="Scope Insurer", label="scope-insurer", active=True)
+    db.add_all([fleet, partner])
+    db.flush()
+    for _ in range(scoped):
+        driver_id = _add_driver_with_trips(db)
+        db.add(OldDriverFleetAssignment(driverProfileId=driver_id, fleet_id=fleet.id))
+        db.add(InsurancePartnerDriver(partner_id=partner.id, driverProfileId=driver_id))
+    for _ in range(outside):
+        _add_driver_with_trips(db)
+    db.commit()
+    fleet_key = create_api_client(db, role="fleet_manager", fleet_id=fleet.id)
+    partner_key = create_api_client(db, role="insurance_partner", insurance_partner_id=partner.id)
+    return fleet_key, partner_key
+
+
+def _scoped_trip_ids(db, context):
+    query = filter_query_by_driver_ids(db.query(Trip.id), Trip.driverProfileId, context)
+    return query, {row[0] for row in query.all()}
+
+
+@pytest.mark.parametrize("role_index", [0, 1])
+def test_subquery_scope_matches_inline_scope(monkeypatch, role_index):
+    with TestingSessionLocal() as db:
+        api_key = _seed_scopes(db)[role_index]
+        context = resolve_api_key(db, api_key)
+
+        monkeypatch.setattr(security, "DRIVER_SCOPE_INLINE_LIMIT", 1000)
+        inline_query, inline_ids = _scoped_trip_ids(db, context)
+        monkeypatch.setattr(security, "DRIVER_SCOPE_INLINE_LIMIT", 0)
+        subquery_query, subquery_ids = _scoped_trip_ids(db, context)
+
+    assert len(inline_ids) == 12
+    assert inline_ids == subquery_ids
+    inline_sql = str(inline_query.statement.compile())
+    subquery_sql = str(subquery_query.statement.compile())
+    assert inline_sql.count("__[POSTCOMPILE") == 1
+    assert "SELECT" in subquery_sql.split("IN", 1)[1]
+    assert "POSTCOMPILE" not in subquery_sql
+
+
+def test_subquery_scope_endpoint_parity(monkeypatch):
+    with TestingSessionLocal() as db:
+        _, partner_key = _seed_scopes(db)
+
+    headers = {"X-API-Key": partner_key}
+    monkeypatch.setattr(security, "DRIVER_SCOPE_INLINE_LIMIT", 1000)
+    inline = client.get("/api/insurance/telematics/trips", headers=headers)
+    monkeypatch.setattr(security, "DRIVER_SCOPE_INLINE_LIMIT", 0)
+    subquery = client.get("/api/insurance/telematics/trips", headers=headers)
+
+    assert inline.status_code == subquery.status_code == 200
+    assert inline.json()["total"] == 12
+    assert inline.json() == subquery.json()
+
+
+def test_small_and_empty_scopes_keep_inline_path(monkeypatch):
+    monkeypatch.setattr(security, "DRIVER_SCOPE_INLINE_LIMIT", 0)
+    with TestingSessionLocal() as db:
+        driver_id = _add_driver_with_trips(db, trips=3)
+        _add_driver_with_trips(db)
+        db.commit()
+        driver_key = create_api_client(db, role="driver", driver_profile_id=driver_id)
+        empty_fleet = Fleet(name="Empty Fleet")
+        db.add(empty_fleet)
+        db.commit()
+        empty_key = create_api_client(db, role="fleet_manager", fleet_id=empty_fleet.id)
+
+        _, driver_trips = _scoped_trip_ids(db, resolve_api_key(db, driver_key))
+        _, empty_trips = _scoped_trip_ids(db, resolve_api_key(db, empty_key))
+
+    assert len(driver_trips) == 3
+    assert empty_trips == set()
@@ -0,0 +1,108 @@
+import gzip
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+import zstandard
+
+from safedrive.core import exports
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.raw_sensor_data import RawSensorData
+from safedrive.models.trip import Trip
+from tests.db_fixtures import (
+    TestingSessionLocal,
+    client,
+    create_api_client,
+    create_tables,
+    drop_tables,
+)
+
+EXPORT_URL = "/api/researcher/raw_sensor_data/export"
+DECOMPRESS = {
+    "gzip": gzip.decompress,
+    "zstd": lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data),
+}
+
+
+@pytest.fixture(autouse=True)
+def prepare_database():
+    create_tables()
+    try:
+        yield
+    finally:
+        drop_tables()
+
+
+def _seed(readings=400):
+    with TestingSessionLocal() as db:
+        driver = DriverProfile(driverProfileId=uuid4(), email="zip@example.com", sync=True)
+        db.add(driver)
+        db.flush()
+        trip = Trip(id=uuid4(), driverProfileId=driver.driverProfileId, start_date=datetime.utcnow(), sync=True)
+        db.add(trip)
+        for n in range(readings):
+            db.add(
+                RawSensorData(
+                    id=uuid4(),
+                    sensor_type=1,
+                    sensor_type_name="accelerometer",
+                    values=[n * 0.5, -1.0, 9.81],
+                    timestamp=n,
+                    date=datetime(2025, 5, 1) + timedelta(seconds=n),
+                    accuracy=3,
+                    trip_id=trip.id,
+                    sync=True,
+                )
+            )
+        db.commit()
+        return {"X-API-Key": create_api_client(db, role="researcher")}
+
+
+def _raw_get(url, headers):
+    # Read the body as sent, without httpx undoing Content-Encoding.
+    with client.stream("GET", url, headers=headers) as response:
+        return response, b"".join(response.iter_raw())
+
+
+@pytest.mark.parametrize("export_format", ["jsonl", "csv"])
+@pytest.mark.parametrize("encoding", ["gzip", "zstd"])
+def test_compressed_streams_match_uncompressed_export(monkeypatch, export_format, encoding):
+    # Small chunks so the compressor is fed many pieces.
+    monkeypatch.setattr(exports, "EXPORT_CHUNK_BYTES", 2048)
+    headers = _seed()
+    url = f"{EXPORT_URL}?format={export_format}"
+    plain, plain_body = _raw_get(url, {**headers, "Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain_body.count(b"\n") >= 400
+
+    download, body = _raw_get(f"{url}&compression={encoding}", headers)
+    assert download.status_code == 200
+    assert "content-encoding" not in download.headers
+    assert download.headers["content-type"] == exports.EXPORT_COMPRESSIONS[encoding][0]
+    extension = exports.EXPORT_COMPRESSIONS[encoding][1]
+    assert download.headers["content-disposition"].endswith(f'.{export_format}.{extension}"')
+    assert len(body) < len(plain_body) / 3
+    assert DECOMPRESS[encoding](body) == plain_body
+
+    negotiated, body = _raw_get(url, {**headers, "Accept-Encoding": encoding})
+    assert negotiated.headers["content-encoding"] == encoding
+    assert negotiated.headers["vary"] == "Accept-Encoding"
+    assert DECOMPRESS[encoding](body) == plain_body
+
+
+def test_negotiate_encoding_honours_quality_values():
+    assert exports.negotiate_encoding(None) is None
+    assert exports.negotiate_encoding("identity") is None
+    assert exports.negotiate_encoding("gzip, deflate, zstd") == "zstd"
+    assert exports.negotiate_encoding("zstd;q=0.5, gzip") == "gzip"
+    assert exports.negotiate_encoding("gzip;q=0, *") == "zstd"
+    assert exports.negotiate_encoding("br, *;q=0.1, zstd;q=0") == "gzip"
+
+
+def test_invalid_compression_is_rejected():
+    headers = _seed(readings=1)
+    assert client.get(f"{EXPORT_URL}?compression=brotli", headers=headers).status_code == 400
+    columnar = client.get(f"{EXPORT_URL}?format=parquet&compression=gzip", headers=headers)
+    assert columnar.status_code == 400
+    plain = client.get(f"{EXPORT_URL}?format=csv&compression=none", headers=headers)
+    assert plain.headers["content-disposition"].endswith('.csv"')
@@ -0,0 +1,258 @@
+import csv
+import gzip
+import hashlib
+import io
+import json
+import os
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+
+from safedrive.core import export_jobs
+from safedrive.core.security import ApiClientContext, Role
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.export_job import ExportJob
+from safedrive.models.insurance_partner import InsurancePartner, InsurancePartnerDriver
+from safedrive.models.raw_sensor_data import RawSensorData
+from safedrive.models.trip import Trip
+from tests.db_fixtures import (
+    TestingSessionLocal,
+    client,
+    create_api_client,
+    create_tables,
+    drop_tables,
+)
+
+JOBS_URL = "/api/researcher/raw_sensor_data/export/jobs"
+
+
+@pytest.fixture(autouse=True)
+def prepare_database(monkeypatch, tmp_path):
+    runner = export_jobs.export_job_runner
+    monkeypatch.setattr(runner, "workers", 0)
+    monkeypatch.setattr(runner, "chunk_rows", 3)
+    monkeypatch.setattr(runner, "storage_dir", str(tmp_path))
+    monkeypatch.setattr(runner, "session_factory", TestingSessionLocal)
+    create_tables()
+    try:
+        yield
+    finally:
+        drop_tables()
+
+
+def _add_driver(db, readings):
+    driver = DriverProfile(driverProfileId=uuid4(), email=f"{uuid4()}@example.com", sync=True)
+    db.add(driver)
+    db.flush()
+    trip = Trip(id=uuid4(), driverProfileId=driver.driverProfileId, start_date=datetime.utcnow(), sync=True)
+    db.add(trip)
+    for n in range(readings):
+        db.add(
+            RawSensorData(
+                id=uuid4(),
+                sensor_type=1,
+                sensor_type_name="accelerometer",
+                values=[n, n + 0.5, -n],
+                timestamp=1_700_000_000_000 + n,
+                date=datetime(2025, 5, 1) + timedelta(seconds=n),
+                accuracy=3,
+                trip_id=trip.id,
+                sync=True,
+            )
+        )
+    return driver.driverProfileId
+
+
+def _seed(readings=7):
+    with TestingSessionLocal() as db:
+        _add_driver(db, readings)
+        db.commit()
+        return create_api_client(db, role="researcher")
+
+
+def _download(job, headers, **extra):
+    return client.get(job["download_url"], headers={**headers, **extra})
+
+
+def test_job_artifact_matches_streamed_export():
+    headers = {"X-API-Key": _seed()}
+    created = client.post(f"{JOBS_URL}?format=jsonl", headers=headers)
+    assert created.status_code == 202
+    job = created.json()
+    assert job["status"] == "completed"
+    assert job["row_count"] == 7
+
+    status = client.get(f"/api/exports/{job['id']}", headers=headers)
+    assert status.json()["checksum"] == job["checksum"]
+
+    artifact = _download(job, headers)
+    assert artifact.status_code == 200
+    assert artifact.headers["accept-ranges"] == "bytes"
+    assert hashlib.sha256(artifact.content).hexdigest() == job["checksum"]
+    assert artifact.headers["x-checksum-sha256"] == job["checksum"]
+
+    streamed = client.get(
+        "/api/researcher/raw_sensor_data/export?format=jsonl", headers=headers
+    )
+    assert gzip.decompress(artifact.content).decode("utf-8") == streamed.text
+
+    manifest = client.get(f"/api/exports/{job['id']}/manifest", headers=headers).json()
+    assert [chunk["rows"] for chunk in manifest["chunks"]] == [3, 3, 1]
+    assert manifest["sha256"] == job["checksum"]
+
+
+def test_download_supports_range_requests():
+    headers = {"X-API-Key": _seed()}
+    job = client.post(JOBS_URL, headers=headers).json()
+    full = _download(job, headers).content
+
+    tail = _download(job, headers, Range="bytes=20-")
+    assert tail.status_code == 206
+    assert tail.headers["content-range"] == f"bytes 20-{len(full) - 1}/{len(full)}"
+    assert tail.content == full[20:]
+
+    unsatisfiable = _download(job, headers, Range=f"bytes={len(full) + 10}-")
+    assert unsatisfiable.status_code == 416
+
+
+def test_identical_requests_share_a_job():
+    headers = {"X-API-Key": _seed()}
+    first = client.post(f"{JOBS_URL}?sensorType=1", headers=headers).json()
+    again = client.post(f"{JOBS_URL}?sensorType=1", headers=headers).json()
+    other = client.post(f"{JOBS_URL}?sensorType=2", headers=headers).json()
+
+    assert first["id"] == again["id"]
+    assert other["id"] != first["id"]
+    assert other["row_count"] == 0
+
+    with TestingSessionLocal() as db:
+        stranger = create_api_client(db, role="researcher")
+    stranger_headers = {"X-API-Key": stranger}
+    assert client.get(f"/api/exports/{first['id']}", headers=stranger_headers).status_code == 404
+    own = client.post(f"{JOBS_URL}?sensorType=1", headers=stranger_headers).json()
+    assert own["id"] != first["id"]
+
+
+class _WorkerDied(BaseException):
+    pass
+
+
+def test_interrupted_job_resumes_from_manifest(monkeypatch):
+    headers = {"X-API-Key": _seed()}
+    encode_chunk = export_jobs._encode_chunk
+    calls = []
+
+    def _crash_on_second_chunk(*args):
+        calls.append(1)
+        if len(calls) == 2:
+            raise _WorkerDied()
+        return encode_chunk(*args)
+
+    monkeypatch.setattr(export_jobs, "_encode_chunk", _crash_on_second_chunk)
+    with pytest.raises(_WorkerDied):
+        client.post(JOBS_URL, headers=headers)
+
+    with TestingSessionLocal() as db:
+        job = db.query(ExportJob).one()
+        assert job.status == "running"
+        assert job.row_count == 3
+        job.updated_at = datetime.utcnow() - timedelta(hours=1)
+        db.commit()
+
+    monkeypatch.setattr(export_jobs, "_encode_chunk", encode_chunk)
+    resumed = client.post(JOBS_URL, headers=headers).json()
+    assert resumed["status"] == "completed"
+    assert resumed["row_count"] == 7
+
+    lines = gzip.decompress(_download(resumed, headers).content).decode().splitlines()
+    timestamps = [json.loads(line)["timestamp"] for line in lines]
+    assert timestamps == [1_700_000_000_000 + n for n in range(7)]
+
+
+def test_expired_artifacts_are_removed_and_rebuilt():
+    headers = {"X-API-Key": _seed()}
+    job = client.post(JOBS_URL, headers=headers).json()
+    with TestingSessionLocal() as db:
+        stored = db.get(ExportJob, UUID(job["id"]))
+        stored.expires_at = datetime.utcnow() - timedelta(seconds=1)
+        artifact_path = stored.artifact_path
+        db.commit()
+
+    assert _download(job, headers).status_code == 410
+    rebuilt = client.post(JOBS_URL, headers=headers).json()
+    assert rebuilt["id"] != job["id"]
+    assert not os.path.exists(artifact_path)
+    assert client.get(f"/api/exports/{job['id']}", headers=headers).json()["status"] == "expired"
+
+
+def test_insurance_csv_job_is_scoped_to_partner_drivers():
+    with TestingSessionLocal() as db:
+        partner = InsurancePartner(name="Jobs Insurer", label="jobs-insurer", active=True)
+        db.add(partner)
+        db.flush()
+        covered = _add_driver(db, readings=4)
+        _add_driver(db, readings=5)
+        db.add(InsurancePartnerDriver(partner_id=partner.id, driverProfileId=covered))
+        db.commit()
+        api_key = create_api_client(db, role="insurance_partner", insurance_partner_id=partner.id)
+
+    headers = {"X-API-Key": api_key}
+    job = client.post(
+        "/api/insurance/raw_sensor_data/export/jobs?format=csv", headers=headers
+    ).json()
+    assert job["row_count"] == 4
+
+    text = gzip.decompress(_download(job, headers).content).decode("utf-8")
+    rows = list(csv.reader(io.StringIO(text)))
+    assert rows[0][0] == "id"
+    assert len(rows) == 5
+    assert {row[1] for row in rows[1:]} == {str(covered)}
+
+
+
+def test_stale_job_is_resumed_by_exactly_one_claim(monkeypatch):
+    headers = {"X-API-Key": _seed()}
+    encode_chunk = export_jobs._encode_chunk
+
+    def _crash(*args):
+        raise _WorkerDied()
+
+    monkeypatch.setattr(export_jobs, "_encode_chunk", _crash)
+    with pytest.raises(_WorkerDied):
+        client.post(JOBS_URL, headers=headers)
+    monkeypatch.setattr(export_jobs, "_encode_chunk", encode_chunk)
+
+    with TestingSessionLocal() as db:
+        job = db.query(ExportJob).one()
+        job.updated_at = datetime.utcnow() - timedelta(hours=1)
+        db.commit()
+        job_id, orphaned_lease = job.id, job.lease_id
+
+    # Two requests read the same stale job before either claims it.
+    with TestingSessionLocal() as first, TestingSessionLocal() as second:
+        seen_first = first.get(ExportJob, job_id)
+        seen_second = second.get(ExportJob, job_id)
+        lease = export_jobs.claim_export_job(first, seen_first)
+        assert lease is not None
+        assert export_jobs.claim_export_job(second, seen_second) is None
+
+    context = ApiClientContext(
+        id=uuid4(),
+        name="claim-test",
+        role=Role.RESEARCHER,
+        driver_profile_id=None,
+        fleet_id=None,
+        insurance_partner_id=None,
+        allowed_driver_ids=None,
+    )
+    runner = export_jobs.export_job_runner
+    # The runner whose lease was taken over writes nothing.
+    runner.run(job_id, context, orphaned_lease)
+    with TestingSessionLocal() as db:
+        assert db.get(ExportJob, job_id).status == "running"
+    runner.run(job_id, context, lease)
+    with TestingSessionLocal() as db:
+        resumed = db.get(ExportJob, job_id)
+        assert resumed.status == "completed"
+        assert resumed.row_count == 7
@@ -0,0 +1,201 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import create_engine, insert
+
+from safedrive.database.base import Base
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.raw_sensor_data import RawSensorData
+from safedrive.models.trip import Trip
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXPORT_ROWS = 100_000
+# Peak RSS growth allowed while exporting. Materializing the export as ORM
+# objects (or buffering the result) costs several times this.
+MAX_RSS_GROWTH_MB = 40
+
+_EXPORT_SCRIPT = textwrap.dedent(
+    """
+    import json
+    import resource
+    import sys
+    from uuid import uuid4
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    import safedrive.api.v1.endpoints.researcher  # registers the export datasets
+    from safedrive.core import export_jobs
+    from safedrive.core.security import ApiClientContext, Role
+    from safedrive.models.export_job import ExportJob
+
+    engine = create_engine(sys.argv[1])
+    SessionLocal = sessionmaker(bind=engine, autoflush=False)
+    context = ApiClientContext(
+        id=uuid4(),
+        name="rss-test",
+        role=Role.ADMIN,
+        driver_profile_id=None,
+        fleet_id=None,
+        insurance_partner_id=None,
+        allowed_driver_ids=None,
+    )
+    runner = export_jobs.ExportJobRunner(
+        workers=0, storage_dir=sys.argv[2], chunk_rows=5000, session_factory=SessionLocal
+    )
+    with SessionLocal() as db:
+        job = ExportJob(
+            dataset="researcher_raw_sensor_export",
+            export_format="jsonl",
+            params={},
+            params_hash="rss",
+            status="pending",
+            lease_id=uuid4(),
+        )
+        db.add(job)
+        db.commit()
+        job_id, lease = job.id, job.lease_id
+
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    runner.run(job_id, context, lease)
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    with SessionLocal() as db:
+        job = db.get(ExportJob, job_id)
+        print(json.dumps({"status": job.status, "rows": job.row_count, "growth_kb": after - before}))
+    """
+)
+
+_STREAM_SCRIPT = textwrap.dedent(
+    """
+    import asyncio
+    import json
+    import resource
+    import sys
+    from uuid import uuid4
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from safedrive.api.v1.endpoints import researcher
+    from safedrive.core.security import ApiClientContext, Role
+
+    engine = create_engine(sys.argv[1])
+    SessionLocal = sessionmaker(bind=engine, autoflush=False)
+    context = ApiClientContext(
+        id=uuid4(),
+        name="rss-test",
+        role=Role.ADMIN,
+        driver_profile_id=None,
+        fleet_id=None,
+        insurance_partner_id=None,
+        allowed_driver_ids=None,
+    )
+
+
+    async def drain(response):
+        lines = 0
+        async for chunk in response.body_iterator:
+            lines += chunk.count(b"\\n")
+        return lines
+
+
+    with SessionLocal() as db:
+        before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # The GET /researcher/raw_sensor_data/export handler, body drained
+        # as the server would send it.
+        response = researcher.export_raw_sensor_data(
+            driver_profile_id=None,
+            trip_id=None,
+            sensor_type=None,
+            sensor_type_name=None,
+            start_timestamp=None,
+            end_timestamp=None,
+            start_date=None,
+            end_date=None,
+            week=None,
+            since=None,
+            export_format="jsonl",
+            compression=None,
+            accept_encoding=None,
+            db=db,
+            current_client=context,
+        )
+        lines = asyncio.run(drain(response))
+        after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"rows": lines, "growth_kb": after - before}))
+    """
+)
+
+
+def _seed(database_url, rows):
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    started = datetime(2025, 1, 1)
+    with engine.begin() as conn:
+        driver_id, trip_id = uuid4(), uuid4()
+        conn.execute(
+            insert(DriverProfile),
+            [{"driverProfileId": driver_id, "email": "rss@example.com", "sync": True}],
+        )
+        conn.execute(
+            insert(Trip),
+            [{"id": trip_id, "driverProfileId": driver_id, "start_date": started, "sync": True}],
+        )
+        for offset in range(0, rows, 10_000):
+            conn.execute(
+                insert(RawSensorData),
+                [
+                    {
+                        "id": uuid4(),
+                        "sensor_type": 1,
+                        "sensor_type_name": "accelerometer",
+                        "values": [n * 0.01, -n * 0.02, 9.81],
+                        "timestamp": n,
+                        "date": started + timedelta(milliseconds=n),
+                        "accuracy": 3,
+                        "trip_id": trip_id,
+                        "sync": True,
+                    }
+                    for n in range(offset, min(offset + 10_000, rows))
+                ],
+            )
+    engine.dispose()
+
+
+def _run(script, database_url, *args):
+    result = subprocess.run(
+        [sys.executable, "-c", script, database_url, *args],
+        cwd=ROOT,
+        env={**os.environ, "DATABASE_URL": database_url},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_large_export_keeps_peak_rss_flat(tmp_path):
+    database_url = f"sqlite:///{tmp_path / 'export.db'}"
+    _seed(database_url, EXPORT_ROWS)
+    storage = tmp_path / "artifacts"
+
+    report = _run(_EXPORT_SCRIPT, database_url, str(storage))
+
+    assert report["status"] == "completed"
+    assert report["rows"] == EXPORT_ROWS
+    assert report["growth_kb"] / 1024 < MAX_RSS_GROWTH_MB
+
+
+def test_streamed_export_keeps_peak_rss_flat(tmp_path):
+    database_url = f"sqlite:///{tmp_path / 'export.db'}"
+    _seed(database_url, EXPORT_ROWS)
+
+    report = _run(_STREAM_SCRIPT, database_url)
+
+    assert report["rows"] == EXPORT_ROWS
+    assert report["growth_kb"] / 1024 < MAX_RSS_GROWTH_MB
@@ -0,0 +1,105 @@
+import csv
+import io
+import json
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from safedrive.core import exports
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.insurance_partner import InsurancePartner, InsurancePartnerDriver
+from safedrive.models.raw_sensor_data import RawSensorData
+from safedrive.models.trip import Trip
+from tests.db_fixtures import (
+    TestingSessionLocal,
+    client,
+    create_api_client,
+    create_tables,
+    drop_tables,
+)
+
+
+@pytest.fixture(autouse=True)
+def prepare_database():
+    create_tables()
+    try:
+        yield
+    finally:
+        drop_tables()
+
+
+def _payloads(count):
+    return [
+        {
+            "id": uuid4(),
+            "date": datetime(2025, 2, 3, 4, 5, 6, 789000),
+            "values": [n * 0.5, -1.0, 9.81],
+            "note": f"row, {n}",
+        }
+        for n in range(count)
+    ]
+
+
+def test_jsonl_chunks_batch_rows_and_round_trip():
+    payloads = _payloads(2000)
+    chunks = list(exports.jsonl_chunks(payloads, chunk_bytes=8192))
+
+    assert 1 < len(chunks) < 100
+    assert all(chunk.endswith(b"\n") for chunk in chunks)
+    assert all(len(chunk) < 8192 + 512 for chunk in chunks)
+    decoded = [json.loads(line) for line in b"".join(chunks).splitlines()]
+    assert len(decoded) == 2000
+    assert decoded[7]["id"] == str(payloads[7]["id"])
+    assert datetime.fromisoformat(decoded[7]["date"]) == payloads[7]["date"]
+    assert decoded[7]["values"] == payloads[7]["values"]
+
+
+def test_csv_chunks_match_csv_writer():
+    rows = [[p["id"], p["note"], exports.json_cell(p["values"])] for p in _payloads(1500)]
+    header = ["id", "note", "values"]
+    chunks = list(exports.csv_chunks(header, iter(rows), chunk_bytes=4096))
+
+    expected = io.StringIO()
+    writer = csv.writer(expected)
+    writer.writerow(header)
+    writer.writerows(rows)
+    assert len(chunks) > 1
+    assert b"".join(chunks).decode("utf-8") == expected.getvalue()
+    assert list(exports.csv_chunks(header, iter([]))) == [b"id,note,values\r\n"]
+
+
+def test_insurance_csv_export_quotes_sensor_values():
+    with TestingSessionLocal() as db:
+        partner = InsurancePartner(name="Csv Insurer", label="csv-insurer", active=True)
+        driver = DriverProfile(driverProfileId=uuid4(), email="csv@example.com", sync=True)
+        db.add_all([partner, driver])
+        db.flush()
+        trip = Trip(id=uuid4(), driverProfileId=driver.driverProfileId, start_date=datetime.utcnow(), sync=True)
+        db.add(trip)
+        db.add(InsurancePartnerDriver(partner_id=partner.id, driverProfileId=driver.driverProfileId))
+        db.add(
+            RawSensorData(
+                id=uuid4(),
+                sensor_type=1,
+                sensor_type_name="accelerometer",
+                values=[0.25, -1.5, 9.75],
+                timestamp=1,
+                date=datetime.utcnow(),
+                accuracy=3,
+                trip_id=trip.id,
+                sync=True,
+            )
+        )
+        db.commit()
+        driver_id = driver.driverProfileId
+        api_key = create_api_client(db, role="insurance_partner", insurance_partner_id=partner.id)
+
+    response = client.get(
+        "/api/insurance/raw_sensor_data/export?format=csv", headers={"X-API-Key": api_key}
+    )
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 1
+    assert json.loads(rows[0]["values"]) == [0.25, -1.5, 9.75]
+    assert rows[0]["driverProfileId"] == str(driver_id)
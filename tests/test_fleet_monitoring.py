@@ -1,24 +1,36 @@
+import asyncio
+import re
 from datetime import datetime, timedelta
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import event
 
+from safedrive.api.v1.endpoints import fleet_monitoring
+from safedrive.core import driver_monitor
+from safedrive.core.driver_reports import driver_metrics
+from safedrive.crud.raw_sensor_data import raw_sensor_data_crud
 from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.driver_speed_stats import DriverSpeedStats
 from safedrive.models.location import Location
 from safedrive.models.raw_sensor_data import RawSensorData
 from safedrive.models.trip import Trip
 from safedrive.models.unsafe_behaviour import UnsafeBehaviour
+from safedrive.schemas.raw_sensor_data import RawSensorDataCreate
 from tests.db_fixtures import (
     client,
     TestingSessionLocal,
     create_api_client,
     create_tables,
     drop_tables,
+    engine,
 )
 
 
 @pytest.fixture(autouse=True)
-def prepare_database():
+def prepare_database(monkeypatch):
+    monkeypatch.setattr(driver_monitor, "get_redis_client", lambda: None)
+    driver_monitor.driver_monitor_counters.clear()
     create_tables()
     try:
         yield
@@ -161,3 +173,189 @@ def test_driver_monitor_endpoint():
     assert payload["speedingCount"] == 1
     assert len(payload["recentUnsafeBehaviours"]) == 2
 
+    assert payload["recentUnsafeBehavioursNextCursor"] is None
+
+
+def _add_behaviours(db, driver_id, count, start_ms):
+    for n in range(count):
+        db.add(
+            UnsafeBehaviour(
+                id=uuid4(),
+                driverProfileId=driver_id,
+                behaviour_type="harsh_acceleration",
+                severity=0.5,
+                timestamp=start_ms - n * 1000,
+                date=datetime.utcnow(),
+            )
+        )
+    db.commit()
+
+
+def _monitor(driver_id, api_key, **params):
+    return client.get(
+        f"/api/fleet/driver_monitor/{driver_id}",
+        params=params,
+        headers={"X-API-Key": api_key},
+    ).json()
+
+
+def test_driver_monitor_pages_recent_behaviours():
+    with TestingSessionLocal() as db:
+        driver_id = _seed_driver_data(db).driverProfileId
+        now_ms = int(datetime.utcnow().timestamp() * 1000)
+        _add_behaviours(db, driver_id, 3, now_ms - 5000)
+        api_key = create_api_client(db, role="admin")
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        page = _monitor(driver_id, api_key, **params)
+        assert len(page["recentUnsafeBehaviours"]) <= 2
+        seen.extend(page["recentUnsafeBehaviours"])
+        cursor = page["recentUnsafeBehavioursNextCursor"]
+        if cursor is None:
+            break
+
+    timestamps = [item["timestamp"] for item in seen]
+    assert len(seen) == 5
+    assert len({item["id"] for item in seen}) == 5
+    assert timestamps == sorted(timestamps, reverse=True)
+
+    bad = client.get(
+        f"/api/fleet/driver_monitor/{driver_id}?cursor=not-a-cursor",
+        headers={"X-API-Key": api_key},
+    )
+    assert bad.status_code == 400
+
+
+def test_driver_monitor_keeps_sync_helpers_off_the_event_loop(monkeypatch):
+    with TestingSessionLocal() as db:
+        driver_id = _seed_driver_data(db).driverProfileId
+        db.commit()
+        api_key = create_api_client(db, role="admin")
+
+    on_loop = []
+
+    def _recording(helper):
+        def _call(*args):
+            try:
+                asyncio.get_running_loop()
+                on_loop.append(True)
+            except RuntimeError:
+                on_loop.append(False)
+            return helper(*args)
+
+        return _call
+
+    monkeypatch.setattr(
+        fleet_monitoring,
+        "ensure_dataset_access",
+        _recording(fleet_monitoring.ensure_dataset_access),
+    )
+    monkeypatch.setattr(
+        driver_monitor.driver_monitor_counters,
+        "counters",
+        _recording(driver_monitor.driver_monitor_counters.counters),
+    )
+    assert _monitor(driver_id, api_key)["driverProfileId"] == str(driver_id)
+    assert on_loop == [False, False]
+
+
+def test_driver_monitor_counters_follow_ingestion_without_rescanning():
+    with TestingSessionLocal() as db:
+        driver_id = _seed_driver_data(db).driverProfileId
+        api_key = create_api_client(db, role="admin")
+    assert _monitor(driver_id, api_key)["unsafeBehaviourCount"] == 2
+
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    now_ms = int(datetime.utcnow().timestamp() * 1000)
+    with TestingSessionLocal() as db:
+        _add_behaviours(db, driver_id, 40, now_ms)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        payload = _monitor(driver_id, api_key)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert payload["unsafeBehaviourCount"] == 42
+    assert payload["unsafeBehaviourLast24h"] == 41
+    assert payload["speedingCount"] == 1
+    assert len(payload["recentUnsafeBehaviours"]) == 20
+    assert not any("count(" in statement.lower() for statement in statements)
+    # No scan of the location table (its counts come from driver_speed_stats).
+    assert not any(re.search(r"\blocation\b", statement) for statement in statements)
+
+
+def test_speed_totals_are_kept_at_ingest_and_seeded_from_their_row():
+    with TestingSessionLocal() as db:
+        driver = _seed_driver_data(db)
+        driver_id = driver.driverProfileId
+        trip_id = db.query(Trip.id).filter(Trip.driverProfileId == driver_id).first()[0]
+        api_key = create_api_client(db, role="admin")
+    assert _monitor(driver_id, api_key)["speedingCount"] == 1
+
+    now_ms = int(datetime.utcnow().timestamp() * 1000)
+    with TestingSessionLocal() as db:
+        locations = [
+            Location(
+                id=uuid4(),
+                latitude=1.0,
+                longitude=1.0,
+                timestamp=now_ms + 2000 + n,
+                date=datetime.utcnow(),
+                altitude=100.0,
+                speed=speed,
+                speedLimit=20.0,
+                distance=10.0,
+                sync=False,
+            )
+            for n, speed in enumerate((30.0, 10.0, 35.0))
+        ]
+        db.add_all(locations)
+        db.commit()
+        rows = [
+            RawSensorDataCreate(
+                id=uuid4(),
+                sensor_type=sensor_type,
+                sensor_type_name="accelerometer",
+                values=[0.0],
+                timestamp=location.timestamp,
+                accuracy=3,
+                location_id=location.id,
+                trip_id=trip_id,
+            )
+            # Several sensor rows per location; each location counts once.
+            for location in locations
+            for sensor_type in (1, 2)
+        ]
+        raw_sensor_data_crud.batch_create(db, rows[:3])
+        raw_sensor_data_crud.batch_create(db, rows[3:])
+
+        stats = db.get(DriverSpeedStats, driver_id)
+        expected = driver_metrics(db, [Trip.driverProfileId == driver_id])[driver_id]
+        assert (stats.location_count, stats.speeding_count) == (
+            expected.location_count,
+            expected.speeding_events,
+        )
+        assert (stats.location_count, stats.speeding_count) == (5, 3)
+
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    driver_monitor.driver_monitor_counters.clear()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        payload = _monitor(driver_id, api_key)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert payload["speedingCount"] == 3
+    # No scan of the location table (its counts come from driver_speed_stats).
+    assert not any(re.search(r"\blocation\b", statement) for statement in statements)
@@ -0,0 +1,137 @@
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from safedrive.core.partitions import (
+    epoch_ms,
+    partition_bound,
+    partition_clause,
+    plan_rotation,
+    rotate_partitions,
+)
+from safedrive.crud.trip import trip_crud
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.location import Location
+from safedrive.models.raw_sensor_data import RawSensorData
+from safedrive.models.trip import Trip
+from tests.db_fixtures import (
+    TestingSessionLocal,
+    client,
+    create_api_client,
+    create_tables,
+    drop_tables,
+    engine,
+)
+
+
+@pytest.fixture(autouse=True)
+def prepare_database():
+    create_tables()
+    try:
+        yield
+    finally:
+        drop_tables()
+
+
+def test_rotation_adds_months_ahead_and_expires_past_retention():
+    existing = ["p202604", "p202605", "p202606", "p202607", "p202608", "pmax"]
+    plan = plan_rotation(
+        "raw_sensor_data", existing, date(2026, 7, 19), months_ahead=3, retention_months=2
+    )
+    assert plan.create == [date(2026, 9, 1), date(2026, 10, 1)]
+    assert plan.expire == [date(2026, 4, 1)]
+
+    settled = plan_rotation(
+        "raw_sensor_data", existing + ["p202609", "p202610"], date(2026, 7, 31),
+        months_ahead=3, retention_months=0,
+    )
+    assert settled.create == [] and settled.expire == []
+
+
+def test_partition_bounds_are_month_starts_across_years():
+    assert partition_bound(date(2026, 12, 1)) == epoch_ms(datetime(2027, 1, 1))
+    assert partition_clause(date(2026, 12, 1)) == (
+        f"PARTITION p202612 VALUES LESS THAN ({epoch_ms(datetime(2027, 1, 1))})"
+    )
+
+
+def test_rotation_is_a_no_op_without_mysql():
+    assert rotate_partitions(engine, retention_months=1) == []
+    with pytest.raises(ValueError):
+        rotate_partitions(engine, action="truncate")
+
+
+def _add_sensor_row(db, trip_id, recorded: datetime):
+    location = Location(
+        id=uuid4(),
+        latitude=0.0,
+        longitude=0.0,
+        timestamp=epoch_ms(recorded),
+        date=recorded,
+        altitude=0.0,
+        speed=10.0,
+        speedLimit=50.0,
+        distance=100.0,
+        sync=True,
+    )
+    db.add(location)
+    db.add(
+        RawSensorData(
+            id=uuid4(),
+            sensor_type=1,
+            sensor_type_name="accelerometer",
+            values=[0.0],
+            timestamp=location.timestamp,
+            date=recorded,
+            accuracy=3,
+            location_id=location.id,
+            trip_id=trip_id,
+            sync=True,
+        )
+    )
+
+
+def test_date_filtered_summary_bounds_timestamp():
+    now = datetime.utcnow().replace(microsecond=0)
+    with TestingSessionLocal() as db:
+        driver_id, trip_id = uuid4(), uuid4()
+        db.add(DriverProfile(driverProfileId=driver_id, email=f"{driver_id}@example.com", sync=True))
+        db.add(Trip(id=trip_id, driverProfileId=driver_id, start_date=now, sync=True))
+        _add_sensor_row(db, trip_id, now - timedelta(days=90))
+        _add_sensor_row(db, trip_id, now - timedelta(hours=1))
+        db.commit()
+        api_key = create_api_client(db, role="researcher")
+
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM raw_sensor_data" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        response = client.get(
+            "/api/researcher/raw_sensor_data/summary",
+            params={"startDate": (now - timedelta(days=7)).isoformat()},
+            headers={"X-API-Key": api_key},
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert response.status_code == 200
+    assert response.json()[0]["total"] == 1
+    assert "raw_sensor_data.timestamp >=" in statements[-1]
+
+
+def test_trip_batch_delete_removes_sensor_rows():
+    with TestingSessionLocal() as db:
+        driver_id, trip_id = uuid4(), uuid4()
+        db.add(DriverProfile(driverProfileId=driver_id, email=f"{driver_id}@example.com", sync=True))
+        db.add(Trip(id=trip_id, driverProfileId=driver_id, start_date=datetime.utcnow(), sync=True))
+        _add_sensor_row(db, trip_id, datetime.utcnow())
+        db.commit()
+
+        trip_crud.batch_delete(db, [trip_id])
+        assert db.query(RawSensorData).count() == 0
@@ -0,0 +1,96 @@
+from uuid import uuid4
+
+import pytest
+
+from safedrive.core import passwords
+from safedrive.models.driver_profile import DriverProfile
+from tests.db_fixtures import TestingSessionLocal, client, create_tables, drop_tables
+
+EMAIL = "hash.driver@example.com"
+PASSWORD = "correct-horse"
+
+
+@pytest.fixture(autouse=True)
+def prepare_database(monkeypatch):
+    monkeypatch.setattr(passwords, "get_redis_client", lambda: None)
+    monkeypatch.setattr(
+        passwords, "password_hasher", passwords.PasswordHasher(workers=0, rounds=5)
+    )
+    monkeypatch.setattr(passwords.login_throttle, "max_attempts", 3)
+    monkeypatch.setattr(passwords.login_throttle, "_failures", {})
+    create_tables()
+    try:
+        yield
+    finally:
+        drop_tables()
+
+
+def _seed_driver(rounds):
+    with TestingSessionLocal() as db:
+        driver = DriverProfile(
+            driverProfileId=uuid4(),
+            email=EMAIL,
+            password_hash=passwords.build_context(rounds).hash(PASSWORD),
+            sync=True,
+        )
+        db.add(driver)
+        db.commit()
+        return driver.driverProfileId
+
+
+def _stored_hash(driver_id):
+    with TestingSessionLocal() as db:
+        return db.get(DriverProfile, driver_id).password_hash
+
+
+def _login(password=PASSWORD):
+    return client.post("/api/auth/driver/login", json={"email": EMAIL, "password": password})
+
+
+def test_process_pool_hash_round_trip():
+    hasher = passwords.PasswordHasher(workers=1, rounds=4)
+    try:
+        hashed = hasher.hash(PASSWORD)
+        assert hashed.startswith("$2b$04$")
+        # Never forked from the threaded server process.
+        assert hasher._get_pool()._mp_context.get_start_method() == "spawn"
+        assert hasher.verify_and_update(PASSWORD, hashed) == (True, None)
+        assert hasher.verify_and_update("wrong", hashed) == (False, None)
+    finally:
+        hasher.shutdown()
+
+
+def test_login_rehashes_when_cost_changes():
+    driver_id = _seed_driver(rounds=4)
+    assert _login().status_code == 200
+    rehashed = _stored_hash(driver_id)
+    assert rehashed.startswith("$2b$05$")
+
+    assert _login().status_code == 200
+    assert _stored_hash(driver_id) == rehashed
+
+
+def test_failed_attempts_are_throttled_per_email():
+    _seed_driver(rounds=5)
+    for _ in range(3):
+        assert _login("wrong-password").status_code == 401
+
+    throttled = _login()
+    assert throttled.status_code == 429
+    assert "Retry-After" in throttled.headers
+
+    other = client.post(
+        "/api/auth/driver/login",
+        json={"email": "someone.else@example.com", "password": "x" * 8},
+    )
+    assert other.status_code == 401
+
+
+def test_successful_login_resets_failures():
+    _seed_driver(rounds=5)
+    for _ in range(2):
+        assert _login("wrong-password").status_code == 401
+    assert _login().status_code == 200
+    for _ in range(2):
+        assert _login("wrong-password").status_code == 401
+    assert _login().status_code == 200
@@ -0,0 +1,74 @@
+import logging
+
+import pytest
+from sqlalchemy import text
+
+from safedrive.database import query_log
+from safedrive.database.query_log import QueryStats, redact_statement
+from tests.db_fixtures import (
+    TestingSessionLocal,
+    client,
+    create_api_client,
+    create_tables,
+    drop_tables,
+)
+
+
+@pytest.fixture(autouse=True)
+def prepare_database():
+    create_tables()
+    try:
+        yield
+    finally:
+        drop_tables()
+
+
+def test_redaction_drops_literals_and_folds_placeholder_lists():
+    statement = (
+        "SELECT trip.id FROM trip WHERE trip.influence = 'alcohol' AND trip.start_time > 1700000000000\n"
+        "  AND trip.id IN (?, ?, ?, ?, ?, ?) AND trip_2.sync = ?"
+    )
+    assert redact_statement(statement) == (
+        "SELECT trip.id FROM trip WHERE trip.influence = ? AND trip.start_time > ? "
+        "AND trip.id IN (?, ...) AND trip_2.sync = ?"
+    )
+    assert redact_statement("SELECT 'x'", max_chars=6) == "SELECT..."
+
+
+def test_only_slow_statements_are_logged_with_request_id(monkeypatch, caplog):
+    stats = QueryStats(request_id="req-1")
+    token = query_log._current_stats.set(stats)
+    try:
+        with caplog.at_level(logging.INFO, logger=query_log.logger.name):
+            with TestingSessionLocal() as db:
+                monkeypatch.setattr(query_log, "SLOW_QUERY_MS", 10_000.0)
+                db.execute(text("SELECT 'fast'"))
+                monkeypatch.setattr(query_log, "SLOW_QUERY_MS", 0.0)
+                db.execute(text("SELECT 'secret' AS value"))
+    finally:
+        query_log._current_stats.reset(token)
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert len(messages) == 1
+    assert messages[0].startswith("Slow query ")
+    assert "request=req-1" in messages[0]
+    assert "SELECT ? AS value" in messages[0]
+    assert "secret" not in messages[0]
+    assert stats.count == 2
+
+
+def test_requests_report_query_totals():
+    with TestingSessionLocal() as db:
+        api_key = create_api_client(db, role="admin")
+
+    response = client.get(
+        "/api/insurance/alerts", headers={"X-API-Key": api_key, "X-Request-ID": "abc-123"}
+    )
+    assert response.headers["X-Request-ID"] == "abc-123"
+    timing = response.headers["Server-Timing"]
+    assert timing.startswith("db;dur=")
+    assert int(timing.split('desc="')[1].split(" ")[0]) > 0
+
+    generated = client.get("/api/insurance/alerts", headers={"X-Request-ID": "bad id\n"})
+    assert generated.headers["X-Request-ID"] != "bad id"
+    assert len(generated.headers["X-Request-ID"]) == 32
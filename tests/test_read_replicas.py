@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from safedrive.core.exports import decode_change_cursor, next_change_cursor
+from safedrive.database.base import Base
+from safedrive.database.replicas import READ_LAG_ALLOWANCE_KEY, ReadReplicas, read_replicas
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.location import Location
+from safedrive.models.raw_sensor_data import RawSensorData
+from safedrive.models.trip import Trip
+from tests.db_fixtures import (
+    TestingSessionLocal,
+    client,
+    create_api_client,
+    create_tables,
+    drop_tables,
+    engine,
+)
+
+
+@pytest.fixture(autouse=True)
+def prepare_database():
+    create_tables()
+    try:
+        yield
+    finally:
+        read_replicas.configure([])
+        drop_tables()
+
+
+def _replica(tmp_path, name="replica"):
+    url = f"sqlite:///{tmp_path / name}.db"
+    replica_engine = create_engine(url)
+    Base.metadata.create_all(bind=replica_engine)
+    return url, sessionmaker(bind=replica_engine)
+
+
+def _seed_driver(db, ingested_at):
+    """A driver with one trip and a located sensor row written at ``ingested_at``."""
+    driver_id = uuid4()
+    trip_id = uuid4()
+    location = Location(
+        id=uuid4(),
+        latitude=0.0,
+        longitude=0.0,
+        timestamp=0,
+        date=datetime.utcnow(),
+        altitude=0.0,
+        speed=10.0,
+        speedLimit=50.0,
+        distance=1000.0,
+        sync=True,
+    )
+    db.add(DriverProfile(driverProfileId=driver_id, email=f"{driver_id}@example.com", sync=True))
+    db.add(Trip(id=trip_id, driverProfileId=driver_id, start_date=datetime.utcnow(), sync=True))
+    db.add(location)
+    db.add(
+        RawSensorData(
+            id=uuid4(),
+            sensor_type=1,
+            sensor_type_name="accelerometer",
+            values=[0.0],
+            timestamp=0,
+            accuracy=3,
+            location_id=location.id,
+            trip_id=trip_id,
+            sync=True,
+            ingested_at=ingested_at,
+        )
+    )
+    db.commit()
+    return driver_id
+
+
+def _ubpk_drivers(api_key):
+    response = client.get("/api/behaviour_metrics/ubpk", headers={"X-API-Key": api_key})
+    assert response.status_code == 200
+    return {row["driverProfileId"] for row in response.json()}
+
+
+def test_reads_use_replica_until_it_lags(tmp_path, monkeypatch):
+    url, ReplicaSession = _replica(tmp_path)
+    now = datetime.utcnow()
+    with TestingSessionLocal() as db:
+        primary_driver = _seed_driver(db, now)
+        api_key = create_api_client(db, role="admin")
+    with ReplicaSession() as db:
+        replica_driver = _seed_driver(db, now - timedelta(seconds=10))
+
+    read_replicas.configure([url])
+    monkeypatch.setattr(read_replicas, "max_lag", 30.0)
+    monkeypatch.setattr(read_replicas, "check_interval", 0.0)
+    assert _ubpk_drivers(api_key) == {str(replica_driver)}
+
+    # The primary moves on; the replica is now too far behind.
+    with TestingSessionLocal() as db:
+        _seed_driver(db, now + timedelta(seconds=60))
+    drivers = _ubpk_drivers(api_key)
+    assert str(primary_driver) in drivers
+    assert str(replica_driver) not in drivers
+
+
+def test_unreachable_replica_falls_back_to_primary(tmp_path):
+    replicas = ReadReplicas([f"sqlite:///{tmp_path}/missing/replica.db"], check_interval=0.0)
+    assert replicas.session(engine) is None
+
+
+def test_replicas_are_chosen_round_robin(tmp_path):
+    first, _ = _replica(tmp_path, "first")
+    second, _ = _replica(tmp_path, "second")
+    replicas = ReadReplicas([first, second], check_interval=60.0)
+
+    chosen = []
+    for _ in range(4):
+        db = replicas.session(engine)
+        chosen.append(str(db.get_bind().url))
+        assert db.info[READ_LAG_ALLOWANCE_KEY] == replicas.max_lag + 60.0
+        db.close()
+    assert chosen == [first, second, first, second]
+
+
+def test_change_cursor_trails_replica_lag_allowance():
+    with TestingSessionLocal() as db:
+        primary_cursor = decode_change_cursor(next_change_cursor(db))
+        db.info[READ_LAG_ALLOWANCE_KEY] = 35.0
+        replica_cursor = decode_change_cursor(next_change_cursor(db))
+    assert primary_cursor - replica_cursor >= timedelta(seconds=34)
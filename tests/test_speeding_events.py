@@ -0,0 +1,207 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from safedrive.core.speeding import _episodes
+from safedrive.crud.raw_sensor_data import raw_sensor_data_crud
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.insurance_partner import InsurancePartner, InsurancePartnerDriver
+from safedrive.models.location import Location
+from safedrive.models.speeding_event import SpeedingEvent
+from safedrive.models.trip import Trip
+from safedrive.models.unsafe_behaviour import UnsafeBehaviour
+from safedrive.schemas.raw_sensor_data import RawSensorDataCreate
+from tests.db_fixtures import (
+    TestingSessionLocal,
+    client,
+    create_api_client,
+    create_tables,
+    drop_tables,
+)
+
+LIMIT = 20.0
+
+
+@pytest.fixture(autouse=True)
+def prepare_database():
+    create_tables()
+    try:
+        yield
+    finally:
+        drop_tables()
+
+
+def _now_ms():
+    return int(datetime.utcnow().timestamp() * 1000)
+
+
+def _add_trip(db):
+    driver_id = uuid4()
+    db.add(DriverProfile(driverProfileId=driver_id, email=f"{driver_id}@example.com", sync=True))
+    db.flush()
+    trip = Trip(id=uuid4(), driverProfileId=driver_id, start_date=datetime.utcnow(), sync=True)
+    db.add(trip)
+    db.commit()
+    return driver_id, trip.id
+
+
+def _upload(db, trip_id, points):
+    """Store ``(timestamp, speed)`` locations and link them to the trip with sensor rows."""
+    rows = []
+    for timestamp, speed in points:
+        location = Location(
+            id=uuid4(),
+            latitude=0.0,
+            longitude=0.0,
+            timestamp=timestamp,
+            date=datetime.utcnow(),
+            altitude=0.0,
+            speed=speed,
+            speedLimit=LIMIT,
+            distance=10.0,
+            sync=True,
+        )
+        db.add(location)
+        rows.append(
+            RawSensorDataCreate(
+                id=uuid4(),
+                sensor_type=1,
+                sensor_type_name="accelerometer",
+                values=[0.0],
+                timestamp=timestamp,
+                accuracy=3,
+                location_id=location.id,
+                trip_id=trip_id,
+            )
+        )
+    db.commit()
+    raw_sensor_data_crud.batch_create(db, rows)
+
+
+def _episodes_of(db, trip_id):
+    return (
+        db.query(SpeedingEvent)
+        .filter(SpeedingEvent.trip_id == trip_id)
+        .order_by(SpeedingEvent.timestamp)
+        .all()
+    )
+
+
+def test_consecutive_over_limit_points_merge_into_one_episode():
+    episodes = _episodes(
+        [
+            (1, 10.0, LIMIT, False),
+            (2, 30.0, LIMIT, True),
+            (3, 35.0, LIMIT, True),
+            (4, 25.0, LIMIT, True),
+            (5, 15.0, LIMIT, False),
+            (6, 40.0, LIMIT, True),
+        ]
+    )
+    assert [(e.timestamp, e.end_timestamp, e.point_count) for e in episodes] == [
+        (2, 4, 3),
+        (6, 6, 1),
+    ]
+    assert episodes[0].max_overspeed == 15.0
+    assert episodes[0].max_speed == 35.0
+
+
+def test_sensor_uploads_detect_and_extend_episodes():
+    start = _now_ms() - 60_000
+    with TestingSessionLocal() as db:
+        driver_id, trip_id = _add_trip(db)
+        _upload(db, trip_id, [(start, 10.0), (start + 1000, 30.0), (start + 2000, 35.0), (start + 3000, 15.0), (start + 4000, 25.0)])
+        first = [(e.timestamp, e.end_timestamp, e.point_count) for e in _episodes_of(db, trip_id)]
+        assert first == [(start + 1000, start + 2000, 2), (start + 4000, start + 4000, 1)]
+
+        # A later upload continues the open episode instead of adding one.
+        _upload(db, trip_id, [(start + 5000, 45.0), (start + 6000, 10.0)])
+        episodes = _episodes_of(db, trip_id)
+        assert [(e.timestamp, e.end_timestamp, e.point_count) for e in episodes] == [
+            (start + 1000, start + 2000, 2),
+            (start + 4000, start + 5000, 2),
+        ]
+        assert episodes[1].max_overspeed == 25.0
+        assert {e.driverProfileId for e in episodes} == {driver_id}
+
+        # A late point inside the first episode splits it.
+        _upload(db, trip_id, [(start + 1500, 12.0)])
+        assert [(e.timestamp, e.point_count) for e in _episodes_of(db, trip_id)] == [
+            (start + 1000, 1),
+            (start + 2000, 1),
+            (start + 4000, 2),
+        ]
+
+
+def test_alert_feed_merges_sources_in_time_order_with_cursor():
+    now = _now_ms()
+    with TestingSessionLocal() as db:
+        partner = InsurancePartner(name="Alert Insurer", label="alert-insurer", active=True)
+        db.add(partner)
+        db.flush()
+        driver_id, trip_id = _add_trip(db)
+        db.add(InsurancePartnerDriver(partner_id=partner.id, driverProfileId=driver_id))
+        # Three speeding episodes and an old one outside the 24h window.
+        _upload(
+            db,
+            trip_id,
+            [
+                (now - 100_000, 30.0),
+                (now - 90_000, 10.0),
+                (now - 70_000, 30.0),
+                (now - 60_000, 10.0),
+                (now - 40_000, 30.0),
+                (now - 30_000, 10.0),
+            ],
+        )
+        other_driver, other_trip = _add_trip(db)
+        _upload(db, other_trip, [(now - 50_000, 30.0)])
+        for offset in (80_000, 50_000, 20_000):
+            db.add(
+                UnsafeBehaviour(
+                    id=uuid4(),
+                    trip_id=trip_id,
+                    driverProfileId=driver_id,
+                    behaviour_type="hard_brake",
+                    severity=0.9,
+                    timestamp=now - offset,
+                )
+            )
+        db.add(
+            SpeedingEvent(
+                driverProfileId=driver_id,
+                trip_id=trip_id,
+                timestamp=now - 48 * 3600 * 1000,
+                end_timestamp=now - 48 * 3600 * 1000,
+                max_speed=30.0,
+                speed_limit=LIMIT,
+                max_overspeed=10.0,
+            )
+        )
+        db.commit()
+        api_key = create_api_client(db, role="insurance_partner", insurance_partner_id=partner.id)
+
+    headers = {"X-API-Key": api_key}
+    alerts, cursor = [], None
+    while True:
+        params = {"limit": 4, **({"cursor": cursor} if cursor else {})}
+        page = client.get("/api/insurance/alerts", params=params, headers=headers)
+        assert page.status_code == 200
+        alerts.extend(page.json())
+        cursor = page.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert [alert["alert_type"] for alert in alerts] == [
+        "unsafe_behaviour",
+        "speed_violation",
+        "unsafe_behaviour",
+        "speed_violation",
+        "unsafe_behaviour",
+        "speed_violation",
+    ]
+    timestamps = [alert["timestamp"] for alert in alerts]
+    assert timestamps == sorted(timestamps, reverse=True)
+    assert {alert["driverProfileId"] for alert in alerts} == {str(driver_id)}
+    assert alerts[1]["max_overspeed"] == 10.0
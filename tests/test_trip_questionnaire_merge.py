@@ -0,0 +1,133 @@
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from safedrive.api.v1.endpoints import researcher
+from safedrive.models.alcohol_questionnaire import AlcoholQuestionnaire
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.trip import Trip
+from tests.db_fixtures import (
+    TestingSessionLocal,
+    client,
+    create_api_client,
+    create_tables,
+    drop_tables,
+)
+
+
+@pytest.fixture(autouse=True)
+def prepare_database():
+    create_tables()
+    try:
+        yield
+    finally:
+        drop_tables()
+
+
+def _questionnaire(driver_id, when, drank):
+    return AlcoholQuestionnaire(
+        id=uuid4(),
+        driverProfileId=driver_id,
+        drankAlcohol=drank,
+        selectedAlcoholTypes="beer" if drank else "",
+        beerQuantity="1" if drank else "0",
+        wineQuantity="0",
+        spiritsQuantity="0",
+        firstDrinkTime="18:00",
+        lastDrinkTime="19:00",
+        emptyStomach=False,
+        caffeinatedDrink=False,
+        impairmentLevel=1,
+        date=when,
+        plansToDrive=True,
+        sync=True,
+    )
+
+
+def _seed():
+    """Three drivers, several trips and questionnaires per day, some trips without start_date."""
+    day = datetime(2025, 3, 10)
+    expected = {}
+    with TestingSessionLocal() as db:
+        for d in range(3):
+            driver_id = uuid4()
+            db.add(DriverProfile(driverProfileId=driver_id, email=f"merge{d}@example.com", sync=True))
+            db.flush()
+            for offset in range(4):
+                current = day + timedelta(days=offset)
+                # Two questionnaires on even days; the later one must win.
+                answers = [(current + timedelta(hours=8), False)]
+                if offset % 2 == 0:
+                    answers.append((current + timedelta(hours=20), True))
+                if offset == 3 and d == 1:
+                    answers = []
+                for when, drank in answers:
+                    db.add(_questionnaire(driver_id, when, drank))
+                latest = max(answers)[1] if answers else None
+
+                dated = Trip(id=uuid4(), driverProfileId=driver_id, start_date=current + timedelta(hours=23), sync=True)
+                undated = Trip(
+                    id=uuid4(),
+                    driverProfileId=driver_id,
+                    start_time=int((current + timedelta(hours=1) - datetime(1970, 1, 1)).total_seconds() * 1000),
+                    sync=True,
+                )
+                db.add_all([dated, undated])
+                expected[str(dated.id)] = latest
+                expected[str(undated.id)] = latest
+            no_day = Trip(id=uuid4(), driverProfileId=driver_id, sync=True)
+            db.add(no_day)
+            expected[str(no_day.id)] = None
+        db.add(_questionnaire(driver_id, None, True))
+        db.commit()
+        api_key = create_api_client(db, role="researcher")
+    return {"X-API-Key": api_key}, expected
+
+
+def test_trip_export_matches_latest_same_day_questionnaire():
+    headers, expected = _seed()
+    response = client.get("/api/researcher/trips/export?format=jsonl", headers=headers)
+    assert response.status_code == 200
+
+    trips = [json.loads(line) for line in response.text.splitlines()]
+    matched = {
+        trip["id"]: trip["matchedQuestionnaire"]["drankAlcohol"] if trip["matchedQuestionnaire"] else None
+        for trip in trips
+    }
+    assert matched == expected
+
+
+def test_backfill_uses_merged_matches():
+    headers, expected = _seed()
+    payload = client.post("/api/researcher/trips/backfill_alcohol", headers=headers).json()
+
+    assert payload["totalTrips"] == len(expected)
+    assert payload["skippedTripsNoDate"] == 3
+    assert payload["matchedTrips"] == sum(value is not None for value in expected.values())
+    with TestingSessionLocal() as db:
+        for trip in db.query(Trip).all():
+            drank = expected[str(trip.id)]
+            assert trip.user_alcohol_response == (None if drank is None else ("1" if drank else "0"))
+
+
+def test_merge_reads_questionnaires_one_driver_day_at_a_time():
+    driver_id = uuid4()
+    day = datetime(2025, 1, 1)
+    consumed = []
+
+    def questionnaires():
+        for n in range(100):
+            consumed.append(n)
+            yield SimpleNamespace(driverProfileId=driver_id, date=day + timedelta(days=n))
+
+    trips = (
+        SimpleNamespace(driverProfileId=driver_id, start_date=day + timedelta(days=n, hours=1), start_time=None)
+        for n in range(0, 100, 10)
+    )
+    for trip, match in researcher._merge_questionnaires(trips, questionnaires()):
+        assert match.date.date() == trip.start_date.date()
+        # Only the matching day and one look-ahead have been read.
+        assert len(consumed) <= (trip.start_date - day).days + 2
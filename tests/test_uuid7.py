@@ -0,0 +1,98 @@
+import time
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+from safedrive.database.ids import uuid7, uuid7_timestamp_ms
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.trip import Trip
+from tests.db_fixtures import (
+    TestingSessionLocal,
+    client,
+    create_api_client,
+    create_tables,
+    drop_tables,
+)
+
+
+@pytest.fixture(autouse=True)
+def prepare_database():
+    create_tables()
+    try:
+        yield
+    finally:
+        drop_tables()
+
+
+def test_uuid7_is_versioned_and_time_ordered():
+    before = time.time_ns() // 1_000_000
+    ids = [uuid7() for _ in range(10000)]
+    after = time.time_ns() // 1_000_000
+
+    assert all(value.version == 7 and value.variant == "specified in RFC 4122" for value in ids)
+    # Strictly increasing as stored: bytewise, the way BINARY(16) compares.
+    assert [value.bytes for value in ids] == sorted(value.bytes for value in ids)
+    assert len({value.bytes for value in ids}) == len(ids)
+    assert before <= uuid7_timestamp_ms(ids[0]) <= uuid7_timestamp_ms(ids[-1]) <= after + 1
+
+
+def _location(**fields):
+    return {
+        "latitude": 1.0,
+        "longitude": 2.0,
+        "timestamp": 1_760_000_000_000,
+        "date": datetime.utcnow().isoformat(),
+        "altitude": 0.0,
+        "speed": 10.0,
+        "speedLimit": 50.0,
+        "distance": 5.0,
+        **fields,
+    }
+
+
+def test_server_generates_uuid7_and_keeps_client_ids():
+    with TestingSessionLocal() as db:
+        api_key = create_api_client(db, role="admin")
+
+    generated = client.post("/api/locations/", json=_location(), headers={"X-API-Key": api_key})
+    assert generated.status_code == 200
+    assert UUID(generated.json()["id"]).version == 7
+
+    client_id = uuid4()
+    kept = client.post(
+        "/api/locations/", json=_location(id=str(client_id)), headers={"X-API-Key": api_key}
+    )
+    assert kept.status_code == 200
+    assert kept.json()["id"] == str(client_id)
+
+
+def test_unsafe_behaviours_keep_client_ids():
+    driver_id, trip_id = uuid4(), uuid4()
+    with TestingSessionLocal() as db:
+        db.add(DriverProfile(driverProfileId=driver_id, email=f"{driver_id}@example.com", sync=True))
+        db.add(Trip(id=trip_id, driverProfileId=driver_id, start_time=1_760_000_000_000, sync=True))
+        db.commit()
+        api_key = create_api_client(db, role="admin")
+
+    behaviour = {
+        "trip_id": str(trip_id),
+        "driverProfileId": str(driver_id),
+        "behaviour_type": "harsh_braking",
+        "severity": 0.7,
+        "timestamp": 1_760_000_000_000,
+    }
+    generated = client.post(
+        "/api/unsafe_behaviours/", json=behaviour, headers={"X-API-Key": api_key}
+    )
+    assert generated.status_code == 200
+    assert UUID(generated.json()["id"]).version == 7
+
+    client_id = uuid4()
+    kept = client.post(
+        "/api/unsafe_behaviours/",
+        json={**behaviour, "id": str(client_id)},
+        headers={"X-API-Key": api_key},
+    )
+    assert kept.status_code == 200
+    assert kept.json()["id"] == str(client_id)
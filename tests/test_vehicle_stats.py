@@ -0,0 +1,282 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from safedrive.crud.raw_sensor_data import raw_sensor_data_crud
+from safedrive.crud.trip import trip_crud
+from safedrive.crud.unsafe_behaviour import unsafe_behaviour_crud
+from safedrive.models.driver_profile import DriverProfile
+from safedrive.models.fleet import Fleet
+from safedrive.models.location import Location
+from safedrive.models.trip import Trip
+from safedrive.models.vehicle import Vehicle
+from safedrive.core import vehicle_stats
+from safedrive.models.vehicle_day_stats import VehicleDayDirty, VehicleDayStats
+from safedrive.schemas.raw_sensor_data import RawSensorDataCreate
+from safedrive.schemas.trip import TripUpdate
+from safedrive.schemas.unsafe_behaviour import UnsafeBehaviourCreate
+from tests.db_fixtures import (
+    TestingSessionLocal,
+    client,
+    create_api_client,
+    create_tables,
+    drop_tables,
+    engine,
+)
+
+
+@pytest.fixture(autouse=True)
+def prepare_database():
+    create_tables()
+    try:
+        yield
+    finally:
+        drop_tables()
+
+
+def _ms(moment: datetime) -> int:
+    return int((moment - datetime(1970, 1, 1)).total_seconds() * 1000)
+
+
+def _add_vehicle(db):
+    fleet = Fleet(name="Stats Fleet")
+    db.add(fleet)
+    db.flush()
+    vehicle = Vehicle(fleet_id=fleet.id, license_plate=f"KAA-{uuid4().hex[:6]}")
+    db.add(vehicle)
+    db.commit()
+    return fleet.id, vehicle.id
+
+
+def _add_driver(db):
+    driver_id = uuid4()
+    db.add(DriverProfile(driverProfileId=driver_id, email=f"{driver_id}@example.com", sync=True))
+    db.commit()
+    return driver_id
+
+
+def _add_trip(db, vehicle_id, driver_id, started, minutes=30):
+    """A finished trip, ended through the CRUD update like the app does."""
+    trip = Trip(
+        id=uuid4(),
+        driverProfileId=driver_id,
+        vehicle_id=vehicle_id,
+        start_date=started,
+        start_time=_ms(started),
+        sync=True,
+    )
+    db.add(trip)
+    db.commit()
+    trip_crud.update(db, trip, TripUpdate(end_time=_ms(started + timedelta(minutes=minutes))))
+    return trip.id
+
+
+def _upload(db, trip_id, distances, sensors_per_location=2):
+    """Locations linked to the trip by several sensor rows each."""
+    rows = []
+    for distance in distances:
+        location = Location(
+            id=uuid4(),
+            latitude=0.0,
+            longitude=0.0,
+            timestamp=_ms(datetime.utcnow()),
+            date=datetime.utcnow(),
+            altitude=0.0,
+            speed=10.0,
+            speedLimit=50.0,
+            distance=distance,
+            sync=True,
+        )
+        db.add(location)
+        for _ in range(sensors_per_location):
+            rows.append(
+                RawSensorDataCreate(
+                    id=uuid4(),
+                    sensor_type=1,
+                    sensor_type_name="accelerometer",
+                    values=[0.0],
+                    timestamp=location.timestamp,
+                    accuracy=3,
+                    location_id=location.id,
+                    trip_id=trip_id,
+                )
+            )
+    db.commit()
+    raw_sensor_data_crud.batch_create(db, rows)
+
+
+def _report_unsafe(db, trip_id, driver_id, count):
+    unsafe_behaviour_crud.batch_create(
+        db,
+        [
+            UnsafeBehaviourCreate(
+                id=uuid4(),
+                trip_id=trip_id,
+                driverProfileId=driver_id,
+                behaviour_type="harsh_braking",
+                severity=0.9,
+                timestamp=_ms(datetime.utcnow()),
+            )
+            for _ in range(count)
+        ],
+    )
+
+
+def test_ingest_maintains_rollup_and_stats_read_it():
+    now = datetime.utcnow()
+    with TestingSessionLocal() as db:
+        fleet_id, vehicle_id = _add_vehicle(db)
+        busy, occasional = _add_driver(db), _add_driver(db)
+        recent = _add_trip(db, vehicle_id, busy, now - timedelta(minutes=90))
+        _add_trip(db, vehicle_id, busy, now - timedelta(days=10), minutes=60)
+        _add_trip(db, vehicle_id, busy, now - timedelta(days=12))
+        _add_trip(db, vehicle_id, occasional, now - timedelta(days=40))
+        _upload(db, recent, [400.0, 600.0])
+        _upload(db, recent, [1000.0])
+        _report_unsafe(db, recent, busy, 3)
+        api_key = create_api_client(db, role="fleet_manager", fleet_id=fleet_id)
+
+        assert db.query(VehicleDayStats).count() == 4
+
+    headers = {"X-API-Key": api_key}
+    everything = client.get(f"/api/vehicles/{vehicle_id}/stats", headers=headers).json()
+    assert everything["total_trips"] == 4
+    assert everything["unique_drivers"] == 2
+    assert everything["total_distance_km"] == pytest.approx(2.0)
+    assert everything["total_duration_hours"] == pytest.approx(2.5)
+    assert everything["total_unsafe_behaviours"] == 3
+    assert everything["ubpk"] == pytest.approx(1.5)
+    assert everything["busiest_driver"]["driver_profile_id"] == str(busy)
+    assert everything["busiest_driver"]["trip_count"] == 3
+
+    month = client.get(
+        f"/api/vehicles/{vehicle_id}/stats", params={"period": "month"}, headers=headers
+    ).json()
+    assert (month["total_trips"], month["unique_drivers"]) == (3, 1)
+
+    day = client.get(
+        f"/api/vehicles/{vehicle_id}/stats", params={"period": "day"}, headers=headers
+    ).json()
+    assert day["total_trips"] == 1
+    assert day["total_duration_hours"] == pytest.approx(0.5)
+
+
+def test_trip_update_moves_its_bucket():
+    now = datetime.utcnow()
+    with TestingSessionLocal() as db:
+        _, vehicle_id = _add_vehicle(db)
+        driver_id = _add_driver(db)
+        trip_id = _add_trip(db, vehicle_id, driver_id, now - timedelta(days=5))
+        trip = db.get(Trip, trip_id)
+        moved = now - timedelta(days=3)
+        trip_crud.update(
+            db, trip, TripUpdate(start_time=_ms(moved), end_time=_ms(moved) + 60_000)
+        )
+
+        buckets = db.query(VehicleDayStats).all()
+        assert [(bucket.day, bucket.trip_count) for bucket in buckets] == [(moved.date(), 1)]
+        assert buckets[0].duration_ms == 60_000
+
+
+
+def test_writes_queue_their_day_for_one_debounced_rebuild(monkeypatch):
+    monkeypatch.setattr(vehicle_stats.vehicle_day_refresher, "schedule", lambda bind: None)
+    now = datetime.utcnow()
+    with TestingSessionLocal() as db:
+        _, vehicle_id = _add_vehicle(db)
+        driver_id = _add_driver(db)
+        trip_id = _add_trip(db, vehicle_id, driver_id, now - timedelta(hours=2))
+        for _ in range(3):
+            _upload(db, trip_id, [100.0])
+        _report_unsafe(db, trip_id, driver_id, 2)
+
+        # Every write queued the same day; none rebuilt it.
+        assert db.query(VehicleDayStats).count() == 0
+        assert [(row.vehicle_id, row.day) for row in db.query(VehicleDayDirty)] == [
+            (vehicle_id, (now - timedelta(hours=2)).date())
+        ]
+
+        rebuild_calls = []
+        rebuild = vehicle_stats.rebuild_vehicle_days
+        monkeypatch.setattr(
+            vehicle_stats,
+            "rebuild_vehicle_days",
+            lambda session, days: rebuild_calls.append(days) or rebuild(session, days),
+        )
+        assert vehicle_stats.rebuild_dirty_vehicle_days(db) == 1
+        assert len(rebuild_calls) == 1
+        assert db.query(VehicleDayDirty).count() == 0
+        bucket = db.query(VehicleDayStats).one()
+        assert (bucket.trip_count, bucket.distance_m, bucket.unsafe_count) == (1, 300.0, 2)
+
+
+def test_write_during_a_rebuild_keeps_its_day_queued(monkeypatch):
+    monkeypatch.setattr(vehicle_stats.vehicle_day_refresher, "schedule", lambda bind: None)
+    now = datetime.utcnow()
+    with TestingSessionLocal() as db:
+        _, vehicle_id = _add_vehicle(db)
+        driver_id = _add_driver(db)
+        trip_id = _add_trip(db, vehicle_id, driver_id, now - timedelta(hours=2))
+        _upload(db, trip_id, [100.0])
+
+        rebuild = vehicle_stats.rebuild_vehicle_days
+
+        def _rebuild_then_write(session, days):
+            rebuilt = rebuild(session, days)
+            # Committed after the rebuild read the day, before it deletes the mark.
+            with TestingSessionLocal() as writer:
+                _report_unsafe(writer, trip_id, driver_id, 1)
+            return rebuilt
+
+        monkeypatch.setattr(vehicle_stats, "rebuild_vehicle_days", _rebuild_then_write)
+        assert vehicle_stats.rebuild_dirty_vehicle_days(db) == 1
+        assert db.query(VehicleDayDirty).count() == 1
+
+        monkeypatch.setattr(vehicle_stats, "rebuild_vehicle_days", rebuild)
+        assert vehicle_stats.rebuild_dirty_vehicle_days(db) == 1
+        assert db.query(VehicleDayDirty).count() == 0
+        assert db.query(VehicleDayStats).one().unsafe_count == 1
+
+
+def test_trip_page_metrics_use_fixed_query_count():
+    now = datetime.utcnow()
+    with TestingSessionLocal() as db:
+        fleet_id, vehicle_id = _add_vehicle(db)
+        driver_id = _add_driver(db)
+        trip_ids = [
+            _add_trip(db, vehicle_id, driver_id, now - timedelta(hours=hours))
+            for hours in range(1, 13)
+        ]
+        _upload(db, trip_ids[0], [250.0, 250.0])
+        _report_unsafe(db, trip_ids[0], driver_id, 2)
+        api_key = create_api_client(db, role="fleet_manager", fleet_id=fleet_id)
+
+    headers = {"X-API-Key": api_key}
+    url = f"/api/vehicles/{vehicle_id}/trips"
+    client.get(url, headers=headers)
+
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    counts = []
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        for page_size in (10, 12):
+            statements.clear()
+            response = client.get(url, params={"page_size": page_size}, headers=headers)
+            assert response.status_code == 200
+            counts.append(len(statements))
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert counts[0] == counts[1]
+    trips = response.json()["trips"]
+    assert len(trips) == 12
+    assert trips[0]["id"] == str(trip_ids[0])
+    assert trips[0]["distance_km"] == pytest.approx(0.5)
+    assert trips[0]["unsafe_count"] == 2
+    assert trips[1]["distance_km"] == 0.0